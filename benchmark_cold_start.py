@@ -0,0 +1,179 @@
+"""
+Cold-start measurement: process launch to the first successful cross-language call.
+
+The harnesses time calls inside an already-initialized process; their
+"initialization" section only covers what happens after the interpreter is up
+(and gRPC and JPype measure it differently). The cold-start suite instead
+launches a fresh interpreter per sample and runs a small per-mechanism script
+(<test dir>/cold_start.py) that stops after one call. The script reports each
+stage boundary on stdout as
+
+    METAFFI_COLD_START <stage> <time.monotonic_ns()>
+
+(the scripts print the marks themselves rather than importing this module,
+so the launcher's imports are not charged to any stage). The launcher reads
+the same system-wide monotonic clock right before starting the process and
+turns the marks into per-stage durations:
+
+    interpreter_start   launch -> first instruction of the script
+    sdk_import          interop SDK import (metaffi, ctypes, jpype, grpc + stubs)
+    runtime_load        runtime plugin / JVM / gRPC server start (0 for ctypes)
+    module_load         guest module, shared library, guest classes or channel
+    first_load_entity   first entity lookup (load_entity, symbol, method, stub)
+    first_call          first call, result checked
+
+exec_to_first_call is their sum. Every launch is a separate process, so every
+sample pays the full cost; teardown is not measured.
+
+Enabled by run.cold_start_runs (0 disables). The runner writes
+<results>/cold_start.json, and consolidate_results.py copies it into the
+"cold_start" section of the consolidated output.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+COLD_START_MARK = "METAFFI_COLD_START"
+COLD_START_FILENAME = "cold_start.json"
+STAGES = (
+    "interpreter_start",
+    "sdk_import",
+    "runtime_load",
+    "module_load",
+    "first_load_entity",
+    "first_call",
+)
+
+# Cold-start scripts per (host, guest, mechanism), relative to the tests root.
+# Only Python hosts: Go and Java hosts run under `go test` / Maven, whose
+# startup would dominate a process-launch measurement.
+COLD_START_SCRIPTS = {
+    ("python3", "go", "metaffi"): "python3/call_go/cold_start.py",
+    ("python3", "java", "metaffi"): "python3/call_java/cold_start.py",
+    ("python3", "go", "ctypes"): "python3/without_metaffi/call_go_ctypes/cold_start.py",
+    ("python3", "go", "grpc"): "python3/without_metaffi/call_go_grpc/cold_start.py",
+    ("python3", "java", "grpc"): "python3/without_metaffi/call_java_grpc/cold_start.py",
+    ("python3", "java", "jpype"): "python3/without_metaffi/call_java_jpype/cold_start.py",
+}
+
+# Seconds one launch may take before it is treated as hung.
+LAUNCH_TIMEOUT_S = 300
+
+
+class ColdStartError(Exception):
+    """Raised when a cold-start launch fails or reports incomplete stages."""
+
+
+def parse_marks(stdout: str) -> dict[str, int]:
+    marks: dict[str, int] = {}
+    for line in stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == COLD_START_MARK:
+            marks[parts[1]] = int(parts[2])
+    return marks
+
+
+def stage_durations(launch_ns: int, marks: dict[str, int]) -> dict[str, int]:
+    """Per-stage durations of one launch, plus exec_to_first_call_ns."""
+    missing = [s for s in STAGES if s not in marks]
+    if missing:
+        raise ColdStartError(f"cold-start script did not report stages {missing}")
+    durations: dict[str, int] = {}
+    previous = launch_ns
+    for stage in STAGES:
+        if marks[stage] < previous:
+            raise ColdStartError(f"cold-start stage {stage} reported before the previous stage")
+        durations[f"{stage}_ns"] = marks[stage] - previous
+        previous = marks[stage]
+    durations["exec_to_first_call_ns"] = marks[STAGES[-1]] - launch_ns
+    return durations
+
+
+def launch_once(script: Path, cwd: Path, env: dict[str, str]) -> dict[str, int]:
+    """Start a fresh interpreter on script and return its stage durations."""
+    launch_ns = time.monotonic_ns()
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(script)],
+            cwd=str(cwd),
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=LAUNCH_TIMEOUT_S,
+            check=False,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise ColdStartError(f"{script} did not finish within {LAUNCH_TIMEOUT_S} s") from e
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-20:])
+        raise ColdStartError(f"{script} exited with code {proc.returncode}:\n{tail}")
+    return stage_durations(launch_ns, parse_marks(proc.stdout))
+
+
+def _summary(values: list[int]) -> dict[str, Any]:
+    ordered = sorted(values)
+    n = len(ordered)
+    median = (ordered[(n - 1) // 2] + ordered[n // 2]) / 2.0
+    return {
+        "mean_ns": sum(ordered) / n,
+        "median_ns": median,
+        "min_ns": float(ordered[0]),
+        "max_ns": float(ordered[-1]),
+    }
+
+
+def run_cold_start(
+    triple: tuple[str, str, str],
+    tests_root: Path,
+    runs: int,
+    env: dict[str, str],
+) -> dict[str, Any]:
+    """Launch the triple's cold-start script `runs` times; return its "cold_start" entry.
+
+    All launches are kept (no outlier removal): a slow first launch with a cold
+    page cache is part of what is being measured.
+    """
+    script = tests_root / COLD_START_SCRIPTS[triple]
+    if not script.is_file():
+        raise ColdStartError(f"Cold-start script not found: {script}")
+    samples = [launch_once(script, script.parent, env) for _ in range(runs)]
+    fields = [f"{s}_ns" for s in STAGES] + ["exec_to_first_call_ns"]
+    raw = {f: [s[f] for s in samples] for f in fields}
+    host, guest, mechanism = triple
+    return {
+        "host": host,
+        "guest": guest,
+        "mechanism": mechanism,
+        "launches": runs,
+        "stages": {f[:-3]: _summary(raw[f]) for f in fields},
+        "raw_ns": raw,
+    }
+
+
+def write_cold_start(path: Path, entries: list[dict[str, Any]], runs: int) -> None:
+    """Merge entries into the cold-start file (other mechanisms' entries are kept)."""
+    existing: list[dict[str, Any]] = []
+    if path.is_file():
+        with open(path, encoding="utf-8") as f:
+            existing = json.load(f).get("mechanisms", [])
+    replaced = {(e["host"], e["guest"], e["mechanism"]) for e in entries}
+    kept = [e for e in existing if (e.get("host"), e.get("guest"), e.get("mechanism")) not in replaced]
+    data = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "runs": runs,
+            "python_version": sys.version.split()[0],
+            "stages": list(STAGES),
+        },
+        "mechanisms": sorted(kept + entries, key=lambda e: (e["host"], e["guest"], e["mechanism"])),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
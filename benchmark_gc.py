@@ -0,0 +1,183 @@
+"""
+Garbage-collector handling of the measured phase in the Python harnesses.
+
+The Python harness loops allocate (closures, argument lists, results), so
+gen-0..2 collections land inside random samples and show up in the tail.
+METAFFI_TEST_GC_MODE selects what happens during measurement:
+
+    enabled    GC left alone (the historical behaviour)
+    disabled   gc.disable() for the measured phase, with an explicit, untimed
+               gc.collect() before every sample block
+               (benchmark_precision.PrecisionSampler blocks; one block in
+               fixed mode)
+    trace      GC left on; gc.callbacks time every collection and the samples
+               during which one completed are tagged
+
+Warmup and the memory / phase probes are not affected.
+
+Every benchmark entry records a "gc" section:
+
+    {"mode": "trace", "collections": 41, "collections_by_generation": [38, 3, 0],
+     "pause_ns_total": 912000, "pause_ns_max": 310000,
+     "gc_samples": 39, "gc_sample_indices": [...],
+     "tail": {"all": {"p95_ns": ..., "p99_ns": ..., "max_ns": ...},
+              "without_gc": {"p95_ns": ..., "p99_ns": ..., "max_ns": ...}}}
+
+gc_sample_indices index raw_iterations_ns, so the tagged samples can be
+excluded afterwards. The tail percentiles are taken on the raw samples (no IQR
+cleaning); "without_gc" drops the tagged ones. Outside trace mode only
+"mode" and "explicit_collections" (disabled mode) are set. The runner merges
+repeats with merge_gc().
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from benchmark_stats import order_statistic_index
+
+
+GC_MODE_ENV = "METAFFI_TEST_GC_MODE"
+GC_MODES = ("enabled", "disabled", "trace")
+
+
+class GcError(Exception):
+    """Raised on an invalid GC configuration."""
+
+
+@dataclass(frozen=True)
+class GcSettings:
+    mode: str = "enabled"
+
+    @classmethod
+    def from_env(cls) -> "GcSettings":
+        mode = os.environ.get(GC_MODE_ENV, "").strip().lower() or "enabled"
+        if mode not in GC_MODES:
+            raise GcError(f"{GC_MODE_ENV} must be one of {GC_MODES}, got {mode!r}")
+        return cls(mode=mode)
+
+    def as_config(self) -> dict[str, Any]:
+        return {"gc_mode": self.mode}
+
+
+def tail_stats(samples: Sequence[float]) -> dict[str, float | None]:
+    """p95 / p99 / max of the raw samples."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {"p95_ns": None, "p99_ns": None, "max_ns": None}
+    return {
+        "p95_ns": float(ordered[order_statistic_index(n, 0.95)]),
+        "p99_ns": float(ordered[order_statistic_index(n, 0.99)]),
+        "max_ns": float(ordered[-1]),
+    }
+
+
+class GcMonitor:
+    """Applies the GC mode around one scenario's measured phase.
+
+    Use as a context manager around the measurement loop; call before_block()
+    before every block. In trace mode the harness compares `collections`
+    before and after each sample and calls tag(index) when it changed.
+    """
+
+    def __init__(self, settings: GcSettings):
+        self.mode = settings.mode
+        self.collections = 0
+        self.explicit_collections = 0
+        self.pauses: list[tuple[int, int]] = []
+        self.tagged: list[int] = []
+        self._started_ns: int | None = None
+        self._was_enabled = True
+
+    def _callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._started_ns = time.perf_counter_ns()
+        elif self._started_ns is not None:
+            self.pauses.append((info["generation"], time.perf_counter_ns() - self._started_ns))
+            self._started_ns = None
+            self.collections += 1
+
+    def __enter__(self) -> "GcMonitor":
+        if self.mode == "trace":
+            gc.callbacks.append(self._callback)
+        elif self.mode == "disabled":
+            self._was_enabled = gc.isenabled()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self.mode == "trace":
+            gc.callbacks.remove(self._callback)
+        elif self.mode == "disabled" and self._was_enabled:
+            gc.enable()
+
+    def before_block(self) -> None:
+        if self.mode == "disabled":
+            gc.collect()
+            gc.disable()
+            self.explicit_collections += 1
+
+    def tag(self, index: int) -> None:
+        self.tagged.append(index)
+
+    def info(self, samples: Sequence[float]) -> dict[str, Any]:
+        if self.mode != "trace":
+            return {
+                "mode": self.mode,
+                "explicit_collections": self.explicit_collections if self.mode == "disabled" else None,
+            }
+        by_generation = [0, 0, 0]
+        for generation, _ in self.pauses:
+            by_generation[generation] += 1
+        tagged = set(self.tagged)
+        return {
+            "mode": "trace",
+            "collections": self.collections,
+            "collections_by_generation": by_generation,
+            "pause_ns_total": sum(p for _, p in self.pauses),
+            "pause_ns_max": max((p for _, p in self.pauses), default=0),
+            "gc_samples": len(self.tagged),
+            "gc_sample_indices": self.tagged,
+            "tail": {
+                "all": tail_stats(samples),
+                "without_gc": tail_stats([s for i, s in enumerate(samples) if i not in tagged]),
+            },
+        }
+
+
+def merge_gc(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the gc sections of one scenario across repeats.
+
+    Counts and pause totals are summed; tail percentiles are the median over
+    repeats. Sample indices are per repeat and are not carried over.
+    """
+    sections = [s for s in sections if isinstance(s, dict)]
+    if not sections:
+        return None
+    mode = sections[0].get("mode")
+    if mode != "trace":
+        explicit = [s["explicit_collections"] for s in sections if isinstance(s.get("explicit_collections"), int)]
+        return {"mode": mode, "explicit_collections": sum(explicit) if explicit else None}
+
+    def median_of(kind: str, key: str) -> float | None:
+        values = [s["tail"][kind][key] for s in sections if s["tail"][kind][key] is not None]
+        return statistics.median(values) if values else None
+
+    return {
+        "mode": "trace",
+        "collections": sum(s["collections"] for s in sections),
+        "collections_by_generation": [sum(s["collections_by_generation"][g] for s in sections) for g in range(3)],
+        "pause_ns_total": sum(s["pause_ns_total"] for s in sections),
+        "pause_ns_max": max(s["pause_ns_max"] for s in sections),
+        "gc_samples": sum(s["gc_samples"] for s in sections),
+        "gc_samples_per_repeat": [s["gc_samples"] for s in sections],
+        "tail": {
+            kind: {key: median_of(kind, key) for key in ("p95_ns", "p99_ns", "max_ns")}
+            for kind in ("all", "without_gc")
+        },
+    }
@@ -0,0 +1,127 @@
+"""
+Import-time profile of the Python3-host test processes (run_all_tests.py --importtime).
+
+With --importtime the runner starts every Python3-host stage command with
+`python -X importtime`. CPython then reports one stderr line per imported module
+when its import finishes:
+
+    import time: self [us] | cumulative | imported package
+    import time:       463 |       1047 | _frozen_importlib_external
+    import time:        69 |         69 |     _codecs
+
+The indentation of the name is 2 spaces per nesting level; a module's children
+are reported before it. Process-scaling workers are spawned without the flag
+(benchmark_scaling), so only the stage process itself is profiled. The runner
+keeps these lines out of the output tail, parses them here and stores:
+
+  - <results>/import_profiles/<triple>__<stage>[__rNN].json: the summary plus
+    the raw lines
+  - the summary in the benchmark result ("import_profile"), merged across
+    repeats with merge_import_profiles()
+
+A summary is
+
+    {"total_us": 61234, "module_count": 412, "sdk_import_us": 18250,
+     "top_modules": [{"module": "metaffi", "self_us": 310, "cumulative_us": 18250}, ...]}
+
+total_us is the sum of the top-level cumulative times (everything imported by
+the process, including interpreter startup). sdk_import_us is the cumulative
+time of the first top-level import of an interop SDK (metaffi, jpype, grpc,
+ctypes); null when the process never imported one, e.g. because the fixtures
+that need it did not run.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+
+IMPORT_TIME_PREFIX = "import time:"
+IMPORT_PROFILE_DIRNAME = "import_profiles"
+SDK_MODULES = ("metaffi", "jpype", "grpc", "ctypes")
+TOP_MODULES = 25
+
+
+class ImportTimeError(Exception):
+    """Raised when -X importtime output cannot be parsed."""
+
+
+def parse_importtime(lines: list[str]) -> list[dict[str, Any]]:
+    """One record per imported module: module, depth, self_us, cumulative_us (report order)."""
+    records = []
+    for line in lines:
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(IMPORT_TIME_PREFIX):].split("|", 2)
+        if len(fields) != 3:
+            raise ImportTimeError(f"Malformed importtime line: {line!r}")
+        self_us, cumulative_us, name = fields
+        if self_us.strip() == "self [us]":
+            continue
+        name = name.rstrip()
+        stripped = name.lstrip(" ")
+        try:
+            records.append({
+                "module": stripped,
+                # One space separates the column from the name; each level adds 2
+                "depth": (len(name) - len(stripped) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            })
+        except ValueError as e:
+            raise ImportTimeError(f"Malformed importtime line: {line!r}") from e
+    return records
+
+
+def summarize_importtime(records: list[dict[str, Any]], top: int = TOP_MODULES) -> dict[str, Any]:
+    """Totals, the SDK import cost and the `top` modules by cumulative time."""
+    top_level = [r for r in records if r["depth"] == 0]
+    sdk_import_us = next((r["cumulative_us"] for r in top_level if r["module"] in SDK_MODULES), None)
+    ranked = sorted(records, key=lambda r: r["cumulative_us"], reverse=True)[:top]
+    return {
+        "total_us": sum(r["cumulative_us"] for r in top_level),
+        "module_count": len(records),
+        "sdk_import_us": sdk_import_us,
+        "top_modules": [
+            {"module": r["module"], "self_us": r["self_us"], "cumulative_us": r["cumulative_us"]}
+            for r in ranked
+        ],
+    }
+
+
+def write_import_profile(path: Path, summary: dict[str, Any], lines: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({**summary, "raw": lines}, f, indent=2)
+
+
+def merge_import_profiles(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the import profiles of one triple across repeats (medians per module)."""
+    sections = [s for s in sections if isinstance(s, dict)]
+    if not sections:
+        return None
+    totals = [s["total_us"] for s in sections]
+    sdk = [s["sdk_import_us"] for s in sections if s.get("sdk_import_us") is not None]
+    per_module: dict[str, list[dict[str, Any]]] = {}
+    for s in sections:
+        for m in s.get("top_modules", []):
+            per_module.setdefault(m["module"], []).append(m)
+    modules = [
+        {
+            "module": name,
+            "self_us": statistics.median(m["self_us"] for m in ms),
+            "cumulative_us": statistics.median(m["cumulative_us"] for m in ms),
+        }
+        for name, ms in per_module.items()
+    ]
+    modules.sort(key=lambda m: m["cumulative_us"], reverse=True)
+    return {
+        "repeats": len(sections),
+        "total_us": statistics.median(totals),
+        "total_us_per_repeat": totals,
+        "module_count": max(s["module_count"] for s in sections),
+        "sdk_import_us": statistics.median(sdk) if sdk else None,
+        "top_modules": modules[:TOP_MODULES],
+    }
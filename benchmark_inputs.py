@@ -0,0 +1,235 @@
+"""
+Input construction for the Python host array scenarios.
+
+MetaFFI's Python API may convert a packed-array argument element by element
+(list) or pass a buffer straight through (bytes, memoryview, array.array,
+NumPy). To see which representation reaches the packed-array path without an
+intermediate copy, the array scenarios can be repeated per input container:
+
+    METAFFI_TEST_ARRAY_CONTAINERS=list,bytes,bytearray,memoryview,array,numpy
+
+Each harness keeps its historical container for the plain scenario
+("array_echo", "array_sum") so cross-mechanism comparisons are unchanged; every
+other selected container is reported as "<scenario>_<container>" (for example
+array_echo_memoryview with data_size 1000, selector array_echo_memoryview_1000)
+and carries "input_container" in its benchmark entry.
+
+Array sizes are shared by every harness (Python, Go, Java) through
+
+    METAFFI_TEST_ARRAY_SIZES=10,100,1000,10000      element counts (the default)
+    METAFFI_TEST_LARGE_ARRAY_ITERATIONS=50          measured iterations (and warmup
+                                                    cap) for sizes above 10,000
+    METAFFI_TEST_LIST_ARRAY_MAX_SIZE=1000000        largest size measured with a list
+                                                    input (unset: no limit)
+
+A list holds one Python int per element and is converted element by element on
+every call, so at the largest sizes it costs gigabytes and minutes per scenario;
+list runs above the limit are skipped (supports_size).
+
+Python harnesses read array payloads from files generated once under
+METAFFI_TEST_INPUT_DIR (the runner uses <results>/_inputs and pre-generates every
+size) and memory-map them copy-on-write, so a 500 MB input is neither rebuilt
+per harness nor duplicated by a Python-level loop:
+
+    uint8_<n>.bin   i % 256                 (array_echo, Go guest)
+    int32_<n>.bin   1, 2, ..., n            (array_sum, Java guest)
+
+Without METAFFI_TEST_INPUT_DIR the same payloads are built in memory.
+
+Writing inputs does not require NumPy; only the "numpy" container does.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+
+ARRAY_CONTAINERS_ENV = "METAFFI_TEST_ARRAY_CONTAINERS"
+ARRAY_SIZES_ENV = "METAFFI_TEST_ARRAY_SIZES"
+LARGE_ARRAY_ITERATIONS_ENV = "METAFFI_TEST_LARGE_ARRAY_ITERATIONS"
+LIST_ARRAY_MAX_SIZE_ENV = "METAFFI_TEST_LIST_ARRAY_MAX_SIZE"
+INPUT_DIR_ENV = "METAFFI_TEST_INPUT_DIR"
+
+DEFAULT_ARRAY_SIZES = (10, 100, 1000, 10000)
+# Sizes above this use METAFFI_TEST_LARGE_ARRAY_ITERATIONS.
+LARGE_ARRAY_THRESHOLD = 10000
+ARRAY_CONTAINERS = ("list", "bytes", "bytearray", "memoryview", "array", "numpy")
+
+# Containers that only make sense for byte (uint8) payloads.
+_BYTE_ONLY_CONTAINERS = frozenset({"bytes", "bytearray"})
+
+_NUMPY_DTYPES = {"B": "uint8", "i": "int32", "q": "int64"}
+_FILE_PREFIX = {"B": "uint8", "i": "int32", "q": "int64"}
+_GEN_CHUNK = 1 << 20  # elements per generation step
+
+
+class InputError(Exception):
+    """Raised on an unknown or unusable input container."""
+
+
+def containers_from_env() -> list[str]:
+    """Additional input containers to measure; empty when the sweep is disabled."""
+    raw = os.environ.get(ARRAY_CONTAINERS_ENV, "").strip()
+    if not raw:
+        return []
+    containers: list[str] = []
+    for part in raw.split(","):
+        name = part.strip().lower()
+        if not name:
+            continue
+        if name not in ARRAY_CONTAINERS:
+            raise InputError(f"{ARRAY_CONTAINERS_ENV}: unknown container {name!r} (expected one of {ARRAY_CONTAINERS})")
+        if name not in containers:
+            containers.append(name)
+    return containers
+
+
+def parse_size(value: Any, what: str) -> int:
+    """Element count from an int, an integral float or a string such as "5e8"."""
+    if isinstance(value, bool):
+        raise InputError(f"{what} must be a positive integer, got {value!r}")
+    try:
+        number = float(value) if isinstance(value, str) else value
+    except ValueError as e:
+        raise InputError(f"{what} must be a positive integer, got {value!r}") from e
+    if not isinstance(number, (int, float)) or number != int(number) or int(number) < 1:
+        raise InputError(f"{what} must be a positive integer, got {value!r}")
+    return int(number)
+
+
+def array_sizes_from_env() -> list[int]:
+    raw = os.environ.get(ARRAY_SIZES_ENV, "").strip()
+    if not raw:
+        return list(DEFAULT_ARRAY_SIZES)
+    return [parse_size(part.strip(), ARRAY_SIZES_ENV) for part in raw.split(",") if part.strip()]
+
+
+def array_iterations(size: int, warmup: int, iterations: int) -> tuple[int, int]:
+    """(warmup, iterations) for one array size: large sizes use the large-array budget."""
+    if size <= LARGE_ARRAY_THRESHOLD:
+        return warmup, iterations
+    raw = os.environ.get(LARGE_ARRAY_ITERATIONS_ENV, "").strip()
+    large = parse_size(raw, LARGE_ARRAY_ITERATIONS_ENV) if raw else iterations
+    return min(warmup, large), large
+
+
+def element_size(typecode: str) -> int:
+    return array(typecode).itemsize
+
+
+def expected_ascending_sum(size: int, bits: int = 64) -> int:
+    """sum(1..size) as returned by a signed `bits`-wide accumulator (Java int wraps)."""
+    total = size * (size + 1) // 2
+    mod = 1 << bits
+    total %= mod
+    return total - mod if total >= mod >> 1 else total
+
+
+def _pattern_chunks(typecode: str, size: int) -> Iterable[bytes]:
+    """Little-endian payload of `size` elements in chunks: i % 256 for uint8, i + 1 otherwise."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    for start in range(0, size, _GEN_CHUNK):
+        stop = min(size, start + _GEN_CHUNK)
+        if typecode == "B":
+            # chunk starts are multiples of 256, so the pattern restarts at 0
+            block = bytes(range(256)) * ((stop - start + 255) // 256)
+            yield block[: stop - start]
+        elif np is not None:
+            yield np.arange(start + 1, stop + 1, dtype=np.dtype(_NUMPY_DTYPES[typecode]).newbyteorder("<")).tobytes()
+        else:
+            chunk = array(typecode, range(start + 1, stop + 1))
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            yield chunk.tobytes()
+
+
+def input_file(input_dir: str | Path, typecode: str, size: int) -> Path:
+    """Generate (once) the payload file for typecode/size under input_dir and return its path."""
+    if typecode not in _FILE_PREFIX:
+        raise InputError(f"No input pattern for array typecode {typecode!r}")
+    path = Path(input_dir) / f"{_FILE_PREFIX[typecode]}_{size}.bin"
+    expected_bytes = size * element_size(typecode)
+    if path.is_file() and path.stat().st_size == expected_bytes:
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        for chunk in _pattern_chunks(typecode, size):
+            f.write(chunk)
+    os.replace(tmp, path)
+    return path
+
+
+def array_payload(typecode: str, size: int) -> Sequence[int]:
+    """The standard payload for typecode/size (see module docstring).
+
+    With METAFFI_TEST_INPUT_DIR set this is a writable memoryview over a
+    copy-on-write mapping of the shared input file; otherwise an array.array.
+    """
+    input_dir = os.environ.get(INPUT_DIR_ENV, "").strip()
+    if not input_dir:
+        return array(typecode, b"".join(_pattern_chunks(typecode, size)))
+    path = input_file(input_dir, typecode, size)
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped).cast(typecode)
+    if sys.byteorder != "little" and typecode != "B":
+        swapped = array(typecode, view)
+        swapped.byteswap()
+        return swapped
+    return view
+
+
+def supports(container: str, typecode: str) -> bool:
+    """True when container can carry elements of array typecode."""
+    return typecode == "B" or container not in _BYTE_ONLY_CONTAINERS
+
+
+def supports_size(container: str, size: int) -> bool:
+    """False for list inputs above METAFFI_TEST_LIST_ARRAY_MAX_SIZE."""
+    if container != "list":
+        return True
+    raw = os.environ.get(LIST_ARRAY_MAX_SIZE_ENV, "").strip()
+    return not raw or size <= parse_size(raw, LIST_ARRAY_MAX_SIZE_ENV)
+
+
+def container_scenario(scenario: str, container: str, default: str) -> str:
+    """Scenario name for one container: the plain name for the harness default."""
+    return scenario if container == default else f"{scenario}_{container}"
+
+
+def make_array_input(container: str, values: array | memoryview) -> Any:
+    """Build the call argument for `values` (an array_payload) in the given container.
+
+    memoryview and numpy share the buffer of `values` (no copy), as does array
+    when `values` already is one; list, bytes and bytearray are materialized
+    once, outside the timed loop.
+    """
+    typecode = values.typecode if isinstance(values, array) else values.format
+    if container == "list":
+        return values.tolist()
+    if container == "array":
+        return values if isinstance(values, array) else array(typecode, values)
+    if container == "memoryview":
+        return memoryview(values)
+    if container in _BYTE_ONLY_CONTAINERS:
+        if typecode != "B":
+            raise InputError(f"{container} input requires uint8 elements, got array typecode {typecode!r}")
+        return bytes(values) if container == "bytes" else bytearray(values)
+    if container == "numpy":
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise InputError("numpy input container selected but NumPy is not installed") from e
+        if typecode not in _NUMPY_DTYPES:
+            raise InputError(f"No NumPy dtype for array typecode {typecode!r}")
+        return np.frombuffer(values, dtype=_NUMPY_DTYPES[typecode])
+    raise InputError(f"Unknown input container {container!r}")
@@ -0,0 +1,203 @@
+"""
+Process memory probes shared by the Python harnesses.
+
+Readings are best effort and platform specific; a probe returns None where
+the platform offers no cheap equivalent:
+
+    current_rss_bytes()   Linux /proc/self/statm, Windows WorkingSetSize
+    peak_rss_bytes()      getrusage ru_maxrss (POSIX), Windows PeakWorkingSetSize
+    hwm_bytes()           Linux /proc/self/status VmHWM, Windows PeakWorkingSetSize
+
+Every Python benchmark entry carries a "memory" section built from these
+(memory_before() ahead of warmup, scenario_memory() after the measured loop):
+
+    rss_before_bytes / rss_after_bytes / rss_growth_bytes
+    peak_rss_bytes                process peak after the scenario
+    hwm_delta_bytes               VmHWM growth during the scenario
+    py_alloc_bytes_per_call       median tracemalloc peak of one call
+    py_retained_bytes_per_call    tracemalloc growth over the probe, per call
+    probe_calls
+
+The tracemalloc figures come from a separate, untimed pass of
+METAFFI_TEST_MEMORY_PROBE_CALLS calls (0 skips it), so tracing never touches
+the timed samples. tracemalloc sees only allocations made through Python's
+allocators; copies made inside the guest runtime show up in RSS and VmHWM.
+
+Stdlib only: harness environments do not need psutil.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+
+MEMORY_PROBE_CALLS_ENV = "METAFFI_TEST_MEMORY_PROBE_CALLS"
+DEFAULT_MEMORY_PROBE_CALLS = 100
+
+# Section keys merged as the maximum over repeats; the rest are medians.
+_MAX_KEYS = frozenset({"peak_rss_bytes", "hwm_delta_bytes", "probe_calls"})
+
+
+class MemoryProbeError(Exception):
+    """Raised on an invalid memory probe configuration."""
+
+
+def probe_calls_from_env() -> int:
+    raw = os.environ.get(MEMORY_PROBE_CALLS_ENV, "").strip()
+    if not raw:
+        return DEFAULT_MEMORY_PROBE_CALLS
+    try:
+        calls = int(raw)
+    except ValueError as e:
+        raise MemoryProbeError(f"{MEMORY_PROBE_CALLS_ENV} must be an integer, got {raw!r}") from e
+    if calls < 0:
+        raise MemoryProbeError(f"{MEMORY_PROBE_CALLS_ENV} must be >= 0, got {calls}")
+    return calls
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None where it cannot be read."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        return counters.WorkingSetSize if counters is not None else None
+    return None
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, or None where it cannot be read."""
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        return counters.PeakWorkingSetSize if counters is not None else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def hwm_bytes() -> int | None:
+    """Resident high-water mark (VmHWM) of this process, or None where it cannot be read."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024  # kB
+        except (OSError, ValueError, IndexError):
+            return None
+        return None
+    if sys.platform == "win32":
+        return peak_rss_bytes()
+    return None
+
+
+def memory_before() -> dict[str, int | None]:
+    """Readings taken before a scenario's warmup; pass to scenario_memory()."""
+    return {"rss_bytes": current_rss_bytes(), "hwm_bytes": hwm_bytes()}
+
+
+def _delta(after: int | None, before: int | None) -> int | None:
+    return after - before if after is not None and before is not None else None
+
+
+def python_allocations(bench_fn: Callable[[], Any], calls: int) -> tuple[int, int]:
+    """(median per-call tracemalloc peak, retained bytes per call) over `calls` untimed calls."""
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        peaks = []
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            bench_fn()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return round(statistics.median(peaks)), round(retained / calls)
+
+
+def scenario_memory(before: dict[str, int | None], bench_fn: Callable[[], Any], probe_calls: int) -> dict[str, Any]:
+    """The "memory" section of one benchmark entry (see module docstring).
+
+    RSS and VmHWM are read before the tracemalloc pass, which allocates for
+    its own bookkeeping.
+    """
+    rss_after = current_rss_bytes()
+    section: dict[str, Any] = {
+        "rss_before_bytes": before["rss_bytes"],
+        "rss_after_bytes": rss_after,
+        "rss_growth_bytes": _delta(rss_after, before["rss_bytes"]),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "hwm_delta_bytes": _delta(hwm_bytes(), before["hwm_bytes"]),
+        "py_alloc_bytes_per_call": None,
+        "py_retained_bytes_per_call": None,
+        "probe_calls": probe_calls,
+    }
+    if probe_calls > 0:
+        section["py_alloc_bytes_per_call"], section["py_retained_bytes_per_call"] = python_allocations(
+            bench_fn, probe_calls
+        )
+    return section
+
+
+def merge_memory(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the memory sections of one scenario across repeats.
+
+    High-water marks (and probe_calls) take the maximum, everything else the
+    median of the repeats that reported it.
+    """
+    sections = [s for s in sections if isinstance(s, dict)]
+    if not sections:
+        return None
+    merged: dict[str, Any] = {}
+    for key in sections[0]:
+        values = [s[key] for s in sections if isinstance(s.get(key), (int, float))]
+        if not values:
+            merged[key] = None
+        elif key in _MAX_KEYS:
+            merged[key] = max(values)
+        else:
+            merged[key] = round(statistics.median(values))
+    return merged
+
+
+def _win_memory_counters() -> Any:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.WinDLL("kernel32")
+    psapi = ctypes.WinDLL("psapi")
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    ok = psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+    return counters if ok else None
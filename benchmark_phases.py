@@ -0,0 +1,251 @@
+"""
+Phase breakdown (marshal / call / unmarshal) for the Python3 MetaFFI harnesses.
+
+The timed loop only yields phases.total. With
+
+    METAFFI_TEST_PHASE_PROBE_CALLS=1000       (0, the default, disables it)
+
+python3/call_go and python3/call_java run an extra, untimed pass of that many
+calls per scenario under sys.monitoring (Python 3.12+) and take three
+timestamps around every MetaFFI call:
+
+    t0  entry of the Python SDK wrapper (PY_START of a frame in the metaffi package)
+    t1  just before the XLLR xcall (CALL of the native function named *xcall*)
+    t2  just after it (C_RETURN / C_RAISE of that call)
+    t3  exit of the SDK wrapper (PY_RETURN / PY_UNWIND)
+
+    marshal = t1 - t0     Python-side argument handling before the xcall
+    call    = t2 - t1     the native xcall: CDTS work done in native code,
+                          cross-runtime dispatch and the guest function
+    unmarshal = t3 - t2   Python-side return value handling
+
+A scenario that makes several MetaFFI calls per iteration (object, callback)
+sums them per iteration, so the phases add up to the instrumented iteration.
+If the SDK calls the xcall without a Python wrapper frame, marshal and
+unmarshal are 0.
+
+The wrapper code objects and xcall call sites are discovered from one traced
+call; the measured pass then enables events on those code objects only.
+Each phase still includes about one monitoring callback, so the probe is for
+attribution; compare phases.total against the untimed-loop numbers, not
+against the sum of the phases.
+
+Benchmark entries get phases.marshal/call/unmarshal (summary statistics),
+"raw_phase_ns" (the per-iteration samples, pooled over repeats by the runner)
+and "phase_probe" (calls, wrapper and xcall names).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Any, Callable
+
+from benchmark_stats import summarize
+
+
+PHASE_PROBE_CALLS_ENV = "METAFFI_TEST_PHASE_PROBE_CALLS"
+PHASES = ("marshal", "call", "unmarshal")
+
+# sys.monitoring tool slot; PROFILER_ID is reserved for profilers like this one.
+_TOOL_NAME = "metaffi-phase-probe"
+
+
+class PhaseProbeError(Exception):
+    """Raised when the phase probe is misconfigured or cannot find the xcall."""
+
+
+def phase_probe_calls_from_env() -> int:
+    raw = os.environ.get(PHASE_PROBE_CALLS_ENV, "").strip()
+    if not raw:
+        return 0
+    try:
+        calls = int(raw)
+    except ValueError as e:
+        raise PhaseProbeError(f"{PHASE_PROBE_CALLS_ENV} must be an integer, got {raw!r}") from e
+    if calls < 0:
+        raise PhaseProbeError(f"{PHASE_PROBE_CALLS_ENV} must be >= 0, got {calls}")
+    if calls and not hasattr(sys, "monitoring"):
+        raise PhaseProbeError(
+            f"{PHASE_PROBE_CALLS_ENV}={calls} needs sys.monitoring (Python 3.12+), "
+            f"running Python {sys.version_info.major}.{sys.version_info.minor}"
+        )
+    return calls
+
+
+def _callable_name(fn: Any) -> str:
+    return getattr(fn, "__qualname__", None) or getattr(fn, "__name__", None) or type(fn).__name__
+
+
+def _is_xcall(fn: Any) -> bool:
+    return not hasattr(fn, "__code__") and "xcall" in _callable_name(fn).lower()
+
+
+class _Tool:
+    """Claims the profiler tool id for the lifetime of a with-block."""
+
+    def __init__(self) -> None:
+        self.mon = sys.monitoring
+        self.tool = self.mon.PROFILER_ID
+
+    def __enter__(self) -> "_Tool":
+        current = self.mon.get_tool(self.tool)
+        if current is not None:
+            raise PhaseProbeError(f"sys.monitoring profiler slot is taken by {current!r}")
+        self.mon.use_tool_id(self.tool, _TOOL_NAME)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.mon.set_events(self.tool, 0)
+        for event in (self.mon.events.PY_START, self.mon.events.PY_RETURN, self.mon.events.PY_UNWIND,
+                      self.mon.events.CALL, self.mon.events.C_RETURN, self.mon.events.C_RAISE):
+            self.mon.register_callback(self.tool, event, None)
+        self.mon.free_tool_id(self.tool)
+
+
+def _discover(bench_fn: Callable[[], Any], sdk_root: str) -> tuple[set[Any], dict[Any, set[int]], set[str]]:
+    """Trace one call: SDK wrapper code objects, xcall call sites and xcall names."""
+    wrappers: set[Any] = set()
+    sites: dict[Any, set[int]] = {}
+    names: set[str] = set()
+    depth = 0
+
+    def in_sdk(code: Any) -> bool:
+        return os.path.abspath(code.co_filename).startswith(sdk_root + os.sep)
+
+    def on_start(code: Any, offset: int) -> None:
+        nonlocal depth
+        if in_sdk(code):
+            if depth == 0:
+                wrappers.add(code)
+            depth += 1
+
+    def on_exit(code: Any, offset: int, _value: Any) -> None:
+        nonlocal depth
+        if in_sdk(code):
+            depth -= 1
+
+    def on_call(code: Any, offset: int, fn: Any, _arg0: Any) -> None:
+        if _is_xcall(fn):
+            sites.setdefault(code, set()).add(offset)
+            names.add(_callable_name(fn))
+
+    with _Tool() as t:
+        ev = t.mon.events
+        t.mon.register_callback(t.tool, ev.PY_START, on_start)
+        t.mon.register_callback(t.tool, ev.PY_RETURN, on_exit)
+        t.mon.register_callback(t.tool, ev.PY_UNWIND, on_exit)
+        t.mon.register_callback(t.tool, ev.CALL, on_call)
+        t.mon.set_events(t.tool, ev.PY_START | ev.PY_RETURN | ev.PY_UNWIND | ev.CALL)
+        bench_fn()
+
+    if not sites:
+        raise PhaseProbeError(
+            "no native call named *xcall* observed during one benchmark call; "
+            "the MetaFFI Python SDK no longer matches the phase probe"
+        )
+    return wrappers, sites, names
+
+
+def probe_phases(bench_fn: Callable[[], Any], calls: int, sdk_root: str) -> dict[str, Any]:
+    """Run `calls` untimed, instrumented iterations of bench_fn.
+
+    Returns {"raw_phase_ns": {phase: [ns per iteration]}, "phase_probe": {...}}.
+    sdk_root is the directory of the metaffi package.
+    """
+    sdk_root = os.path.abspath(sdk_root)
+    wrappers, sites, names = _discover(bench_fn, sdk_root)
+    clock = time.perf_counter_ns
+    acc = [0, 0, 0]
+    # wrapper depth, xcall depth, t0 (wrapper entry or last xcall return), t1 (xcall start)
+    state = [0, 0, 0, 0]
+
+    def on_start(code: Any, offset: int) -> None:
+        if code in wrappers and state[1] == 0:
+            if state[0] == 0:
+                state[2] = clock()
+            state[0] += 1
+
+    def on_exit(code: Any, offset: int, _value: Any) -> None:
+        if code in wrappers and state[1] == 0:
+            state[0] -= 1
+            if state[0] == 0:
+                acc[2] += clock() - state[2]
+
+    def on_call(code: Any, offset: int, fn: Any, _arg0: Any) -> None:
+        if offset in sites.get(code, ()) and state[1] == 0:
+            now = clock()
+            if state[0]:
+                acc[0] += now - state[2]
+            state[1] = 1
+            state[3] = now
+
+    def on_c_exit(code: Any, offset: int, fn: Any, _arg0: Any) -> None:
+        if state[1] and offset in sites.get(code, ()):
+            now = clock()
+            acc[1] += now - state[3]
+            state[1] = 0
+            state[2] = now
+
+    raw: dict[str, list[int]] = {phase: [] for phase in PHASES}
+    with _Tool() as t:
+        ev = t.mon.events
+        t.mon.register_callback(t.tool, ev.PY_START, on_start)
+        t.mon.register_callback(t.tool, ev.PY_RETURN, on_exit)
+        t.mon.register_callback(t.tool, ev.PY_UNWIND, on_exit)
+        t.mon.register_callback(t.tool, ev.CALL, on_call)
+        t.mon.register_callback(t.tool, ev.C_RETURN, on_c_exit)
+        t.mon.register_callback(t.tool, ev.C_RAISE, on_c_exit)
+        # PY_UNWIND cannot be enabled per code object; it only fires when an exception leaves a frame.
+        t.mon.set_events(t.tool, ev.PY_UNWIND)
+        for code in wrappers:
+            t.mon.set_local_events(t.tool, code, ev.PY_START | ev.PY_RETURN)
+        for code in sites:
+            extra = ev.PY_START | ev.PY_RETURN if code in wrappers else 0
+            t.mon.set_local_events(t.tool, code, ev.CALL | ev.C_RETURN | ev.C_RAISE | extra)
+        try:
+            for i in range(calls):
+                acc[:] = [0, 0, 0]
+                state[:] = [0, 0, 0, 0]
+                try:
+                    bench_fn()
+                except Exception as e:
+                    raise RuntimeError(f"phase probe iteration {i}: {e}") from e
+                if not wrappers:
+                    # xcall made straight from non-SDK code: nothing Python-side to attribute
+                    acc[0] = acc[2] = 0
+                for phase, value in zip(PHASES, acc):
+                    raw[phase].append(value)
+        finally:
+            for code in set(wrappers) | set(sites):
+                t.mon.set_local_events(t.tool, code, 0)
+
+    return {
+        "raw_phase_ns": raw,
+        "phase_probe": {
+            "calls": calls,
+            "wrappers": sorted(f"{os.path.basename(c.co_filename)}:{c.co_qualname}" for c in wrappers),
+            "xcall": sorted(names),
+        },
+    }
+
+
+def phase_stats(raw_phase_ns: dict[str, list[int]]) -> dict[str, dict[str, Any]]:
+    """phases.<phase> summaries for the samples of probe_phases()."""
+    return {phase: summarize(raw_phase_ns[phase]) for phase in PHASES if raw_phase_ns.get(phase)}
+
+
+def merge_phases(entries: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Pool the phase samples of one scenario across repeats.
+
+    Returns {"phases": {...}, "raw_phase_ns": {...}, "phase_probe": {...}} or
+    None unless every repeat carries samples.
+    """
+    raws = [e.get("raw_phase_ns") for e in entries]
+    if not raws or not all(isinstance(r, dict) for r in raws):
+        return None
+    pooled = {phase: [v for r in raws for v in r.get(phase, [])] for phase in PHASES}
+    probe = dict(entries[0].get("phase_probe") or {})
+    probe["calls"] = sum((e.get("phase_probe") or {}).get("calls", 0) for e in entries)
+    return {"phases": phase_stats(pooled), "raw_phase_ns": pooled, "phase_probe": probe}
@@ -0,0 +1,177 @@
+"""
+Measured-iteration policy shared by the Python harnesses (Go and Java harnesses mirror it).
+
+By default every scenario takes METAFFI_TEST_ITERATIONS samples. With
+
+    METAFFI_TEST_PRECISION_TARGET=0.01            relative CI half-width (0 disables)
+    METAFFI_TEST_PRECISION_BLOCK=1000             samples per block
+    METAFFI_TEST_PRECISION_MAX_ITERATIONS=100000  sample cap per scenario
+    METAFFI_TEST_PRECISION_MAX_SECONDS=60         measurement time cap per scenario
+
+samples are taken in blocks until the 95% confidence interval of the median
+(of the IQR-cleaned samples, the median the summaries report) is within
++/- target of that median, or one of the caps is reached. The interval is the
+distribution-free order-statistic one (benchmark_stats.median_ci), so noisy,
+skewed scenarios get more samples and stable ones stop after one block.
+
+Array scenarios above benchmark_inputs.LARGE_ARRAY_THRESHOLD elements keep
+their fixed (large-array) iteration count.
+
+Every benchmark entry records a "precision" section:
+
+    {"mode": "target", "target": 0.01, "iterations": 3000, "blocks": 3,
+     "half_width_rel": 0.0087, "met": true, "stop": "target"}
+
+"stop" is "target", "max_iterations" or "time_budget" ("iterations" in fixed
+mode, where target and met are null; half_width_rel is still reported). The
+runner merges repeats with merge_precision().
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from benchmark_inputs import LARGE_ARRAY_THRESHOLD
+from benchmark_stats import median_ci
+
+
+PRECISION_TARGET_ENV = "METAFFI_TEST_PRECISION_TARGET"
+PRECISION_BLOCK_ENV = "METAFFI_TEST_PRECISION_BLOCK"
+PRECISION_MAX_ITERATIONS_ENV = "METAFFI_TEST_PRECISION_MAX_ITERATIONS"
+PRECISION_MAX_SECONDS_ENV = "METAFFI_TEST_PRECISION_MAX_SECONDS"
+
+DEFAULT_BLOCK_ITERATIONS = 1000
+DEFAULT_MAX_ITERATIONS = 100000
+DEFAULT_MAX_SECONDS = 60
+
+
+class PrecisionError(Exception):
+    """Raised on an invalid precision configuration."""
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as e:
+        raise PrecisionError(f"{name} must be an integer, got {raw!r}") from e
+    if value < 1:
+        raise PrecisionError(f"{name} must be >= 1, got {value}")
+    return value
+
+
+@dataclass(frozen=True)
+class PrecisionSettings:
+    target: float = 0.0
+    block_iterations: int = DEFAULT_BLOCK_ITERATIONS
+    max_iterations: int = DEFAULT_MAX_ITERATIONS
+    max_seconds: int = DEFAULT_MAX_SECONDS
+
+    @classmethod
+    def from_env(cls) -> "PrecisionSettings":
+        raw = os.environ.get(PRECISION_TARGET_ENV, "").strip()
+        try:
+            target = float(raw) if raw else 0.0
+        except ValueError as e:
+            raise PrecisionError(f"{PRECISION_TARGET_ENV} must be a number, got {raw!r}") from e
+        if not 0 <= target < 1:
+            raise PrecisionError(f"{PRECISION_TARGET_ENV} must be in [0, 1), got {target}")
+        return cls(
+            target=target,
+            block_iterations=_env_int(PRECISION_BLOCK_ENV, DEFAULT_BLOCK_ITERATIONS),
+            max_iterations=_env_int(PRECISION_MAX_ITERATIONS_ENV, DEFAULT_MAX_ITERATIONS),
+            max_seconds=_env_int(PRECISION_MAX_SECONDS_ENV, DEFAULT_MAX_SECONDS),
+        )
+
+    def as_config(self) -> dict[str, Any]:
+        return {
+            "precision_target": self.target,
+            "precision_block_iterations": self.block_iterations,
+            "precision_max_iterations": self.max_iterations,
+            "precision_max_seconds": self.max_seconds,
+        }
+
+
+def relative_half_width(samples: Sequence[float]) -> float:
+    """Half-width of the median's 95% CI relative to the median (IQR-cleaned samples)."""
+    low, median, high = median_ci(samples)
+    if median <= 0:
+        return 0.0
+    return (high - low) / (2 * median)
+
+
+class PrecisionSampler:
+    """Decides how many samples one scenario takes.
+
+    The harness calls next_block(samples) before every block and appends that
+    many samples; 0 means measurement is done and info() holds the section.
+    """
+
+    def __init__(self, settings: PrecisionSettings, data_size: int | None, iterations: int):
+        self.settings = settings
+        self.adaptive = settings.target > 0 and (data_size is None or data_size <= LARGE_ARRAY_THRESHOLD)
+        self.block = settings.block_iterations if self.adaptive else iterations
+        self.max_iterations = settings.max_iterations if self.adaptive else iterations
+        self.blocks = 0
+        self.iterations = 0
+        self.half_width: float | None = None
+        self.stop: str | None = None
+        self._deadline = 0.0
+
+    def next_block(self, samples: Sequence[float]) -> int:
+        n = len(samples)
+        if n == 0:
+            self._deadline = time.monotonic() + self.settings.max_seconds
+        else:
+            self.blocks += 1
+            self.half_width = relative_half_width(samples)
+            if not self.adaptive:
+                self.stop = "iterations"
+            elif self.half_width <= self.settings.target:
+                self.stop = "target"
+            elif n >= self.max_iterations:
+                self.stop = "max_iterations"
+            elif time.monotonic() >= self._deadline:
+                self.stop = "time_budget"
+            if self.stop is not None:
+                self.iterations = n
+                return 0
+        return min(self.block, self.max_iterations - n)
+
+    def info(self) -> dict[str, Any]:
+        target = self.settings.target if self.adaptive else None
+        return {
+            "mode": "target" if self.adaptive else "fixed",
+            "target": target,
+            "iterations": self.iterations,
+            "blocks": self.blocks,
+            "half_width_rel": self.half_width,
+            "met": self.half_width <= target if target is not None else None,
+            "stop": self.stop,
+        }
+
+
+def merge_precision(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the precision sections of one scenario across repeats.
+
+    half_width_rel is the worst repeat; met is true only if every targeted
+    repeat met the target.
+    """
+    sections = [s for s in sections if isinstance(s, dict)]
+    if not sections:
+        return None
+    widths = [s["half_width_rel"] for s in sections if isinstance(s.get("half_width_rel"), (int, float))]
+    met = [s["met"] for s in sections if isinstance(s.get("met"), bool)]
+    return {
+        "mode": sections[0].get("mode"),
+        "target": sections[0].get("target"),
+        "iterations_per_repeat": [s.get("iterations") for s in sections],
+        "half_width_rel": max(widths) if widths else None,
+        "met": all(met) if met else None,
+        "stop_per_repeat": [s.get("stop") for s in sections],
+    }
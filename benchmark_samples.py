@@ -0,0 +1,322 @@
+"""
+Raw-sample storage for benchmark result files.
+
+By default every benchmark entry carries its per-iteration samples inline as JSON
+integer lists (`raw_iterations_ns`, `raw_batch_calls`). With the opt-in `npy`
+format (METAFFI_TEST_RAW_FORMAT=npy, or outputs.raw_sample_format in the runner
+config) each list is written to a little-endian int64 `.npy` sidecar next to the
+result file and the JSON keeps only a reference:
+
+    "raw_iterations_ns_file": {
+        "path": "python3_to_go_metaffi.raw/void_call.raw_iterations_ns.npy",
+        "length": 10000,
+        "dtype": "<i8",
+        "sha256": "..."
+    }
+
+`path` is relative to the directory of the JSON file that references it.
+Readers (runner, consolidate_results.py, generate_report.py) open sidecars through
+memory mapping (np.load(mmap_mode="r"), or mmap + memoryview without NumPy), so
+no text is parsed.
+
+Writing does not require NumPy; harness environments only need the stdlib.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # stdlib-only fallback
+    np = None
+
+
+RAW_FORMAT_ENV = "METAFFI_TEST_RAW_FORMAT"
+RAW_FORMATS = ("json", "npy")
+
+# Per-sample fields that may be moved into sidecars.
+SAMPLE_FIELDS = ("raw_iterations_ns", "raw_batch_calls")
+
+NPY_MAGIC = b"\x93NUMPY"
+NPY_DTYPE = "<i8"
+
+
+class SampleFileError(Exception):
+    """Raised when a sidecar is missing, malformed, or does not match its reference."""
+
+
+def raw_format_from_env() -> str:
+    fmt = os.environ.get(RAW_FORMAT_ENV, "json").strip().lower() or "json"
+    if fmt not in RAW_FORMATS:
+        raise SampleFileError(f"{RAW_FORMAT_ENV} must be one of {RAW_FORMATS}, got {fmt!r}")
+    return fmt
+
+
+def sidecar_dir(result_path: str | Path) -> Path:
+    """Directory holding the sidecars of one result JSON file."""
+    p = Path(result_path)
+    return p.parent / f"{p.stem}.raw"
+
+
+def scenario_file_key(bench: dict[str, Any]) -> str:
+    scenario = str(bench["scenario"])
+    data_size = bench.get("data_size")
+    return f"{scenario}_{data_size}" if data_size is not None else scenario
+
+
+def file_ref_key(field: str) -> str:
+    return f"{field}_file"
+
+
+def _npy_header(length: int) -> bytes:
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (NPY_DTYPE, length)
+    # Pad so that the data starts on a 64-byte boundary (NPY format 1.0).
+    total = len(NPY_MAGIC) + 2 + 2 + len(header) + 1
+    header += " " * ((64 - total % 64) % 64) + "\n"
+    return NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _as_int64_bytes(values: Iterable[float]) -> tuple[bytes, int]:
+    if np is not None:
+        arr = np.asarray(values)
+        if arr.dtype.kind == "f":
+            arr = np.rint(arr)
+        arr = arr.astype(NPY_DTYPE, copy=False)
+        return arr.tobytes(), int(arr.size)
+    arr = array("q", (int(round(v)) for v in values))
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes(), len(arr)
+
+
+def write_npy(path: Path, values: Iterable[float]) -> dict[str, Any]:
+    """Write values as a 1-D little-endian int64 .npy file; return length and sha256."""
+    data, length = _as_int64_bytes(values)
+    blob = _npy_header(length) + data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    return {"length": length, "dtype": NPY_DTYPE, "sha256": hashlib.sha256(blob).hexdigest()}
+
+
+class NpySampleWriter:
+    """Write a 1-D '<i8' .npy file incrementally when the total length is known upfront.
+
+    Used by streaming aggregation so that pooled samples never exist as one array.
+    """
+
+    def __init__(self, path: Path, length: int):
+        self.path = path
+        self.length = length
+        self._written = 0
+        self._sha = hashlib.sha256()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._f = open(self._tmp, "wb")
+        self._write(_npy_header(length))
+
+    def _write(self, blob: bytes) -> None:
+        self._f.write(blob)
+        self._sha.update(blob)
+
+    def append(self, values: Iterable[float]) -> None:
+        data, n = _as_int64_bytes(values)
+        if self._written + n > self.length:
+            raise SampleFileError(f"{self.path}: more than the declared {self.length} samples appended")
+        self._write(data)
+        self._written += n
+
+    def finish(self) -> dict[str, Any]:
+        """Complete the temporary file without publishing it; return its length, dtype and sha256.
+
+        commit() moves it to `path`, so a caller can publish the sidecar only once
+        the result file that references it has been written.
+        """
+        self._f.close()
+        if self._written != self.length:
+            os.remove(self._tmp)
+            raise SampleFileError(f"{self.path}: {self._written} samples appended, {self.length} declared")
+        return {"length": self.length, "dtype": NPY_DTYPE, "sha256": self._sha.hexdigest()}
+
+    def commit(self) -> None:
+        os.replace(self._tmp, self.path)
+
+    def close(self) -> dict[str, Any]:
+        """Finish the file, publish it and return its length, dtype and sha256."""
+        meta = self.finish()
+        self.commit()
+        return meta
+
+    def abort(self) -> None:
+        self._f.close()
+        if self._tmp.exists():
+            os.remove(self._tmp)
+
+
+def sidecar_path(result_path: str | Path, bench: dict[str, Any], field: str) -> Path:
+    """Location of the sidecar holding `field` of `bench` for a given result file."""
+    return sidecar_dir(result_path) / f"{scenario_file_key(bench)}.{field}.npy"
+
+
+def externalize_raw_samples(
+    result: dict[str, Any],
+    result_path: str | Path,
+    fmt: str | None = None,
+    staged: list[NpySampleWriter] | None = None,
+) -> None:
+    """Move inline per-sample lists of every benchmark into sidecars (fmt == "npy").
+
+    With fmt == "json" the result is left untouched. Entries that already
+    reference a sidecar are kept as they are. With `staged`, each sidecar is
+    finished but not published: its writer is appended to `staged` for the
+    caller to commit() once the result file is written (or abort()).
+    """
+    fmt = raw_format_from_env() if fmt is None else fmt
+    if fmt not in RAW_FORMATS:
+        raise SampleFileError(f"Unsupported raw sample format {fmt!r}")
+    if fmt == "json":
+        return
+
+    result_path = Path(result_path)
+    for bench in result.get("benchmarks") or []:
+        if not isinstance(bench, dict) or "scenario" not in bench:
+            continue
+        for field in SAMPLE_FIELDS:
+            values = bench.get(field)
+            if values is None:
+                continue
+            path = sidecar_path(result_path, bench, field)
+            ref = {"path": path.relative_to(result_path.parent).as_posix()}
+            if staged is None:
+                ref.update(write_npy(path, values))
+            else:
+                writer = NpySampleWriter(path, len(values))
+                staged.append(writer)
+                writer.append(values)
+                ref.update(writer.finish())
+            bench[file_ref_key(field)] = ref
+            del bench[field]
+
+
+def _parse_npy_header(buf: Any, path: Path) -> tuple[int, int]:
+    """Return (data_offset, length) of a 1-D '<i8' .npy buffer."""
+    if bytes(buf[:6]) != NPY_MAGIC:
+        raise SampleFileError(f"Not an .npy file: {path}")
+    major = buf[6]
+    if major == 1:
+        (hlen,) = struct.unpack("<H", bytes(buf[8:10]))
+        offset = 10
+    elif major in (2, 3):
+        (hlen,) = struct.unpack("<I", bytes(buf[8:12]))
+        offset = 12
+    else:
+        raise SampleFileError(f"Unsupported .npy version {major} in {path}")
+    try:
+        header = ast.literal_eval(bytes(buf[offset:offset + hlen]).decode("latin1"))
+    except (ValueError, SyntaxError) as e:
+        raise SampleFileError(f"Malformed .npy header in {path}: {e}") from e
+    if header.get("descr") != NPY_DTYPE or header.get("fortran_order") or len(header.get("shape", ())) != 1:
+        raise SampleFileError(f"Expected 1-D {NPY_DTYPE} array in {path}, got {header}")
+    return offset + hlen, int(header["shape"][0])
+
+
+def open_npy(path: Path) -> Sequence[int]:
+    """Memory-map a sidecar. Returns a read-only ndarray or an int64 memoryview."""
+    if not path.is_file():
+        raise SampleFileError(f"Missing raw sample sidecar: {path}")
+    if np is not None:
+        try:
+            arr = np.load(path, mmap_mode="r")
+        except ValueError as e:
+            raise SampleFileError(f"Malformed .npy sidecar {path}: {e}") from e
+        if arr.ndim != 1 or arr.dtype != np.dtype(NPY_DTYPE):
+            raise SampleFileError(f"Expected 1-D {NPY_DTYPE} array in {path}, got {arr.dtype}{arr.shape}")
+        return arr
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SampleFileError(f"Empty raw sample sidecar: {path}")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    offset, length = _parse_npy_header(mm, path)
+    if sys.byteorder != "little":
+        arr = array("q", mm[offset:offset + 8 * length])
+        arr.byteswap()
+        return arr
+    return memoryview(mm)[offset:offset + 8 * length].cast("q")
+
+
+def verify_sha256(path: Path, expected: str) -> None:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            actual = hashlib.sha256(b"").hexdigest()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                actual = hashlib.sha256(mm).hexdigest()
+    if actual != expected:
+        raise SampleFileError(f"Checksum mismatch for raw sample sidecar {path}")
+
+
+def load_samples(
+    bench: dict[str, Any],
+    field: str,
+    base_dir: str | Path,
+    verify: bool = False,
+) -> Sequence[float] | None:
+    """Return the samples of `field` (inline list or memory-mapped sidecar), or None if absent.
+
+    base_dir is the directory of the JSON file containing `bench`.
+    """
+    inline = bench.get(field)
+    if inline is not None:
+        if not isinstance(inline, list):
+            raise SampleFileError(f"{field} must be a list in scenario {bench.get('scenario')!r}")
+        return inline
+
+    ref = bench.get(file_ref_key(field))
+    if ref is None:
+        return None
+    if not isinstance(ref, dict) or not isinstance(ref.get("path"), str) or not isinstance(ref.get("length"), int):
+        raise SampleFileError(f"Malformed {file_ref_key(field)} reference in scenario {bench.get('scenario')!r}")
+
+    path = Path(base_dir) / ref["path"]
+    if verify and isinstance(ref.get("sha256"), str):
+        if not path.is_file():
+            raise SampleFileError(f"Missing raw sample sidecar: {path}")
+        verify_sha256(path, ref["sha256"])
+    samples = open_npy(path)
+    if len(samples) != ref["length"]:
+        raise SampleFileError(
+            f"Sidecar {path} holds {len(samples)} samples, reference says {ref['length']}"
+        )
+    return samples
+
+
+def sample_count(bench: dict[str, Any], field: str = "raw_iterations_ns") -> int:
+    """Number of samples of `field` without opening any sidecar."""
+    inline = bench.get(field)
+    if isinstance(inline, list):
+        return len(inline)
+    ref = bench.get(file_ref_key(field))
+    if isinstance(ref, dict) and isinstance(ref.get("length"), int):
+        return ref["length"]
+    return 0
+
+
+def has_samples(bench: dict[str, Any], field: str) -> bool:
+    """True when `field` is present inline or as a sidecar reference."""
+    return bench.get(field) is not None or file_ref_key(field) in bench
+
+
+def has_sidecars(bench: dict[str, Any]) -> bool:
+    return any(file_ref_key(field) in bench for field in SAMPLE_FIELDS)
@@ -0,0 +1,652 @@
+"""
+Concurrency scaling mode for the Python3 -> Go benchmark harnesses.
+
+In addition to the single-caller scenarios, the MetaFFI, ctypes and gRPC
+harnesses can measure how a call behaves when N caller threads issue it at
+the same time (GIL release, Go scheduler interaction, XLLR locking):
+
+    METAFFI_TEST_SCALING_THREADS=1,2,4,8      worker counts (1 is always measured)
+    METAFFI_TEST_SCALING_PROCESSES=1,2,4      same, one process (and runtime) per worker
+    METAFFI_TEST_SCALING_INFLIGHT=1,8,64,256  gRPC only: outstanding grpc.aio requests
+    METAFFI_TEST_SCALING_DURATION_MS=1000     measured window per worker count
+
+For every worker count all workers warm up, meet on a barrier and then call
+the scenario back-to-back for the measured window, timing every call. The
+result JSON gains a "scaling" section:
+
+    "scaling": {
+        "threads": {
+            "worker_counts": [1, 2, 4, 8],
+            "duration_ms": 1000,
+            "scenarios": [
+                {"scenario": "void_call", "data_size": null, "levels": [
+                    {"workers": 2, "total_ops": ..., "wall_ns": ..., "ops_per_sec": ...,
+                     "efficiency": ...,            # ops_per_sec / (workers * ops_per_sec at 1)
+                     "latency": {mean_ns, median_ns, p95_ns, p99_ns, stddev_ns, ci95_ns},
+                     "per_worker": [{"ops": ..., "latency": {...}}, ...]},
+                    ...]}
+            ]
+        }
+    }
+
+Process scaling ("processes" section, same shape) spawns K worker processes per
+worker count. Every worker runs the harness' setup function (for MetaFFI:
+load_runtime_plugin + load_module in its own interpreter), then all workers
+meet on a shared barrier before each scenario. Each worker hands its samples
+back through a shared-memory block, and the section gains per-process init
+cost and resident set size:
+
+    "process_init": [
+        {"workers": 4, "processes": [
+            {"spawn_ns": ..., "load_runtime_plugin_ns": ..., "load_module_ns": ...,
+             "init_ns": ..., "rss_after_init_bytes": ..., "rss_after_run_bytes": ...,
+             "peak_rss_bytes": ...}, ...]},
+        ...]
+
+spawn_ns is the time from Process.start() to the worker's first instruction;
+init_ns is the wall time of the setup function.
+
+In-flight scaling ("inflight" section, gRPC harnesses only) keeps N requests
+outstanding on one grpc.aio channel from a single event loop: N coroutines each
+issue the next request as soon as their previous one completes. There "workers"
+is the in-flight depth, latency is request issue to completion, and per_worker
+is omitted.
+
+Latencies are per call and are not IQR-cleaned: under contention the tail is
+the measurement. Raw per-call samples are not stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+import traceback
+from array import array
+from multiprocessing import shared_memory
+from typing import Any, Awaitable, Callable, Iterator
+
+from benchmark_memory import current_rss_bytes, peak_rss_bytes
+from benchmark_stats import compute_stats
+
+
+SCALING_THREADS_ENV = "METAFFI_TEST_SCALING_THREADS"
+SCALING_PROCESSES_ENV = "METAFFI_TEST_SCALING_PROCESSES"
+SCALING_INFLIGHT_ENV = "METAFFI_TEST_SCALING_INFLIGHT"
+SCALING_DURATION_ENV = "METAFFI_TEST_SCALING_DURATION_MS"
+DEFAULT_DURATION_MS = 1000
+
+# (scenario, data_size) pairs measured in scaling mode.
+SCALING_SCENARIOS: tuple[tuple[str, int | None], ...] = (
+    ("void_call", None),
+    ("primitive_echo", None),
+    ("array_echo", 1000),
+    ("callback", None),
+)
+
+# (scenario, data_size) pairs measured in in-flight mode; harnesses provide the
+# subset their service implements (the Java service has ArraySum, not EchoBytes).
+INFLIGHT_SCENARIOS: tuple[tuple[str, int | None], ...] = (
+    ("void_call", None),
+    ("primitive_echo", None),
+    ("array_echo", 1000),
+    ("array_sum", 1000),
+    ("any_echo", 100),
+)
+
+# Upper bound on how long workers may take to reach the start barrier.
+_BARRIER_TIMEOUT_S = 120.0
+
+
+class ScalingError(Exception):
+    """Raised on invalid scaling configuration or when a worker fails."""
+
+
+def _parse_counts(env_name: str) -> list[int]:
+    raw = os.environ.get(env_name, "").strip()
+    if not raw:
+        return []
+    counts: set[int] = {1}
+    for part in raw.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            n = int(part)
+        except ValueError as e:
+            raise ScalingError(f"{env_name}: {part!r} is not an integer") from e
+        if n < 1:
+            raise ScalingError(f"{env_name}: worker counts must be >= 1, got {n}")
+        counts.add(n)
+    return sorted(counts)
+
+
+def thread_counts_from_env() -> list[int]:
+    """Worker counts for thread scaling; empty when the mode is disabled."""
+    return _parse_counts(SCALING_THREADS_ENV)
+
+
+def process_counts_from_env() -> list[int]:
+    """Worker counts for process scaling; empty when the mode is disabled."""
+    return _parse_counts(SCALING_PROCESSES_ENV)
+
+
+def inflight_depths_from_env() -> list[int]:
+    """In-flight depths for grpc.aio scaling; empty when the mode is disabled."""
+    return _parse_counts(SCALING_INFLIGHT_ENV)
+
+
+def duration_ns_from_env() -> int:
+    raw = os.environ.get(SCALING_DURATION_ENV, str(DEFAULT_DURATION_MS)).strip()
+    try:
+        ms = int(raw)
+    except ValueError as e:
+        raise ScalingError(f"{SCALING_DURATION_ENV}: {raw!r} is not an integer") from e
+    if ms < 1:
+        raise ScalingError(f"{SCALING_DURATION_ENV} must be >= 1")
+    return ms * 1_000_000
+
+
+def level_entry(workers: int, per_worker: list[tuple[int, int, Any]]) -> dict[str, Any]:
+    """Summarize one worker count from (start_ns, end_ns, latencies) per worker.
+
+    Start/end are perf_counter_ns values of one clock domain (threads, or
+    processes on one host).
+    """
+    wall_ns = max(end for _, end, _ in per_worker) - min(start for start, _, _ in per_worker)
+    total_ops = sum(len(lat) for _, _, lat in per_worker)
+    pooled = array("q")
+    for _, _, lat in per_worker:
+        pooled.extend(lat)
+    return {
+        "workers": workers,
+        "total_ops": total_ops,
+        "wall_ns": wall_ns,
+        "ops_per_sec": total_ops / (wall_ns / 1e9) if wall_ns > 0 else 0.0,
+        "latency": compute_stats(pooled),
+        "per_worker": [{"ops": len(lat), "latency": compute_stats(lat)} for _, _, lat in per_worker],
+    }
+
+
+def add_efficiency(levels: list[dict[str, Any]]) -> None:
+    """Set efficiency = ops_per_sec / (workers * single-worker ops_per_sec) on every level."""
+    base = next((lv["ops_per_sec"] for lv in levels if lv["workers"] == 1), 0.0)
+    for lv in levels:
+        lv["efficiency"] = lv["ops_per_sec"] / (lv["workers"] * base) if base > 0 else None
+
+
+def _timed_window(fn: Callable[[], Any], duration_ns: int) -> tuple[int, int, array]:
+    latencies = array("q")
+    clock = time.perf_counter_ns
+    start = clock()
+    stop = start + duration_ns
+    now = start
+    while now < stop:
+        t0 = clock()
+        fn()
+        now = clock()
+        latencies.append(now - t0)
+    return start, now, latencies
+
+
+def run_thread_level(
+    make_fn: Callable[[], Callable[[], Any]],
+    workers: int,
+    warmup: int,
+    duration_ns: int,
+) -> dict[str, Any]:
+    """Run `workers` threads, each calling its own make_fn() result for duration_ns."""
+    barrier = threading.Barrier(workers)
+    results: list[tuple[int, int, array] | None] = [None] * workers
+    errors: list[BaseException] = []
+
+    def worker(idx: int) -> None:
+        try:
+            fn = make_fn()
+            for _ in range(warmup):
+                fn()
+            barrier.wait(timeout=_BARRIER_TIMEOUT_S)
+            results[idx] = _timed_window(fn, duration_ns)
+        except threading.BrokenBarrierError:
+            pass  # another worker failed; its error is reported
+        except BaseException as e:  # re-raised on the calling thread
+            errors.append(e)
+            barrier.abort()
+
+    threads = [threading.Thread(target=worker, args=(i,), name=f"scaling-{i}") for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise ScalingError(f"thread scaling with {workers} workers failed: {errors[0]}") from errors[0]
+    if any(r is None for r in results):
+        raise ScalingError(f"thread scaling with {workers} workers: start barrier broke")
+    return level_entry(workers, results)  # type: ignore[arg-type]
+
+
+def run_thread_scaling(
+    scenario: str,
+    data_size: int | None,
+    make_fn: Callable[[], Callable[[], Any]],
+    worker_counts: list[int],
+    warmup: int,
+    duration_ns: int,
+) -> dict[str, Any]:
+    """Measure one scenario at every worker count.
+
+    make_fn is called once per worker thread and must return a callable that
+    raises on an incorrect result. Anything the callable mutates (ctypes out
+    parameters, request objects) must be created inside make_fn.
+    """
+    levels = [run_thread_level(make_fn, n, warmup, duration_ns) for n in worker_counts]
+    add_efficiency(levels)
+    return {"scenario": scenario, "data_size": data_size, "levels": levels}
+
+
+def run_thread_scaling_suite(
+    factories: dict[tuple[str, int | None], Callable[[], Callable[[], Any]]],
+    should_run: Callable[[str, int | None], bool],
+    worker_counts: list[int],
+    warmup: int,
+    duration_ns: int,
+) -> dict[str, Any]:
+    """Thread-scale every SCALING_SCENARIOS entry the harness provides a factory for
+    and return the "threads" scaling section."""
+    scenarios = []
+    for name, size in SCALING_SCENARIOS:
+        if (name, size) not in factories or not should_run(name, size):
+            continue
+        scenarios.append(run_thread_scaling(name, size, factories[(name, size)], worker_counts, warmup, duration_ns))
+    print_scaling_summary("threads", scenarios, sys.stderr)
+    return scaling_section(worker_counts, duration_ns, scenarios)
+
+
+# ---------------------------------------------------------------------------
+# Process scaling
+# ---------------------------------------------------------------------------
+
+SetupFn = Callable[[], tuple[dict[str, int], dict[tuple[str, int | None], Callable[[], Callable[[], Any]]]]]
+
+
+def _process_worker(
+    setup: SetupFn,
+    scenarios: list[tuple[str, int | None]],
+    warmup: int,
+    duration_ns: int,
+    barrier: Any,
+    collected: Any,
+    conn: Any,
+) -> None:
+    """Body of one scaling worker process.
+
+    Reports ("ok", report) or ("error", text) on conn, then keeps its shared
+    memory blocks open until the parent has copied them. Exits through
+    os._exit: some runtimes (the Go runtime) crash during interpreter teardown.
+    """
+    entered_ns = time.perf_counter_ns()
+    blocks: list[shared_memory.SharedMemory] = []
+    try:
+        t0 = time.perf_counter_ns()
+        init, factories = setup()
+        init_ns = time.perf_counter_ns() - t0
+        report: dict[str, Any] = {
+            "entered_ns": entered_ns,
+            "init": dict(init, init_ns=init_ns),
+            "rss_after_init_bytes": current_rss_bytes(),
+            "windows": [],
+        }
+        for key in scenarios:
+            if key not in factories:
+                continue  # identical in every worker: all run the same setup
+            fn = factories[key]()
+            for _ in range(warmup):
+                fn()
+            barrier.wait(timeout=_BARRIER_TIMEOUT_S)
+            start, end, latencies = _timed_window(fn, duration_ns)
+            shm = shared_memory.SharedMemory(create=True, size=max(8, 8 * len(latencies)))
+            blocks.append(shm)
+            shm.buf[:8 * len(latencies)] = memoryview(latencies).cast("B")
+            report["windows"].append({
+                "scenario": list(key), "start_ns": start, "end_ns": end,
+                "count": len(latencies), "shm": shm.name,
+            })
+        report["rss_after_run_bytes"] = current_rss_bytes()
+        report["peak_rss_bytes"] = peak_rss_bytes()
+        conn.send(("ok", report))
+        collected.wait(timeout=_BARRIER_TIMEOUT_S)
+    except BaseException:
+        barrier.abort()
+        for shm in blocks:
+            shm.unlink()
+        try:
+            conn.send(("error", traceback.format_exc()))
+        except (OSError, ValueError):
+            pass
+    finally:
+        for shm in blocks:
+            shm.close()
+        conn.close()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
+
+
+def _receive_report(proc: Any, conn: Any, idx: int, workers: int) -> dict[str, Any]:
+    while not conn.poll(0.5):
+        if proc.exitcode is not None and not conn.poll(0):
+            raise ScalingError(
+                f"process scaling with {workers} workers: worker {idx} exited "
+                f"(code {proc.exitcode}) without a report"
+            )
+    status, payload = conn.recv()
+    if status != "ok":
+        raise ScalingError(f"process scaling with {workers} workers: worker {idx} failed:\n{payload}")
+    return payload
+
+
+def _copy_samples(name: str, count: int) -> array:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        latencies = array("q")
+        latencies.frombytes(bytes(shm.buf[:8 * count]))
+    finally:
+        shm.close()
+        shm.unlink()
+    return latencies
+
+
+def _discard_samples(name: str) -> None:
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+@contextlib.contextmanager
+def _without_importtime() -> Iterator[None]:
+    """Keep `-X importtime` (run_all_tests.py --importtime) out of spawned interpreters.
+
+    multiprocessing passes the parent's -X options on to spawned workers and
+    the resource tracker. Their import lines would share the stage's stderr and
+    be counted in its import profile.
+    """
+    value = sys._xoptions.pop("importtime", None)
+    try:
+        yield
+    finally:
+        if value is not None:
+            sys._xoptions["importtime"] = value
+
+
+def run_process_level(
+    setup: SetupFn,
+    scenarios: list[tuple[str, int | None]],
+    workers: int,
+    warmup: int,
+    duration_ns: int,
+) -> tuple[dict[tuple[str, int | None], dict[str, Any]], dict[str, Any]]:
+    """Spawn `workers` processes and measure every scenario with all of them.
+
+    Returns a level entry per measured scenario (scenarios the setup provides
+    no factory for are skipped) and the per-process init record.
+    setup must be a module-level function: it is pickled into spawned
+    interpreters (the default start method on Windows, used everywhere here).
+    """
+    with _without_importtime():
+        return _run_process_level(setup, scenarios, workers, warmup, duration_ns)
+
+
+def _run_process_level(
+    setup: SetupFn,
+    scenarios: list[tuple[str, int | None]],
+    workers: int,
+    warmup: int,
+    duration_ns: int,
+) -> tuple[dict[tuple[str, int | None], dict[str, Any]], dict[str, Any]]:
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    collected = ctx.Event()
+    procs = []
+    spawned_ns = []
+    for idx in range(workers):
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=_process_worker,
+            args=(setup, scenarios, warmup, duration_ns, barrier, collected, send_conn),
+            name=f"scaling-{idx}",
+        )
+        spawned_ns.append(time.perf_counter_ns())
+        proc.start()
+        send_conn.close()
+        procs.append((proc, recv_conn))
+
+    reports: list[dict[str, Any]] = []
+    samples: list[list[array]] = []
+    try:
+        for idx, (proc, conn) in enumerate(procs):
+            reports.append(_receive_report(proc, conn, idx, workers))
+        for r in reports:
+            samples.append([_copy_samples(w["shm"], w["count"]) for w in r["windows"]])
+    except BaseException:
+        for r in reports[len(samples):]:
+            for w in r["windows"]:
+                _discard_samples(w["shm"])
+        raise
+    finally:
+        collected.set()
+        for proc, conn in procs:
+            proc.join(timeout=_BARRIER_TIMEOUT_S)
+            if proc.exitcode is None:
+                proc.kill()
+                proc.join()
+            conn.close()
+
+    levels: dict[tuple[str, int | None], dict[str, Any]] = {}
+    for i, window in enumerate(reports[0]["windows"]):
+        per_worker = [
+            (r["windows"][i]["start_ns"], r["windows"][i]["end_ns"], samples[w][i])
+            for w, r in enumerate(reports)
+        ]
+        levels[tuple(window["scenario"])] = level_entry(workers, per_worker)
+    init = {
+        "workers": workers,
+        "processes": [
+            {
+                "spawn_ns": r["entered_ns"] - spawned_ns[w],
+                **r["init"],
+                "rss_after_init_bytes": r["rss_after_init_bytes"],
+                "rss_after_run_bytes": r["rss_after_run_bytes"],
+                "peak_rss_bytes": r["peak_rss_bytes"],
+            }
+            for w, r in enumerate(reports)
+        ],
+    }
+    return levels, init
+
+
+def run_process_scaling_suite(
+    setup: SetupFn,
+    should_run: Callable[[str, int | None], bool],
+    worker_counts: list[int],
+    warmup: int,
+    duration_ns: int,
+) -> dict[str, Any]:
+    """Process-scale the SCALING_SCENARIOS entries selected by should_run and
+    return the "processes" scaling section.
+
+    setup() runs once in every worker process and returns (init timings in ns,
+    factories keyed like SCALING_SCENARIOS).
+    """
+    selected = [(name, size) for name, size in SCALING_SCENARIOS if should_run(name, size)]
+    by_scenario: dict[tuple[str, int | None], list[dict[str, Any]]] = {key: [] for key in selected}
+    process_init = []
+    if selected:
+        for n in worker_counts:
+            levels, init = run_process_level(setup, selected, n, warmup, duration_ns)
+            for key, lv in levels.items():
+                by_scenario[key].append(lv)
+            process_init.append(init)
+
+    scenarios = []
+    for (name, size), levels in by_scenario.items():
+        if not levels:
+            continue
+        add_efficiency(levels)
+        scenarios.append({"scenario": name, "data_size": size, "levels": levels})
+    print_scaling_summary("processes", scenarios, sys.stderr)
+    section = scaling_section(worker_counts, duration_ns, scenarios)
+    section["process_init"] = process_init
+    return section
+
+
+# ---------------------------------------------------------------------------
+# In-flight (asyncio) scaling
+# ---------------------------------------------------------------------------
+
+AsyncCall = Callable[[], Awaitable[Any]]
+
+
+async def _inflight_lane(fn: AsyncCall, stop_ns: int) -> tuple[int, int, array]:
+    latencies = array("q")
+    clock = time.perf_counter_ns
+    start = clock()
+    now = start
+    while now < stop_ns:
+        t0 = clock()
+        await fn()
+        now = clock()
+        latencies.append(now - t0)
+    return start, now, latencies
+
+
+async def run_inflight_level(fn: AsyncCall, depth: int, warmup: int, duration_ns: int) -> dict[str, Any]:
+    """Keep `depth` calls of fn outstanding for duration_ns on the running event loop."""
+    async def warm() -> None:
+        for _ in range(warmup):
+            await fn()
+
+    await asyncio.gather(*(warm() for _ in range(depth)))
+    stop_ns = time.perf_counter_ns() + duration_ns
+    lanes = await asyncio.gather(*(_inflight_lane(fn, stop_ns) for _ in range(depth)))
+    entry = level_entry(depth, list(lanes))
+    del entry["per_worker"]
+    return entry
+
+
+def run_inflight_suite(
+    connect: Callable[[], Awaitable[tuple[Any, dict[tuple[str, int | None], AsyncCall]]]],
+    should_run: Callable[[str, int | None], bool],
+    depths: list[int],
+    warmup: int,
+    duration_ns: int,
+) -> dict[str, Any]:
+    """Measure every INFLIGHT_SCENARIOS entry the harness provides at each depth
+    and return the "inflight" scaling section.
+
+    connect() runs inside the event loop and returns (channel, calls); every
+    call must raise on an incorrect result. The channel is closed afterwards.
+    """
+    async def session() -> list[dict[str, Any]]:
+        channel, calls = await connect()
+        try:
+            scenarios = []
+            for name, size in INFLIGHT_SCENARIOS:
+                if (name, size) not in calls or not should_run(name, size):
+                    continue
+                levels = [await run_inflight_level(calls[(name, size)], d, warmup, duration_ns) for d in depths]
+                add_efficiency(levels)
+                scenarios.append({"scenario": name, "data_size": size, "levels": levels})
+            return scenarios
+        finally:
+            await channel.close()
+
+    scenarios = asyncio.run(session())
+    print_scaling_summary("inflight", scenarios, sys.stderr)
+    return scaling_section(depths, duration_ns, scenarios)
+
+
+def scaling_section(worker_counts: list[int], duration_ns: int, scenarios: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "worker_counts": worker_counts,
+        "duration_ms": duration_ns // 1_000_000,
+        "scenarios": scenarios,
+    }
+
+
+def print_scaling_summary(mode: str, scenarios: list[dict[str, Any]], out: Any) -> None:
+    for sc in scenarios:
+        name = sc["scenario"] if sc["data_size"] is None else f"{sc['scenario']}_{sc['data_size']}"
+        curve = ", ".join(
+            f"{lv['workers']}:{lv['ops_per_sec']:.0f}/s"
+            + (f" ({lv['efficiency']:.2f})" if lv.get("efficiency") is not None else "")
+            for lv in sc["levels"]
+        )
+        print(f"Scaling [{mode}] {name}: {curve}", file=out)
+
+
+def merge_scaling_runs(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the "scaling" sections of several repeats of one triple.
+
+    Every level keeps the per-repeat entries under "repeats"; ops_per_sec and
+    p99_ns are medians across repeats and efficiency is recomputed from them.
+    """
+    present = [s for s in sections if isinstance(s, dict)]
+    if not present:
+        return None
+    merged: dict[str, Any] = {}
+    for mode in sorted({m for s in present for m in s}):
+        runs = [s[mode] for s in present if isinstance(s.get(mode), dict)]
+        by_scenario: dict[tuple[str, Any], dict[int, list[dict[str, Any]]]] = {}
+        for run in runs:
+            for sc in run.get("scenarios", []):
+                key = (sc["scenario"], sc.get("data_size"))
+                for lv in sc.get("levels", []):
+                    by_scenario.setdefault(key, {}).setdefault(lv["workers"], []).append(lv)
+        scenarios = []
+        for (name, size), by_workers in sorted(by_scenario.items(), key=lambda kv: (kv[0][0], kv[0][1] or -1)):
+            levels = []
+            for workers in sorted(by_workers):
+                reps = by_workers[workers]
+                levels.append({
+                    "workers": workers,
+                    "ops_per_sec": statistics.median(r["ops_per_sec"] for r in reps),
+                    "p99_ns": statistics.median(r["latency"]["p99_ns"] for r in reps),
+                    "repeat_ops_per_sec": [r["ops_per_sec"] for r in reps],
+                    "repeats": reps,
+                })
+            add_efficiency(levels)
+            scenarios.append({"scenario": name, "data_size": size, "levels": levels})
+        merged[mode] = {
+            "worker_counts": runs[0].get("worker_counts"),
+            "duration_ms": runs[0].get("duration_ms"),
+            "repeat_count": len(runs),
+            "scenarios": scenarios,
+        }
+        if any("process_init" in run for run in runs):
+            merged[mode]["process_init"] = _merge_process_init(runs)
+    return merged
+
+
+def _merge_process_init(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Pool per-process init records of all repeats; medians per worker count."""
+    by_workers: dict[int, list[dict[str, Any]]] = {}
+    for run in runs:
+        for entry in run.get("process_init", []):
+            by_workers.setdefault(entry["workers"], []).extend(entry["processes"])
+    merged = []
+    for workers in sorted(by_workers):
+        procs = by_workers[workers]
+        entry: dict[str, Any] = {"workers": workers, "processes": procs}
+        for field in ("spawn_ns", "init_ns", "rss_after_init_bytes", "rss_after_run_bytes", "peak_rss_bytes"):
+            values = [p[field] for p in procs if p.get(field) is not None]
+            entry[f"median_{field}"] = statistics.median(values) if values else None
+        merged.append(entry)
+    return merged
@@ -0,0 +1,300 @@
+"""
+Shared benchmark statistics for the harnesses and run_all_tests.py.
+
+All Python benchmark harnesses and the runner's pooled aggregation use the same
+definitions (matching the Go/Java harnesses):
+  - IQR outlier removal with Q1 = s[n // 4], Q3 = s[3n // 4] and 1.5 * IQR fences
+  - median = middle order statistic (mean of the two middle values for even n)
+  - pXX = s[min(int(n * XX / 100), n - 1)]
+  - population stddev and a normal-approximation 95% CI of the mean
+  - median_ci(): order-statistic 95% CI of the median (precision targeting)
+
+When NumPy is importable, order statistics are selected with np.partition (O(n),
+no full sort) and mean/variance are computed as vectorized reductions. Without
+NumPy the same results are produced by a pure-Python path.
+
+SortedRunsSummary computes the same statistics exactly in bounded memory: each
+added chunk (one repeat) is sorted and spilled to a scratch .npy file, order
+statistics are found by binary search over the value range of the memory-mapped
+runs, and mean/variance are accumulated chunk by chunk. It requires NumPy.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+
+HAVE_NUMPY = np is not None
+
+# Fraction of the IQR added below Q1 / above Q3 before a sample is an outlier.
+IQR_FENCE = 1.5
+
+# Samples read per step when SortedRunsSummary accumulates sums.
+STREAM_CHUNK = 1 << 20
+
+
+def order_statistic_index(n: int, q: float) -> int:
+    """Index of the q-quantile in a sorted sample of size n (harness convention)."""
+    return min(int(n * q), n - 1)
+
+
+def as_samples(values: Iterable[float]) -> Any:
+    """Return values as a float64 ndarray (NumPy) or a list of floats (fallback)."""
+    if np is not None:
+        if isinstance(values, np.ndarray):
+            return values.astype(np.float64, copy=False)
+        if hasattr(values, "__len__"):
+            return np.asarray(values, dtype=np.float64)
+        return np.fromiter(values, dtype=np.float64)
+    return [float(v) for v in values]
+
+
+def concat_samples(chunks: list[Any]) -> Any:
+    """Concatenate sample chunks produced by as_samples()."""
+    if np is not None:
+        if not chunks:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate([as_samples(c) for c in chunks])
+    out: list[float] = []
+    for c in chunks:
+        out.extend(float(v) for v in c)
+    return out
+
+
+def to_list(values: Any) -> list[float]:
+    """Convert samples back to a JSON-serializable list."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def _select(values: Any, indices: list[int]) -> list[float]:
+    """Return the order statistics at the given sorted-sample indices."""
+    if np is not None:
+        arr = as_samples(values)
+        kth = sorted(set(indices))
+        part = np.partition(arr, kth)
+        return [float(part[i]) for i in indices]
+    s = sorted(values)
+    return [float(s[i]) for i in indices]
+
+
+def iqr_bounds(values: Any) -> tuple[float, float]:
+    """Return the (lower, upper) IQR fences of a sample with at least 4 values."""
+    n = len(values)
+    q1, q3 = _select(values, [n // 4, (3 * n) // 4])
+    iqr = q3 - q1
+    return q1 - IQR_FENCE * iqr, q3 + IQR_FENCE * iqr
+
+
+def remove_outliers_iqr(values: Any) -> Any:
+    """Drop samples outside the IQR fences. Input order is not required."""
+    n = len(values)
+    if n < 4:
+        return values
+
+    low, high = iqr_bounds(values)
+    if np is not None:
+        arr = as_samples(values)
+        cleaned = arr[(arr >= low) & (arr <= high)]
+        return cleaned if cleaned.size else arr
+    cleaned = [v for v in values if low <= v <= high]
+    return cleaned if cleaned else values
+
+
+def compute_stats(values: Any) -> dict[str, float | list[float]]:
+    """Compute mean/median/p95/p99/stddev/ci95 (nanoseconds). Input order is not required."""
+    n = len(values)
+    if n == 0:
+        return {
+            "mean_ns": 0.0,
+            "median_ns": 0.0,
+            "p95_ns": 0.0,
+            "p99_ns": 0.0,
+            "stddev_ns": 0.0,
+            "ci95_ns": [0.0, 0.0],
+        }
+
+    mid_lo = n // 2 - 1 if n % 2 == 0 else n // 2
+    mid_hi = n // 2
+    lo, hi, p95, p99 = _select(
+        values,
+        [mid_lo, mid_hi, order_statistic_index(n, 0.95), order_statistic_index(n, 0.99)],
+    )
+    median = (lo + hi) / 2.0
+
+    # Single pass over the samples shifted by the median: the shift keeps the
+    # sum of squares well-conditioned for large nanosecond values.
+    if np is not None:
+        d = as_samples(values) - median
+        s1 = float(d.sum())
+        s2 = float(np.dot(d, d))
+    else:
+        s1 = 0.0
+        s2 = 0.0
+        for v in values:
+            dv = v - median
+            s1 += dv
+            s2 += dv * dv
+
+    return _finish_stats(n, median, p95, p99, s1, s2)
+
+
+def _finish_stats(n: int, median: float, p95: float, p99: float, s1: float, s2: float) -> dict[str, Any]:
+    """Build the stats dict from order statistics and sums of (x - median), (x - median)^2."""
+    mean = median + s1 / n
+    var = max(s2 / n - (s1 / n) ** 2, 0.0)
+    stddev = math.sqrt(var)
+    se = stddev / math.sqrt(n)
+    return {
+        "mean_ns": mean,
+        "median_ns": median,
+        "p95_ns": p95,
+        "p99_ns": p99,
+        "stddev_ns": stddev,
+        "ci95_ns": [mean - 1.96 * se, mean + 1.96 * se],
+    }
+
+
+def median_ci_indices(n: int, z: float = 1.96) -> tuple[int, int]:
+    """Sorted-sample indices bounding the distribution-free CI of the median.
+
+    The count of samples below the median is Binomial(n, 1/2); with the normal
+    approximation the bounds are the order statistics n/2 -/+ z * sqrt(n) / 2.
+    """
+    half = z * math.sqrt(n) / 2
+    return max(math.floor(n / 2 - half), 0), min(math.ceil(n / 2 + half), n - 1)
+
+
+def median_ci(values: Any) -> tuple[float, float, float]:
+    """(low, median, high): 95% order-statistic CI of the median of the IQR-cleaned samples."""
+    cleaned = remove_outliers_iqr(as_samples(values))
+    n = len(cleaned)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    lo, hi = median_ci_indices(n)
+    mid_lo = n // 2 - 1 if n % 2 == 0 else n // 2
+    low, m1, m2, high = _select(cleaned, [lo, mid_lo, n // 2, hi])
+    return low, (m1 + m2) / 2.0, high
+
+
+def summarize(values: Any) -> dict[str, float | list[float]]:
+    """IQR-clean the samples and compute their summary statistics."""
+    return compute_stats(remove_outliers_iqr(as_samples(values)))
+
+
+class SortedRunsSummary:
+    """Exact IQR-cleaned summary statistics over samples added chunk by chunk.
+
+    Peak memory is one chunk (plus page cache for the memory-mapped runs),
+    independent of the number of chunks. Results equal summarize() on the
+    concatenated samples, up to floating-point summation order. Samples are
+    integer nanoseconds and are stored as int64.
+    """
+
+    def __init__(self, scratch_dir: str | Path):
+        if np is None:
+            raise RuntimeError("SortedRunsSummary requires NumPy")
+        self._scratch_dir = Path(scratch_dir)
+        self._scratch_dir.mkdir(parents=True, exist_ok=True)
+        self._paths: list[Path] = []
+        self._runs: list[Any] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, values: Iterable[float]) -> None:
+        """Sort one chunk and spill it to a scratch run."""
+        arr = np.asarray(values)
+        if arr.dtype.kind == "f":
+            arr = np.rint(arr)
+        run = np.sort(arr.astype(np.int64))
+        if run.size == 0:
+            return
+        path = self._scratch_dir / f"run_{len(self._paths):04d}.npy"
+        np.save(path, run)
+        del run
+        self._paths.append(path)
+        self._runs.append(np.load(path, mmap_mode="r"))
+        self._count += int(self._runs[-1].size)
+
+    def close(self) -> None:
+        """Drop the memory maps and delete the scratch runs."""
+        self._runs = []
+        for p in self._paths:
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+        self._paths = []
+
+    def __enter__(self) -> "SortedRunsSummary":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _count_below(self, value: float, side: str) -> int:
+        return sum(int(np.searchsorted(run, value, side=side)) for run in self._runs)
+
+    def _kth(self, k: int) -> float:
+        """k-th smallest (0-based) pooled sample: binary search over the integer value range."""
+        lo = min(int(run[0]) for run in self._runs)
+        hi = max(int(run[-1]) for run in self._runs)
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            if self._count_below(mid, "right") > k:
+                hi = mid
+            else:
+                lo = mid + 1
+        return float(lo)
+
+    def summarize(self) -> dict[str, float | list[float]]:
+        """Same definitions as summarize(): IQR fences on all samples, stats on the kept ones."""
+        n = self._count
+        if n == 0:
+            return compute_stats([])
+
+        # The kept samples form one contiguous range [skip, skip + kept) of the
+        # pooled sorted order, i.e. one contiguous slice of every sorted run.
+        slices = [(0, int(run.size)) for run in self._runs]
+        skip = 0
+        if n >= 4:
+            q1, q3 = self._kth(n // 4), self._kth((3 * n) // 4)
+            iqr = q3 - q1
+            low, high = q1 - IQR_FENCE * iqr, q3 + IQR_FENCE * iqr
+            kept_slices = [
+                (int(np.searchsorted(run, low, side="left")), int(np.searchsorted(run, high, side="right")))
+                for run in self._runs
+            ]
+            if sum(b - a for a, b in kept_slices) > 0:
+                slices = kept_slices
+                skip = sum(a for a, _ in kept_slices)
+        kept = sum(b - a for a, b in slices)
+
+        mid_lo = kept // 2 - 1 if kept % 2 == 0 else kept // 2
+        mid_hi = kept // 2
+        lo = self._kth(skip + mid_lo)
+        hi = self._kth(skip + mid_hi)
+        median = (lo + hi) / 2.0
+        p95 = self._kth(skip + order_statistic_index(kept, 0.95))
+        p99 = self._kth(skip + order_statistic_index(kept, 0.99))
+
+        s1 = 0.0
+        s2 = 0.0
+        for run, (a, b) in zip(self._runs, slices):
+            for start in range(a, b, STREAM_CHUNK):
+                d = np.asarray(run[start:min(start + STREAM_CHUNK, b)], dtype=np.float64) - median
+                s1 += float(d.sum())
+                s2 += float(np.dot(d, d))
+
+        return _finish_stats(kept, median, p95, p99, s1, s2)
@@ -0,0 +1,177 @@
+"""
+Warmup policy shared by the Python harnesses (Go and Java harnesses mirror it).
+
+METAFFI_TEST_WARMUP_MODE selects how many calls run before measurement:
+
+    fixed      METAFFI_TEST_WARMUP calls (the historical behaviour)
+    adaptive   windows of METAFFI_TEST_WARMUP_WINDOW individually timed calls
+               until the last METAFFI_TEST_WARMUP_STABLE_WINDOWS windows agree:
+               their medians within METAFFI_TEST_WARMUP_TOLERANCE of the
+               smallest of them, and their MADs within the same bound. At
+               least METAFFI_TEST_WARMUP calls run; METAFFI_TEST_WARMUP_MAX_CALLS
+               caps the total.
+
+Array scenarios above benchmark_inputs.LARGE_ARRAY_THRESHOLD elements keep their
+fixed (large-array) warmup in both modes: one window there can take minutes.
+
+Every benchmark entry records what happened in a "warmup" section:
+
+    {"mode": "adaptive", "calls": 1800, "windows": 18, "converged": true}
+
+"converged" is false when the cap was reached first and null in fixed mode.
+The runner merges repeats with merge_warmup().
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from benchmark_inputs import LARGE_ARRAY_THRESHOLD
+
+
+WARMUP_MODE_ENV = "METAFFI_TEST_WARMUP_MODE"
+WARMUP_WINDOW_ENV = "METAFFI_TEST_WARMUP_WINDOW"
+WARMUP_STABLE_WINDOWS_ENV = "METAFFI_TEST_WARMUP_STABLE_WINDOWS"
+WARMUP_TOLERANCE_ENV = "METAFFI_TEST_WARMUP_TOLERANCE"
+WARMUP_MAX_CALLS_ENV = "METAFFI_TEST_WARMUP_MAX_CALLS"
+
+WARMUP_MODES = ("fixed", "adaptive")
+DEFAULT_WINDOW_CALLS = 100
+DEFAULT_STABLE_WINDOWS = 3
+DEFAULT_TOLERANCE = 0.05
+DEFAULT_MAX_CALLS = 20000
+
+
+class WarmupError(Exception):
+    """Raised on an invalid warmup configuration."""
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as e:
+        raise WarmupError(f"{name} must be an integer, got {raw!r}") from e
+    if value < 1:
+        raise WarmupError(f"{name} must be >= 1, got {value}")
+    return value
+
+
+@dataclass(frozen=True)
+class WarmupSettings:
+    mode: str = "fixed"
+    window_calls: int = DEFAULT_WINDOW_CALLS
+    stable_windows: int = DEFAULT_STABLE_WINDOWS
+    tolerance: float = DEFAULT_TOLERANCE
+    max_calls: int = DEFAULT_MAX_CALLS
+
+    @classmethod
+    def from_env(cls) -> "WarmupSettings":
+        mode = os.environ.get(WARMUP_MODE_ENV, "").strip().lower() or "fixed"
+        if mode not in WARMUP_MODES:
+            raise WarmupError(f"{WARMUP_MODE_ENV} must be one of {WARMUP_MODES}, got {mode!r}")
+        raw_tol = os.environ.get(WARMUP_TOLERANCE_ENV, "").strip()
+        try:
+            tolerance = float(raw_tol) if raw_tol else DEFAULT_TOLERANCE
+        except ValueError as e:
+            raise WarmupError(f"{WARMUP_TOLERANCE_ENV} must be a number, got {raw_tol!r}") from e
+        if not 0 < tolerance < 1:
+            raise WarmupError(f"{WARMUP_TOLERANCE_ENV} must be in (0, 1), got {tolerance}")
+        return cls(
+            mode=mode,
+            window_calls=_env_int(WARMUP_WINDOW_ENV, DEFAULT_WINDOW_CALLS),
+            stable_windows=_env_int(WARMUP_STABLE_WINDOWS_ENV, DEFAULT_STABLE_WINDOWS),
+            tolerance=tolerance,
+            max_calls=_env_int(WARMUP_MAX_CALLS_ENV, DEFAULT_MAX_CALLS),
+        )
+
+    def as_config(self) -> dict[str, Any]:
+        return {
+            "warmup_mode": self.mode,
+            "warmup_window_calls": self.window_calls,
+            "warmup_stable_windows": self.stable_windows,
+            "warmup_tolerance": self.tolerance,
+            "warmup_max_calls": self.max_calls,
+        }
+
+
+def windows_agree(medians: list[float], mads: list[float], tolerance: float) -> bool:
+    """True when the windows' medians and MADs all lie within tolerance x the lowest median."""
+    bound = tolerance * min(medians)
+    return max(medians) - min(medians) <= bound and max(mads) - min(mads) <= bound
+
+
+def warm_up(
+    scenario: str,
+    data_size: int | None,
+    bench_fn: Callable[[], Any],
+    warmup: int,
+    settings: WarmupSettings,
+) -> dict[str, Any]:
+    """Run the warmup for one scenario and return its "warmup" section.
+
+    warmup is the fixed count, and the minimum in adaptive mode. bench_fn
+    must raise on incorrect results; failures name the warmup call.
+    """
+    adaptive = settings.mode == "adaptive" and (data_size is None or data_size <= LARGE_ARRAY_THRESHOLD)
+
+    def call(i: int) -> None:
+        try:
+            bench_fn()
+        except Exception as e:
+            raise RuntimeError(f"Benchmark '{scenario}' warmup iteration {i}: {e}") from e
+
+    if not adaptive:
+        for i in range(warmup):
+            call(i)
+        return {"mode": "fixed", "calls": warmup, "windows": None, "converged": None}
+
+    clock = time.perf_counter_ns
+    max_calls = max(settings.max_calls, warmup)
+    medians: list[float] = []
+    mads: list[float] = []
+    calls = 0
+    converged = False
+    while calls < max_calls:
+        window = []
+        for _ in range(min(settings.window_calls, max_calls - calls)):
+            start = clock()
+            call(calls)
+            window.append(clock() - start)
+            calls += 1
+        median = statistics.median(window)
+        medians.append(median)
+        mads.append(statistics.median(abs(x - median) for x in window))
+        k = settings.stable_windows
+        if calls >= warmup and len(medians) >= k and windows_agree(medians[-k:], mads[-k:], settings.tolerance):
+            converged = True
+            break
+    return {"mode": "adaptive", "calls": calls, "windows": len(medians), "converged": converged}
+
+
+def merge_warmup(sections: list[dict[str, Any] | None]) -> dict[str, Any] | None:
+    """Combine the warmup sections of one scenario across repeats.
+
+    calls and windows take the maximum (calls_per_repeat keeps every value);
+    converged is true only if every adaptive repeat converged.
+    """
+    sections = [s for s in sections if isinstance(s, dict)]
+    if not sections:
+        return None
+    calls = [s.get("calls") for s in sections]
+    counted = [c for c in calls if isinstance(c, int)]
+    windows = [s["windows"] for s in sections if isinstance(s.get("windows"), int)]
+    converged = [s["converged"] for s in sections if isinstance(s.get("converged"), bool)]
+    return {
+        "mode": sections[0].get("mode"),
+        "calls": max(counted) if counted else None,
+        "calls_per_repeat": calls,
+        "windows": max(windows) if windows else None,
+        "converged": all(converged) if converged else None,
+    }
@@ -0,0 +1,372 @@
+"""
+Content-hash build cache for native bridges, gRPC servers and C++ host tests.
+
+A build is described by a BuildSpec: the command that produces it, the source
+files it reads, the toolchain version commands whose output it depends on, and
+the artifacts it writes. The cache key is the SHA-256 over all of those:
+
+    key = sha256(name, command, flags, toolchain versions, {source: sha256})
+
+After a successful build the cache records a stamp under
+results/_build_cache/<name>.json with the key and a fingerprint of every output.
+The next request with the same key skips the build as long as the outputs are
+still the ones that were recorded. File outputs are also copied to
+results/_build_cache/<name>/<key>/, so a deleted artifact (or one built from
+other sources in between) is restored without invoking the toolchain.
+
+Used by run_all_tests.py before every stage and by harnesses that build their
+own bridge (python3/without_metaffi/call_go_ctypes). The cache directory can be
+overridden with METAFFI_TEST_BUILD_CACHE; the runner sets it to
+<canonical_results_dir>/_build_cache.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+BUILD_CACHE_ENV = "METAFFI_TEST_BUILD_CACHE"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "results" / "_build_cache"
+
+# Artifact sets kept per build name; older ones are pruned after each build.
+MAX_ARTIFACT_SETS = 4
+
+# Directories never treated as sources (build outputs and tool caches).
+EXCLUDED_SOURCE_DIRS = frozenset({
+    "target", ".cmake_build", ".java_include", "__pycache__", ".git", ".pytest_cache",
+})
+
+# Environment variables that change what compilers produce.
+COMPILER_ENV_VARS = ("CC", "CXX", "CGO_ENABLED", "CGO_CFLAGS", "CGO_LDFLAGS", "GOFLAGS", "GOOS", "GOARCH")
+
+_HASH_BLOCK = 1 << 20
+
+
+class BuildCacheError(Exception):
+    """Raised when a cached build step fails or the cache is inconsistent."""
+
+
+@dataclass(frozen=True)
+class BuildSpec:
+    name: str
+    command: tuple[str, ...]
+    cwd: Path
+    sources: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    toolchain: tuple[tuple[str, ...], ...] = ()
+    flags: tuple[str, ...] = ()
+    env: tuple[tuple[str, str], ...] = ()
+    store_artifacts: bool = True
+
+    def key(self) -> str:
+        h = hashlib.sha256()
+        payload = {
+            "name": self.name,
+            "command": list(self.command),
+            "flags": list(self.flags),
+            "env": [list(kv) for kv in self.env],
+            "outputs": [p.name for p in self.outputs],
+            "toolchain": [toolchain_version(cmd) for cmd in self.toolchain],
+        }
+        h.update(json.dumps(payload, sort_keys=True).encode("utf-8"))
+        for src in sorted(self.sources):
+            rel = _relative_to(src, self.cwd)
+            h.update(b"\0" + rel.encode("utf-8") + b"\0")
+            h.update(file_sha256(src).encode("ascii"))
+        return h.hexdigest()
+
+
+@dataclass
+class _Stamp:
+    key: str
+    outputs: dict[str, str] = field(default_factory=dict)
+    built_at: str = ""
+
+
+def _relative_to(path: Path, base: Path) -> str:
+    try:
+        return path.resolve().relative_to(base.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_HASH_BLOCK)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def output_fingerprint(path: Path) -> str | None:
+    """sha256 of a file, or of every (relative path, sha256) under a directory; None if missing."""
+    if path.is_file():
+        return file_sha256(path)
+    if path.is_dir():
+        h = hashlib.sha256()
+        for f in sorted(p for p in path.rglob("*") if p.is_file()):
+            h.update(f.relative_to(path).as_posix().encode("utf-8") + b"\0")
+            h.update(file_sha256(f).encode("ascii"))
+        return "dir:" + h.hexdigest()
+    return None
+
+
+def collect_sources(
+    root: Path,
+    suffixes: Iterable[str] | None = None,
+    names: Iterable[str] = (),
+) -> tuple[Path, ...]:
+    """Files under root matching suffixes (all files if None) or exact names, skipping build dirs."""
+    suffix_set = tuple(suffixes) if suffixes is not None else None
+    name_set = set(names)
+    found: list[Path] = []
+    if not root.is_dir():
+        return ()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_SOURCE_DIRS]
+        for fn in filenames:
+            if fn in name_set or suffix_set is None or fn.endswith(suffix_set):
+                found.append(Path(dirpath) / fn)
+    return tuple(sorted(found))
+
+
+@functools.lru_cache(maxsize=None)
+def toolchain_version(cmd: tuple[str, ...]) -> str:
+    """Output of a version command, resolved once per process."""
+    try:
+        proc = subprocess.run(list(cmd), capture_output=True, text=True, timeout=60, check=False)
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return f"unavailable: {type(e).__name__}"
+    return f"rc={proc.returncode}\n{proc.stdout.strip()}\n{proc.stderr.strip()}"
+
+
+def compiler_env() -> tuple[tuple[str, str], ...]:
+    return tuple((k, os.environ[k]) for k in COMPILER_ENV_VARS if k in os.environ)
+
+
+def _go_mod_local_replaces(module_dir: Path) -> list[Path]:
+    """Directories of the `replace ... => <local path>` directives in module_dir/go.mod."""
+    go_mod = module_dir / "go.mod"
+    if not go_mod.is_file():
+        return []
+    found: list[Path] = []
+    in_block = False
+    for raw in go_mod.read_text(encoding="utf-8").splitlines():
+        line = raw.split("//", 1)[0].strip()
+        if in_block:
+            if line == ")":
+                in_block = False
+                continue
+        elif line.startswith("replace"):
+            line = line[len("replace"):].strip()
+            if line == "(":
+                in_block = True
+                continue
+        else:
+            continue
+        if "=>" not in line:
+            continue
+        target = line.split("=>", 1)[1].split()
+        # A local target is a path (./, ../ or absolute); otherwise it is a module path + version.
+        if len(target) == 1 and (target[0].startswith((".", "/")) or Path(target[0]).is_absolute()):
+            found.append((module_dir / target[0]).resolve())
+    return found
+
+
+def go_local_module_dirs(package_dir: Path) -> tuple[Path, ...]:
+    """Local modules package_dir builds from through go.mod replace directives, transitively."""
+    root = Path(package_dir).resolve()
+    seen: list[Path] = []
+    pending = _go_mod_local_replaces(root)
+    while pending:
+        d = pending.pop(0)
+        if d == root or d in seen:
+            continue
+        seen.append(d)
+        pending.extend(_go_mod_local_replaces(d))
+    return tuple(seen)
+
+
+def go_build_spec(
+    name: str,
+    package_dir: Path,
+    output_name: str,
+    build_flags: Iterable[str] = (),
+    command: Iterable[str] | None = None,
+    extra_sources: Iterable[Path] = (),
+    flags: Iterable[str] = (),
+) -> BuildSpec:
+    """Spec for `go build` of the package in package_dir (a cgo bridge or a server binary).
+
+    Sources include the local modules go.mod replaces point at (e.g. the Go guest
+    module), so a change there invalidates the cached binary.
+    """
+    package_dir = Path(package_dir)
+    cmd = tuple(command) if command is not None else (
+        "go", "build", *build_flags, "-o", output_name, ".",
+    )
+    sources = collect_sources(package_dir, (".go", ".c", ".h"), ("go.mod", "go.sum"))
+    for module_dir in go_local_module_dirs(package_dir):
+        sources += collect_sources(module_dir, (".go", ".c", ".h"), ("go.mod", "go.sum"))
+    return BuildSpec(
+        name=name,
+        command=cmd,
+        cwd=package_dir,
+        sources=tuple(dict.fromkeys(sources)) + tuple(extra_sources),
+        outputs=(package_dir / output_name,),
+        toolchain=(("go", "version"), ("go", "env", "GOOS", "GOARCH", "CC", "CGO_ENABLED")),
+        flags=tuple(flags),
+        env=compiler_env(),
+    )
+
+
+_LOCKS: dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(name: str) -> threading.Lock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(name, threading.Lock())
+
+
+def run_build_command(spec: BuildSpec, env: dict[str, str] | None = None) -> None:
+    """Default build step: run spec.command in spec.cwd, raising BuildCacheError on failure."""
+    if env is None:
+        env = dict(os.environ)
+        env.update(dict(spec.env))
+    try:
+        proc = subprocess.run(
+            list(spec.command), cwd=spec.cwd, env=env, capture_output=True, text=True, check=False,
+        )
+    except FileNotFoundError as e:
+        raise BuildCacheError(f"{spec.name}: build tool not found: {e}") from e
+    if proc.returncode != 0:
+        output = (proc.stdout + proc.stderr).strip().splitlines()
+        tail = "\n".join(output[-60:])
+        raise BuildCacheError(
+            f"{spec.name}: build failed (exit code {proc.returncode}): {' '.join(spec.command)}\n{tail}"
+        )
+
+
+class BuildCache:
+    """Stamps and stored artifacts of content-hashed builds under one directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    @classmethod
+    def from_env(cls) -> "BuildCache":
+        return cls(os.environ.get(BUILD_CACHE_ENV) or DEFAULT_CACHE_DIR)
+
+    def _stamp_path(self, name: str) -> Path:
+        return self.root / f"{name}.json"
+
+    def _artifact_dir(self, name: str, key: str) -> Path:
+        return self.root / name / key[:16]
+
+    def _read_stamp(self, name: str) -> _Stamp | None:
+        path = self._stamp_path(name)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return _Stamp(key=raw["key"], outputs=dict(raw["outputs"]), built_at=raw.get("built_at", ""))
+        except (OSError, ValueError, KeyError, TypeError):
+            # A torn or foreign stamp only means "rebuild".
+            return None
+
+    def _write_stamp(self, name: str, stamp: _Stamp) -> None:
+        path = self._stamp_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": stamp.key, "built_at": stamp.built_at, "outputs": stamp.outputs}, f, indent=2)
+        os.replace(tmp, path)
+
+    def _restore(self, spec: BuildSpec, key: str) -> _Stamp | None:
+        """Copy stored file artifacts for key back into place; return the stamp they satisfy."""
+        if not spec.store_artifacts:
+            return None
+        store = self._artifact_dir(spec.name, key)
+        manifest = store / "manifest.json"
+        if not manifest.is_file():
+            return None
+        try:
+            with open(manifest, "r", encoding="utf-8") as f:
+                outputs: dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for out in spec.outputs:
+            stored = store / out.name
+            if _relative_to(out, spec.cwd) not in outputs or not stored.is_file():
+                return None
+            if output_fingerprint(stored) != outputs[_relative_to(out, spec.cwd)]:
+                return None
+        for out in spec.outputs:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(store / out.name, out)
+        return _Stamp(key=key, outputs=outputs, built_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+
+    def _store(self, spec: BuildSpec, stamp: _Stamp) -> None:
+        if not spec.store_artifacts or not all(out.is_file() for out in spec.outputs):
+            return
+        store = self._artifact_dir(spec.name, stamp.key)
+        store.mkdir(parents=True, exist_ok=True)
+        for out in spec.outputs:
+            shutil.copy2(out, store / out.name)
+        with open(store / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(stamp.outputs, f, indent=2)
+
+        sets = sorted((d for d in store.parent.iterdir() if d.is_dir()), key=lambda d: d.stat().st_mtime)
+        for old in sets[:-MAX_ARTIFACT_SETS]:
+            shutil.rmtree(old, ignore_errors=True)
+
+    def is_fresh(self, spec: BuildSpec, key: str | None = None) -> bool:
+        key = spec.key() if key is None else key
+        stamp = self._read_stamp(spec.name)
+        if stamp is None or stamp.key != key:
+            return False
+        return all(output_fingerprint(out) == stamp.outputs.get(_relative_to(out, spec.cwd)) for out in spec.outputs)
+
+    def ensure(self, spec: BuildSpec, build: Callable[[], None] | None = None) -> str:
+        """Make spec's outputs current. Returns "hit", "restored" or "built".
+
+        build defaults to run_build_command(spec). Concurrent callers with the
+        same spec name (threads of one runner) are serialized.
+        """
+        with _lock_for(spec.name):
+            key = spec.key()
+            if self.is_fresh(spec, key):
+                return "hit"
+
+            restored = self._restore(spec, key)
+            if restored is not None:
+                self._write_stamp(spec.name, restored)
+                return "restored"
+
+            (build or (lambda: run_build_command(spec)))()
+
+            outputs: dict[str, str] = {}
+            for out in spec.outputs:
+                fp = output_fingerprint(out)
+                if fp is None:
+                    raise BuildCacheError(f"{spec.name}: build succeeded but did not produce {out}")
+                outputs[_relative_to(out, spec.cwd)] = fp
+            stamp = _Stamp(key=key, outputs=outputs, built_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+            self._store(spec, stamp)
+            self._write_stamp(spec.name, stamp)
+            return "built"
@@ -3,7 +3,10 @@
 Consolidates per-pair JSON result files into a single consolidated report.
 
 Reads all results/<host>_to_<guest>_<mechanism>.json files and produces
-results/consolidated.json with cross-pair comparison data.
+results/consolidated.json with cross-pair comparison data. Besides the pairs
+between the Go, Python3 and Java hosts, the C guest (MetaFFI and a native
+baseline: cgo, ctypes, JNI), the C++ guest (MetaFFI) and the C++ host calling
+Go, Python3 and Java (MetaFFI) are expected.
 
 FAIL-FAST: If any result file is malformed, this script aborts immediately.
 
@@ -11,21 +14,66 @@ Explicitly reports:
   - Missing result files (expected triples with no data)
   - Failed benchmarks/correctness within existing result files
   - Scenarios with no data across all mechanisms for a pair
+
+MetaFFI array scenarios measured with several Python input containers are
+lined up against the native baseline in "container_comparisons".
+
+Comparison cells carry the memory cost recorded by the Python harnesses
+(benchmark_memory.py): tracemalloc bytes allocated per call and RSS growth
+over the scenario.
+
+"phase_breakdown" lists the marshal / call / unmarshal split recorded by the
+Python3 MetaFFI harnesses when run.phase_probe_calls is set
+(benchmark_phases.py), as mean ns per phase and the share spent in the xcall.
+
+"precision_misses" lists the scenarios measured with run.precision_target that
+stopped at the iteration or time cap before their median CI reached the target
+(benchmark_precision.py); summary.precision counts targeted and met scenarios.
+
+"gc_attribution" lists the scenarios measured with run.gc_mode: trace
+(benchmark_gc.py): collections and pause time during measurement, the number
+of samples a collection landed in, and p99 with and without those samples.
+
+"array_throughput" turns the array scenarios (run.array_sizes sweep) into
+bytes/sec per mechanism, with the payload size recorded by the harness (or
+inferred from the element type) and the peak RSS where the harness reports it.
+
+Results with a "scaling" section (thread/process scaling mode) are also
+tabulated side by side per mechanism in "scaling_comparisons"; per-process
+init cost and RSS of process scaling go to "scaling_process_init", and
+"concurrency_throughput" lines up thread, process and grpc.aio in-flight
+throughput at equal concurrency.
+
+"cold_start" copies results/cold_start.json (run.cold_start_runs,
+benchmark_cold_start.py): per mechanism, the stages from process launch to the
+first cross-language call over fresh-process launches. It is null when the
+cold-start stage has not run.
+
+Raw samples stored in .npy sidecars (outputs.raw_sample_format: npy) are
+verified against their recorded length and sha256 through memory mapping.
+
+results/tables.md and results/report.md are then rendered in the same process
+from one report model (report_model.py) built from the consolidated data.
 """
 
 import json
-import subprocess
+import statistics
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import benchmark_cold_start
+import benchmark_samples
 
 RESULTS_DIR = Path(__file__).resolve().parent / "results"
 CONSOLIDATED_FILE = RESULTS_DIR / "consolidated.json"
 
-# All 18 expected (host, guest, mechanism) triples
-HOSTS = ["go", "python3", "java"]
+# Expected (host, guest, mechanism) triples: 18 between the three interop hosts,
+# plus the C and C++ guests (metaffi; C also has a native baseline, no gRPC) and
+# the C++ host calling each of them (metaffi only, the floor reference)
+INTEROP_HOSTS = ["go", "python3", "java"]
+HOSTS = [*INTEROP_HOSTS, "cpp"]
 
 NATIVE_MECHANISMS = {
     ("go", "python3"): "cpython",
@@ -37,14 +85,32 @@ NATIVE_MECHANISMS = {
 }
 
 ALL_EXPECTED_TRIPLES: list[tuple[str, str, str]] = []
-for h in HOSTS:
-    for g in HOSTS:
+for h in INTEROP_HOSTS:
+    for g in INTEROP_HOSTS:
         if h == g:
             continue
         ALL_EXPECTED_TRIPLES.append((h, g, "metaffi"))
         ALL_EXPECTED_TRIPLES.append((h, g, NATIVE_MECHANISMS[(h, g)]))
         ALL_EXPECTED_TRIPLES.append((h, g, "grpc"))
 
+C_NATIVE_MECHANISMS = {
+    "go": "cgo",
+    "python3": "ctypes",
+    "java": "jni",
+}
+
+for h in INTEROP_HOSTS:
+    ALL_EXPECTED_TRIPLES.append((h, "c", "metaffi"))
+    ALL_EXPECTED_TRIPLES.append((h, "c", C_NATIVE_MECHANISMS[h]))
+    ALL_EXPECTED_TRIPLES.append((h, "cpp", "metaffi"))
+
+for g in INTEROP_HOSTS:
+    ALL_EXPECTED_TRIPLES.append(("cpp", g, "metaffi"))
+
+
+# Array scenarios whose data_size is an element count.
+ARRAY_SCENARIOS = ("array_echo", "array_sum", "packed_array_sum")
+
 
 class ConsolidationError(Exception):
     """Raised when a result file cannot be processed."""
@@ -77,16 +143,59 @@ def load_result_files() -> list[dict[str, Any]]:
         if "metadata" not in data:
             raise ConsolidationError(f"Missing 'metadata' in {path}")
 
+        validate_sample_sidecars(path, data)
         results.append(data)
 
     return results
 
 
+def load_cold_start() -> dict[str, Any] | None:
+    """Load results/cold_start.json if the cold-start stage has produced it."""
+    path = RESULTS_DIR / benchmark_cold_start.COLD_START_FILENAME
+    if not path.is_file():
+        return None
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ConsolidationError(f"Malformed JSON in {path}: {e}")
+    if not isinstance(data.get("mechanisms"), list):
+        raise ConsolidationError(f"Missing 'mechanisms' in {path}")
+    for entry in data["mechanisms"]:
+        missing = [s for s in benchmark_cold_start.STAGES if s not in entry.get("stages", {})]
+        if missing:
+            raise ConsolidationError(f"{path}: {entry.get('host')}->{entry.get('guest')} "
+                                     f"[{entry.get('mechanism')}] lacks stages {missing}")
+    return data
+
+
+def validate_sample_sidecars(path: Path, data: dict[str, Any]) -> None:
+    """Check every raw-sample sidecar referenced by a result file (existence, length, sha256)."""
+
+    for b in data.get("benchmarks") or []:
+        if not isinstance(b, dict) or not benchmark_samples.has_sidecars(b):
+            continue
+        for field in benchmark_samples.SAMPLE_FIELDS:
+            try:
+                benchmark_samples.load_samples(b, field, path.parent, verify=True)
+            except benchmark_samples.SampleFileError as e:
+                raise ConsolidationError(f"Invalid raw samples in {path} ({b.get('scenario')}): {e}")
+
+
 def _native_mechanisms_for_pair(host: str, guest: str) -> list[str]:
     """Return the native-direct mechanism name(s) for a (host, guest) pair."""
+    if guest == "c":
+        return [C_NATIVE_MECHANISMS[host]] if host in C_NATIVE_MECHANISMS else []
     return [NATIVE_MECHANISMS[(host, guest)]] if (host, guest) in NATIVE_MECHANISMS else []
 
 
+def _expected_mechanisms_for_pair(host: str, guest: str) -> list[str]:
+    """Mechanisms expected for a (host, guest) pair, in comparison order (metaffi, native, grpc)."""
+    expected = {m for h, g, m in ALL_EXPECTED_TRIPLES if (h, g) == (host, guest)}
+    ordered = ["metaffi", *_native_mechanisms_for_pair(host, guest), "grpc"]
+    return [m for m in ordered if m in expected]
+
+
 def _find_benchmark(result: dict, scenario_key: str) -> dict[str, Any] | None:
     """Find a benchmark entry matching a scenario key (possibly with data_size suffix)."""
 
@@ -105,7 +214,8 @@ def compute_comparison_table(results: list[dict[str, Any]]) -> list[dict[str, An
     Build a cross-pair comparison table.
 
     For each (host, guest, scenario) group, compare MetaFFI vs. native vs. gRPC
-    total call times. Missing data is explicitly marked.
+    total call times, over the mechanisms expected for that pair (the C and C++
+    guests have no gRPC baseline). Missing data is explicitly marked.
     """
 
     # Index results by (host, guest, mechanism)
@@ -143,7 +253,7 @@ def compute_comparison_table(results: list[dict[str, Any]]) -> list[dict[str, An
             }
 
             # For each mechanism, find the matching benchmark
-            for mechanism in ["metaffi", *_native_mechanisms_for_pair(host, guest), "grpc"]:
+            for mechanism in _expected_mechanisms_for_pair(host, guest):
                 result = indexed.get((host, guest, mechanism))
                 if result is None:
                     # Explicitly mark as MISSING (no result file)
@@ -165,6 +275,10 @@ def compute_comparison_table(results: list[dict[str, Any]]) -> list[dict[str, An
                         "p95_ns": total_stats.get("p95_ns"),
                         "status": benchmark.get("status"),
                     }
+                    memory = benchmark.get("memory")
+                    if isinstance(memory, dict):
+                        row[mechanism]["py_alloc_bytes_per_call"] = memory.get("py_alloc_bytes_per_call")
+                        row[mechanism]["rss_growth_bytes"] = memory.get("rss_growth_bytes")
                 else:
                     row[mechanism] = {"status": benchmark.get("status", "FAIL")}
 
@@ -220,6 +334,257 @@ def compute_mechanism_averages_by_pair(comparisons: list[dict[str, Any]]) -> lis
     return result
 
 
+def compute_container_comparison(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    MetaFFI array scenarios per Python input container (benchmark_inputs.py).
+
+    One row per (host, guest, base scenario, data_size) with {container:
+    {mean_ns, vs_native}}, where vs_native is the MetaFFI mean over the mean of
+    each native mechanism on the plain scenario (e.g. ctypes array_echo_1000).
+    """
+    indexed = {(r["metadata"]["host"], r["metadata"]["guest"], r["metadata"]["mechanism"]): r for r in results}
+    rows: dict[tuple[str, str, str, int], dict[str, Any]] = {}
+    for (host, guest, mechanism), r in indexed.items():
+        if mechanism != "metaffi":
+            continue
+        for b in r.get("benchmarks", []):
+            container = b.get("input_container")
+            if container is None or b.get("status") != "PASS":
+                continue
+            scenario = b["scenario"]
+            base = scenario[: -len(f"_{container}")] if scenario.endswith(f"_{container}") else scenario
+            row = rows.setdefault(
+                (host, guest, base, b["data_size"]),
+                {"host": host, "guest": guest, "scenario": base, "data_size": b["data_size"],
+                 "native": {}, "containers": {}},
+            )
+            row["containers"][container] = {"mean_ns": b["phases"]["total"]["mean_ns"], "default": base == scenario}
+
+    for (host, guest, base, size), row in rows.items():
+        for native in _native_mechanisms_for_pair(host, guest):
+            result = indexed.get((host, guest, native))
+            bench = _find_benchmark(result, f"{base}_{size}") if result is not None else None
+            if bench is not None and bench.get("status") == "PASS":
+                row["native"][native] = bench["phases"]["total"]["mean_ns"]
+        for entry in row["containers"].values():
+            entry["vs_native"] = {
+                native: entry["mean_ns"] / mean for native, mean in row["native"].items() if mean
+            }
+    return [rows[k] for k in sorted(rows)]
+
+
+def _payload_bytes(bench: dict[str, Any], guest: str) -> int:
+    """Bytes passed per call: the harness value, else data_size x element size of the guest signature."""
+    if isinstance(bench.get("payload_bytes"), int):
+        return bench["payload_bytes"]
+    if bench["scenario"] == "array_echo":
+        return bench["data_size"]  # uint8[]
+    return bench["data_size"] * (4 if guest == "java" else 8)  # int32[] for Java guests, int64[] otherwise
+
+
+def compute_array_throughput(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Array scenario throughput per (host, guest, scenario, data_size).
+
+    Each mechanism gets {mean_ns, payload_bytes, bytes_per_sec, peak_rss_bytes}
+    where bytes_per_sec = payload_bytes / mean call time. Container variants
+    (input_container other than the default) are left to container_comparisons.
+    """
+    rows: dict[tuple[str, str, str, int], dict[str, Any]] = {}
+    for r in results:
+        meta = r["metadata"]
+        for b in r.get("benchmarks", []):
+            if b["scenario"] not in ARRAY_SCENARIOS or b.get("data_size") is None or b.get("status") != "PASS":
+                continue
+            mean_ns = ((b.get("phases") or {}).get("total") or {}).get("mean_ns")
+            if not mean_ns:
+                continue
+            payload = _payload_bytes(b, meta["guest"])
+            row = rows.setdefault(
+                (meta["host"], meta["guest"], b["scenario"], b["data_size"]),
+                {"host": meta["host"], "guest": meta["guest"], "scenario": b["scenario"], "data_size": b["data_size"]},
+            )
+            row[meta["mechanism"]] = {
+                "mean_ns": mean_ns,
+                "payload_bytes": payload,
+                "bytes_per_sec": payload * 1e9 / mean_ns,
+                "peak_rss_bytes": (b.get("memory") or {}).get("peak_rss_bytes"),
+            }
+    return [rows[k] for k in sorted(rows)]
+
+
+def compute_phase_breakdown(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Marshal / call / unmarshal split per (host, guest, mechanism, scenario).
+
+    Only benchmarks with probed phases (phases.call) contribute. call_share is
+    call / (marshal + call + unmarshal) over the instrumented iterations.
+    """
+    rows = []
+    for r in results:
+        meta = r["metadata"]
+        for b in r.get("benchmarks", []):
+            phases = b.get("phases") or {}
+            if b.get("status") != "PASS" or "call" not in phases:
+                continue
+            means = {p: (phases.get(p) or {}).get("mean_ns") for p in ("marshal", "call", "unmarshal")}
+            if any(v is None for v in means.values()):
+                raise ConsolidationError(
+                    f"Incomplete phase breakdown in {meta['host']}->{meta['guest']} [{meta['mechanism']}] {b['scenario']}"
+                )
+            instrumented = sum(means.values())
+            scenario = b["scenario"] if b.get("data_size") is None else f"{b['scenario']}_{b['data_size']}"
+            rows.append({
+                "host": meta["host"],
+                "guest": meta["guest"],
+                "mechanism": meta["mechanism"],
+                "scenario": scenario,
+                "marshal_ns": means["marshal"],
+                "call_ns": means["call"],
+                "unmarshal_ns": means["unmarshal"],
+                "total_ns": (phases.get("total") or {}).get("mean_ns"),
+                "call_share": means["call"] / instrumented if instrumented else None,
+                "probe_calls": (b.get("phase_probe") or {}).get("calls"),
+            })
+    return sorted(rows, key=lambda row: (row["host"], row["guest"], row["mechanism"], row["scenario"]))
+
+
+def find_precision_misses(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Targeted benchmarks (precision.mode == "target") whose precision target was not met."""
+    misses = []
+    for r in results:
+        meta = r["metadata"]
+        for b in r.get("benchmarks", []):
+            precision = b.get("precision") or {}
+            if b.get("status") != "PASS" or precision.get("met") is not False:
+                continue
+            scenario = b["scenario"] if b.get("data_size") is None else f"{b['scenario']}_{b['data_size']}"
+            misses.append({
+                "host": meta["host"],
+                "guest": meta["guest"],
+                "mechanism": meta["mechanism"],
+                "scenario": scenario,
+                "target": precision.get("target"),
+                "half_width_rel": precision.get("half_width_rel"),
+                "iterations_per_repeat": precision.get("iterations_per_repeat"),
+                "stop_per_repeat": precision.get("stop_per_repeat"),
+            })
+    return sorted(misses, key=lambda row: (row["host"], row["guest"], row["mechanism"], row["scenario"]))
+
+
+def compute_gc_attribution(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """GC collections and tail latency with / without GC-overlapped samples (gc.mode == "trace")."""
+    rows = []
+    for r in results:
+        meta = r["metadata"]
+        for b in r.get("benchmarks", []):
+            gc_info = b.get("gc") or {}
+            if b.get("status") != "PASS" or gc_info.get("mode") != "trace":
+                continue
+            scenario = b["scenario"] if b.get("data_size") is None else f"{b['scenario']}_{b['data_size']}"
+            rows.append({
+                "host": meta["host"],
+                "guest": meta["guest"],
+                "mechanism": meta["mechanism"],
+                "scenario": scenario,
+                "collections": gc_info.get("collections"),
+                "collections_by_generation": gc_info.get("collections_by_generation"),
+                "pause_ns_total": gc_info.get("pause_ns_total"),
+                "pause_ns_max": gc_info.get("pause_ns_max"),
+                "gc_samples": gc_info.get("gc_samples"),
+                "p99_ns": gc_info["tail"]["all"]["p99_ns"],
+                "p99_ns_without_gc": gc_info["tail"]["without_gc"]["p99_ns"],
+            })
+    return sorted(rows, key=lambda row: (row["host"], row["guest"], row["mechanism"], row["scenario"]))
+
+
+def compute_scaling_comparison(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Side-by-side concurrency scaling per (host, guest, mode, scenario, workers).
+
+    Each row holds {mechanism: {ops_per_sec, efficiency, p99_ns}} for every
+    result file that carries a "scaling" section (see benchmark_scaling.py).
+    """
+    rows: dict[tuple[str, str, str, str, int], dict[str, Any]] = {}
+    for r in results:
+        meta = r["metadata"]
+        scaling = r.get("scaling")
+        if not isinstance(scaling, dict):
+            continue
+        for mode, section in scaling.items():
+            if not isinstance(section, dict):
+                raise ConsolidationError(
+                    f"Malformed scaling.{mode} in {meta['host']}->{meta['guest']} [{meta['mechanism']}]"
+                )
+            for sc in section.get("scenarios", []):
+                key = sc["scenario"] if sc.get("data_size") is None else f"{sc['scenario']}_{sc['data_size']}"
+                for lv in sc.get("levels", []):
+                    p99 = lv.get("p99_ns")
+                    if p99 is None and isinstance(lv.get("latency"), dict):
+                        p99 = lv["latency"].get("p99_ns")
+                    row = rows.setdefault(
+                        (meta["host"], meta["guest"], mode, key, lv["workers"]),
+                        {
+                            "host": meta["host"],
+                            "guest": meta["guest"],
+                            "mode": mode,
+                            "scenario": key,
+                            "workers": lv["workers"],
+                        },
+                    )
+                    row[meta["mechanism"]] = {
+                        "ops_per_sec": lv["ops_per_sec"],
+                        "efficiency": lv.get("efficiency"),
+                        "p99_ns": p99,
+                    }
+    return [rows[k] for k in sorted(rows)]
+
+
+def compute_concurrency_throughput(scaling_comparisons: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Throughput under concurrency across scaling modes, per (host, guest, scenario, N).
+
+    N is the thread or process count for MetaFFI and native mechanisms and the
+    in-flight request depth for grpc.aio. Each row maps "<mechanism>/<mode>" to
+    {ops_per_sec, p99_ns}.
+    """
+    rows: dict[tuple[str, str, str, int], dict[str, Any]] = {}
+    for comp in scaling_comparisons:
+        row = rows.setdefault(
+            (comp["host"], comp["guest"], comp["scenario"], comp["workers"]),
+            {"host": comp["host"], "guest": comp["guest"], "scenario": comp["scenario"], "concurrency": comp["workers"]},
+        )
+        for mech, data in comp.items():
+            if isinstance(data, dict):
+                row[f"{mech}/{comp['mode']}"] = {"ops_per_sec": data["ops_per_sec"], "p99_ns": data["p99_ns"]}
+    return [rows[k] for k in sorted(rows)]
+
+
+def compute_process_init(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Per-process init cost and RSS of process-scaling runs, per worker count."""
+    rows = []
+    for r in results:
+        meta = r["metadata"]
+        section = (r.get("scaling") or {}).get("processes")
+        if not isinstance(section, dict):
+            continue
+        for entry in section.get("process_init", []):
+            procs = entry["processes"]
+            rss = [p["rss_after_init_bytes"] for p in procs if p.get("rss_after_init_bytes") is not None]
+            rows.append({
+                "host": meta["host"],
+                "guest": meta["guest"],
+                "mechanism": meta["mechanism"],
+                "workers": entry["workers"],
+                "median_spawn_ns": entry.get("median_spawn_ns", statistics.median(p["spawn_ns"] for p in procs)),
+                "median_init_ns": entry.get("median_init_ns", statistics.median(p["init_ns"] for p in procs)),
+                "median_rss_after_init_bytes": entry.get(
+                    "median_rss_after_init_bytes", statistics.median(rss) if rss else None
+                ),
+            })
+    return sorted(rows, key=lambda row: (row["host"], row["guest"], row["mechanism"], row["workers"]))
+
+
 def find_missing_triples(results: list[dict[str, Any]]) -> list[dict[str, str]]:
     """Identify expected triples with no result file."""
 
@@ -272,6 +637,9 @@ def build_summary(results: list[dict[str, Any]],
     total_correctness_fail = 0
     total_benchmarks_pass = 0
     total_benchmarks_fail = 0
+    total_sidecar_benchmarks = 0
+    precision_targeted = 0
+    precision_met = 0
 
     for r in results:
         correctness = r.get("correctness")
@@ -286,6 +654,12 @@ def build_summary(results: list[dict[str, Any]],
                 total_benchmarks_pass += 1
             elif b.get("status") == "FAIL":
                 total_benchmarks_fail += 1
+            if benchmark_samples.has_sidecars(b):
+                total_sidecar_benchmarks += 1
+            met = (b.get("precision") or {}).get("met")
+            if b.get("status") == "PASS" and isinstance(met, bool):
+                precision_targeted += 1
+                precision_met += met
 
     return {
         "expected_triples": len(ALL_EXPECTED_TRIPLES),
@@ -299,12 +673,18 @@ def build_summary(results: list[dict[str, Any]],
             "passed": total_benchmarks_pass,
             "failed": total_benchmarks_fail,
         },
+        "raw_sample_sidecars": total_sidecar_benchmarks,
+        "precision": {
+            "targeted": precision_targeted,
+            "met": precision_met,
+        },
     }
 
 
 def main() -> int:
     try:
         results = load_result_files()
+        cold_start = load_cold_start()
     except ConsolidationError as e:
         print(f"FATAL: {e}", file=sys.stderr)
         return 1
@@ -318,6 +698,14 @@ def main() -> int:
     comparisons = compute_comparison_table(results)
     summary = build_summary(results, missing_triples, failed_benchmarks)
     mechanism_averages_by_pair = compute_mechanism_averages_by_pair(comparisons)
+    container_comparisons = compute_container_comparison(results)
+    array_throughput = compute_array_throughput(results)
+    phase_breakdown = compute_phase_breakdown(results)
+    precision_misses = find_precision_misses(results)
+    gc_attribution = compute_gc_attribution(results)
+    scaling_comparisons = compute_scaling_comparison(results)
+    process_init = compute_process_init(results)
+    concurrency_throughput = compute_concurrency_throughput(scaling_comparisons)
 
     consolidated = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -326,6 +714,15 @@ def main() -> int:
         "failed_benchmarks": failed_benchmarks,
         "comparisons": comparisons,
         "mechanism_averages_by_pair": mechanism_averages_by_pair,
+        "container_comparisons": container_comparisons,
+        "array_throughput": array_throughput,
+        "phase_breakdown": phase_breakdown,
+        "precision_misses": precision_misses,
+        "gc_attribution": gc_attribution,
+        "scaling_comparisons": scaling_comparisons,
+        "scaling_process_init": process_init,
+        "concurrency_throughput": concurrency_throughput,
+        "cold_start": cold_start,
         "results": results,
     }
 
@@ -342,6 +739,11 @@ def main() -> int:
     print(f"  Missing files:     {summary['missing_result_files']}")
     print(f"  Correctness:       {summary['correctness']['passed']} passed, {summary['correctness']['failed']} failed")
     print(f"  Benchmarks:        {summary['benchmarks']['passed']} passed, {summary['benchmarks']['failed']} failed")
+    if summary["precision"]["targeted"]:
+        print(f"  Precision target:  {summary['precision']['met']} of {summary['precision']['targeted']} targeted scenarios met")
+    if cold_start:
+        print(f"  Cold start:        {len(cold_start['mechanisms'])} mechanism(s), "
+              f"{cold_start['metadata'].get('runs')} launches each")
 
     # Explicitly report missing triples
     if missing_triples:
@@ -360,6 +762,13 @@ def main() -> int:
                 label += f"  -- {f_item['error'][:80]}"
             print(label)
 
+    if precision_misses:
+        print()
+        print("PRECISION TARGET NOT MET:")
+        for m in precision_misses:
+            print(f"  {m['host']}->{m['guest']} [{m['mechanism']}] {m['scenario']}  "
+                  f"+/-{m['half_width_rel']:.2%} (target {m['target']:.2%}), stopped at {m['stop_per_repeat']}")
+
     # Count MISSING entries in comparison table
     missing_data_points = 0
     for row in comparisons:
@@ -378,19 +787,23 @@ def main() -> int:
                   or summary["correctness"]["failed"] > 0
                   or summary["benchmarks"]["failed"] > 0)
 
-    # Generate tables and report (fail-fast on any generation error)
-    tables_script = Path(__file__).resolve().parent / "generate_tables.py"
-    report_script = Path(__file__).resolve().parent / "generate_report.py"
+    # Generate tables and report from one in-memory model (fail-fast on any generation error).
+    # Imported here: the report needs matplotlib, consolidation alone does not.
+    import generate_report
+    import generate_tables
+    import report_model
+
     print()
-    if tables_script.is_file():
-        subprocess.run([sys.executable, str(tables_script)], cwd=str(tables_script.parent), check=True)
-    else:
-        raise FileNotFoundError(f"Missing required script: {tables_script}")
-
-    if report_script.is_file():
-        subprocess.run([sys.executable, str(report_script)], cwd=str(report_script.parent), check=True)
-    else:
-        raise FileNotFoundError(f"Missing required script: {report_script}")
+    try:
+        model = report_model.build_model(consolidated, report_model.load_json(report_model.COMPLEXITY_FILE))
+        generate_tables.write_tables(model)
+        print(f"Tables written to {generate_tables.TABLES_FILE}")
+        generate_report.write_report(model)
+        print(f"Report written to {generate_report.REPORT_FILE}")
+        print(f"Figures written to {generate_report.FIGURES_DIR}")
+    except (report_model.ReportModelError, generate_report.ReportGenerationError) as e:
+        print(f"FATAL: {e}", file=sys.stderr)
+        return 1
 
     if has_issues:
         print()
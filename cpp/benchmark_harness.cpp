@@ -0,0 +1,753 @@
+#include "benchmark_harness.h"
+
+#include <array>
+#include <cctype>
+#include <cstdio>
+#include <cstdlib>
+#include <ctime>
+#include <filesystem>
+#include <fstream>
+#include <iomanip>
+#include <iostream>
+#include <sstream>
+
+namespace bench
+{
+
+namespace
+{
+
+std::string env_or_empty(const char* name)
+{
+	const char* value = std::getenv(name);
+	std::string s = value ? value : "";
+	size_t first = s.find_first_not_of(" \t\r\n");
+	size_t last = s.find_last_not_of(" \t\r\n");
+	return first == std::string::npos ? "" : s.substr(first, last - first + 1);
+}
+
+std::string lower(std::string s)
+{
+	for (char& c : s)
+	{
+		c = char(std::tolower(static_cast<unsigned char>(c)));
+	}
+	return s;
+}
+
+// Parses an integer variable; min_value guards settings that must be positive.
+int64_t int_env(const char* name, int64_t default_value, int64_t min_value)
+{
+	std::string raw = env_or_empty(name);
+	if (raw.empty())
+	{
+		return default_value;
+	}
+	size_t pos = 0;
+	int64_t value = 0;
+	try
+	{
+		value = std::stoll(raw, &pos);
+	}
+	catch (const std::exception&)
+	{
+		pos = 0;
+	}
+	if (pos != raw.size() || value < min_value)
+	{
+		throw std::runtime_error(std::string(name) + ": invalid value \"" + raw + "\"");
+	}
+	return value;
+}
+
+// Parses a fraction in [low, 1); low_inclusive selects [low, 1) vs (low, 1).
+double fraction_env(const char* name, double default_value, bool low_inclusive)
+{
+	std::string raw = env_or_empty(name);
+	if (raw.empty())
+	{
+		return default_value;
+	}
+	size_t pos = 0;
+	double value = 0;
+	try
+	{
+		value = std::stod(raw, &pos);
+	}
+	catch (const std::exception&)
+	{
+		pos = 0;
+	}
+	bool low_ok = low_inclusive ? value >= 0 : value > 0;
+	if (pos != raw.size() || !low_ok || value >= 1)
+	{
+		throw std::runtime_error(std::string(name) + ": invalid value \"" + raw + "\"");
+	}
+	return value;
+}
+
+double median_in_place(std::vector<double>& values)
+{
+	std::sort(values.begin(), values.end());
+	size_t n = values.size();
+	return n % 2 == 1 ? values[n / 2] : (values[n / 2 - 1] + values[n / 2]) / 2;
+}
+
+// Reports whether the medians and MADs all lie within tolerance x the lowest median.
+bool windows_agree(const std::vector<double>& medians, const std::vector<double>& mads, size_t k, double tolerance)
+{
+	auto [med_lo, med_hi] = std::minmax_element(medians.end() - k, medians.end());
+	auto [mad_lo, mad_hi] = std::minmax_element(mads.end() - k, mads.end());
+	double bound = tolerance * *med_lo;
+	return *med_hi - *med_lo <= bound && *mad_hi - *mad_lo <= bound;
+}
+
+// Half-width of the order-statistic 95% CI of the median of the IQR-cleaned
+// samples, relative to that median.
+double median_ci_half_width(const std::vector<int64_t>& samples)
+{
+	std::vector<int64_t> sorted(samples);
+	std::sort(sorted.begin(), sorted.end());
+	std::vector<int64_t> cleaned = remove_outliers_iqr(sorted);
+	size_t n = cleaned.size();
+	if (n == 0)
+	{
+		return 0;
+	}
+	double half = 1.96 * std::sqrt(double(n)) / 2;
+	size_t lo = size_t(std::max(std::floor(double(n) / 2 - half), 0.0));
+	size_t hi = size_t(std::min(std::ceil(double(n) / 2 + half), double(n - 1)));
+	double median = n % 2 == 0 ? double(cleaned[n / 2 - 1] + cleaned[n / 2]) / 2 : double(cleaned[n / 2]);
+	if (median <= 0)
+	{
+		return 0;
+	}
+	return double(cleaned[hi] - cleaned[lo]) / (2 * median);
+}
+
+// ---------------------------------------------------------------------------
+// Raw sample sidecars (METAFFI_TEST_RAW_FORMAT=npy, see benchmark_samples.py)
+// ---------------------------------------------------------------------------
+
+std::string sha256_hex(const std::string& data)
+{
+	static const uint32_t k[64] = {
+		0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+		0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+		0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+		0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+		0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+		0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+		0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+		0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+	};
+	uint32_t h[8] = {
+		0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+	};
+	auto rotr = [](uint32_t x, int n) { return (x >> n) | (x << (32 - n)); };
+
+	std::string msg = data;
+	uint64_t bit_len = uint64_t(data.size()) * 8;
+	msg.push_back(char(0x80));
+	while (msg.size() % 64 != 56)
+	{
+		msg.push_back(0);
+	}
+	for (int i = 7; i >= 0; i--)
+	{
+		msg.push_back(char((bit_len >> (8 * i)) & 0xff));
+	}
+
+	for (size_t chunk = 0; chunk < msg.size(); chunk += 64)
+	{
+		uint32_t w[64];
+		for (int i = 0; i < 16; i++)
+		{
+			const auto* p = reinterpret_cast<const unsigned char*>(msg.data() + chunk + 4 * i);
+			w[i] = (uint32_t(p[0]) << 24) | (uint32_t(p[1]) << 16) | (uint32_t(p[2]) << 8) | uint32_t(p[3]);
+		}
+		for (int i = 16; i < 64; i++)
+		{
+			uint32_t s0 = rotr(w[i - 15], 7) ^ rotr(w[i - 15], 18) ^ (w[i - 15] >> 3);
+			uint32_t s1 = rotr(w[i - 2], 17) ^ rotr(w[i - 2], 19) ^ (w[i - 2] >> 10);
+			w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+		}
+		uint32_t a = h[0], b = h[1], c = h[2], d = h[3], e = h[4], f = h[5], g = h[6], hh = h[7];
+		for (int i = 0; i < 64; i++)
+		{
+			uint32_t s1 = rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25);
+			uint32_t ch = (e & f) ^ (~e & g);
+			uint32_t t1 = hh + s1 + ch + k[i] + w[i];
+			uint32_t s0 = rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22);
+			uint32_t maj = (a & b) ^ (a & c) ^ (b & c);
+			uint32_t t2 = s0 + maj;
+			hh = g;
+			g = f;
+			f = e;
+			e = d + t1;
+			d = c;
+			c = b;
+			b = a;
+			a = t1 + t2;
+		}
+		h[0] += a; h[1] += b; h[2] += c; h[3] += d;
+		h[4] += e; h[5] += f; h[6] += g; h[7] += hh;
+	}
+
+	std::ostringstream out;
+	for (uint32_t v : h)
+	{
+		out << std::hex << std::setw(8) << std::setfill('0') << v;
+	}
+	return out.str();
+}
+
+// Writes samples as a 1-D little-endian int64 .npy file; returns its sha256.
+std::string write_npy_int64(const std::filesystem::path& path, const std::vector<int64_t>& samples)
+{
+	std::string header = "{'descr': '<i8', 'fortran_order': False, 'shape': (" +
+		std::to_string(samples.size()) + ",), }";
+	// Pad so that the data starts on a 64-byte boundary (NPY format 1.0).
+	size_t total = 6 + 2 + 2 + header.size() + 1;
+	header += std::string((64 - total % 64) % 64, ' ') + "\n";
+
+	std::string buf("\x93NUMPY\x01\x00", 8);
+	buf.push_back(char(header.size() & 0xff));
+	buf.push_back(char((header.size() >> 8) & 0xff));
+	buf += header;
+	for (int64_t v : samples)
+	{
+		uint64_t u = uint64_t(v);
+		for (int i = 0; i < 8; i++)
+		{
+			buf.push_back(char((u >> (8 * i)) & 0xff));
+		}
+	}
+
+	std::filesystem::create_directories(path.parent_path());
+	std::ofstream f(path, std::ios::binary);
+	f.write(buf.data(), std::streamsize(buf.size()));
+	if (!f)
+	{
+		throw std::runtime_error("failed to write raw samples: " + path.string());
+	}
+	return sha256_hex(buf);
+}
+
+// ---------------------------------------------------------------------------
+// JSON writing
+// ---------------------------------------------------------------------------
+
+std::string json_string(const std::string& s)
+{
+	std::ostringstream out;
+	out << '"';
+	for (char c : s)
+	{
+		switch (c)
+		{
+			case '"': out << "\\\""; break;
+			case '\\': out << "\\\\"; break;
+			case '\n': out << "\\n"; break;
+			case '\r': out << "\\r"; break;
+			case '\t': out << "\\t"; break;
+			default:
+				if (static_cast<unsigned char>(c) < 0x20)
+				{
+					out << "\\u" << std::hex << std::setw(4) << std::setfill('0') << int(c) << std::dec;
+				}
+				else
+				{
+					out << c;
+				}
+		}
+	}
+	out << '"';
+	return out.str();
+}
+
+std::string json_number(double v)
+{
+	if (!std::isfinite(v))
+	{
+		return "null";
+	}
+	std::ostringstream out;
+	out << std::setprecision(17) << v;
+	return out.str();
+}
+
+template <typename T>
+std::string json_optional(const std::optional<T>& v)
+{
+	if (!v)
+	{
+		return "null";
+	}
+	if constexpr (std::is_same_v<T, bool>)
+	{
+		return *v ? "true" : "false";
+	}
+	else if constexpr (std::is_floating_point_v<T>)
+	{
+		return json_number(*v);
+	}
+	else
+	{
+		return std::to_string(*v);
+	}
+}
+
+std::string json_int_array(const std::vector<int64_t>& values)
+{
+	std::ostringstream out;
+	out << '[';
+	for (size_t i = 0; i < values.size(); i++)
+	{
+		if (i > 0)
+		{
+			out << ", ";
+		}
+		out << values[i];
+	}
+	out << ']';
+	return out.str();
+}
+
+std::string os_name()
+{
+#if defined(_WIN32)
+	return "windows";
+#elif defined(__APPLE__)
+	return "darwin";
+#else
+	return "linux";
+#endif
+}
+
+std::string arch_name()
+{
+#if defined(_M_X64) || defined(__x86_64__)
+	return "amd64";
+#elif defined(_M_ARM64) || defined(__aarch64__)
+	return "arm64";
+#else
+	return "unknown";
+#endif
+}
+
+std::string compiler_version()
+{
+#if defined(_MSC_VER)
+	return "msvc " + std::to_string(_MSC_VER);
+#elif defined(__clang__)
+	return std::string("clang ") + __clang_version__;
+#elif defined(__GNUC__)
+	return std::string("gcc ") + __VERSION__;
+#else
+	return "unknown";
+#endif
+}
+
+std::string utc_timestamp()
+{
+	std::time_t now = std::time(nullptr);
+	std::tm tm{};
+#if defined(_WIN32)
+	gmtime_s(&tm, &now);
+#else
+	gmtime_r(&now, &tm);
+#endif
+	char buf[32];
+	std::strftime(buf, sizeof(buf), "%Y-%m-%dT%H:%M:%SZ", &tm);
+	return buf;
+}
+
+} // namespace
+
+// ---------------------------------------------------------------------------
+// Configuration
+// ---------------------------------------------------------------------------
+
+Config Config::from_env()
+{
+	Config cfg;
+	cfg.mode = env_or_empty("METAFFI_TEST_MODE");
+	cfg.warmup = int(int_env("METAFFI_TEST_WARMUP", 100, 0));
+	cfg.iterations = int(int_env("METAFFI_TEST_ITERATIONS", 10000, 1));
+	cfg.batch_min_elapsed_ns = int_env("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", 10000, 0);
+	cfg.batch_max_calls = int(int_env("METAFFI_TEST_BATCH_MAX_CALLS", 100000, 1));
+
+	std::string warmup_mode = lower(env_or_empty("METAFFI_TEST_WARMUP_MODE"));
+	if (!warmup_mode.empty())
+	{
+		if (warmup_mode != "fixed" && warmup_mode != "adaptive")
+		{
+			throw std::runtime_error("METAFFI_TEST_WARMUP_MODE must be fixed or adaptive, got \"" + warmup_mode + "\"");
+		}
+		cfg.warmup_settings.mode = warmup_mode;
+	}
+	cfg.warmup_settings.window_calls = int(int_env("METAFFI_TEST_WARMUP_WINDOW", 100, 1));
+	cfg.warmup_settings.stable_windows = int(int_env("METAFFI_TEST_WARMUP_STABLE_WINDOWS", 3, 1));
+	cfg.warmup_settings.max_calls = int(int_env("METAFFI_TEST_WARMUP_MAX_CALLS", 20000, 1));
+	cfg.warmup_settings.tolerance = fraction_env("METAFFI_TEST_WARMUP_TOLERANCE", 0.05, false);
+
+	cfg.precision.target = fraction_env("METAFFI_TEST_PRECISION_TARGET", 0.0, true);
+	cfg.precision.block_iterations = int(int_env("METAFFI_TEST_PRECISION_BLOCK", 1000, 1));
+	cfg.precision.max_iterations = int(int_env("METAFFI_TEST_PRECISION_MAX_ITERATIONS", 100000, 1));
+	cfg.precision.max_seconds = int(int_env("METAFFI_TEST_PRECISION_MAX_SECONDS", 60, 1));
+
+	std::string raw_format = lower(env_or_empty("METAFFI_TEST_RAW_FORMAT"));
+	if (!raw_format.empty())
+	{
+		if (raw_format != "json" && raw_format != "npy")
+		{
+			throw std::runtime_error("METAFFI_TEST_RAW_FORMAT must be json or npy, got \"" + raw_format + "\"");
+		}
+		cfg.raw_sample_format = raw_format;
+	}
+
+	std::stringstream scenarios(env_or_empty("METAFFI_TEST_SCENARIOS"));
+	std::string part;
+	while (std::getline(scenarios, part, ','))
+	{
+		size_t first = part.find_first_not_of(" \t");
+		size_t last = part.find_last_not_of(" \t");
+		if (first != std::string::npos)
+		{
+			cfg.scenario_filter.insert(part.substr(first, last - first + 1));
+		}
+	}
+	return cfg;
+}
+
+bool Config::should_run(const std::string& scenario, std::optional<int> data_size) const
+{
+	return scenario_filter.empty() || scenario_filter.count(scenario_key(scenario, data_size)) > 0;
+}
+
+std::string scenario_key(const std::string& scenario, std::optional<int> data_size)
+{
+	return data_size ? scenario + "_" + std::to_string(*data_size) : scenario;
+}
+
+// ---------------------------------------------------------------------------
+// Statistics helpers
+// ---------------------------------------------------------------------------
+
+PhaseStats compute_stats(const std::vector<int64_t>& sorted)
+{
+	PhaseStats stats;
+	size_t n = sorted.size();
+	if (n == 0)
+	{
+		return stats;
+	}
+
+	double sum = 0;
+	for (int64_t v : sorted)
+	{
+		sum += double(v);
+	}
+	double mean = sum / double(n);
+
+	double median = n % 2 == 0 ? double(sorted[n / 2 - 1] + sorted[n / 2]) / 2.0 : double(sorted[n / 2]);
+	double p95 = double(sorted[size_t(double(n) * 0.95)]);
+	double p99 = double(sorted[size_t(std::min(double(n) * 0.99, double(n - 1)))]);
+
+	double sq_diff_sum = 0;
+	for (int64_t v : sorted)
+	{
+		double diff = double(v) - mean;
+		sq_diff_sum += diff * diff;
+	}
+	double stddev = std::sqrt(sq_diff_sum / double(n));
+	double se = stddev / std::sqrt(double(n));
+
+	stats.mean_ns = mean;
+	stats.median_ns = median;
+	stats.p95_ns = p95;
+	stats.p99_ns = p99;
+	stats.stddev_ns = stddev;
+	stats.ci95_ns[0] = mean - 1.96 * se;
+	stats.ci95_ns[1] = mean + 1.96 * se;
+	return stats;
+}
+
+std::vector<int64_t> remove_outliers_iqr(const std::vector<int64_t>& sorted)
+{
+	size_t n = sorted.size();
+	if (n < 4)
+	{
+		return sorted;
+	}
+	double q1 = double(sorted[n / 4]);
+	double q3 = double(sorted[3 * n / 4]);
+	double iqr = q3 - q1;
+	double lower_bound = q1 - 1.5 * iqr;
+	double upper_bound = q3 + 1.5 * iqr;
+
+	std::vector<int64_t> result;
+	result.reserve(n);
+	for (int64_t v : sorted)
+	{
+		if (double(v) >= lower_bound && double(v) <= upper_bound)
+		{
+			result.push_back(v);
+		}
+	}
+	return result;
+}
+
+int64_t measure_timer_overhead()
+{
+	using clock = std::chrono::steady_clock;
+	constexpr int n = 10000;
+	std::vector<int64_t> samples(n);
+	for (int i = 0; i < n; i++)
+	{
+		auto start = clock::now();
+		samples[i] = std::chrono::duration_cast<std::chrono::nanoseconds>(clock::now() - start).count();
+	}
+	std::sort(samples.begin(), samples.end());
+	return samples[n / 2];
+}
+
+// ---------------------------------------------------------------------------
+// Warmup and precision-targeted sampling
+// ---------------------------------------------------------------------------
+
+WarmupInfo warm_up(const std::string& scenario, std::optional<int> data_size, const Config& cfg,
+                   const std::function<void()>& fn)
+{
+	using clock = std::chrono::steady_clock;
+	const WarmupSettings& s = cfg.warmup_settings;
+	WarmupInfo info;
+
+	auto checked_call = [&](int i) {
+		try
+		{
+			fn();
+		}
+		catch (const std::exception& e)
+		{
+			throw std::runtime_error("benchmark \"" + scenario + "\" warmup iteration " + std::to_string(i) + ": " + e.what());
+		}
+	};
+
+	if (s.mode != "adaptive" || (data_size && *data_size > LARGE_ARRAY_THRESHOLD))
+	{
+		for (int i = 0; i < cfg.warmup; i++)
+		{
+			checked_call(i);
+		}
+		info.mode = "fixed";
+		info.calls = cfg.warmup;
+		return info;
+	}
+
+	int max_calls = std::max(s.max_calls, cfg.warmup);
+	std::vector<double> medians, mads, window;
+	int calls = 0;
+	bool converged = false;
+	while (calls < max_calls && !converged)
+	{
+		window.clear();
+		while (int(window.size()) < s.window_calls && calls < max_calls)
+		{
+			auto start = clock::now();
+			checked_call(calls);
+			window.push_back(double(std::chrono::duration_cast<std::chrono::nanoseconds>(clock::now() - start).count()));
+			calls++;
+		}
+		double median = median_in_place(window);
+		for (double& v : window)
+		{
+			v = std::abs(v - median);
+		}
+		medians.push_back(median);
+		mads.push_back(median_in_place(window));
+		size_t k = size_t(s.stable_windows);
+		converged = calls >= cfg.warmup && medians.size() >= k && windows_agree(medians, mads, k, s.tolerance);
+	}
+	info.mode = "adaptive";
+	info.calls = calls;
+	info.windows = int(medians.size());
+	info.converged = converged;
+	return info;
+}
+
+PrecisionSampler::PrecisionSampler(const PrecisionSettings& settings, std::optional<int> data_size, int iterations)
+	: m_settings(settings)
+	, m_block(iterations)
+	, m_max_iterations(iterations)
+{
+	if (settings.target > 0 && (!data_size || *data_size <= LARGE_ARRAY_THRESHOLD))
+	{
+		m_adaptive = true;
+		m_block = settings.block_iterations;
+		m_max_iterations = settings.max_iterations;
+		m_info.mode = "target";
+		m_info.target = settings.target;
+	}
+}
+
+int PrecisionSampler::next(const std::vector<int64_t>& samples)
+{
+	int n = int(samples.size());
+	if (n == 0)
+	{
+		m_deadline = std::chrono::steady_clock::now() + std::chrono::seconds(m_settings.max_seconds);
+	}
+	else
+	{
+		m_info.blocks++;
+		m_info.half_width_rel = median_ci_half_width(samples);
+		if (!m_adaptive)
+		{
+			m_info.stop = "iterations";
+		}
+		else if (m_info.half_width_rel <= m_settings.target)
+		{
+			m_info.stop = "target";
+		}
+		else if (n >= m_max_iterations)
+		{
+			m_info.stop = "max_iterations";
+		}
+		else if (std::chrono::steady_clock::now() >= m_deadline)
+		{
+			m_info.stop = "time_budget";
+		}
+		if (!m_info.stop.empty())
+		{
+			m_info.iterations = n;
+			if (m_adaptive)
+			{
+				m_info.met = m_info.half_width_rel <= m_settings.target;
+			}
+			return 0;
+		}
+	}
+	return std::min(m_max_iterations - n, m_block);
+}
+
+// ---------------------------------------------------------------------------
+// Result writer
+// ---------------------------------------------------------------------------
+
+void write_results(const std::string& default_path, const ResultMetadata& meta, const Config& cfg,
+                   const std::vector<std::pair<std::string, int64_t>>& initialization,
+                   const std::vector<BenchmarkResult>& benchmarks)
+{
+	std::string result_path = env_or_empty("METAFFI_TEST_RESULTS_FILE");
+	if (result_path.empty())
+	{
+		result_path = default_path;
+	}
+	std::filesystem::path path(result_path);
+	std::string stem = path.stem().string();
+
+	std::ostringstream out;
+	out << "{\n";
+	out << "  \"metadata\": {\n";
+	out << "    \"host\": " << json_string(meta.host) << ",\n";
+	out << "    \"guest\": " << json_string(meta.guest) << ",\n";
+	out << "    \"mechanism\": " << json_string(meta.mechanism) << ",\n";
+	out << "    \"timestamp\": " << json_string(utc_timestamp()) << ",\n";
+	out << "    \"environment\": {\n";
+	out << "      \"os\": " << json_string(os_name()) << ",\n";
+	out << "      \"arch\": " << json_string(arch_name()) << ",\n";
+	out << "      \"cpp_compiler\": " << json_string(compiler_version()) << "\n";
+	out << "    },\n";
+	out << "    \"config\": {\n";
+	out << "      \"warmup_iterations\": " << cfg.warmup << ",\n";
+	out << "      \"warmup_mode\": " << json_string(cfg.warmup_settings.mode) << ",\n";
+	out << "      \"warmup_window_calls\": " << cfg.warmup_settings.window_calls << ",\n";
+	out << "      \"warmup_stable_windows\": " << cfg.warmup_settings.stable_windows << ",\n";
+	out << "      \"warmup_tolerance\": " << json_number(cfg.warmup_settings.tolerance) << ",\n";
+	out << "      \"warmup_max_calls\": " << cfg.warmup_settings.max_calls << ",\n";
+	out << "      \"precision_target\": " << json_number(cfg.precision.target) << ",\n";
+	out << "      \"precision_block_iterations\": " << cfg.precision.block_iterations << ",\n";
+	out << "      \"precision_max_iterations\": " << cfg.precision.max_iterations << ",\n";
+	out << "      \"precision_max_seconds\": " << cfg.precision.max_seconds << ",\n";
+	out << "      \"measured_iterations\": " << cfg.iterations << ",\n";
+	out << "      \"batch_min_elapsed_ns\": " << cfg.batch_min_elapsed_ns << ",\n";
+	out << "      \"batch_max_calls\": " << cfg.batch_max_calls << ",\n";
+	out << "      \"raw_sample_format\": " << json_string(cfg.raw_sample_format) << ",\n";
+	out << "      \"timer_overhead_ns\": " << meta.timer_overhead_ns << "\n";
+	out << "    }\n";
+	out << "  },\n";
+	out << "  \"initialization\": {";
+	for (size_t i = 0; i < initialization.size(); i++)
+	{
+		out << (i > 0 ? ",\n" : "\n") << "    " << json_string(initialization[i].first) << ": " << initialization[i].second;
+	}
+	out << (initialization.empty() ? "},\n" : "\n  },\n");
+	out << "  \"correctness\": null,\n";
+	out << "  \"benchmarks\": [";
+
+	for (size_t i = 0; i < benchmarks.size(); i++)
+	{
+		const BenchmarkResult& b = benchmarks[i];
+		const PhaseStats& t = b.total;
+		out << (i > 0 ? ",\n" : "\n");
+		out << "    {\n";
+		out << "      \"scenario\": " << json_string(b.scenario) << ",\n";
+		out << "      \"data_size\": " << json_optional(b.data_size) << ",\n";
+		out << "      \"status\": \"PASS\",\n";
+		if (cfg.raw_sample_format == "npy")
+		{
+			// Large sample lists go to <result stem>.raw/<scenario key>.raw_iterations_ns.npy
+			std::string rel = stem + ".raw/" + scenario_key(b.scenario, b.data_size) + ".raw_iterations_ns.npy";
+			std::string sha = write_npy_int64(path.parent_path() / std::filesystem::path(rel), b.raw_iterations_ns);
+			out << "      \"raw_iterations_ns\": null,\n";
+			out << "      \"raw_iterations_ns_file\": {\"path\": " << json_string(rel)
+			    << ", \"length\": " << b.raw_iterations_ns.size()
+			    << ", \"dtype\": \"<i8\", \"sha256\": " << json_string(sha) << "},\n";
+		}
+		else
+		{
+			out << "      \"raw_iterations_ns\": " << json_int_array(b.raw_iterations_ns) << ",\n";
+		}
+		out << "      \"raw_batch_calls\": " << json_int_array(b.raw_batch_calls) << ",\n";
+		out << "      \"phases\": {\n";
+		out << "        \"total\": {\n";
+		out << "          \"mean_ns\": " << json_number(t.mean_ns) << ",\n";
+		out << "          \"median_ns\": " << json_number(t.median_ns) << ",\n";
+		out << "          \"p95_ns\": " << json_number(t.p95_ns) << ",\n";
+		out << "          \"p99_ns\": " << json_number(t.p99_ns) << ",\n";
+		out << "          \"stddev_ns\": " << json_number(t.stddev_ns) << ",\n";
+		out << "          \"ci95_ns\": [" << json_number(t.ci95_ns[0]) << ", " << json_number(t.ci95_ns[1]) << "]\n";
+		out << "        }\n";
+		out << "      },\n";
+		out << "      \"warmup\": {\"mode\": " << json_string(b.warmup.mode)
+		    << ", \"calls\": " << b.warmup.calls
+		    << ", \"windows\": " << json_optional(b.warmup.windows)
+		    << ", \"converged\": " << json_optional(b.warmup.converged) << "},\n";
+		out << "      \"precision\": {\"mode\": " << json_string(b.precision.mode)
+		    << ", \"target\": " << json_optional(b.precision.target)
+		    << ", \"iterations\": " << b.precision.iterations
+		    << ", \"blocks\": " << b.precision.blocks
+		    << ", \"half_width_rel\": " << json_number(b.precision.half_width_rel)
+		    << ", \"met\": " << json_optional(b.precision.met)
+		    << ", \"stop\": " << json_string(b.precision.stop) << "}\n";
+		out << "    }";
+	}
+	out << (benchmarks.empty() ? "]\n" : "\n  ]\n");
+	out << "}\n";
+
+	if (path.has_parent_path())
+	{
+		std::filesystem::create_directories(path.parent_path());
+	}
+	std::ofstream f(path, std::ios::binary);
+	f << out.str();
+	if (!f)
+	{
+		throw std::runtime_error("failed to write benchmark results: " + result_path);
+	}
+	std::cerr << "Results written to " << result_path << std::endl;
+}
+
+} // namespace bench
@@ -0,0 +1,203 @@
+#pragma once
+
+// Benchmark harness shared by the C++ host benchmarks (cpp/call_*/benchmark.cpp).
+//
+// Mirrors the Go/Java/Python harnesses: METAFFI_TEST_* configuration, fixed or
+// adaptive warmup, precision-targeted sample count, batched timing loop, IQR
+// outlier removal, and the same result JSON schema (including .npy raw sample
+// sidecars when METAFFI_TEST_RAW_FORMAT=npy). Any failure throws.
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+#include <functional>
+#include <optional>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace bench
+{
+
+// Array sizes above this keep the fixed warmup and iteration count. The C++
+// host has scalar scenarios only; kept so the helpers match the other harnesses.
+constexpr int LARGE_ARRAY_THRESHOLD = 10000;
+
+// METAFFI_TEST_WARMUP calls, adaptive runs windows of timed calls until they agree.
+struct WarmupSettings
+{
+	std::string mode = "fixed";
+	int window_calls = 100;
+	int stable_windows = 3;
+	double tolerance = 0.05;
+	int max_calls = 20000;
+};
+
+// With target > 0 samples are taken in blocks until the median's 95% CI is
+// within +/- target of the median (see benchmark_precision.py).
+struct PrecisionSettings
+{
+	double target = 0.0;
+	int block_iterations = 1000;
+	int max_iterations = 100000;
+	int max_seconds = 60;
+};
+
+struct Config
+{
+	int warmup = 100;
+	WarmupSettings warmup_settings;
+	PrecisionSettings precision;
+	int iterations = 10000;
+	int64_t batch_min_elapsed_ns = 10000;
+	int batch_max_calls = 100000;
+	std::string raw_sample_format = "json";
+	std::set<std::string> scenario_filter;  // empty = all scenarios
+	std::string mode;                       // METAFFI_TEST_MODE
+
+	static Config from_env();
+	bool should_run(const std::string& scenario, std::optional<int> data_size = std::nullopt) const;
+};
+
+struct WarmupInfo
+{
+	std::string mode;
+	int calls = 0;
+	std::optional<int> windows;
+	std::optional<bool> converged;
+};
+
+struct PrecisionInfo
+{
+	std::string mode = "fixed";
+	std::optional<double> target;
+	int iterations = 0;
+	int blocks = 0;
+	double half_width_rel = 0.0;
+	std::optional<bool> met;
+	std::string stop;
+};
+
+struct PhaseStats
+{
+	double mean_ns = 0;
+	double median_ns = 0;
+	double p95_ns = 0;
+	double p99_ns = 0;
+	double stddev_ns = 0;
+	double ci95_ns[2] = {0, 0};
+};
+
+struct BenchmarkResult
+{
+	std::string scenario;
+	std::optional<int> data_size;
+	std::vector<int64_t> raw_iterations_ns;
+	std::vector<int64_t> raw_batch_calls;
+	PhaseStats total;
+	WarmupInfo warmup;
+	PrecisionInfo precision;
+};
+
+std::string scenario_key(const std::string& scenario, std::optional<int> data_size);
+
+// Summary statistics over samples sorted ascending.
+PhaseStats compute_stats(const std::vector<int64_t>& sorted);
+
+// IQR-based outlier removal over samples sorted ascending.
+std::vector<int64_t> remove_outliers_iqr(const std::vector<int64_t>& sorted);
+
+// Median of 10K back-to-back clock reads.
+int64_t measure_timer_overhead();
+
+// Runs the warmup of one scenario. In adaptive mode `warmup` is the minimum
+// call count; array sizes above LARGE_ARRAY_THRESHOLD keep the fixed warmup.
+WarmupInfo warm_up(const std::string& scenario, std::optional<int> data_size, const Config& cfg,
+                   const std::function<void()>& fn);
+
+// Decides how many samples one scenario takes: next() is called before every
+// block and returns its size, or 0 once measurement is done.
+class PrecisionSampler
+{
+public:
+	PrecisionSampler(const PrecisionSettings& settings, std::optional<int> data_size, int iterations);
+
+	int next(const std::vector<int64_t>& samples);
+	const PrecisionInfo& info() const { return m_info; }
+
+private:
+	PrecisionSettings m_settings;
+	bool m_adaptive = false;
+	int m_block;
+	int m_max_iterations;
+	std::chrono::steady_clock::time_point m_deadline;
+	PrecisionInfo m_info;
+};
+
+// Executes one scenario: warmup, then batched measured samples. fn must throw
+// on an incorrect result (fail-fast). The measured loop calls fn directly, so
+// only the call itself is inside the timed region.
+template <typename Fn>
+BenchmarkResult run_benchmark(const std::string& scenario, std::optional<int> data_size,
+                              const Config& cfg, Fn&& fn)
+{
+	using clock = std::chrono::steady_clock;
+
+	BenchmarkResult result;
+	result.scenario = scenario;
+	result.data_size = data_size;
+	result.warmup = warm_up(scenario, data_size, cfg, std::function<void()>(std::ref(fn)));
+
+	PrecisionSampler sampler(cfg.precision, data_size, cfg.iterations);
+	std::vector<int64_t>& raw_ns = result.raw_iterations_ns;
+	for (int block = sampler.next(raw_ns); block > 0; block = sampler.next(raw_ns))
+	{
+		for (int i = 0; i < block; i++)
+		{
+			// Keep calling within one sample until the batch budget is used up,
+			// so sub-microsecond calls are not dominated by the timer floor.
+			int64_t calls = 0;
+			int64_t elapsed = 0;
+			const auto start = clock::now();
+			while (true)
+			{
+				fn();
+				calls++;
+				elapsed = std::chrono::duration_cast<std::chrono::nanoseconds>(clock::now() - start).count();
+				if (elapsed >= cfg.batch_min_elapsed_ns || calls >= cfg.batch_max_calls)
+				{
+					break;
+				}
+			}
+			const double per_call = double(elapsed) / double(calls);
+			// Keep strictly positive values to avoid timer-floor collapse to 0 ns.
+			raw_ns.push_back(per_call > 0.0 && per_call < 1.0 ? 1 : int64_t(std::llround(per_call)));
+			result.raw_batch_calls.push_back(calls);
+		}
+	}
+	result.precision = sampler.info();
+
+	std::vector<int64_t> sorted(raw_ns);
+	std::sort(sorted.begin(), sorted.end());
+	result.total = compute_stats(remove_outliers_iqr(sorted));
+	return result;
+}
+
+struct ResultMetadata
+{
+	std::string host;
+	std::string guest;
+	std::string mechanism;
+	int64_t timer_overhead_ns = 0;
+};
+
+// Writes the result file to METAFFI_TEST_RESULTS_FILE (or default_path).
+// initialization: ordered (name, ns) pairs for the "initialization" section.
+void write_results(const std::string& default_path, const ResultMetadata& meta, const Config& cfg,
+                   const std::vector<std::pair<std::string, int64_t>>& initialization,
+                   const std::vector<BenchmarkResult>& benchmarks);
+
+} // namespace bench
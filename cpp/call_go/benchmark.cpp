@@ -0,0 +1,114 @@
+// C++ host benchmark: C++ -> Go guest via MetaFFI
+//
+// Scalar scenarios (void call, primitive echo, error propagation) timed with the
+// shared harness in ../benchmark_harness.h. C++ is the thinnest MetaFFI host, so
+// these results are the floor reference for the Go runtime.
+// Outputs results to tests/results/cpp_to_go_metaffi.json.
+
+#include "benchmark_harness.h"
+#include "test_env.h"
+
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+#include <exception>
+#include <iostream>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace
+{
+
+int run()
+{
+	const bench::Config cfg = bench::Config::from_env();
+	if (cfg.mode == "correctness")
+	{
+		std::cerr << "Skipping benchmarks: METAFFI_TEST_MODE=correctness" << std::endl;
+		return 0;
+	}
+
+	// Runtime plugin and guest module are loaded on first use of test_env()
+	const auto init_start = std::chrono::steady_clock::now();
+	auto& env = test_env();
+	const int64_t init_ns = std::chrono::duration_cast<std::chrono::nanoseconds>(
+		std::chrono::steady_clock::now() - init_start).count();
+	std::cerr << "Go runtime and guest module loaded in " << double(init_ns) / 1e6 << " ms" << std::endl;
+
+	bench::ResultMetadata meta{"cpp", "go", "metaffi", bench::measure_timer_overhead()};
+	std::cerr << "Timer overhead: " << meta.timer_overhead_ns << " ns" << std::endl;
+
+	std::vector<bench::BenchmarkResult> benchmarks;
+
+	// --- Scenario 1: Void call ---
+	if (cfg.should_run("void_call"))
+	{
+		auto f = env.module.load_entity("callable=NoOp", {}, {});
+		benchmarks.push_back(bench::run_benchmark("void_call", std::nullopt, cfg, [&]() {
+			f.call<>();
+		}));
+	}
+
+	// --- Scenario 2: Primitive echo (int64 -> float64) ---
+	if (cfg.should_run("primitive_echo"))
+	{
+		auto f = env.module.load_entity(
+			"callable=DivIntegers",
+			{metaffi_int64_type, metaffi_int64_type},
+			{metaffi_float64_type});
+		benchmarks.push_back(bench::run_benchmark("primitive_echo", std::nullopt, cfg, [&]() {
+			auto [v] = f.call<double>(int64_t(10), int64_t(2));
+			if (std::abs(v - 5.0) > 1e-10)
+			{
+				throw std::runtime_error("DivIntegers(10,2) = " + std::to_string(v) + ", want 5.0");
+			}
+		}));
+	}
+
+	// --- Scenario 3: Error propagation ---
+	if (cfg.should_run("error_propagation"))
+	{
+		auto f = env.module.load_entity("callable=ReturnsAnError", {}, {});
+		benchmarks.push_back(bench::run_benchmark("error_propagation", std::nullopt, cfg, [&]() {
+			bool threw = false;
+			try
+			{
+				f.call<>();
+			}
+			catch (const std::exception&)
+			{
+				// Error IS expected -- this is the successful path
+				threw = true;
+			}
+			if (!threw)
+			{
+				throw std::runtime_error("ReturnsAnError: expected error but call succeeded");
+			}
+		}));
+	}
+
+	if (benchmarks.empty())
+	{
+		throw std::runtime_error("METAFFI_TEST_SCENARIOS selected no benchmark scenarios");
+	}
+
+	bench::write_results("../../results/cpp_to_go_metaffi.json", meta, cfg,
+	                     {{"load_runtime_and_module_ns", init_ns}}, benchmarks);
+	return 0;
+}
+
+} // namespace
+
+int main()
+{
+	try
+	{
+		return run();
+	}
+	catch (const std::exception& e)
+	{
+		std::cerr << "FATAL: " << e.what() << std::endl;
+		return 1;
+	}
+}
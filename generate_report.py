@@ -3,54 +3,116 @@
 Generate a thesis-oriented Markdown report from the consolidated test outputs.
 
 Inputs:
-  - results/tables.md
   - results/consolidated.json
   - results/complexity.json
+  - results/<triple>.raw/*.npy (raw-sample sidecars, memory-mapped when present)
+
+Tables and figures come from the shared report model (report_model.py), the
+same one tables.md is rendered from, so figures plot exact nanosecond values.
 
 Outputs:
   - results/report.md
   - results/report_figures/*.png
 
+Figures are described as FigureJobs (plot function + input series + styling)
+and drawn in a process pool with the Agg backend. Each job is keyed by a hash
+of those inputs; results/report_figures/_figure_cache.json records the key and
+the sha256 of every file a job wrote, so a figure whose inputs did not change
+(e.g. the other pairs after a single-scenario --scenario rerun) is not redrawn.
+PNGs no longer produced by any job are removed.
+
 FAIL-FAST:
-  - Any malformed table, unknown format, missing file, or plotting failure aborts
-    report generation immediately.
+  - Any malformed input value, missing file, or plotting failure aborts report
+    generation immediately.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+import multiprocessing
+import os
 import re
-import shutil
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.ticker import FuncFormatter
+
+import benchmark_inputs
+import benchmark_samples
+import build_cache
+import report_model
+from report_model import (
+    COMPLEXITY_KINDS,
+    COMPLEXITY_LANGUAGES,
+    COMPLEXITY_PAIR_SLOC,
+    COMPLEXITY_SUMMARY,
+    PAIR_PERFORMANCE,
+    Cell,
+    ReportModel,
+    ReportModelError,
+    Table,
+)
 
 
 RESULTS_DIR = Path(__file__).resolve().parent / "results"
-TABLES_FILE = RESULTS_DIR / "tables.md"
 CONSOLIDATED_FILE = RESULTS_DIR / "consolidated.json"
 COMPLEXITY_FILE = RESULTS_DIR / "complexity.json"
 REPORT_FILE = RESULTS_DIR / "report.md"
 FIGURES_DIR = RESULTS_DIR / "report_figures"
+FIGURE_CACHE_FILE = FIGURES_DIR / "_figure_cache.json"
+
+# Part of every figure cache key; bump when a plot_* function changes how it draws.
+FIGURE_STYLE_VERSION = 1
+
+# Percentiles marked on the latency distribution figures and listed in their tables.
+DISTRIBUTION_PERCENTILES = (0.50, 0.90, 0.99, 0.999)
+DISTRIBUTION_MARKERS = ("o", "s", "^", "D")
+# Probabilities the ECDF is drawn at: a uniform body (also the violin data) plus
+# log-spaced tail points up to p99.99, so the tail keeps its resolution.
+ECDF_BODY_POINTS = 1001
+ECDF_TAIL_POINTS = 41
 
 
 class ReportGenerationError(Exception):
     """Raised on any report-generation issue (fail-fast)."""
 
 
-@dataclass
-class TableBlock:
-    title: str
-    header: list[str]
-    rows: list[list[str]]
-    markdown: str
+@dataclass(frozen=True)
+class FigureJob:
+    """One figure to draw: FIGURE_RENDERERS[renderer](**params, output_path=outputs[0]).
+
+    params holds everything the drawing depends on (series, labels, scales), so
+    it is hashed into the cache key. outputs lists every file the renderer writes.
+    """
+
+    renderer: str
+    params: dict[str, Any] = field(hash=False)
+    outputs: tuple[Path, ...]
+
+    @property
+    def path(self) -> Path:
+        return self.outputs[0]
+
+    def key(self) -> str:
+        payload = {
+            "renderer": self.renderer,
+            "params": self.params,
+            "outputs": [p.name for p in self.outputs],
+            "style_version": FIGURE_STYLE_VERSION,
+            "matplotlib": matplotlib.__version__,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
 
 
 DEDICATED_PACKAGE_NAMES = {
@@ -60,103 +122,14 @@ DEDICATED_PACKAGE_NAMES = {
     ("java", "python3"): "JEP",
     ("python3", "go"): "ctypes",
     ("python3", "java"): "JPype",
+    ("go", "c"): "CGo",
+    ("java", "c"): "JNI",
+    ("python3", "c"): "ctypes",
 }
 
-LATENCY_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(ns|us|µs|μs|ms|s)\s*$", re.IGNORECASE)
-LEADING_NUM_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)")
 PAIR_TITLE_RE = re.compile(r"^\s*([A-Za-z0-9_]+)\s*->\s*([A-Za-z0-9_]+)\s*$")
 
 
-def load_json(path: Path) -> dict:
-    if not path.is_file():
-        raise ReportGenerationError(f"Missing required input file: {path}")
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        raise ReportGenerationError(f"Malformed JSON in {path}: {e}") from e
-
-
-def split_markdown_row(line: str) -> list[str]:
-    line = line.strip()
-    if not (line.startswith("|") and line.endswith("|")):
-        raise ReportGenerationError(f"Invalid markdown table row (must start/end with '|'): {line}")
-    parts = [p.strip() for p in line[1:-1].split("|")]
-    if any(p == "" for p in parts):
-        # Empty cells are valid only for separators; data rows must be explicit.
-        return parts
-    return parts
-
-
-def is_separator_row(line: str) -> bool:
-    line = line.strip()
-    if not (line.startswith("|") and line.endswith("|")):
-        return False
-    cells = [c.strip() for c in line[1:-1].split("|")]
-    if not cells:
-        return False
-    return all(c and set(c) <= {"-", ":"} for c in cells)
-
-
-def parse_tables(markdown_text: str) -> list[TableBlock]:
-    lines = markdown_text.splitlines()
-    current_heading = ""
-    tables: list[TableBlock] = []
-    i = 0
-
-    while i < len(lines):
-        raw = lines[i].rstrip()
-        stripped = raw.strip()
-
-        if stripped.startswith("#"):
-            current_heading = stripped.lstrip("#").strip()
-            i += 1
-            continue
-
-        if stripped.startswith("|") and i + 1 < len(lines) and is_separator_row(lines[i + 1]):
-            table_lines = [lines[i], lines[i + 1]]
-            i += 2
-            while i < len(lines) and lines[i].strip().startswith("|"):
-                table_lines.append(lines[i])
-                i += 1
-
-            header = split_markdown_row(table_lines[0])
-            sep = split_markdown_row(table_lines[1])
-            if len(header) != len(sep):
-                raise ReportGenerationError(
-                    f"Table header/separator column mismatch under '{current_heading}'"
-                )
-
-            rows: list[list[str]] = []
-            for row_line in table_lines[2:]:
-                row = split_markdown_row(row_line)
-                if len(row) != len(header):
-                    raise ReportGenerationError(
-                        f"Table row has {len(row)} columns, expected {len(header)} under '{current_heading}'"
-                    )
-                rows.append(row)
-
-            if not current_heading:
-                raise ReportGenerationError("Encountered table without preceding heading")
-            if not rows:
-                raise ReportGenerationError(f"Table '{current_heading}' has no data rows")
-
-            tables.append(
-                TableBlock(
-                    title=current_heading,
-                    header=header,
-                    rows=rows,
-                    markdown="\n".join(table_lines),
-                )
-            )
-            continue
-
-        i += 1
-
-    if not tables:
-        raise ReportGenerationError("No markdown tables found in tables.md")
-    return tables
-
-
 def _convert_us_to_micro_sign(text: str) -> str:
     return re.sub(r"(\d+(?:\.\d+)?)\s+us\b", r"\1 µs", text)
 
@@ -171,7 +144,21 @@ def _parse_sized_scenario(scenario: str, prefix: str) -> int | None:
     return int(suffix)
 
 
+def _split_input_container(scenario: str) -> tuple[str, str | None]:
+    """Split "array_echo_memoryview_1000" into ("array_echo_1000", "memoryview")."""
+    for container in benchmark_inputs.ARRAY_CONTAINERS:
+        for base in ("array_echo", "array_sum", "packed_array_sum"):
+            marker = f"{base}_{container}_"
+            if scenario.startswith(marker) and scenario[len(marker):].isdigit():
+                return f"{base}_{scenario[len(marker):]}", container
+    return scenario, None
+
+
 def scenario_display_name(host: str, guest: str, scenario: str) -> str:
+    scenario, container = _split_input_container(scenario)
+    if container is not None:
+        return f"{scenario_display_name(host, guest, scenario)}_from_{container}"
+
     pair = (host.strip().lower(), guest.strip().lower())
     base_map = {
         "void_call": "void_call_void_void",
@@ -179,6 +166,7 @@ def scenario_display_name(host: str, guest: str, scenario: str) -> str:
         "string_echo": "string_echo_string8_utf8",
         "object_method": "object_method_ctor_plus_instance_call",
         "callback": "callback_callable_int_int_to_int",
+        "callback_stream_setup": "callback_stream_setup_grpc_bidi_open_close",
         "error_propagation": "error_propagation_exception_path",
     }
     if scenario in base_map:
@@ -294,6 +282,14 @@ def extract_benchmark_protocol(
     return unique_configs, entries
 
 
+def load_raw_samples(bench: dict, context: str):
+    """Raw per-iteration samples of a benchmark: inline list or memory-mapped .npy sidecar."""
+    try:
+        return benchmark_samples.load_samples(bench, "raw_iterations_ns", RESULTS_DIR)
+    except benchmark_samples.SampleFileError as e:
+        raise ReportGenerationError(f"{context}: {e}") from e
+
+
 def format_latency_ns(ns: float) -> str:
     if ns < 1:
         return f"{ns:.3f} ns"
@@ -330,7 +326,7 @@ def build_repeat_analysis_tables(consolidated: dict) -> list[str]:
         if not isinstance(benches, list):
             continue
 
-        rows: list[tuple[str, list[float], float, float]] = []
+        rows: list[tuple[str, list[float], float, float, int]] = []
         max_repeat = 0
         for b in benches:
             if not isinstance(b, dict):
@@ -364,7 +360,10 @@ def build_repeat_analysis_tables(consolidated: dict) -> list[str]:
             if global_mean is None:
                 raise ReportGenerationError(f"Missing global mean in repeat analysis for {scenario_key}")
 
-            rows.append((scenario_display, repeat_means, mean_of_means, float(global_mean)))
+            samples = load_raw_samples(b, f"{host}->{guest}[{mechanism}] {scenario_key}")
+            sample_count = len(samples) if samples is not None else 0
+
+            rows.append((scenario_display, repeat_means, mean_of_means, float(global_mean), sample_count))
 
         if not rows:
             continue
@@ -372,9 +371,10 @@ def build_repeat_analysis_tables(consolidated: dict) -> list[str]:
         header = ["Scenario"] + [f"run_{i}_mean" for i in range(1, max_repeat + 1)] + [
             "mean_of_repeat_means",
             "global_pooled_mean",
+            "pooled_samples",
         ]
         table_rows: list[list[str]] = []
-        for scenario_display, repeat_means, mean_of_means, global_mean in rows:
+        for scenario_display, repeat_means, mean_of_means, global_mean, sample_count in rows:
             row = [scenario_display]
             for i in range(max_repeat):
                 if i < len(repeat_means):
@@ -383,6 +383,7 @@ def build_repeat_analysis_tables(consolidated: dict) -> list[str]:
                     row.append("—")
             row.append(format_latency_ns(mean_of_means))
             row.append(format_latency_ns(global_mean))
+            row.append(f"{sample_count:,}")
             table_rows.append(row)
 
         block = []
@@ -408,12 +409,12 @@ def build_signature_matrix_rows() -> list[list[str]]:
     ]
 
 
-def format_table_for_report(block: TableBlock, table_index: int) -> str:
-    header = [h for h in block.header]
-    rows = [[c for c in r] for r in block.rows]
+def format_table_for_report(table: Table) -> str:
+    header = [h for h in table.header]
+    rows = [[c.text for c in r] for r in table.rows]
 
     # Rename "Native" to "Dedicated package baseline" in complexity tables
-    if table_index in (7, 8, 9):
+    if table.kind in COMPLEXITY_KINDS:
         for i, h in enumerate(header):
             if h.strip().lower() == "native":
                 header[i] = "Dedicated package baseline"
@@ -421,8 +422,8 @@ def format_table_for_report(block: TableBlock, table_index: int) -> str:
             if r and r[0].strip().lower() == "native":
                 r[0] = "dedicated package baseline"
 
-    # Drop "Avg SLOC" column from Table 7 (Summary by Mechanism)
-    if table_index == 7:
+    # Drop "Avg SLOC" column from the Summary by Mechanism table
+    if table.kind == COMPLEXITY_SUMMARY:
         avg_sloc_idx = None
         for i, h in enumerate(header):
             if h.strip() == "Avg SLOC":
@@ -432,10 +433,9 @@ def format_table_for_report(block: TableBlock, table_index: int) -> str:
             header = header[:avg_sloc_idx] + header[avg_sloc_idx + 1:]
             rows = [r[:avg_sloc_idx] + r[avg_sloc_idx + 1:] for r in rows]
 
-    if header and header[0].strip().lower() == "scenario":
-        host, guest = parse_pair_title(block.title)
+    if header and header[0].strip().lower() == "scenario" and table.host and table.guest:
         for r in rows:
-            r[0] = scenario_display_name(host, guest, r[0])
+            r[0] = scenario_display_name(table.host, table.guest, r[0])
 
     for r in rows:
         for i, cell in enumerate(r):
@@ -449,32 +449,13 @@ def slugify(text: str) -> str:
     return slug.strip("_") or "table"
 
 
-def parse_latency_to_ns(cell: str, context: str, allow_missing: bool = False) -> float | None:
-    if allow_missing and cell.strip().upper() in ("MISSING", "FAIL"):
-        return None
-    m = LATENCY_RE.match(cell)
-    if not m:
-        raise ReportGenerationError(f"Expected latency value in '{context}', got '{cell}'")
-    value = float(m.group(1))
-    unit = m.group(2).lower()
-    if unit == "ns":
-        return value
-    if unit in ("us", "µs", "μs"):
-        return value * 1_000.0
-    if unit == "ms":
-        return value * 1_000_000.0
-    if unit == "s":
-        return value * 1_000_000_000.0
-    raise ReportGenerationError(f"Unsupported latency unit '{unit}' in '{context}'")
-
-
-def parse_leading_number(cell: str, context: str, allow_missing: bool = False) -> float:
-    if allow_missing and cell.strip().upper() in ("MISSING", "FAIL"):
-        return float("nan")
-    m = LEADING_NUM_RE.match(cell)
-    if not m:
-        raise ReportGenerationError(f"Expected numeric-leading value in '{context}', got '{cell}'")
-    return float(m.group(1))
+def cell_number(cell: Cell, context: str, allow_missing: bool = False) -> float:
+    """Exact value behind a table cell; allow_missing maps status/empty cells to NaN."""
+    if cell.value is None:
+        if allow_missing:
+            return float("nan")
+        raise ReportGenerationError(f"Expected numeric value in '{context}', got '{cell.text}'")
+    return cell.value
 
 
 def require_positive(values: list[float], context: str) -> None:
@@ -485,13 +466,6 @@ def require_positive(values: list[float], context: str) -> None:
         raise ReportGenerationError(f"Negative values not supported for {context}")
 
 
-def parse_pair_title(title: str) -> tuple[str, str]:
-    m = PAIR_TITLE_RE.match(title)
-    if not m:
-        raise ReportGenerationError(f"Cannot parse pair title '{title}'")
-    return m.group(1).strip().lower(), m.group(2).strip().lower()
-
-
 def normalize_mechanism_label(label: str) -> str:
     return label.strip().lower()
 
@@ -581,17 +555,17 @@ def plot_grouped_bars(
     plt.close(fig)
 
 
-def _extract_complexity_data(block: TableBlock) -> tuple[list[str], list[str], list[list[float]]]:
+def _extract_complexity_data(table: Table) -> tuple[list[str], list[str], list[list[float]]]:
     """Extract mechanism labels, metric labels, and per-mechanism values from the complexity table.
 
     Returns (mechanism_labels, metric_labels, series_values) where
     series_values[i] is the list of metric values for mechanism i.
     """
     mechanism_labels = [
-        ("dedicated package baseline" if r[0].strip().lower() == "native" else r[0])
-        for r in block.rows
+        ("dedicated package baseline" if r[0].text.strip().lower() == "native" else r[0].text)
+        for r in table.rows
     ]
-    col_labels = block.header[1:]
+    col_labels = table.header[1:]
 
     wanted = ["Avg Benchmark SLOC", "Avg Languages", "Avg Max CC"]
     selected_col_indices = []
@@ -606,28 +580,45 @@ def _extract_complexity_data(block: TableBlock) -> tuple[list[str], list[str], l
     metric_labels = [col_labels[i] for i in selected_col_indices]
 
     series_values: list[list[float]] = []
-    for r_idx, row in enumerate(block.rows):
+    for r_idx, row in enumerate(table.rows):
         vals: list[float] = []
         for in_idx in selected_col_indices:
             cell = row[1:][in_idx]
-            v = parse_leading_number(cell, f"{block.title} row {r_idx + 1}")
+            v = cell_number(cell, f"{table.title} row {r_idx + 1}")
             vals.append(v)
         series_values.append(vals)
 
     if not series_values:
-        raise ReportGenerationError(f"Empty bar chart source in '{block.title}'")
+        raise ReportGenerationError(f"Empty bar chart source in '{table.title}'")
 
     return mechanism_labels, metric_labels, series_values
 
 
-def plot_complexity_bars(block: TableBlock, output_path: Path) -> None:
+def complexity_figure_paths(output_path: Path) -> tuple[Path, ...]:
+    """Files written by plot_complexity_bars: main figure, 07a/07b/07c per metric, 07d normalized."""
+    stem = output_path.stem
+    return (
+        output_path,
+        output_path.parent / f"{stem}a_avg_benchmark_sloc.png",
+        output_path.parent / f"{stem}b_avg_languages.png",
+        output_path.parent / f"{stem}c_avg_max_cc.png",
+        output_path.parent / f"{stem}d_normalized.png",
+    )
+
+
+def plot_complexity_bars(
+    mechanism_labels: list[str],
+    metric_labels: list[str],
+    series_values: list[list[float]],
+    output_path: Path,
+) -> None:
     """Generate complexity summary figures:
 
     1. Small multiples (3 subplots side-by-side) — the main figure.
     2. Three individual per-metric figures (07a/07b/07c).
     3. Percent-of-max normalized bar chart with raw annotations (07d).
     """
-    mechanism_labels, metric_labels, series_values = _extract_complexity_data(block)
+    paths = complexity_figure_paths(output_path)
     colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]
     y_labels = ["SLOC", "Languages", "Cyclomatic complexity"]
 
@@ -659,13 +650,7 @@ def plot_complexity_bars(block: TableBlock, output_path: Path) -> None:
     plt.close(fig)
 
     # ---- (2) Individual per-metric figures ----
-    suffixes = ["a", "b", "c"]
-    slug_names = ["avg_benchmark_sloc", "avg_languages", "avg_max_cc"]
-
-    for col_idx, (suffix, slug, metric, ylabel) in enumerate(
-        zip(suffixes, slug_names, metric_labels, y_labels)
-    ):
-        ind_path = output_path.parent / f"{output_path.stem}{suffix}_{slug}.png"
+    for col_idx, (ind_path, metric, ylabel) in enumerate(zip(paths[1:4], metric_labels, y_labels)):
         vals = [series_values[m_idx][col_idx] for m_idx in range(len(mechanism_labels))]
         bar_colors = [colors[i % len(colors)] for i in range(len(mechanism_labels))]
 
@@ -690,7 +675,7 @@ def plot_complexity_bars(block: TableBlock, output_path: Path) -> None:
         plt.close(fig_ind)
 
     # ---- (3) Percent-of-max normalized bars with raw value annotations ----
-    norm_path = output_path.parent / f"{output_path.stem}d_normalized.png"
+    norm_path = paths[4]
 
     # Compute per-metric max for normalization
     num_metrics = len(metric_labels)
@@ -736,46 +721,46 @@ def plot_complexity_bars(block: TableBlock, output_path: Path) -> None:
     plt.close(fig_norm)
 
 
-def render_figure_for_table(
-    block: TableBlock,
+def figure_job_for_table(
+    table: Table,
     index: int,
     averages_by_pair: dict[tuple[str, str], dict[str, float]],
-) -> tuple[Path, str]:
-    filename = f"{index:02d}_{slugify(block.title)}.png"
+) -> tuple[FigureJob, str] | None:
+    """Figure for one table, chosen by table kind; None for kinds that are reported as tables only."""
+    filename = f"{index:02d}_{slugify(table.title)}.png"
     output_path = FIGURES_DIR / filename
 
-    if not block.header:
-        raise ReportGenerationError(f"Table '{block.title}' has empty header")
-
-    first_col = block.header[0].strip().lower()
+    if not table.header:
+        raise ReportGenerationError(f"Table '{table.title}' has empty header")
 
-    if first_col == "scenario":
-        host, guest = parse_pair_title(block.title)
+    if table.kind == PAIR_PERFORMANCE:
+        host, guest = table.host, table.guest
         pair_avg = averages_by_pair.get((host, guest))
         if pair_avg is None:
-            raise ReportGenerationError(f"No mechanism averages found for pair '{block.title}'")
+            raise ReportGenerationError(f"No mechanism averages found for pair '{table.title}'")
 
-        categories = [scenario_display_name(host, guest, row[0]) for row in block.rows]
-        series_labels = [normalize_mechanism_label(h.replace(" (mean)", "").strip()) for h in block.header[1:]]
+        # Mean latency columns only (memory columns are reported in the table)
+        mean_cols = [(i, h) for i, h in enumerate(table.header) if h.endswith(" (mean)")]
+        categories = [scenario_display_name(host, guest, row[0].text) for row in table.rows]
+        series_labels = [normalize_mechanism_label(h.replace(" (mean)", "").strip()) for _, h in mean_cols]
         series_values: list[list[float]] = []
         has_zero = False
         avg_lines: dict[str, float] = {}
-        for c_idx, label in enumerate(series_labels, start=1):
+        for (c_idx, _), label in zip(mean_cols, series_labels):
             vals: list[float] = []
-            for r_idx, row in enumerate(block.rows):
-                parsed = parse_latency_to_ns(
+            for r_idx, row in enumerate(table.rows):
+                vals.append(cell_number(
                     row[c_idx],
-                    f"{block.title} row {r_idx + 1} '{label}'",
+                    f"{table.title} row {r_idx + 1} '{label}'",
                     allow_missing=True,
-                )
-                vals.append(float("nan") if parsed is None else parsed)
-            require_positive(vals, block.title)
+                ))
+            require_positive(vals, table.title)
             if any((not math.isnan(v)) and v == 0 for v in vals):
                 has_zero = True
             series_values.append(vals)
             if label not in pair_avg:
                 raise ReportGenerationError(
-                    f"Average for mechanism '{label}' missing in consolidated averages for '{block.title}'"
+                    f"Average for mechanism '{label}' missing in consolidated averages for '{table.title}'"
                 )
             avg_lines[label] = float(pair_avg[label])
 
@@ -786,30 +771,34 @@ def render_figure_for_table(
             for vals in series_values
         ]
 
-        plot_grouped_bars(
+        job = FigureJob("grouped_bars", dict(
             categories=categories,
             series_labels=series_labels,
             series_values=plot_values,
-            title=block.title,
+            title=table.title,
             ylabel="Mean latency (ns, log scale)",
-            output_path=output_path,
             log_y=True,
             avg_lines=avg_lines,
-        )
+        ), (output_path,))
         desc = "Grouped bar chart on logarithmic Y-axis (mean latency in ns) with dashed per-mechanism average lines."
         if has_zero:
             desc += " Cells reported as 0 ns are plotted at 1 ns for visualization only."
-        return output_path, desc
+        return job, desc
 
-    if first_col == "mechanism":
-        plot_complexity_bars(block, output_path)
-        return output_path, "Grouped bar chart comparing key complexity metrics by mechanism (raw values annotated)."
+    if table.kind == COMPLEXITY_SUMMARY:
+        mechanism_labels, metric_labels, series_values = _extract_complexity_data(table)
+        job = FigureJob("complexity_bars", dict(
+            mechanism_labels=mechanism_labels,
+            metric_labels=metric_labels,
+            series_values=series_values,
+        ), complexity_figure_paths(output_path))
+        return job, "Grouped bar chart comparing key complexity metrics by mechanism (raw values annotated)."
 
-    if first_col == "pair":
+    if table.kind in (COMPLEXITY_PAIR_SLOC, COMPLEXITY_LANGUAGES):
         # Add dedicated package names to pair labels
         categories = []
-        for row in block.rows:
-            pair = row[0].strip()
+        for row in table.rows:
+            pair = row[0].text.strip()
             m = PAIR_TITLE_RE.match(pair)
             if m:
                 host, guest = m.group(1).strip().lower(), m.group(2).strip().lower()
@@ -823,29 +812,28 @@ def render_figure_for_table(
 
         series_labels = [
             "Dedicated package baseline" if h.strip().lower() == "native" else h.strip()
-            for h in block.header[1:]
+            for h in table.header[1:]
         ]
         series_values: list[list[float]] = []
         for c_idx, label in enumerate(series_labels, start=1):
             vals: list[float] = []
-            for r_idx, row in enumerate(block.rows):
-                vals.append(parse_leading_number(row[c_idx], f"{block.title} row {r_idx + 1} '{label}'"))
-            require_positive(vals, block.title)
+            for r_idx, row in enumerate(table.rows):
+                vals.append(cell_number(row[c_idx], f"{table.title} row {r_idx + 1} '{label}'"))
+            require_positive(vals, table.title)
             series_values.append(vals)
 
-        ylabel = "Count" if "Languages Required" in block.title else "SLOC / value"
-        plot_grouped_bars(
+        ylabel = "Count" if table.kind == COMPLEXITY_LANGUAGES else "SLOC / value"
+        job = FigureJob("grouped_bars", dict(
             categories=categories,
             series_labels=series_labels,
             series_values=series_values,
-            title=block.title,
+            title=table.title,
             ylabel=ylabel,
-            output_path=output_path,
             log_y=False,
-        )
-        return output_path, "Grouped bar chart by language pair."
+        ), (output_path,))
+        return job, "Grouped bar chart by language pair."
 
-    raise ReportGenerationError(f"Unsupported table format for '{block.title}'")
+    return None
 
 
 def _extract_comparison_mean_ns(comp: dict, mechanism_key: str, context: str) -> float:
@@ -868,7 +856,7 @@ def _extract_comparison_mean_ns(comp: dict, mechanism_key: str, context: str) ->
         ) from e
 
 
-def render_any_echo_figure(consolidated: dict) -> tuple[Path, str] | None:
+def any_echo_figure_job(consolidated: dict) -> tuple[FigureJob, str] | None:
     comparisons = consolidated.get("comparisons")
     if not isinstance(comparisons, list):
         raise ReportGenerationError("consolidated.json missing 'comparisons' for Any-Echo figure")
@@ -918,43 +906,28 @@ def render_any_echo_figure(consolidated: dict) -> tuple[Path, str] | None:
     grpc_vals = [e[3] for e in entries]
     require_positive(metaffi_vals + native_vals + grpc_vals, "Any-Echo comparison figure")
 
-    output_path = FIGURES_DIR / "00_any_echo_overview.png"
-    plot_grouped_bars(
+    job = FigureJob("grouped_bars", dict(
         categories=categories,
         series_labels=["metaffi", "dedicated_native", "grpc"],
         series_values=[metaffi_vals, native_vals, grpc_vals],
         title="Any-Echo Dynamic Payload Benchmark",
         ylabel="Mean latency (ns, log scale)",
-        output_path=output_path,
         log_y=True,
-    )
-    return output_path, (
+    ), (FIGURES_DIR / "00_any_echo_overview.png",))
+    return job, (
         "Any-Echo focused grouped bar chart on logarithmic Y-axis "
         "(MetaFFI vs dedicated native package vs gRPC)."
     )
 
 
-def extract_native_bindings_from_tables(tables: list[TableBlock]) -> list[tuple[str, str, str]]:
+def extract_native_bindings(complexity: dict) -> list[tuple[str, str, str]]:
     """
-    Extract per-pair native package labels from
-    'Per-Pair Comparison (Benchmark-Only SLOC)' table.
+    Extract per-pair native package labels from the complexity pair comparisons
+    (the packages shown in parentheses in the Per-Pair Comparison table).
     """
-    target_title = "Per-Pair Comparison (Benchmark-Only SLOC)"
-    target = next((t for t in tables if t.title.strip() == target_title), None)
-    if target is None:
-        raise ReportGenerationError(f"Missing table required for native binding extraction: '{target_title}'")
-
-    normalized_header = [h.strip().lower() for h in target.header]
-    if not normalized_header or normalized_header[0] != "pair":
-        raise ReportGenerationError(f"Unexpected first column in '{target_title}': {target.header}")
-
-    native_col_idx = -1
-    for i, h in enumerate(normalized_header):
-        if "native" in h or "dedicated package baseline" in h:
-            native_col_idx = i
-            break
-    if native_col_idx <= 0:
-        raise ReportGenerationError(f"Could not find native baseline column in '{target_title}'")
+    comparisons = complexity.get("pair_comparisons")
+    if not isinstance(comparisons, list):
+        raise ReportGenerationError("complexity.json missing 'pair_comparisons' for native binding extraction")
 
     description_by_binding = {
         "jni": "Java Native Interface bridge (includes language-specific native glue where needed).",
@@ -965,24 +938,18 @@ def extract_native_bindings_from_tables(tables: list[TableBlock]) -> list[tuple[
     }
 
     extracted: list[tuple[str, str, str]] = []
-    for row in target.rows:
-        pair = row[0].strip()
-        native_cell = row[native_col_idx].strip()
-
-        m = re.search(r"\(([^)]+)\)", native_cell)
-        if not m:
-            raise ReportGenerationError(
-                f"Native baseline cell for pair '{pair}' must include package label in parentheses, got '{native_cell}'"
-            )
-        binding = m.group(1).strip().lower()
+    for comp in comparisons:
+        pair = f"{comp['host']}->{comp['guest']}"
+        native = report_model.native_mechanism(comp.get("mechanisms") or {})
+        if native is None:
+            raise ReportGenerationError(f"No native baseline mechanism in complexity.json for pair '{pair}'")
+        binding = native.strip().lower()
         if binding not in description_by_binding:
-            raise ReportGenerationError(
-                f"Unknown native binding '{binding}' in '{target_title}' for pair '{pair}'"
-            )
+            raise ReportGenerationError(f"Unknown native binding '{binding}' in complexity.json for pair '{pair}'")
         extracted.append((pair, binding, description_by_binding[binding]))
 
     if not extracted:
-        raise ReportGenerationError(f"No native baseline bindings extracted from '{target_title}'")
+        raise ReportGenerationError("No native baseline bindings extracted from complexity.json")
     return extracted
 
 
@@ -1065,10 +1032,10 @@ def _get_figure_commentary(table_title: str) -> str | None:
 
 def build_cross_pair_section(
     averages_by_pair: dict[tuple[str, str], dict[str, float]],
-) -> tuple[str, Path]:
+) -> tuple[str, FigureJob]:
     """Build a cross-pair performance comparison table + grouped bar chart.
 
-    Returns (markdown_section, figure_path).
+    Returns (markdown_section, figure_job).
     """
     # Collect data for all 6 pairs
     pair_order = [
@@ -1125,15 +1092,14 @@ def build_cross_pair_section(
 
     # Build the figure
     figure_path = FIGURES_DIR / "00_cross_pair_summary.png"
-    plot_grouped_bars(
+    job = FigureJob("grouped_bars", dict(
         categories=categories,
         series_labels=["MetaFFI", "Dedicated package", "gRPC"],
         series_values=[metaffi_vals, native_vals, grpc_vals],
         title="Cross-Pair Performance Summary",
         ylabel="Mean latency (ns, log scale)",
-        output_path=figure_path,
         log_y=True,
-    )
+    ), (figure_path,))
 
     # Assemble section
     lines: list[str] = []
@@ -1152,17 +1118,25 @@ def build_cross_pair_section(
         lines.append(commentary)
         lines.append("")
 
-    return "\n".join(lines), figure_path
+    return "\n".join(lines), job
 
 
 def build_report_markdown(
-    consolidated: dict,
-    complexity: dict,
-    tables: list[TableBlock],
-    figure_map: list[tuple[Path, str]],
-    averages_by_pair: dict[tuple[str, str], dict[str, float]],
-    any_echo_figure: tuple[Path, str] | None = None,
+    model: ReportModel,
+    figure_map: list[tuple[FigureJob, str] | None],
+    cross_pair_md: str,
+    any_echo_figure: tuple[FigureJob, str] | None = None,
+    distribution_md: str = "",
 ) -> str:
+    consolidated = model.consolidated
+    complexity = model.complexity
+    tables = model.tables
+    # Table numbers as listed under "Tables And Figures"
+    complexity_numbers = [i for i, t in enumerate(tables, start=1) if t.kind in COMPLEXITY_KINDS]
+    if not complexity_numbers:
+        raise ReportGenerationError("Report model has no code complexity tables")
+    summary_number = next(i for i, t in enumerate(tables, start=1) if t.kind == COMPLEXITY_SUMMARY)
+
     gen_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     summary = consolidated.get("summary", {})
     unique_protocols, protocol_entries = extract_benchmark_protocol(consolidated)
@@ -1185,11 +1159,11 @@ def build_report_markdown(
         f"failed={summary.get('benchmarks', {}).get('failed', 'N/A')}"
     )
     lines.append(f"- `complexity.json`: pair comparisons={len(complexity.get('pair_comparisons', []))}")
-    lines.append(f"- `tables.md`: tables parsed={len(tables)}")
+    lines.append(f"- `tables.md`: tables={len(tables)} (rendered from the same report model)")
     lines.append("")
     lines.append("## Analysis Notes")
     lines.append("")
-    lines.append("- Performance charts use the mean values reported in `tables.md` and are converted to nanoseconds for plotting.")
+    lines.append("- Performance charts plot the exact mean values (ns) from `consolidated.json`; the tables show the same values rounded.")
     lines.append("- Pair performance charts use logarithmic Y-scale due to multi-order magnitude spread across scenarios/mechanisms.")
     lines.append("- Complexity summary chart is a grouped bar chart comparing key metrics (Avg Benchmark SLOC, Avg Languages, Avg Max CC) by mechanism.")
     lines.append("- This report is fail-fast: any malformed source value aborts generation to avoid silent misreporting.")
@@ -1330,7 +1304,7 @@ def build_report_markdown(
     lines.append("- Runtime effects: JIT/runtime warm-up behavior (especially JVM-host cases) can influence steady-state timing and motivates explicit warm-up control.")
     lines.append("- Result interpretation should therefore remain scenario-signature aware and reproducibility-bounded to this exact tooling/version set.")
     lines.append("")
-    lines.append("## Table 7 Metric Definitions")
+    lines.append(f"## Table {summary_number} Metric Definitions")
     lines.append("")
     lines.append("- `Count`: number of implementations in that mechanism group (6 pair-directions per mechanism family).")
     lines.append("- `Avg SLOC`: average source-code lines (SLOC) across implementations in the group.")
@@ -1346,7 +1320,7 @@ def build_report_markdown(
     lines.append("")
     lines.append("## Baseline Interpretation (MetaFFI vs Native Packages)")
     lines.append("")
-    native_bindings = extract_native_bindings_from_tables(tables)
+    native_bindings = extract_native_bindings(complexity)
     lines.append("- Native baselines are intentionally practical per pair. The concrete baselines in this dataset are:")
     for pair, binding, desc in native_bindings:
         lines.append(f"- `{pair}`: `{binding}` ({desc})")
@@ -1360,11 +1334,11 @@ def build_report_markdown(
     lines.append("")
     lines.append("- Values shown as `0 ns` mean the measured latency is below effective timer+measurement resolution for the single-call method in this environment.")
     lines.append("- In performance figures, `0 ns` points are rendered at `1 ns` only so they can be shown on logarithmic axes; this is a visualization floor, not a claimed runtime value.")
-    lines.append("- In Tables 7-9, \"native\" refers to **dedicated per-pair interoperability packages** (e.g., JEP/JPype/JNI/cgo/ctypes), not a uniform raw-native implementation style.")
+    lines.append(f"- In Tables {complexity_numbers[0]}-{complexity_numbers[-1]}, \"native\" refers to **dedicated per-pair interoperability packages** (e.g., JEP/JPype/JNI/cgo/ctypes), not a uniform raw-native implementation style.")
     lines.append("")
     if any_echo_figure is not None:
-        fig_path, fig_desc = any_echo_figure
-        rel_any = fig_path.relative_to(RESULTS_DIR).as_posix()
+        fig_job, fig_desc = any_echo_figure
+        rel_any = fig_job.path.relative_to(RESULTS_DIR).as_posix()
         lines.append("## Any-Echo Focus Figure")
         lines.append("")
         lines.append(f"<p align=\"center\"><b>Any-Echo Dynamic Payload Benchmark</b></p>")
@@ -1391,24 +1365,24 @@ def build_report_markdown(
     lines.append("## Tables And Figures")
     lines.append("")
 
-    for i, (table, (figure_path, figure_desc)) in enumerate(zip(tables, figure_map), start=1):
-        # Insert cross-pair comparison section before Table 7 (complexity tables)
-        if i == 7:
-            cross_pair_md, _ = build_cross_pair_section(averages_by_pair)
+    for i, (table, figure) in enumerate(zip(tables, figure_map), start=1):
+        # Insert cross-pair comparison section before the complexity tables
+        if i == complexity_numbers[0]:
             lines.append(cross_pair_md)
 
-        rel_figure = figure_path.relative_to(RESULTS_DIR).as_posix()
         lines.append(f"### Table {i}: {table.title}")
         lines.append("")
-        lines.append(format_table_for_report(table, i))
+        lines.append(format_table_for_report(table))
         lines.append("")
-        if i in (7, 8, 9):
+        if table.kind in COMPLEXITY_KINDS:
             lines.append("Note: \"Native\" here means dedicated package baseline for that pair, not raw native glue code.")
             lines.append("")
-        lines.append(f"<p align=\"center\"><b>{table.title}</b></p>")
-        lines.append("")
-        lines.append(f"![{table.title}]({rel_figure})")
-        lines.append("")
+        if figure is not None:
+            rel_figure = figure[0].path.relative_to(RESULTS_DIR).as_posix()
+            lines.append(f"<p align=\"center\"><b>{table.title}</b></p>")
+            lines.append("")
+            lines.append(f"![{table.title}]({rel_figure})")
+            lines.append("")
 
         # Add figure commentary after the figure image
         fig_commentary = _get_figure_commentary(table.title)
@@ -1416,38 +1390,301 @@ def build_report_markdown(
             lines.append(fig_commentary)
             lines.append("")
 
+    if distribution_md:
+        lines.append(distribution_md)
+
     return "\n".join(lines) + "\n"
 
 
-def main() -> int:
-    if not TABLES_FILE.is_file():
-        raise ReportGenerationError(f"Missing input table file: {TABLES_FILE}")
+def latency_distribution(samples) -> dict[str, Any]:
+    """ECDF points, violin data and percentile markers of one scenario's raw samples.
+
+    Quantiles follow the harness convention (benchmark_stats.order_statistic_index)
+    and are taken with one sort and vectorized indexing. Samples below 1 ns are
+    floored to 1 ns so they can be drawn on log axes.
+    """
+    values = np.sort(np.maximum(np.asarray(samples, dtype=np.float64), 1.0))
+    n = values.size
+    if n == 0:
+        raise ReportGenerationError("Cannot build a latency distribution from zero samples")
+
+    def at(probs: np.ndarray) -> np.ndarray:
+        return values[np.minimum((probs * n).astype(np.int64), n - 1)]
+
+    body = np.linspace(0.0, 1.0, ECDF_BODY_POINTS)
+    ecdf_p = np.union1d(body, 1.0 - np.logspace(-2, -4, ECDF_TAIL_POINTS))
+    return {
+        "count": int(n),
+        "ecdf_ns": at(ecdf_p).tolist(),
+        "ecdf_p": ecdf_p.tolist(),
+        "body_ns": at(body).tolist(),
+        "percentiles_ns": at(np.asarray(DISTRIBUTION_PERCENTILES)).tolist(),
+    }
+
+
+def _mechanism_order(mechanisms) -> list[str]:
+    return sorted(mechanisms, key=lambda m: (m != "metaffi", m == "grpc", m))
+
+
+def build_latency_distributions(consolidated: dict) -> dict[tuple[str, str, str], dict[str, dict[str, Any]]]:
+    """(host, guest, scenario key) -> mechanism -> latency_distribution of its raw samples.
+
+    Uses the raw per-iteration samples (pooled over repeats, no IQR cleaning) of
+    every PASS benchmark; each sample is the per-call time of one timed batch.
+    """
+    results = consolidated.get("results")
+    if not isinstance(results, list):
+        raise ReportGenerationError("consolidated.json missing 'results' for latency distributions")
+
+    found: dict[tuple[str, str, int, str], dict[str, dict[str, Any]]] = {}
+    for r in results:
+        meta = r.get("metadata") if isinstance(r, dict) else None
+        if not isinstance(meta, dict):
+            continue
+        host = str(meta.get("host", "")).strip().lower()
+        guest = str(meta.get("guest", "")).strip().lower()
+        mechanism = normalize_mechanism_label(str(meta.get("mechanism", "")))
+        for b in r.get("benchmarks") or []:
+            if not isinstance(b, dict) or str(b.get("status", "")).upper() != "PASS":
+                continue
+            if not benchmark_samples.has_samples(b, "raw_iterations_ns"):
+                continue
+            data_size = b.get("data_size")
+            scenario_key = b["scenario"] if data_size is None else f"{b['scenario']}_{data_size}"
+            samples = load_raw_samples(b, f"{host}->{guest}[{mechanism}] {scenario_key}")
+            if len(samples) == 0:
+                continue
+            sort_key = (host, guest, b["scenario"], -1 if data_size is None else int(data_size), scenario_key)
+            found.setdefault(sort_key, {})[mechanism] = latency_distribution(samples)
+
+    return {
+        (host, guest, scenario_key): {m: mechs[m] for m in _mechanism_order(mechs)}
+        for (host, guest, _, _, scenario_key), mechs in sorted(found.items())
+    }
 
-    consolidated = load_json(CONSOLIDATED_FILE)
-    complexity = load_json(COMPLEXITY_FILE)
-    averages_by_pair = build_average_lookup(consolidated)
-    tables_text = TABLES_FILE.read_text(encoding="utf-8")
-    tables = parse_tables(tables_text)
 
-    if FIGURES_DIR.exists():
-        shutil.rmtree(FIGURES_DIR)
+def plot_latency_distribution(
+    title: str,
+    mechanisms: list[str],
+    distributions: list[dict[str, Any]],
+    output_path: Path,
+) -> None:
+    """Log-x ECDF per mechanism (left) and violin + box per mechanism on a log scale (right),
+    both with p50/p90/p99/p99.9 markers."""
+    colors = list(plt.get_cmap("tab10").colors)
+    fig, (ax_cdf, ax_v) = plt.subplots(1, 2, figsize=(14.0, 5.5), gridspec_kw={"width_ratios": [3, 2]})
+
+    for idx, (mech, dist) in enumerate(zip(mechanisms, distributions)):
+        color = colors[idx % len(colors)]
+        ax_cdf.step(dist["ecdf_ns"], dist["ecdf_p"], where="post", color=color, linewidth=1.6,
+                    label=f"{mech} (n={dist['count']:,})")
+        for q, marker, value in zip(DISTRIBUTION_PERCENTILES, DISTRIBUTION_MARKERS, dist["percentiles_ns"]):
+            ax_cdf.plot(value, q, marker=marker, color=color, markersize=6, linestyle="none")
+
+    ax_cdf.set_xscale("log")
+    ax_cdf.set_xlabel("Latency per call (ns, log scale)")
+    ax_cdf.set_ylabel("Fraction of samples <= x")
+    ax_cdf.set_ylim(0.0, 1.02)
+    ax_cdf.grid(alpha=0.25, which="both")
+    marker_handles = [
+        plt.Line2D([], [], marker=marker, color="gray", linestyle="none", label=f"p{q * 100:g}")
+        for q, marker in zip(DISTRIBUTION_PERCENTILES, DISTRIBUTION_MARKERS)
+    ]
+    ax_cdf.legend(handles=ax_cdf.get_legend_handles_labels()[0] + marker_handles, fontsize=8, loc="lower right")
+    ax_cdf.set_title("ECDF")
+
+    # Violin densities are estimated in log10 space so heavy tails do not flatten the body.
+    positions = list(range(1, len(mechanisms) + 1))
+    log_body = [np.log10(dist["body_ns"]) for dist in distributions]
+    violins = ax_v.violinplot(log_body, positions=positions, showextrema=False, widths=0.8)
+    for idx, body in enumerate(violins["bodies"]):
+        body.set_facecolor(colors[idx % len(colors)])
+        body.set_alpha(0.35)
+    ax_v.boxplot(log_body, positions=positions, widths=0.15, showfliers=False, whis=(0, 100),
+                 medianprops={"color": "black"})
+    for pos, dist in zip(positions, distributions):
+        for marker, value in zip(DISTRIBUTION_MARKERS, dist["percentiles_ns"]):
+            ax_v.plot(pos + 0.22, math.log10(value), marker=marker, color="gray", markersize=5, linestyle="none")
+
+    ax_v.set_xticks(positions)
+    ax_v.set_xticklabels(mechanisms)
+    ax_v.yaxis.set_major_formatter(FuncFormatter(lambda y, _: format_latency_ns(10.0 ** y)))
+    ax_v.set_ylabel("Latency per call (log scale)")
+    ax_v.grid(axis="y", alpha=0.25)
+    ax_v.set_title("Violin + box (whiskers: min-max)")
+
+    fig.suptitle(title)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=170)
+    plt.close(fig)
+
+
+def latency_distribution_jobs(
+    distributions: dict[tuple[str, str, str], dict[str, dict[str, Any]]],
+) -> dict[tuple[str, str, str], FigureJob]:
+    jobs: dict[tuple[str, str, str], FigureJob] = {}
+    for (host, guest, scenario_key), by_mech in distributions.items():
+        title = f"{host}->{guest}: {scenario_display_name(host, guest, scenario_key)}"
+        jobs[(host, guest, scenario_key)] = FigureJob("latency_distribution", dict(
+            title=title,
+            mechanisms=list(by_mech),
+            distributions=list(by_mech.values()),
+        ), (FIGURES_DIR / f"dist_{host}_{guest}_{slugify(scenario_key)}.png",))
+    return jobs
+
+
+def build_latency_distribution_section(
+    distributions: dict[tuple[str, str, str], dict[str, dict[str, Any]]],
+    jobs: dict[tuple[str, str, str], FigureJob],
+) -> str:
+    if not distributions:
+        return ""
+
+    lines: list[str] = []
+    lines.append("## Latency Distributions")
+    lines.append("")
+    lines.append("- Raw per-iteration samples of every passing benchmark, pooled over repeats, without IQR cleaning.")
+    lines.append("- Each sample is the per-call time of one timed batch (`batch_min_elapsed_ns` / `batch_max_calls`), so tails are batch-averaged for sub-microsecond calls.")
+    lines.append("- Left: ECDF on a logarithmic latency axis; right: violin (density in log space) with box (whiskers span min-max). Markers: p50 (circle), p90 (square), p99 (triangle), p99.9 (diamond).")
+    lines.append("")
+
+    header = ["Scenario", "Mechanism", "Samples"] + [f"p{q * 100:g}" for q in DISTRIBUTION_PERCENTILES] + ["p99.9 / p50"]
+    pairs = sorted({(host, guest) for host, guest, _ in distributions})
+    for host, guest in pairs:
+        keys = [k for k in distributions if k[:2] == (host, guest)]
+        lines.append(f"### {host} -> {guest}")
+        lines.append("")
+        rows: list[list[str]] = []
+        for key in keys:
+            display = scenario_display_name(host, guest, key[2])
+            for mech, dist in distributions[key].items():
+                pct = dist["percentiles_ns"]
+                rows.append([display, mech, f"{dist['count']:,}"] + [format_latency_ns(v) for v in pct]
+                            + [f"{pct[-1] / pct[0]:.1f}x"])
+        lines.append(_render_markdown_table(header, rows))
+        lines.append("")
+        for key in keys:
+            job = jobs[key]
+            title = job.params["title"]
+            lines.append(f"<p align=\"center\"><b>{title}</b></p>")
+            lines.append("")
+            lines.append(f"![{title}]({job.path.relative_to(RESULTS_DIR).as_posix()})")
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+FIGURE_RENDERERS = {
+    "grouped_bars": plot_grouped_bars,
+    "complexity_bars": plot_complexity_bars,
+    "latency_distribution": plot_latency_distribution,
+}
+
+
+def _init_figure_worker() -> None:
+    matplotlib.use("Agg")
+
+
+def _render_figure_job(job: FigureJob) -> None:
+    FIGURE_RENDERERS[job.renderer](**job.params, output_path=job.path)
+
+
+def _load_figure_stamps() -> dict[str, dict]:
+    if not FIGURE_CACHE_FILE.is_file():
+        return {}
+    try:
+        stamps = json.loads(FIGURE_CACHE_FILE.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}  # a broken cache only costs a full redraw
+    return stamps if isinstance(stamps, dict) else {}
+
+
+def _is_cached(job: FigureJob, key: str, stamp: dict | None) -> bool:
+    if not isinstance(stamp, dict) or stamp.get("key") != key:
+        return False
+    outputs = stamp.get("outputs") or {}
+    return all(
+        p.is_file() and outputs.get(p.name) == build_cache.file_sha256(p)
+        for p in job.outputs
+    )
+
+
+def render_figures(jobs: list[FigureJob], max_workers: int | None = None) -> int:
+    """Draw the jobs whose cache key or outputs changed, in a process pool; return how many were drawn.
+
+    Workers use the Agg backend. PNGs in FIGURES_DIR that no job produces are removed.
+    """
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+    names = [p.name for job in jobs for p in job.outputs]
+    if len(names) != len(set(names)):
+        raise ReportGenerationError(f"Figure jobs write the same file twice: {sorted(names)}")
+
+    stamps = _load_figure_stamps()
+    keys = {job.path.name: job.key() for job in jobs}
+    pending = [job for job in jobs if not _is_cached(job, keys[job.path.name], stamps.get(job.path.name))]
+
+    workers = min(len(pending), max_workers or os.cpu_count() or 1)
+    if workers > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_figure_worker) as pool:
+            # list() re-raises the first failure (fail-fast)
+            list(pool.map(_render_figure_job, pending))
+    else:
+        for job in pending:
+            _render_figure_job(job)
+
+    stamps = {
+        job.path.name: {
+            "key": keys[job.path.name],
+            "outputs": {p.name: build_cache.file_sha256(p) for p in job.outputs},
+        }
+        for job in jobs
+    }
+    FIGURE_CACHE_FILE.write_text(json.dumps(stamps, indent=2, sort_keys=True), encoding="utf-8")
+
+    for stale in sorted(set(p.name for p in FIGURES_DIR.glob("*.png")) - set(names)):
+        (FIGURES_DIR / stale).unlink()
+    return len(pending)
+
 
-    figure_map: list[tuple[Path, str]] = []
-    for idx, table in enumerate(tables, start=1):
-        figure_map.append(render_figure_for_table(table, idx, averages_by_pair))
-    any_echo_figure = render_any_echo_figure(consolidated)
+def write_report(model: ReportModel) -> None:
+    """Render results/report_figures/*.png and write results/report.md from the report model."""
+    averages_by_pair = build_average_lookup(model.consolidated)
+
+    figure_map: list[tuple[FigureJob, str] | None] = []
+    for idx, table in enumerate(model.tables, start=1):
+        figure_map.append(figure_job_for_table(table, idx, averages_by_pair))
+    any_echo_figure = any_echo_figure_job(model.consolidated)
+    cross_pair_md, cross_pair_job = build_cross_pair_section(averages_by_pair)
+
+    distributions = build_latency_distributions(model.consolidated)
+    distribution_jobs = latency_distribution_jobs(distributions)
+
+    jobs = [f[0] for f in figure_map if f is not None] + [cross_pair_job]
+    if any_echo_figure is not None:
+        jobs.append(any_echo_figure[0])
+    jobs.extend(distribution_jobs.values())
+    drawn = render_figures(jobs)
+    print(f"Figures: {drawn} drawn, {len(jobs) - drawn} unchanged (cached)")
 
     report_md = build_report_markdown(
-        consolidated,
-        complexity,
-        tables,
+        model,
         figure_map,
-        averages_by_pair=averages_by_pair,
+        cross_pair_md,
         any_echo_figure=any_echo_figure,
+        distribution_md=build_latency_distribution_section(distributions, distribution_jobs),
     )
     REPORT_FILE.write_text(report_md, encoding="utf-8")
 
+
+def main() -> int:
+    try:
+        model = report_model.load_model(CONSOLIDATED_FILE, COMPLEXITY_FILE)
+    except ReportModelError as e:
+        raise ReportGenerationError(str(e)) from e
+
+    write_report(model)
+
     print(f"Report written to {REPORT_FILE}")
     print(f"Figures written to {FIGURES_DIR}")
     return 0
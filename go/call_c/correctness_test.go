@@ -7,6 +7,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"testing"
+	"time"
 
 	api "github.com/MetaFFI/sdk/api/go"
 	"github.com/MetaFFI/sdk/idl_entities/go/IDL"
@@ -19,6 +20,9 @@ import (
 var (
 	metaffiRT *api.MetaFFIRuntime
 	module    *api.MetaFFIModule
+
+	// initTiming is filled by TestMain and reported by the benchmark
+	initTiming InitTiming
 )
 
 func guestModuleFilename() string {
@@ -49,17 +53,22 @@ func TestMain(m *testing.M) {
 
 	// C guest uses the "cpp" runtime (xllr.cpp handles both)
 	metaffiRT = api.NewMetaFFIRuntime("cpp")
+	start := time.Now()
 	if err := metaffiRT.LoadRuntimePlugin(); err != nil {
 		fmt.Fprintf(os.Stderr, "FATAL: Failed to load cpp runtime plugin: %v\n", err)
 		os.Exit(1)
 	}
 
+	initTiming.LoadRuntimePluginNs = time.Since(start).Nanoseconds()
+
+	start = time.Now()
 	var err error
 	module, err = metaffiRT.LoadModule(modulePath)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "FATAL: Failed to load module %s: %v\n", modulePath, err)
 		os.Exit(1)
 	}
+	initTiming.LoadModuleNs = time.Since(start).Nanoseconds()
 
 	code := m.Run()
 	_ = metaffiRT.ReleaseRuntimePlugin()
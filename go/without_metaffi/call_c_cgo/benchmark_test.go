@@ -0,0 +1,805 @@
+package call_c_cgo
+
+import (
+	"crypto/sha256"
+	"encoding/binary"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"math"
+	"os"
+	"path/filepath"
+	"runtime"
+	"sort"
+	"strconv"
+	"strings"
+	"testing"
+	"time"
+)
+
+// ---------------------------------------------------------------------------
+// Global state set by TestMain
+// ---------------------------------------------------------------------------
+
+var loadDLLNs int64
+
+func guestModuleFilename() string {
+	switch runtime.GOOS {
+	case "windows":
+		return "c_guest_module.dll"
+	case "darwin":
+		return "c_guest_module.dylib"
+	}
+	return "c_guest_module.so"
+}
+
+func TestMain(m *testing.M) {
+	srcRoot := os.Getenv("METAFFI_SOURCE_ROOT")
+	if srcRoot == "" {
+		fmt.Fprintln(os.Stderr, "FATAL: METAFFI_SOURCE_ROOT must be set")
+		os.Exit(1)
+	}
+
+	// Same library the MetaFFI benchmark loads
+	modulePath := filepath.Join(srcRoot, "sdk", "test_modules", "guest_modules", "c", "test_bin", guestModuleFilename())
+
+	loadStart := time.Now()
+	if err := LoadCGuest(modulePath); err != nil {
+		fmt.Fprintf(os.Stderr, "FATAL: %v\n", err)
+		os.Exit(1)
+	}
+	loadDLLNs = time.Since(loadStart).Nanoseconds()
+	fmt.Fprintf(os.Stderr, "C guest module loaded in %d us\n", loadDLLNs/1e3)
+
+	os.Exit(m.Run())
+}
+
+// ---------------------------------------------------------------------------
+// Benchmark configuration (from env or defaults)
+// ---------------------------------------------------------------------------
+
+func getIntEnv(key string, defaultVal int) int {
+	v := os.Getenv(key)
+	if v == "" {
+		return defaultVal
+	}
+	var n int
+	_, err := fmt.Sscanf(v, "%d", &n)
+	if err != nil {
+		return defaultVal
+	}
+	return n
+}
+
+// Scalar scenarios only (dataSize is always nil); the threshold is kept so the
+// warmup and precision helpers stay identical across harnesses.
+const largeArrayThreshold = 10000
+
+// METAFFI_TEST_WARMUP calls, adaptive runs windows of timed calls until they agree.
+type WarmupSettings struct {
+	Mode          string  `json:"warmup_mode"`
+	WindowCalls   int     `json:"warmup_window_calls"`
+	StableWindows int     `json:"warmup_stable_windows"`
+	Tolerance     float64 `json:"warmup_tolerance"`
+	MaxCalls      int     `json:"warmup_max_calls"`
+}
+
+func warmupSettingsFromEnv() (WarmupSettings, error) {
+	s := WarmupSettings{Mode: "fixed", WindowCalls: 100, StableWindows: 3, Tolerance: 0.05, MaxCalls: 20000}
+	if mode := strings.ToLower(strings.TrimSpace(os.Getenv("METAFFI_TEST_WARMUP_MODE"))); mode != "" {
+		if mode != "fixed" && mode != "adaptive" {
+			return s, fmt.Errorf("METAFFI_TEST_WARMUP_MODE must be fixed or adaptive, got %q", mode)
+		}
+		s.Mode = mode
+	}
+	for key, dst := range map[string]*int{
+		"METAFFI_TEST_WARMUP_WINDOW":         &s.WindowCalls,
+		"METAFFI_TEST_WARMUP_STABLE_WINDOWS": &s.StableWindows,
+		"METAFFI_TEST_WARMUP_MAX_CALLS":      &s.MaxCalls,
+	} {
+		raw := strings.TrimSpace(os.Getenv(key))
+		if raw == "" {
+			continue
+		}
+		n, err := strconv.Atoi(raw)
+		if err != nil || n < 1 {
+			return s, fmt.Errorf("%s: invalid value %q", key, raw)
+		}
+		*dst = n
+	}
+	if raw := strings.TrimSpace(os.Getenv("METAFFI_TEST_WARMUP_TOLERANCE")); raw != "" {
+		tol, err := strconv.ParseFloat(raw, 64)
+		if err != nil || tol <= 0 || tol >= 1 {
+			return s, fmt.Errorf("METAFFI_TEST_WARMUP_TOLERANCE: invalid value %q", raw)
+		}
+		s.Tolerance = tol
+	}
+	return s, nil
+}
+
+// WarmupInfo is the "warmup" section of a benchmark entry.
+type WarmupInfo struct {
+	Mode      string `json:"mode"`
+	Calls     int    `json:"calls"`
+	Windows   *int   `json:"windows"`
+	Converged *bool  `json:"converged"`
+}
+
+// medianInPlace sorts values and returns their median.
+func medianInPlace(values []float64) float64 {
+	sort.Float64s(values)
+	n := len(values)
+	if n%2 == 1 {
+		return values[n/2]
+	}
+	return (values[n/2-1] + values[n/2]) / 2
+}
+
+// windowsAgree reports whether the medians and MADs all lie within tolerance x the lowest median.
+func windowsAgree(medians, mads []float64, tolerance float64) bool {
+	spread := func(v []float64) (float64, float64) {
+		lo, hi := v[0], v[0]
+		for _, x := range v[1:] {
+			lo, hi = math.Min(lo, x), math.Max(hi, x)
+		}
+		return lo, hi
+	}
+	medLo, medHi := spread(medians)
+	madLo, madHi := spread(mads)
+	bound := tolerance * medLo
+	return medHi-medLo <= bound && madHi-madLo <= bound
+}
+
+// warmUp runs the warmup of one scenario. In adaptive mode warmup is the minimum
+// call count; array sizes above largeArrayThreshold keep the fixed warmup.
+func warmUp(scenario string, dataSize *int, warmup int, s WarmupSettings, benchFn func() error) (WarmupInfo, error) {
+	if s.Mode != "adaptive" || (dataSize != nil && *dataSize > largeArrayThreshold) {
+		for i := 0; i < warmup; i++ {
+			if err := benchFn(); err != nil {
+				return WarmupInfo{}, fmt.Errorf("benchmark %q warmup iteration %d: %v", scenario, i, err)
+			}
+		}
+		return WarmupInfo{Mode: "fixed", Calls: warmup}, nil
+	}
+
+	maxCalls := s.MaxCalls
+	if warmup > maxCalls {
+		maxCalls = warmup
+	}
+	var medians, mads []float64
+	window := make([]float64, 0, s.WindowCalls)
+	calls := 0
+	converged := false
+	for calls < maxCalls && !converged {
+		window = window[:0]
+		for len(window) < s.WindowCalls && calls < maxCalls {
+			start := time.Now()
+			if err := benchFn(); err != nil {
+				return WarmupInfo{}, fmt.Errorf("benchmark %q warmup iteration %d: %v", scenario, calls, err)
+			}
+			window = append(window, float64(time.Since(start).Nanoseconds()))
+			calls++
+		}
+		median := medianInPlace(window)
+		for i, v := range window {
+			window[i] = math.Abs(v - median)
+		}
+		medians = append(medians, median)
+		mads = append(mads, medianInPlace(window))
+		k := s.StableWindows
+		converged = calls >= warmup && len(medians) >= k && windowsAgree(medians[len(medians)-k:], mads[len(mads)-k:], s.Tolerance)
+	}
+	windows := len(medians)
+	return WarmupInfo{Mode: "adaptive", Calls: calls, Windows: &windows, Converged: &converged}, nil
+}
+
+// PrecisionSettings mirrors benchmark_precision.py: with Target > 0 samples are taken
+// in blocks until the median's 95% CI is within +/- Target of the median.
+type PrecisionSettings struct {
+	Target          float64 `json:"precision_target"`
+	BlockIterations int     `json:"precision_block_iterations"`
+	MaxIterations   int     `json:"precision_max_iterations"`
+	MaxSeconds      int     `json:"precision_max_seconds"`
+}
+
+func precisionSettingsFromEnv() (PrecisionSettings, error) {
+	s := PrecisionSettings{BlockIterations: 1000, MaxIterations: 100000, MaxSeconds: 60}
+	if raw := strings.TrimSpace(os.Getenv("METAFFI_TEST_PRECISION_TARGET")); raw != "" {
+		target, err := strconv.ParseFloat(raw, 64)
+		if err != nil || target < 0 || target >= 1 {
+			return s, fmt.Errorf("METAFFI_TEST_PRECISION_TARGET: invalid value %q", raw)
+		}
+		s.Target = target
+	}
+	for key, dst := range map[string]*int{
+		"METAFFI_TEST_PRECISION_BLOCK":          &s.BlockIterations,
+		"METAFFI_TEST_PRECISION_MAX_ITERATIONS": &s.MaxIterations,
+		"METAFFI_TEST_PRECISION_MAX_SECONDS":    &s.MaxSeconds,
+	} {
+		raw := strings.TrimSpace(os.Getenv(key))
+		if raw == "" {
+			continue
+		}
+		n, err := strconv.Atoi(raw)
+		if err != nil || n < 1 {
+			return s, fmt.Errorf("%s: invalid value %q", key, raw)
+		}
+		*dst = n
+	}
+	return s, nil
+}
+
+// PrecisionInfo is the "precision" section of a benchmark entry.
+type PrecisionInfo struct {
+	Mode         string   `json:"mode"`
+	Target       *float64 `json:"target"`
+	Iterations   int      `json:"iterations"`
+	Blocks       int      `json:"blocks"`
+	HalfWidthRel float64  `json:"half_width_rel"`
+	Met          *bool    `json:"met"`
+	Stop         string   `json:"stop"`
+}
+
+// medianCIHalfWidth returns the half-width of the order-statistic 95% CI of the
+// median of the IQR-cleaned samples, relative to that median.
+func medianCIHalfWidth(samples []int64) float64 {
+	sorted := make([]int64, len(samples))
+	copy(sorted, samples)
+	sort.Slice(sorted, func(i, j int) bool { return sorted[i] < sorted[j] })
+	cleaned := removeOutliersIQR(sorted)
+	n := len(cleaned)
+	if n == 0 {
+		return 0
+	}
+	half := 1.96 * math.Sqrt(float64(n)) / 2
+	lo := int(math.Max(math.Floor(float64(n)/2-half), 0))
+	hi := int(math.Min(math.Ceil(float64(n)/2+half), float64(n-1)))
+	median := float64(cleaned[n/2])
+	if n%2 == 0 {
+		median = float64(cleaned[n/2-1]+cleaned[n/2]) / 2
+	}
+	if median <= 0 {
+		return 0
+	}
+	return float64(cleaned[hi]-cleaned[lo]) / (2 * median)
+}
+
+// precisionSampler decides how many samples one scenario takes: next is called
+// before every block and returns its size, or 0 once measurement is done.
+type precisionSampler struct {
+	s             PrecisionSettings
+	adaptive      bool
+	block         int
+	maxIterations int
+	deadline      time.Time
+	info          PrecisionInfo
+}
+
+func newPrecisionSampler(s PrecisionSettings, dataSize *int, iterations int) *precisionSampler {
+	p := &precisionSampler{s: s, block: iterations, maxIterations: iterations, info: PrecisionInfo{Mode: "fixed"}}
+	if s.Target > 0 && (dataSize == nil || *dataSize <= largeArrayThreshold) {
+		p.adaptive = true
+		p.block, p.maxIterations = s.BlockIterations, s.MaxIterations
+		p.info.Mode = "target"
+		p.info.Target = &s.Target
+	}
+	return p
+}
+
+func (p *precisionSampler) next(samples []int64) int {
+	n := len(samples)
+	if n == 0 {
+		p.deadline = time.Now().Add(time.Duration(p.s.MaxSeconds) * time.Second)
+	} else {
+		p.info.Blocks++
+		p.info.HalfWidthRel = medianCIHalfWidth(samples)
+		switch {
+		case !p.adaptive:
+			p.info.Stop = "iterations"
+		case p.info.HalfWidthRel <= p.s.Target:
+			p.info.Stop = "target"
+		case n >= p.maxIterations:
+			p.info.Stop = "max_iterations"
+		case !time.Now().Before(p.deadline):
+			p.info.Stop = "time_budget"
+		}
+		if p.info.Stop != "" {
+			p.info.Iterations = n
+			if p.adaptive {
+				met := p.info.HalfWidthRel <= p.s.Target
+				p.info.Met = &met
+			}
+			return 0
+		}
+	}
+	if rest := p.maxIterations - n; rest < p.block {
+		return rest
+	}
+	return p.block
+}
+
+func parseScenarioFilter() map[string]struct{} {
+	raw := strings.TrimSpace(os.Getenv("METAFFI_TEST_SCENARIOS"))
+	if raw == "" {
+		return nil
+	}
+
+	res := make(map[string]struct{})
+	for _, part := range strings.Split(raw, ",") {
+		k := strings.TrimSpace(part)
+		if k != "" {
+			res[k] = struct{}{}
+		}
+	}
+	if len(res) == 0 {
+		return nil
+	}
+	return res
+}
+
+func scenarioFilterKey(name string, dataSize *int) string {
+	if dataSize == nil {
+		return name
+	}
+	return fmt.Sprintf("%s_%d", name, *dataSize)
+}
+
+func shouldRunScenario(filter map[string]struct{}, name string, dataSize *int) bool {
+	if len(filter) == 0 {
+		return true
+	}
+	_, ok := filter[scenarioFilterKey(name, dataSize)]
+	return ok
+}
+
+// ---------------------------------------------------------------------------
+// Statistics helpers
+// ---------------------------------------------------------------------------
+
+type PhaseStats struct {
+	MeanNs   float64    `json:"mean_ns"`
+	MedianNs float64    `json:"median_ns"`
+	P95Ns    float64    `json:"p95_ns"`
+	P99Ns    float64    `json:"p99_ns"`
+	StddevNs float64    `json:"stddev_ns"`
+	CI95Ns   [2]float64 `json:"ci95_ns"`
+}
+
+type BenchmarkResult struct {
+	Scenario          string                `json:"scenario"`
+	DataSize          *int                  `json:"data_size"`
+	Status            string                `json:"status"`
+	Error             string                `json:"error,omitempty"`
+	RawIterationsNs   []int64               `json:"raw_iterations_ns"`
+	RawIterationsFile *RawSampleFile        `json:"raw_iterations_ns_file,omitempty"`
+	Phases            map[string]PhaseStats `json:"phases"`
+	Warmup            *WarmupInfo           `json:"warmup,omitempty"`
+	Precision         *PrecisionInfo        `json:"precision,omitempty"`
+}
+
+type ResultFile struct {
+	Metadata    Metadata          `json:"metadata"`
+	Correctness interface{}       `json:"correctness"`
+	Init        InitTiming        `json:"initialization"`
+	Benchmarks  []BenchmarkResult `json:"benchmarks"`
+}
+
+type Metadata struct {
+	Host        string      `json:"host"`
+	Guest       string      `json:"guest"`
+	Mechanism   string      `json:"mechanism"`
+	Timestamp   string      `json:"timestamp"`
+	Environment Environment `json:"environment"`
+	Config      Config      `json:"config"`
+}
+
+type Environment struct {
+	OS        string `json:"os"`
+	Arch      string `json:"arch"`
+	GoVersion string `json:"go_version"`
+}
+
+type Config struct {
+	WarmupIterations int `json:"warmup_iterations"`
+	WarmupSettings
+	PrecisionSettings
+	MeasuredIterations int    `json:"measured_iterations"`
+	BatchMinElapsedNs  int64  `json:"batch_min_elapsed_ns"`
+	BatchMaxCalls      int    `json:"batch_max_calls"`
+	RawSampleFormat    string `json:"raw_sample_format"`
+	TimerOverheadNs    int64  `json:"timer_overhead_ns"`
+}
+
+type InitTiming struct {
+	LoadDLLNs int64 `json:"load_dll_ns"`
+}
+
+// computeStats computes summary statistics from a sorted slice of nanosecond timings.
+// The input MUST be sorted ascending.
+func computeStats(sorted []int64) PhaseStats {
+	n := len(sorted)
+	if n == 0 {
+		return PhaseStats{}
+	}
+
+	// Mean
+	var sum float64
+	for _, v := range sorted {
+		sum += float64(v)
+	}
+	mean := sum / float64(n)
+
+	// Median
+	var median float64
+	if n%2 == 0 {
+		median = float64(sorted[n/2-1]+sorted[n/2]) / 2.0
+	} else {
+		median = float64(sorted[n/2])
+	}
+
+	// Percentiles
+	p95 := float64(sorted[int(float64(n)*0.95)])
+	p99 := float64(sorted[int(math.Min(float64(n)*0.99, float64(n-1)))])
+
+	// Stddev
+	var sqDiffSum float64
+	for _, v := range sorted {
+		diff := float64(v) - mean
+		sqDiffSum += diff * diff
+	}
+	stddev := math.Sqrt(sqDiffSum / float64(n))
+
+	// 95% confidence interval
+	se := stddev / math.Sqrt(float64(n))
+	ci95Low := mean - 1.96*se
+	ci95High := mean + 1.96*se
+
+	return PhaseStats{
+		MeanNs:   mean,
+		MedianNs: median,
+		P95Ns:    p95,
+		P99Ns:    p99,
+		StddevNs: stddev,
+		CI95Ns:   [2]float64{ci95Low, ci95High},
+	}
+}
+
+// removeOutliersIQR removes IQR-based outliers from a sorted slice.
+func removeOutliersIQR(sorted []int64) []int64 {
+	n := len(sorted)
+	if n < 4 {
+		return sorted
+	}
+
+	q1 := float64(sorted[n/4])
+	q3 := float64(sorted[3*n/4])
+	iqr := q3 - q1
+	lower := q1 - 1.5*iqr
+	upper := q3 + 1.5*iqr
+
+	result := make([]int64, 0, n)
+	for _, v := range sorted {
+		if float64(v) >= lower && float64(v) <= upper {
+			result = append(result, v)
+		}
+	}
+	return result
+}
+
+// measureTimerOverhead estimates the overhead of the timing mechanism itself.
+func measureTimerOverhead() int64 {
+	const n = 10000
+	samples := make([]int64, n)
+	for i := 0; i < n; i++ {
+		start := time.Now()
+		elapsed := time.Since(start)
+		samples[i] = elapsed.Nanoseconds()
+	}
+	sort.Slice(samples, func(i, j int) bool { return samples[i] < samples[j] })
+	// Return median as the timer overhead
+	return samples[n/2]
+}
+
+// ---------------------------------------------------------------------------
+// Raw sample sidecars (METAFFI_TEST_RAW_FORMAT=npy, see benchmark_samples.py)
+// ---------------------------------------------------------------------------
+
+type RawSampleFile struct {
+	Path   string `json:"path"`
+	Length int    `json:"length"`
+	Dtype  string `json:"dtype"`
+	SHA256 string `json:"sha256"`
+}
+
+func rawSampleFormatFromEnv() (string, error) {
+	format := strings.ToLower(strings.TrimSpace(os.Getenv("METAFFI_TEST_RAW_FORMAT")))
+	switch format {
+	case "":
+		return "json", nil
+	case "json", "npy":
+		return format, nil
+	}
+	return "", fmt.Errorf("METAFFI_TEST_RAW_FORMAT must be json or npy, got %q", format)
+}
+
+// writeNpyInt64 writes samples as a 1-D little-endian int64 .npy file.
+func writeNpyInt64(path string, samples []int64) (RawSampleFile, error) {
+	header := fmt.Sprintf("{'descr': '<i8', 'fortran_order': False, 'shape': (%d,), }", len(samples))
+	// Pad so that the data starts on a 64-byte boundary (NPY format 1.0).
+	total := 6 + 2 + 2 + len(header) + 1
+	header += strings.Repeat(" ", (64-total%64)%64) + "\n"
+
+	buf := make([]byte, 0, 10+len(header)+8*len(samples))
+	buf = append(buf, "\x93NUMPY\x01\x00"...)
+	buf = binary.LittleEndian.AppendUint16(buf, uint16(len(header)))
+	buf = append(buf, header...)
+	for _, v := range samples {
+		buf = binary.LittleEndian.AppendUint64(buf, uint64(v))
+	}
+
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		return RawSampleFile{}, err
+	}
+	if err := os.WriteFile(path, buf, 0644); err != nil {
+		return RawSampleFile{}, err
+	}
+	sum := sha256.Sum256(buf)
+	return RawSampleFile{Length: len(samples), Dtype: "<i8", SHA256: hex.EncodeToString(sum[:])}, nil
+}
+
+// externalizeRawSamples moves raw_iterations_ns of every benchmark into
+// <result stem>.raw/<scenario key>.raw_iterations_ns.npy next to resultPath.
+func externalizeRawSamples(resultPath string, benchmarks []BenchmarkResult) error {
+	stem := strings.TrimSuffix(filepath.Base(resultPath), filepath.Ext(resultPath))
+	for i := range benchmarks {
+		b := &benchmarks[i]
+		if b.RawIterationsNs == nil {
+			continue
+		}
+		rel := stem + ".raw/" + scenarioFilterKey(b.Scenario, b.DataSize) + ".raw_iterations_ns.npy"
+		ref, err := writeNpyInt64(filepath.Join(filepath.Dir(resultPath), filepath.FromSlash(rel)), b.RawIterationsNs)
+		if err != nil {
+			return fmt.Errorf("write raw samples of %s: %w", scenarioFilterKey(b.Scenario, b.DataSize), err)
+		}
+		ref.Path = rel
+		b.RawIterationsFile = &ref
+		b.RawIterationsNs = nil
+	}
+	return nil
+}
+
+// ---------------------------------------------------------------------------
+// Benchmark runner
+// ---------------------------------------------------------------------------
+
+// runBenchmark executes a benchmark scenario N times (after warmup), recording
+// total per-call time. If any call returns an incorrect result, the benchmark
+// is marked FAILED immediately (fail-fast).
+func runBenchmark(
+	t *testing.T,
+	scenario string,
+	dataSize *int,
+	warmup int,
+	iterations int,
+	batchMinElapsedNs int64,
+	batchMaxCalls int,
+	benchFn func() error, // Must return error if result is incorrect
+) BenchmarkResult {
+	t.Helper()
+
+	// Warmup phase -- discard timing, but still fail on errors
+	settings, err := warmupSettingsFromEnv()
+	if err != nil {
+		t.Fatalf("%v", err)
+	}
+	warmupInfo, err := warmUp(scenario, dataSize, warmup, settings, benchFn)
+	if err != nil {
+		t.Fatalf("%v", err)
+		return BenchmarkResult{Scenario: scenario, DataSize: dataSize, Status: "FAIL"}
+	}
+
+	// Measurement phase
+	precision, err := precisionSettingsFromEnv()
+	if err != nil {
+		t.Fatalf("%v", err)
+	}
+	sampler := newPrecisionSampler(precision, dataSize, iterations)
+	var rawNs []int64
+	for block := sampler.next(rawNs); block > 0; block = sampler.next(rawNs) {
+		first := len(rawNs)
+		rawNs = append(rawNs, make([]int64, block)...)
+		for i := first; i < len(rawNs); i++ {
+			start := time.Now()
+			calls := 0
+			for {
+				err := benchFn()
+				if err != nil {
+					t.Fatalf("benchmark %q iteration %d: %v (BENCHMARK INVALIDATED)", scenario, i, err)
+					return BenchmarkResult{Scenario: scenario, DataSize: dataSize, Status: "FAIL"}
+				}
+				calls++
+				elapsed := time.Since(start).Nanoseconds()
+				if elapsed >= batchMinElapsedNs || calls >= batchMaxCalls {
+					perCall := float64(elapsed) / float64(calls)
+					// Keep strictly positive values to avoid timer-floor collapse to 0 ns.
+					if perCall > 0.0 && perCall < 1.0 {
+						rawNs[i] = 1
+					} else {
+						rawNs[i] = int64(math.Round(perCall))
+					}
+					break
+				}
+			}
+		}
+	}
+
+	// Sort for statistics
+	sortedNs := make([]int64, len(rawNs))
+	copy(sortedNs, rawNs)
+	sort.Slice(sortedNs, func(i, j int) bool { return sortedNs[i] < sortedNs[j] })
+
+	// Remove outliers
+	cleaned := removeOutliersIQR(sortedNs)
+
+	totalStats := computeStats(cleaned)
+
+	return BenchmarkResult{
+		Scenario:        scenario,
+		DataSize:        dataSize,
+		Status:          "PASS",
+		Warmup:          &warmupInfo,
+		Precision:       &sampler.info,
+		RawIterationsNs: rawNs,
+		Phases: map[string]PhaseStats{
+			"total": totalStats,
+		},
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Benchmark tests (3 scenarios)
+// ---------------------------------------------------------------------------
+
+func TestBenchmarkAll(t *testing.T) {
+	mode := os.Getenv("METAFFI_TEST_MODE")
+	if mode == "correctness" {
+		t.Skip("Skipping benchmarks: METAFFI_TEST_MODE=correctness")
+	}
+
+	warmup := getIntEnv("METAFFI_TEST_WARMUP", 100)
+	iterations := getIntEnv("METAFFI_TEST_ITERATIONS", 10000)
+	batchMinElapsedNs := int64(getIntEnv("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", 10000))
+	batchMaxCalls := getIntEnv("METAFFI_TEST_BATCH_MAX_CALLS", 100000)
+	scenarioFilter := parseScenarioFilter()
+
+	timerOverhead := measureTimerOverhead()
+	t.Logf("Timer overhead: %d ns", timerOverhead)
+	if len(scenarioFilter) > 0 {
+		t.Logf("Scenario filter enabled: %s", os.Getenv("METAFFI_TEST_SCENARIOS"))
+	}
+
+	var benchmarks []BenchmarkResult
+
+	// --- Scenario 1: Void call ---
+	if shouldRunScenario(scenarioFilter, "void_call", nil) {
+		t.Run("void_call", func(t *testing.T) {
+			result := runBenchmark(t, "void_call", nil, warmup, iterations, batchMinElapsedNs, batchMaxCalls, func() error {
+				NoOp()
+				return nil
+			})
+			benchmarks = append(benchmarks, result)
+		})
+	}
+
+	// --- Scenario 2: Primitive echo (int64 -> float64) ---
+	if shouldRunScenario(scenarioFilter, "primitive_echo", nil) {
+		t.Run("primitive_echo", func(t *testing.T) {
+			result := runBenchmark(t, "primitive_echo", nil, warmup, iterations, batchMinElapsedNs, batchMaxCalls, func() error {
+				v := DivIntegers(10, 2)
+				if math.Abs(v-5.0) > 1e-10 {
+					return fmt.Errorf("xcall_c_div_integers(10,2): got %v, want 5.0", v)
+				}
+				return nil
+			})
+			benchmarks = append(benchmarks, result)
+		})
+	}
+
+	// --- Scenario 3: Counter increment (guest-side state, int64 -> int64) ---
+	if shouldRunScenario(scenarioFilter, "counter_increment", nil) {
+		t.Run("counter_increment", func(t *testing.T) {
+			SetCounter(0)
+			var expected int64
+			result := runBenchmark(t, "counter_increment", nil, warmup, iterations, batchMinElapsedNs, batchMaxCalls, func() error {
+				v := IncCounter(1)
+				expected++
+				if v != expected {
+					return fmt.Errorf("xcall_c_inc_counter(1): got %d, want %d", v, expected)
+				}
+				return nil
+			})
+			SetCounter(0)
+			benchmarks = append(benchmarks, result)
+		})
+	}
+
+	if len(benchmarks) == 0 {
+		t.Fatalf("METAFFI_TEST_SCENARIOS selected no benchmark scenarios: %q", os.Getenv("METAFFI_TEST_SCENARIOS"))
+	}
+
+	// --- Write results to JSON ---
+	writeResults(t, benchmarks, timerOverhead, warmup, iterations, batchMinElapsedNs, batchMaxCalls)
+}
+
+func writeResults(
+	t *testing.T,
+	benchmarks []BenchmarkResult,
+	timerOverhead int64,
+	warmup, iterations int,
+	batchMinElapsedNs int64,
+	batchMaxCalls int,
+) {
+	t.Helper()
+
+	resultPath := os.Getenv("METAFFI_TEST_RESULTS_FILE")
+	if resultPath == "" {
+		resultPath = "../../../results/go_to_c_cgo.json"
+	}
+
+	rawFormat, err := rawSampleFormatFromEnv()
+	if err != nil {
+		t.Fatalf("%v", err)
+	}
+	warmupSettings, err := warmupSettingsFromEnv()
+	if err != nil {
+		t.Fatalf("%v", err)
+	}
+	precisionSettings, err := precisionSettingsFromEnv()
+	if err != nil {
+		t.Fatalf("%v", err)
+	}
+
+	result := ResultFile{
+		Metadata: Metadata{
+			Host:      "go",
+			Guest:     "c",
+			Mechanism: "cgo",
+			Timestamp: time.Now().UTC().Format(time.RFC3339),
+			Environment: Environment{
+				OS:        runtime.GOOS,
+				Arch:      runtime.GOARCH,
+				GoVersion: runtime.Version(),
+			},
+			Config: Config{
+				WarmupIterations:   warmup,
+				WarmupSettings:     warmupSettings,
+				PrecisionSettings:  precisionSettings,
+				MeasuredIterations: iterations,
+				BatchMinElapsedNs:  batchMinElapsedNs,
+				BatchMaxCalls:      batchMaxCalls,
+				RawSampleFormat:    rawFormat,
+				TimerOverheadNs:    timerOverhead,
+			},
+		},
+		Init:       InitTiming{LoadDLLNs: loadDLLNs},
+		Benchmarks: benchmarks,
+	}
+
+	if rawFormat == "npy" {
+		if err := externalizeRawSamples(resultPath, result.Benchmarks); err != nil {
+			t.Fatalf("Failed to write raw sample sidecars: %v", err)
+		}
+	}
+
+	data, err := json.MarshalIndent(result, "", "  ")
+	if err != nil {
+		t.Fatalf("Failed to marshal results to JSON: %v", err)
+	}
+
+	if err := os.WriteFile(resultPath, data, 0644); err != nil {
+		t.Logf("WARNING: Failed to write results to %s: %v", resultPath, err)
+		// Don't fatal -- results are also logged to stdout
+	} else {
+		t.Logf("Results written to %s", resultPath)
+	}
+}
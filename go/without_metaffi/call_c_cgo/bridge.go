@@ -0,0 +1,129 @@
+package call_c_cgo
+
+// Build requirements: a C compiler for cgo (GCC / MinGW on Windows).
+// Nothing is linked at build time; the C guest module (c_guest_module.dll /
+// .so / .dylib) is loaded at runtime with LoadLibraryA (Windows) or dlopen
+// (Linux/macOS) and its plain C functions are called through function
+// pointers, the same way the MetaFFI cpp runtime resolves them.
+
+/*
+#cgo !windows LDFLAGS: -ldl
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <dlfcn.h>
+#endif
+
+// ---------------------------------------------------------------------------
+// C guest entry points (resolved once by load_c_guest)
+// ---------------------------------------------------------------------------
+
+typedef void (*no_op_t)(void);
+typedef double (*div_integers_t)(int64_t, int64_t);
+typedef void (*set_counter_t)(int64_t);
+typedef int64_t (*inc_counter_t)(int64_t);
+
+static no_op_t pfn_no_op = NULL;
+static div_integers_t pfn_div_integers = NULL;
+static set_counter_t pfn_set_counter = NULL;
+static inc_counter_t pfn_inc_counter = NULL;
+
+#ifdef _WIN32
+static HMODULE g_guest = NULL;
+
+static void* resolve(const char* name) {
+	return (void*)GetProcAddress(g_guest, name);
+}
+#else
+static void* g_guest = NULL;
+
+static void* resolve(const char* name) {
+	return dlsym(g_guest, name);
+}
+#endif
+
+// Load the guest module and resolve every entry point.
+// Returns a malloc'd error string on failure, or NULL on success.
+static char* load_c_guest(const char* path) {
+	char buf[1024];
+#ifdef _WIN32
+	g_guest = LoadLibraryA(path);
+	if (!g_guest) {
+		snprintf(buf, sizeof(buf), "LoadLibrary(%s) failed (error %lu)", path, GetLastError());
+		return strdup(buf);
+	}
+#else
+	g_guest = dlopen(path, RTLD_NOW | RTLD_LOCAL);
+	if (!g_guest) {
+		snprintf(buf, sizeof(buf), "dlopen(%s) failed: %s", path, dlerror());
+		return strdup(buf);
+	}
+#endif
+
+	const char* missing = NULL;
+	if (!(pfn_no_op = (no_op_t)resolve("xcall_c_no_op"))) missing = "xcall_c_no_op";
+	else if (!(pfn_div_integers = (div_integers_t)resolve("xcall_c_div_integers"))) missing = "xcall_c_div_integers";
+	else if (!(pfn_set_counter = (set_counter_t)resolve("xcall_c_set_counter"))) missing = "xcall_c_set_counter";
+	else if (!(pfn_inc_counter = (inc_counter_t)resolve("xcall_c_inc_counter"))) missing = "xcall_c_inc_counter";
+	if (missing) {
+		snprintf(buf, sizeof(buf), "symbol %s not found in %s", missing, path);
+		return strdup(buf);
+	}
+	return NULL;
+}
+
+static void call_no_op(void) { pfn_no_op(); }
+static double call_div_integers(int64_t x, int64_t y) { return pfn_div_integers(x, y); }
+static void call_set_counter(int64_t v) { pfn_set_counter(v); }
+static int64_t call_inc_counter(int64_t v) { return pfn_inc_counter(v); }
+*/
+import "C"
+
+import (
+	"fmt"
+	"unsafe"
+)
+
+// ---------------------------------------------------------------------------
+// Go wrapper functions (exported to test code, no cgo types leak)
+// ---------------------------------------------------------------------------
+
+// LoadCGuest loads the C guest module and resolves the benchmarked functions.
+func LoadCGuest(path string) error {
+	cpath := C.CString(path)
+	defer C.free(unsafe.Pointer(cpath))
+
+	cerr := C.load_c_guest(cpath)
+	if cerr != nil {
+		msg := C.GoString(cerr)
+		C.free(unsafe.Pointer(cerr))
+		return fmt.Errorf("load C guest: %s", msg)
+	}
+	return nil
+}
+
+// NoOp calls xcall_c_no_op (scenario 1).
+func NoOp() {
+	C.call_no_op()
+}
+
+// DivIntegers calls xcall_c_div_integers (scenario 2).
+func DivIntegers(x, y int64) float64 {
+	return float64(C.call_div_integers(C.int64_t(x), C.int64_t(y)))
+}
+
+// SetCounter calls xcall_c_set_counter.
+func SetCounter(v int64) {
+	C.call_set_counter(C.int64_t(v))
+}
+
+// IncCounter calls xcall_c_inc_counter (scenario 3) and returns the new value.
+func IncCounter(v int64) int64 {
+	return int64(C.call_inc_counter(C.int64_t(v)))
+}
@@ -0,0 +1,5 @@
+module github.com/MetaFFI/tests/go/without_metaffi/call_c_cgo
+
+go 1.23.0
+
+toolchain go1.24.4
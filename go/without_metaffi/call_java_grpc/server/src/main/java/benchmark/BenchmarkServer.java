@@ -183,7 +183,9 @@ public class BenchmarkServer extends BenchmarkServiceGrpc.BenchmarkServiceImplBa
             }
         }
 
+        // Large array sizes exceed gRPC's default 4 MB message limit
         Server server = ServerBuilder.forPort(port)
+                .maxInboundMessageSize(Integer.MAX_VALUE)
                 .addService(new BenchmarkServer())
                 .build()
                 .start();
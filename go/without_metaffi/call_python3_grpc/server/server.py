@@ -102,7 +102,14 @@ def serve(module_path: str, port: int):
     sys.path.insert(0, module_path)
     import module  # noqa: E402
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    # Large array sizes exceed gRPC's default 4 MB message limit
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
     benchmark_pb2_grpc.add_BenchmarkServiceServicer_to_server(
         BenchmarkServicer(module), server
     )
@@ -0,0 +1,794 @@
+import api.MetaFFIModule;
+import api.MetaFFIRuntime;
+import metaffi.api.accessor.Caller;
+import metaffi.api.accessor.MetaFFITypeInfo;
+import metaffi.api.accessor.MetaFFITypeInfo.MetaFFITypes;
+import org.junit.AfterClass;
+import org.junit.BeforeClass;
+import org.junit.Test;
+
+import java.io.File;
+import java.io.FileWriter;
+import java.io.IOException;
+import java.io.PrintWriter;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+import static org.junit.Assert.*;
+
+/**
+ * Performance benchmarks: Java host -> C++ guest via MetaFFI.
+ *
+ * 4 scalar scenarios (void call, primitive echo, counter increment, error
+ * propagation), with statistical rigor.
+ * C++ guests use the "cpp" runtime (xllr.cpp handles both C and C++).
+ * Outputs results to tests/results/java_to_cpp_metaffi.json.
+ */
+public class TestBenchmark
+{
+	private static MetaFFIRuntime runtime;
+	private static MetaFFIModule cppModule;
+	private static long loadRuntimePluginNs;
+	private static long loadModuleNs;
+
+	// Configuration from environment
+	private static int WARMUP;
+	private static String WARMUP_MODE;
+	private static int WARMUP_WINDOW;
+	private static int WARMUP_STABLE_WINDOWS;
+	private static double WARMUP_TOLERANCE;
+	private static int WARMUP_MAX_CALLS;
+	private static double PRECISION_TARGET;
+	private static int PRECISION_BLOCK;
+	private static int PRECISION_MAX_ITERATIONS;
+	private static int PRECISION_MAX_SECONDS;
+	private static int ITERATIONS;
+	// Scalar scenarios only (dataSize is always null); kept so the warmup and
+	// precision helpers stay identical across harnesses.
+	private static final int LARGE_ARRAY_THRESHOLD = 10000;
+	private static String RAW_SAMPLE_FORMAT;
+
+	@BeforeClass
+	public static void setUp()
+	{
+		String metaffiHome = System.getenv("METAFFI_HOME");
+		assertNotNull("METAFFI_HOME must be set", metaffiHome);
+
+		String sourceRoot = System.getenv("METAFFI_SOURCE_ROOT");
+		assertNotNull("METAFFI_SOURCE_ROOT must be set", sourceRoot);
+
+		WARMUP = parseIntEnv("METAFFI_TEST_WARMUP", 100);
+		WARMUP_MODE = parseWarmupMode();
+		WARMUP_WINDOW = parseIntEnv("METAFFI_TEST_WARMUP_WINDOW", 100);
+		WARMUP_STABLE_WINDOWS = parseIntEnv("METAFFI_TEST_WARMUP_STABLE_WINDOWS", 3);
+		WARMUP_TOLERANCE = parseWarmupTolerance();
+		WARMUP_MAX_CALLS = parseIntEnv("METAFFI_TEST_WARMUP_MAX_CALLS", 20000);
+		PRECISION_TARGET = parsePrecisionTarget();
+		PRECISION_BLOCK = parseIntEnv("METAFFI_TEST_PRECISION_BLOCK", 1000);
+		PRECISION_MAX_ITERATIONS = parseIntEnv("METAFFI_TEST_PRECISION_MAX_ITERATIONS", 100000);
+		PRECISION_MAX_SECONDS = parseIntEnv("METAFFI_TEST_PRECISION_MAX_SECONDS", 60);
+		ITERATIONS = parseIntEnv("METAFFI_TEST_ITERATIONS", 10000);
+		RAW_SAMPLE_FORMAT = parseRawSampleFormat();
+
+		// C and C++ guests use the "cpp" runtime
+		runtime = new MetaFFIRuntime("cpp");
+
+		long start = System.nanoTime();
+		runtime.loadRuntimePlugin();
+		loadRuntimePluginNs = System.nanoTime() - start;
+
+		String modulePath = sourceRoot.replace('\\', '/') +
+			"/sdk/test_modules/guest_modules/cpp/test_bin/" + getCppGuestModuleFilename();
+
+		start = System.nanoTime();
+		cppModule = runtime.loadModule(modulePath);
+		loadModuleNs = System.nanoTime() - start;
+
+		assertNotNull("Failed to load C++ guest module", cppModule);
+	}
+
+	private static String getCppGuestModuleFilename()
+	{
+		String os = System.getProperty("os.name", "").toLowerCase();
+		if (os.contains("win"))
+		{
+			return "cpp_guest_module.dll";
+		}
+		if (os.contains("mac"))
+		{
+			return "cpp_guest_module.dylib";
+		}
+		return "cpp_guest_module.so";
+	}
+
+	@AfterClass
+	public static void tearDown()
+	{
+		try
+		{
+			if (runtime != null)
+			{
+				runtime.releaseRuntimePlugin();
+			}
+		}
+		finally
+		{
+			cppModule = null;
+			runtime = null;
+		}
+	}
+
+	private static int parseIntEnv(String name, int defaultValue)
+	{
+		String val = System.getenv(name);
+		if (val == null || val.isEmpty()) return defaultValue;
+		return Integer.parseInt(val);
+	}
+
+	private static Set<String> parseScenarioFilter()
+	{
+		String raw = System.getenv("METAFFI_TEST_SCENARIOS");
+		if (raw == null || raw.trim().isEmpty())
+		{
+			return null;
+		}
+
+		Set<String> filter = new HashSet<>();
+		for (String part : raw.split(","))
+		{
+			String k = part.trim();
+			if (!k.isEmpty())
+			{
+				filter.add(k);
+			}
+		}
+		return filter.isEmpty() ? null : filter;
+	}
+
+	private static String scenarioKey(String scenario, Integer dataSize)
+	{
+		return dataSize == null ? scenario : scenario + "_" + dataSize;
+	}
+
+	private static boolean shouldRunScenario(Set<String> filter, String scenario, Integer dataSize)
+	{
+		return filter == null || filter.contains(scenarioKey(scenario, dataSize));
+	}
+
+	// -----------------------------------------------------------------------
+	// Raw sample sidecars (METAFFI_TEST_RAW_FORMAT=npy, see benchmark_samples.py)
+	// -----------------------------------------------------------------------
+
+	private static String parseRawSampleFormat()
+	{
+		String val = System.getenv("METAFFI_TEST_RAW_FORMAT");
+		String format = val == null ? "" : val.trim().toLowerCase();
+		if (format.isEmpty()) return "json";
+		if (!format.equals("json") && !format.equals("npy"))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_RAW_FORMAT must be json or npy, got '" + val + "'");
+		}
+		return format;
+	}
+
+	/**
+	 * Write samples to {@code <result stem>.raw/<scenario key>.raw_iterations_ns.npy}
+	 * (1-D little-endian int64) and return the JSON reference object.
+	 */
+	private static String writeRawSidecar(String scenario, Integer dataSize, long[] rawNs) throws IOException
+	{
+		File resultFile = new File(resolveResultPath()).getAbsoluteFile();
+		String name = resultFile.getName();
+		String stem = name.lastIndexOf('.') > 0 ? name.substring(0, name.lastIndexOf('.')) : name;
+		String relPath = stem + ".raw/" + scenarioKey(scenario, dataSize) + ".raw_iterations_ns.npy";
+
+		String header = "{'descr': '<i8', 'fortran_order': False, 'shape': (" + rawNs.length + ",), }";
+		// Pad so that the data starts on a 64-byte boundary (NPY format 1.0).
+		int total = 6 + 2 + 2 + header.length() + 1;
+		header += " ".repeat((64 - total % 64) % 64) + "\n";
+
+		ByteBuffer buf = ByteBuffer.allocate(10 + header.length() + 8 * rawNs.length).order(ByteOrder.LITTLE_ENDIAN);
+		buf.put((byte) 0x93).put("NUMPY".getBytes(StandardCharsets.US_ASCII)).put((byte) 1).put((byte) 0);
+		buf.putShort((short) header.length());
+		buf.put(header.getBytes(StandardCharsets.US_ASCII));
+		for (long v : rawNs)
+		{
+			buf.putLong(v);
+		}
+		byte[] data = buf.array();
+
+		File sidecar = new File(resultFile.getParentFile(), relPath);
+		sidecar.getParentFile().mkdirs();
+		Files.write(sidecar.toPath(), data);
+
+		StringBuilder sha256 = new StringBuilder();
+		try
+		{
+			for (byte b : MessageDigest.getInstance("SHA-256").digest(data))
+			{
+				sha256.append(String.format("%02x", b));
+			}
+		}
+		catch (NoSuchAlgorithmException e)
+		{
+			throw new IOException("SHA-256 not available", e);
+		}
+
+		return "{\"path\": \"" + relPath + "\", \"length\": " + rawNs.length +
+			", \"dtype\": \"<i8\", \"sha256\": \"" + sha256 + "\"}";
+	}
+
+	// ---- Helper types and methods ----
+
+	private static MetaFFITypeInfo t(MetaFFITypes type)
+	{
+		return new MetaFFITypeInfo(type);
+	}
+
+	// ---- Statistical helpers ----
+
+	private static double[] computeStats(long[] sortedNs)
+	{
+		int n = sortedNs.length;
+		if (n == 0)
+		{
+			return new double[]{0, 0, 0, 0, 0, 0, 0};
+		}
+
+		double sum = 0;
+		for (long v : sortedNs) sum += v;
+		double mean = sum / n;
+
+		double median;
+		if (n % 2 == 1)
+		{
+			median = sortedNs[n / 2];
+		}
+		else
+		{
+			median = (sortedNs[n / 2 - 1] + sortedNs[n / 2]) / 2.0;
+		}
+
+		double p95 = sortedNs[(int) (n * 0.95)];
+		double p99 = sortedNs[Math.min((int) (n * 0.99), n - 1)];
+
+		double sqDiffSum = 0;
+		for (long v : sortedNs) sqDiffSum += (v - mean) * (v - mean);
+		double stddev = Math.sqrt(sqDiffSum / n);
+
+		double se = stddev / Math.sqrt(n);
+		double ci95Low = mean - 1.96 * se;
+		double ci95High = mean + 1.96 * se;
+
+		return new double[]{mean, median, p95, p99, stddev, ci95Low, ci95High};
+	}
+
+	private static long[] removeOutliersIQR(long[] sortedNs)
+	{
+		int n = sortedNs.length;
+		if (n < 4) return sortedNs;
+
+		double q1 = sortedNs[n / 4];
+		double q3 = sortedNs[3 * n / 4];
+		double iqr = q3 - q1;
+		double lower = q1 - 1.5 * iqr;
+		double upper = q3 + 1.5 * iqr;
+
+		List<Long> cleaned = new ArrayList<>();
+		for (long v : sortedNs)
+		{
+			if (v >= lower && v <= upper)
+			{
+				cleaned.add(v);
+			}
+		}
+
+		long[] result = new long[cleaned.size()];
+		for (int i = 0; i < cleaned.size(); i++) result[i] = cleaned.get(i);
+		return result;
+	}
+
+	private static long measureTimerOverhead()
+	{
+		long[] samples = new long[10000];
+		for (int i = 0; i < 10000; i++)
+		{
+			long start = System.nanoTime();
+			samples[i] = System.nanoTime() - start;
+		}
+		Arrays.sort(samples);
+		return samples[5000];
+	}
+
+	// ---- Benchmark runner ----
+
+	@FunctionalInterface
+	interface BenchFn
+	{
+		void run() throws Throwable;
+	}
+
+	// ---- Warmup (METAFFI_TEST_WARMUP_MODE=fixed|adaptive, see benchmark_warmup.py) ----
+
+	private static String parseWarmupMode()
+	{
+		String val = System.getenv("METAFFI_TEST_WARMUP_MODE");
+		String mode = val == null ? "" : val.trim().toLowerCase();
+		if (mode.isEmpty()) return "fixed";
+		if (!mode.equals("fixed") && !mode.equals("adaptive"))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_WARMUP_MODE must be fixed or adaptive, got '" + val + "'");
+		}
+		return mode;
+	}
+
+	private static double parseWarmupTolerance()
+	{
+		String val = System.getenv("METAFFI_TEST_WARMUP_TOLERANCE");
+		if (val == null || val.trim().isEmpty()) return 0.05;
+		double tol = Double.parseDouble(val.trim());
+		if (!(tol > 0 && tol < 1))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_WARMUP_TOLERANCE must be in (0, 1), got '" + val + "'");
+		}
+		return tol;
+	}
+
+	private static double medianInPlace(double[] values, int n)
+	{
+		Arrays.sort(values, 0, n);
+		return n % 2 == 1 ? values[n / 2] : (values[n / 2 - 1] + values[n / 2]) / 2.0;
+	}
+
+	/** True when the medians and MADs all lie within tolerance x the lowest median. */
+	private static boolean windowsAgree(List<Double> medians, List<Double> mads, double tolerance)
+	{
+		double bound = tolerance * Collections.min(medians);
+		return Collections.max(medians) - Collections.min(medians) <= bound
+			&& Collections.max(mads) - Collections.min(mads) <= bound;
+	}
+
+	private static void warmupCall(String scenario, int i, BenchFn fn)
+	{
+		try
+		{
+			fn.run();
+		}
+		catch (Throwable e)
+		{
+			throw new RuntimeException("Benchmark '" + scenario + "' warmup iteration " + i + ": " + e.getMessage(), e);
+		}
+	}
+
+	/**
+	 * Run the warmup of one scenario and return its "warmup" JSON object.
+	 * In adaptive mode, windows of WARMUP_WINDOW timed calls run until the last
+	 * WARMUP_STABLE_WINDOWS agree on median and MAD (JIT tiering has settled);
+	 * warmup is then the minimum and WARMUP_MAX_CALLS the cap. Array sizes above
+	 * LARGE_ARRAY_THRESHOLD keep the fixed warmup.
+	 */
+	private static String warmUp(String scenario, Integer dataSize, int warmup, BenchFn fn)
+	{
+		if (!WARMUP_MODE.equals("adaptive") || (dataSize != null && dataSize > LARGE_ARRAY_THRESHOLD))
+		{
+			for (int i = 0; i < warmup; i++)
+			{
+				warmupCall(scenario, i, fn);
+			}
+			return "{\"mode\": \"fixed\", \"calls\": " + warmup + ", \"windows\": null, \"converged\": null}";
+		}
+
+		int maxCalls = Math.max(WARMUP_MAX_CALLS, warmup);
+		List<Double> medians = new ArrayList<>();
+		List<Double> mads = new ArrayList<>();
+		double[] window = new double[WARMUP_WINDOW];
+		int calls = 0;
+		boolean converged = false;
+		while (calls < maxCalls && !converged)
+		{
+			int n = 0;
+			while (n < WARMUP_WINDOW && calls < maxCalls)
+			{
+				long start = System.nanoTime();
+				warmupCall(scenario, calls, fn);
+				window[n++] = System.nanoTime() - start;
+				calls++;
+			}
+			double median = medianInPlace(window, n);
+			for (int i = 0; i < n; i++)
+			{
+				window[i] = Math.abs(window[i] - median);
+			}
+			medians.add(median);
+			mads.add(medianInPlace(window, n));
+			int k = WARMUP_STABLE_WINDOWS;
+			converged = calls >= warmup && medians.size() >= k && windowsAgree(
+				medians.subList(medians.size() - k, medians.size()), mads.subList(mads.size() - k, mads.size()), WARMUP_TOLERANCE);
+		}
+		return "{\"mode\": \"adaptive\", \"calls\": " + calls + ", \"windows\": " + medians.size() +
+			", \"converged\": " + converged + "}";
+	}
+
+	// ---- Measured iterations (METAFFI_TEST_PRECISION_TARGET, see benchmark_precision.py) ----
+
+	private static double parsePrecisionTarget()
+	{
+		String val = System.getenv("METAFFI_TEST_PRECISION_TARGET");
+		if (val == null || val.trim().isEmpty()) return 0;
+		double target = Double.parseDouble(val.trim());
+		if (!(target >= 0 && target < 1))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_PRECISION_TARGET must be in [0, 1), got '" + val + "'");
+		}
+		return target;
+	}
+
+	/** Half-width of the order-statistic 95% CI of the median of the IQR-cleaned samples, relative to that median. */
+	private static double medianCiHalfWidth(long[] samples)
+	{
+		long[] sorted = samples.clone();
+		Arrays.sort(sorted);
+		long[] cleaned = removeOutliersIQR(sorted);
+		int n = cleaned.length;
+		if (n == 0) return 0;
+		double half = 1.96 * Math.sqrt(n) / 2;
+		int lo = (int) Math.max(Math.floor(n / 2.0 - half), 0);
+		int hi = (int) Math.min(Math.ceil(n / 2.0 + half), n - 1);
+		double median = n % 2 == 1 ? cleaned[n / 2] : (cleaned[n / 2 - 1] + cleaned[n / 2]) / 2.0;
+		if (median <= 0) return 0;
+		return (cleaned[hi] - cleaned[lo]) / (2 * median);
+	}
+
+	/**
+	 * Decides how many samples one scenario takes: nextBlock is called before every
+	 * block and returns its size, or 0 once measurement is done. With PRECISION_TARGET > 0,
+	 * blocks of PRECISION_BLOCK samples are taken until the median's 95% CI is within
+	 * +/- PRECISION_TARGET of the median or a cap is reached; otherwise (and for array
+	 * sizes above LARGE_ARRAY_THRESHOLD) exactly `iterations` samples are taken.
+	 */
+	private static final class PrecisionSampler
+	{
+		private final boolean adaptive;
+		private final int block;
+		private final int maxIterations;
+		private long deadline;
+		private int blocks;
+		private int iterations;
+		private double halfWidth;
+		private String stop;
+
+		PrecisionSampler(Integer dataSize, int iterations)
+		{
+			adaptive = PRECISION_TARGET > 0 && (dataSize == null || dataSize <= LARGE_ARRAY_THRESHOLD);
+			block = adaptive ? PRECISION_BLOCK : iterations;
+			maxIterations = adaptive ? PRECISION_MAX_ITERATIONS : iterations;
+		}
+
+		int nextBlock(long[] samples)
+		{
+			int n = samples.length;
+			if (n == 0)
+			{
+				deadline = System.nanoTime() + PRECISION_MAX_SECONDS * 1_000_000_000L;
+			}
+			else
+			{
+				blocks++;
+				halfWidth = medianCiHalfWidth(samples);
+				if (!adaptive) stop = "iterations";
+				else if (halfWidth <= PRECISION_TARGET) stop = "target";
+				else if (n >= maxIterations) stop = "max_iterations";
+				else if (System.nanoTime() - deadline >= 0) stop = "time_budget";
+				if (stop != null)
+				{
+					iterations = n;
+					return 0;
+				}
+			}
+			return Math.min(block, maxIterations - n);
+		}
+
+		String toJson()
+		{
+			String target = adaptive ? String.valueOf(PRECISION_TARGET) : "null";
+			String met = adaptive ? String.valueOf(halfWidth <= PRECISION_TARGET) : "null";
+			return "{\"mode\": \"" + (adaptive ? "target" : "fixed") + "\", \"target\": " + target +
+				", \"iterations\": " + iterations + ", \"blocks\": " + blocks + ", \"half_width_rel\": " + halfWidth +
+				", \"met\": " + met + ", \"stop\": \"" + stop + "\"}";
+		}
+	}
+
+	private static String runBenchmark(String scenario, Integer dataSize, int warmup, int iterations, BenchFn fn) throws Throwable
+	{
+		String label = scenario + (dataSize != null ? "[" + dataSize + "]" : "");
+		System.err.println("  Benchmark: " + label + " (" + warmup + " warmup + " + iterations + " iterations)...");
+		System.err.flush();
+
+		// Warmup phase
+		String warmupJson = warmUp(scenario, dataSize, warmup, fn);
+
+		// Measurement phase
+		PrecisionSampler sampler = new PrecisionSampler(dataSize, iterations);
+		long[] rawNs = new long[0];
+		int block;
+		while ((block = sampler.nextBlock(rawNs)) > 0)
+		{
+			int first = rawNs.length;
+			rawNs = Arrays.copyOf(rawNs, first + block);
+			for (int i = first; i < rawNs.length; i++)
+			{
+				long start = System.nanoTime();
+				fn.run();
+				rawNs[i] = System.nanoTime() - start;
+			}
+		}
+
+		// Sort for statistics
+		long[] sortedNs = rawNs.clone();
+		Arrays.sort(sortedNs);
+
+		// Remove outliers and compute stats
+		long[] cleaned = removeOutliersIQR(sortedNs);
+		double[] stats = computeStats(cleaned);
+
+		System.err.println("  Done: " + label + " (mean ~" + String.format("%.0f", stats[0]) + " ns)");
+
+		// Build JSON fragment
+		StringBuilder sb = new StringBuilder();
+		sb.append("    {\n");
+		sb.append("      \"scenario\": \"").append(scenario).append("\",\n");
+		sb.append("      \"data_size\": ").append(dataSize == null ? "null" : dataSize).append(",\n");
+		sb.append("      \"status\": \"PASS\",\n");
+
+		// Raw iterations (inline, or an .npy sidecar when METAFFI_TEST_RAW_FORMAT=npy)
+		if (RAW_SAMPLE_FORMAT.equals("npy"))
+		{
+			sb.append("      \"raw_iterations_ns\": null,\n");
+			sb.append("      \"raw_iterations_ns_file\": ").append(writeRawSidecar(scenario, dataSize, rawNs)).append(",\n");
+		}
+		else
+		{
+			sb.append("      \"raw_iterations_ns\": [");
+			for (int i = 0; i < rawNs.length; i++)
+			{
+				if (i > 0) sb.append(", ");
+				sb.append(rawNs[i]);
+			}
+			sb.append("],\n");
+		}
+
+		sb.append("      \"warmup\": ").append(warmupJson).append(",\n");
+		sb.append("      \"precision\": ").append(sampler.toJson()).append(",\n");
+
+		// Phases
+		sb.append("      \"phases\": {\n");
+		sb.append("        \"total\": {\n");
+		sb.append("          \"mean_ns\": ").append(stats[0]).append(",\n");
+		sb.append("          \"median_ns\": ").append(stats[1]).append(",\n");
+		sb.append("          \"p95_ns\": ").append(stats[2]).append(",\n");
+		sb.append("          \"p99_ns\": ").append(stats[3]).append(",\n");
+		sb.append("          \"stddev_ns\": ").append(stats[4]).append(",\n");
+		sb.append("          \"ci95_ns\": [").append(stats[5]).append(", ").append(stats[6]).append("]\n");
+		sb.append("        }\n");
+		sb.append("      }\n");
+		sb.append("    }");
+		return sb.toString();
+	}
+
+	// ---- Individual scenario benchmarks ----
+
+	private void benchVoidCall(Set<String> filter, List<String> jsons, long timerOverhead) throws Throwable
+	{
+		if (!shouldRunScenario(filter, "void_call", null)) return;
+
+		Caller noopFn = cppModule.load("callable=xcall_no_op", null, null);
+		assertNotNull("Failed to load xcall_no_op", noopFn);
+
+		jsons.add(runBenchmark("void_call", null, WARMUP, ITERATIONS,
+			() -> noopFn.call()));
+		writeResults(jsons, timerOverhead);
+		System.gc();
+	}
+
+	private void benchPrimitiveEcho(Set<String> filter, List<String> jsons, long timerOverhead) throws Throwable
+	{
+		if (!shouldRunScenario(filter, "primitive_echo", null)) return;
+
+		Caller divFn = cppModule.load("callable=xcall_div_integers",
+			new MetaFFITypeInfo[]{t(MetaFFITypes.MetaFFIInt64), t(MetaFFITypes.MetaFFIInt64)},
+			new MetaFFITypeInfo[]{t(MetaFFITypes.MetaFFIFloat64)});
+		assertNotNull("Failed to load xcall_div_integers", divFn);
+
+		jsons.add(runBenchmark("primitive_echo", null, WARMUP, ITERATIONS,
+			() -> {
+				Object[] result = divFn.call(10L, 2L);
+				if (Math.abs((Double) result[0] - 5.0) > 1e-10)
+				{
+					throw new RuntimeException("xcall_div_integers: got " + result[0] + ", want 5.0");
+				}
+			}));
+		writeResults(jsons, timerOverhead);
+		System.gc();
+	}
+
+	private void benchCounterIncrement(Set<String> filter, List<String> jsons, long timerOverhead) throws Throwable
+	{
+		if (!shouldRunScenario(filter, "counter_increment", null)) return;
+
+		Caller setFn = cppModule.load("callable=xcall_set_counter",
+			new MetaFFITypeInfo[]{t(MetaFFITypes.MetaFFIInt64)}, null);
+		Caller incFn = cppModule.load("callable=xcall_inc_counter",
+			new MetaFFITypeInfo[]{t(MetaFFITypes.MetaFFIInt64)},
+			new MetaFFITypeInfo[]{t(MetaFFITypes.MetaFFIInt64)});
+		assertNotNull("Failed to load xcall_set_counter", setFn);
+		assertNotNull("Failed to load xcall_inc_counter", incFn);
+
+		setFn.call(0L);
+		final long[] expected = {0};
+		jsons.add(runBenchmark("counter_increment", null, WARMUP, ITERATIONS,
+			() -> {
+				Object[] result = incFn.call(1L);
+				expected[0]++;
+				if (((Number) result[0]).longValue() != expected[0])
+				{
+					throw new RuntimeException("xcall_inc_counter: got " + result[0] + ", want " + expected[0]);
+				}
+			}));
+		setFn.call(0L);
+		writeResults(jsons, timerOverhead);
+		System.gc();
+	}
+
+	private void benchErrorPropagation(Set<String> filter, List<String> jsons, long timerOverhead) throws Throwable
+	{
+		if (!shouldRunScenario(filter, "error_propagation", null)) return;
+
+		Caller errFn = cppModule.load("callable=xcall_returns_an_error", null, null);
+		assertNotNull("Failed to load xcall_returns_an_error", errFn);
+
+		jsons.add(runBenchmark("error_propagation", null, WARMUP, ITERATIONS,
+			() -> {
+				try
+				{
+					errFn.call();
+					throw new RuntimeException("xcall_returns_an_error did not throw");
+				}
+				catch (RuntimeException re)
+				{
+					if (re.getMessage().equals("xcall_returns_an_error did not throw")) throw re;
+					// Expected: C++ exception -> Java exception
+				}
+				catch (Throwable t)
+				{
+					// Expected: C++ exception -> Java throwable
+				}
+			}));
+		writeResults(jsons, timerOverhead);
+		System.gc();
+	}
+
+	// ---- Main benchmark test ----
+
+	@Test
+	public void testAllBenchmarks() throws Throwable
+	{
+		String mode = System.getenv().getOrDefault("METAFFI_TEST_MODE", "");
+		if ("correctness".equals(mode))
+		{
+			System.err.println("Skipping benchmarks: METAFFI_TEST_MODE=correctness");
+			return;
+		}
+
+		long timerOverhead = measureTimerOverhead();
+		System.err.println("Timer overhead: " + timerOverhead + " ns");
+		Set<String> scenarioFilter = parseScenarioFilter();
+		if (scenarioFilter != null)
+		{
+			System.err.println("Scenario filter enabled: " + String.join(",", scenarioFilter));
+		}
+
+		List<String> benchmarkJsons = new ArrayList<>();
+
+		// Run each scenario (each method handles its own filter check)
+		benchVoidCall(scenarioFilter, benchmarkJsons, timerOverhead);
+		benchPrimitiveEcho(scenarioFilter, benchmarkJsons, timerOverhead);
+		benchCounterIncrement(scenarioFilter, benchmarkJsons, timerOverhead);
+		benchErrorPropagation(scenarioFilter, benchmarkJsons, timerOverhead);
+
+		if (benchmarkJsons.isEmpty())
+		{
+			fail("METAFFI_TEST_SCENARIOS selected no benchmark scenarios: " + System.getenv("METAFFI_TEST_SCENARIOS"));
+		}
+
+		// Final write (in case no scenario triggered an intermediate save)
+		writeResults(benchmarkJsons, timerOverhead);
+	}
+
+	private static String resolveResultPath()
+	{
+		String resultPath = System.getenv().getOrDefault("METAFFI_TEST_RESULTS_FILE", "");
+		if (resultPath.isEmpty())
+		{
+			String sourceRoot = System.getenv("METAFFI_SOURCE_ROOT");
+			resultPath = sourceRoot + "/tests/results/java_to_cpp_metaffi.json";
+		}
+		return resultPath;
+	}
+
+	private void writeResults(List<String> benchmarkJsons, long timerOverhead)
+	{
+		String resultPath = resolveResultPath();
+
+		// Build full JSON
+		StringBuilder sb = new StringBuilder();
+		sb.append("{\n");
+		sb.append("  \"metadata\": {\n");
+		sb.append("    \"host\": \"java\",\n");
+		sb.append("    \"guest\": \"cpp\",\n");
+		sb.append("    \"mechanism\": \"metaffi\",\n");
+		sb.append("    \"timestamp\": \"").append(java.time.Instant.now().toString()).append("\",\n");
+		sb.append("    \"environment\": {\n");
+		sb.append("      \"os\": \"").append(System.getProperty("os.name").toLowerCase()).append("\",\n");
+		sb.append("      \"arch\": \"").append(System.getProperty("os.arch")).append("\",\n");
+		sb.append("      \"java_version\": \"").append(System.getProperty("java.version")).append("\"\n");
+		sb.append("    },\n");
+		sb.append("    \"config\": {\n");
+		sb.append("      \"warmup_iterations\": ").append(WARMUP).append(",\n");
+		sb.append("      \"warmup_mode\": \"").append(WARMUP_MODE).append("\",\n");
+		sb.append("      \"warmup_window_calls\": ").append(WARMUP_WINDOW).append(",\n");
+		sb.append("      \"warmup_stable_windows\": ").append(WARMUP_STABLE_WINDOWS).append(",\n");
+		sb.append("      \"warmup_tolerance\": ").append(WARMUP_TOLERANCE).append(",\n");
+		sb.append("      \"warmup_max_calls\": ").append(WARMUP_MAX_CALLS).append(",\n");
+		sb.append("      \"precision_target\": ").append(PRECISION_TARGET).append(",\n");
+		sb.append("      \"precision_block_iterations\": ").append(PRECISION_BLOCK).append(",\n");
+		sb.append("      \"precision_max_iterations\": ").append(PRECISION_MAX_ITERATIONS).append(",\n");
+		sb.append("      \"precision_max_seconds\": ").append(PRECISION_MAX_SECONDS).append(",\n");
+		sb.append("      \"measured_iterations\": ").append(ITERATIONS).append(",\n");
+		sb.append("      \"raw_sample_format\": \"").append(RAW_SAMPLE_FORMAT).append("\",\n");
+		sb.append("      \"timer_overhead_ns\": ").append(timerOverhead).append("\n");
+		sb.append("    }\n");
+		sb.append("  },\n");
+		sb.append("  \"initialization\": {\n");
+		sb.append("    \"load_runtime_plugin_ns\": ").append(loadRuntimePluginNs).append(",\n");
+		sb.append("    \"load_module_ns\": ").append(loadModuleNs).append("\n");
+		sb.append("  },\n");
+		sb.append("  \"correctness\": null,\n");
+		sb.append("  \"benchmarks\": [\n");
+
+		for (int i = 0; i < benchmarkJsons.size(); i++)
+		{
+			if (i > 0) sb.append(",\n");
+			sb.append(benchmarkJsons.get(i));
+		}
+
+		sb.append("\n  ]\n");
+		sb.append("}\n");
+
+		// Write to file
+		try
+		{
+			File file = new File(resultPath);
+			file.getParentFile().mkdirs();
+			try (PrintWriter pw = new PrintWriter(new FileWriter(file)))
+			{
+				pw.print(sb.toString());
+			}
+			System.err.println("Results written to " + resultPath);
+		}
+		catch (Exception e)
+		{
+			System.err.println("Failed to write results: " + e.getMessage());
+			fail("Failed to write benchmark results: " + e.getMessage());
+		}
+	}
+}
@@ -10,10 +10,18 @@ import org.junit.Test;
 
 import java.io.File;
 import java.io.FileWriter;
+import java.io.IOException;
 import java.io.PrintWriter;
 import java.lang.reflect.Method;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Collections;
 import java.util.HashSet;
 import java.util.List;
 import java.util.Set;
@@ -35,7 +43,19 @@ public class TestBenchmark
 
 	// Configuration from environment
 	private static int WARMUP;
+	private static String WARMUP_MODE;
+	private static int WARMUP_WINDOW;
+	private static int WARMUP_STABLE_WINDOWS;
+	private static double WARMUP_TOLERANCE;
+	private static int WARMUP_MAX_CALLS;
+	private static double PRECISION_TARGET;
+	private static int PRECISION_BLOCK;
+	private static int PRECISION_MAX_ITERATIONS;
+	private static int PRECISION_MAX_SECONDS;
 	private static int ITERATIONS;
+	private static int[] ARRAY_SIZES;
+	private static final int LARGE_ARRAY_THRESHOLD = 10000;
+	private static String RAW_SAMPLE_FORMAT;
 
 	@BeforeClass
 	public static void setUp()
@@ -47,7 +67,18 @@ public class TestBenchmark
 		assertNotNull("METAFFI_SOURCE_ROOT must be set", sourceRoot);
 
 		WARMUP = parseIntEnv("METAFFI_TEST_WARMUP", 100);
+		WARMUP_MODE = parseWarmupMode();
+		WARMUP_WINDOW = parseIntEnv("METAFFI_TEST_WARMUP_WINDOW", 100);
+		WARMUP_STABLE_WINDOWS = parseIntEnv("METAFFI_TEST_WARMUP_STABLE_WINDOWS", 3);
+		WARMUP_TOLERANCE = parseWarmupTolerance();
+		WARMUP_MAX_CALLS = parseIntEnv("METAFFI_TEST_WARMUP_MAX_CALLS", 20000);
+		PRECISION_TARGET = parsePrecisionTarget();
+		PRECISION_BLOCK = parseIntEnv("METAFFI_TEST_PRECISION_BLOCK", 1000);
+		PRECISION_MAX_ITERATIONS = parseIntEnv("METAFFI_TEST_PRECISION_MAX_ITERATIONS", 100000);
+		PRECISION_MAX_SECONDS = parseIntEnv("METAFFI_TEST_PRECISION_MAX_SECONDS", 60);
 		ITERATIONS = parseIntEnv("METAFFI_TEST_ITERATIONS", 10000);
+		ARRAY_SIZES = parseArraySizes();
+		RAW_SAMPLE_FORMAT = parseRawSampleFormat();
 
 		runtime = new MetaFFIRuntime("go");
 
@@ -103,6 +134,43 @@ public class TestBenchmark
 		return Integer.parseInt(val);
 	}
 
+	private static int[] parseArraySizes()
+	{
+		String raw = System.getenv("METAFFI_TEST_ARRAY_SIZES");
+		if (raw == null || raw.trim().isEmpty())
+		{
+			return new int[]{10, 100, 1000, 10000};
+		}
+
+		List<Integer> sizes = new ArrayList<>();
+		for (String part : raw.split(","))
+		{
+			String k = part.trim();
+			if (k.isEmpty()) continue;
+			int n = Integer.parseInt(k);
+			if (n < 1)
+			{
+				throw new IllegalArgumentException("METAFFI_TEST_ARRAY_SIZES: invalid size " + k);
+			}
+			sizes.add(n);
+		}
+		return sizes.stream().mapToInt(Integer::intValue).toArray();
+	}
+
+	// Sizes above LARGE_ARRAY_THRESHOLD use METAFFI_TEST_LARGE_ARRAY_ITERATIONS
+	// (which also caps their warmup).
+	private static int arrayIterations(int size)
+	{
+		if (size <= LARGE_ARRAY_THRESHOLD) return ITERATIONS;
+		return parseIntEnv("METAFFI_TEST_LARGE_ARRAY_ITERATIONS", ITERATIONS);
+	}
+
+	private static int arrayWarmup(int size)
+	{
+		if (size <= LARGE_ARRAY_THRESHOLD) return WARMUP;
+		return Math.min(WARMUP, arrayIterations(size));
+	}
+
 	private static Set<String> parseScenarioFilter()
 	{
 		String raw = System.getenv("METAFFI_TEST_SCENARIOS");
@@ -133,6 +201,69 @@ public class TestBenchmark
 		return filter == null || filter.contains(scenarioKey(scenario, dataSize));
 	}
 
+	// -----------------------------------------------------------------------
+	// Raw sample sidecars (METAFFI_TEST_RAW_FORMAT=npy, see benchmark_samples.py)
+	// -----------------------------------------------------------------------
+
+	private static String parseRawSampleFormat()
+	{
+		String val = System.getenv("METAFFI_TEST_RAW_FORMAT");
+		String format = val == null ? "" : val.trim().toLowerCase();
+		if (format.isEmpty()) return "json";
+		if (!format.equals("json") && !format.equals("npy"))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_RAW_FORMAT must be json or npy, got '" + val + "'");
+		}
+		return format;
+	}
+
+	/**
+	 * Write samples to {@code <result stem>.raw/<scenario key>.raw_iterations_ns.npy}
+	 * (1-D little-endian int64) and return the JSON reference object.
+	 */
+	private static String writeRawSidecar(String scenario, Integer dataSize, long[] rawNs) throws IOException
+	{
+		File resultFile = new File(resolveResultPath()).getAbsoluteFile();
+		String name = resultFile.getName();
+		String stem = name.lastIndexOf('.') > 0 ? name.substring(0, name.lastIndexOf('.')) : name;
+		String relPath = stem + ".raw/" + scenarioKey(scenario, dataSize) + ".raw_iterations_ns.npy";
+
+		String header = "{'descr': '<i8', 'fortran_order': False, 'shape': (" + rawNs.length + ",), }";
+		// Pad so that the data starts on a 64-byte boundary (NPY format 1.0).
+		int total = 6 + 2 + 2 + header.length() + 1;
+		header += " ".repeat((64 - total % 64) % 64) + "\n";
+
+		ByteBuffer buf = ByteBuffer.allocate(10 + header.length() + 8 * rawNs.length).order(ByteOrder.LITTLE_ENDIAN);
+		buf.put((byte) 0x93).put("NUMPY".getBytes(StandardCharsets.US_ASCII)).put((byte) 1).put((byte) 0);
+		buf.putShort((short) header.length());
+		buf.put(header.getBytes(StandardCharsets.US_ASCII));
+		for (long v : rawNs)
+		{
+			buf.putLong(v);
+		}
+		byte[] data = buf.array();
+
+		File sidecar = new File(resultFile.getParentFile(), relPath);
+		sidecar.getParentFile().mkdirs();
+		Files.write(sidecar.toPath(), data);
+
+		StringBuilder sha256 = new StringBuilder();
+		try
+		{
+			for (byte b : MessageDigest.getInstance("SHA-256").digest(data))
+			{
+				sha256.append(String.format("%02x", b));
+			}
+		}
+		catch (NoSuchAlgorithmException e)
+		{
+			throw new IOException("SHA-256 not available", e);
+		}
+
+		return "{\"path\": \"" + relPath + "\", \"length\": " + rawNs.length +
+			", \"dtype\": \"<i8\", \"sha256\": \"" + sha256 + "\"}";
+	}
+
 	// ---- Helper types and methods ----
 
 	private static MetaFFITypeInfo t(MetaFFITypes type)
@@ -228,32 +359,219 @@ public class TestBenchmark
 		void run() throws Throwable;
 	}
 
-	private static String runBenchmark(String scenario, Integer dataSize, int warmup, int iterations, BenchFn fn) throws Throwable
+	// ---- Warmup (METAFFI_TEST_WARMUP_MODE=fixed|adaptive, see benchmark_warmup.py) ----
+
+	private static String parseWarmupMode()
 	{
-		String label = scenario + (dataSize != null ? "[" + dataSize + "]" : "");
-		System.err.println("  Benchmark: " + label + " (" + warmup + " warmup + " + iterations + " iterations)...");
-		System.err.flush();
+		String val = System.getenv("METAFFI_TEST_WARMUP_MODE");
+		String mode = val == null ? "" : val.trim().toLowerCase();
+		if (mode.isEmpty()) return "fixed";
+		if (!mode.equals("fixed") && !mode.equals("adaptive"))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_WARMUP_MODE must be fixed or adaptive, got '" + val + "'");
+		}
+		return mode;
+	}
 
-		// Warmup phase
-		for (int i = 0; i < warmup; i++)
+	private static double parseWarmupTolerance()
+	{
+		String val = System.getenv("METAFFI_TEST_WARMUP_TOLERANCE");
+		if (val == null || val.trim().isEmpty()) return 0.05;
+		double tol = Double.parseDouble(val.trim());
+		if (!(tol > 0 && tol < 1))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_WARMUP_TOLERANCE must be in (0, 1), got '" + val + "'");
+		}
+		return tol;
+	}
+
+	private static double medianInPlace(double[] values, int n)
+	{
+		Arrays.sort(values, 0, n);
+		return n % 2 == 1 ? values[n / 2] : (values[n / 2 - 1] + values[n / 2]) / 2.0;
+	}
+
+	/** True when the medians and MADs all lie within tolerance x the lowest median. */
+	private static boolean windowsAgree(List<Double> medians, List<Double> mads, double tolerance)
+	{
+		double bound = tolerance * Collections.min(medians);
+		return Collections.max(medians) - Collections.min(medians) <= bound
+			&& Collections.max(mads) - Collections.min(mads) <= bound;
+	}
+
+	private static void warmupCall(String scenario, int i, BenchFn fn)
+	{
+		try
+		{
+			fn.run();
+		}
+		catch (Throwable e)
+		{
+			throw new RuntimeException("Benchmark '" + scenario + "' warmup iteration " + i + ": " + e.getMessage(), e);
+		}
+	}
+
+	/**
+	 * Run the warmup of one scenario and return its "warmup" JSON object.
+	 * In adaptive mode, windows of WARMUP_WINDOW timed calls run until the last
+	 * WARMUP_STABLE_WINDOWS agree on median and MAD (JIT tiering has settled);
+	 * warmup is then the minimum and WARMUP_MAX_CALLS the cap. Array sizes above
+	 * LARGE_ARRAY_THRESHOLD keep the fixed warmup.
+	 */
+	private static String warmUp(String scenario, Integer dataSize, int warmup, BenchFn fn)
+	{
+		if (!WARMUP_MODE.equals("adaptive") || (dataSize != null && dataSize > LARGE_ARRAY_THRESHOLD))
 		{
-			try
+			for (int i = 0; i < warmup; i++)
 			{
-				fn.run();
+				warmupCall(scenario, i, fn);
+			}
+			return "{\"mode\": \"fixed\", \"calls\": " + warmup + ", \"windows\": null, \"converged\": null}";
+		}
+
+		int maxCalls = Math.max(WARMUP_MAX_CALLS, warmup);
+		List<Double> medians = new ArrayList<>();
+		List<Double> mads = new ArrayList<>();
+		double[] window = new double[WARMUP_WINDOW];
+		int calls = 0;
+		boolean converged = false;
+		while (calls < maxCalls && !converged)
+		{
+			int n = 0;
+			while (n < WARMUP_WINDOW && calls < maxCalls)
+			{
+				long start = System.nanoTime();
+				warmupCall(scenario, calls, fn);
+				window[n++] = System.nanoTime() - start;
+				calls++;
+			}
+			double median = medianInPlace(window, n);
+			for (int i = 0; i < n; i++)
+			{
+				window[i] = Math.abs(window[i] - median);
+			}
+			medians.add(median);
+			mads.add(medianInPlace(window, n));
+			int k = WARMUP_STABLE_WINDOWS;
+			converged = calls >= warmup && medians.size() >= k && windowsAgree(
+				medians.subList(medians.size() - k, medians.size()), mads.subList(mads.size() - k, mads.size()), WARMUP_TOLERANCE);
+		}
+		return "{\"mode\": \"adaptive\", \"calls\": " + calls + ", \"windows\": " + medians.size() +
+			", \"converged\": " + converged + "}";
+	}
+
+	// ---- Measured iterations (METAFFI_TEST_PRECISION_TARGET, see benchmark_precision.py) ----
+
+	private static double parsePrecisionTarget()
+	{
+		String val = System.getenv("METAFFI_TEST_PRECISION_TARGET");
+		if (val == null || val.trim().isEmpty()) return 0;
+		double target = Double.parseDouble(val.trim());
+		if (!(target >= 0 && target < 1))
+		{
+			throw new IllegalArgumentException("METAFFI_TEST_PRECISION_TARGET must be in [0, 1), got '" + val + "'");
+		}
+		return target;
+	}
+
+	/** Half-width of the order-statistic 95% CI of the median of the IQR-cleaned samples, relative to that median. */
+	private static double medianCiHalfWidth(long[] samples)
+	{
+		long[] sorted = samples.clone();
+		Arrays.sort(sorted);
+		long[] cleaned = removeOutliersIQR(sorted);
+		int n = cleaned.length;
+		if (n == 0) return 0;
+		double half = 1.96 * Math.sqrt(n) / 2;
+		int lo = (int) Math.max(Math.floor(n / 2.0 - half), 0);
+		int hi = (int) Math.min(Math.ceil(n / 2.0 + half), n - 1);
+		double median = n % 2 == 1 ? cleaned[n / 2] : (cleaned[n / 2 - 1] + cleaned[n / 2]) / 2.0;
+		if (median <= 0) return 0;
+		return (cleaned[hi] - cleaned[lo]) / (2 * median);
+	}
+
+	/**
+	 * Decides how many samples one scenario takes: nextBlock is called before every
+	 * block and returns its size, or 0 once measurement is done. With PRECISION_TARGET > 0,
+	 * blocks of PRECISION_BLOCK samples are taken until the median's 95% CI is within
+	 * +/- PRECISION_TARGET of the median or a cap is reached; otherwise (and for array
+	 * sizes above LARGE_ARRAY_THRESHOLD) exactly `iterations` samples are taken.
+	 */
+	private static final class PrecisionSampler
+	{
+		private final boolean adaptive;
+		private final int block;
+		private final int maxIterations;
+		private long deadline;
+		private int blocks;
+		private int iterations;
+		private double halfWidth;
+		private String stop;
+
+		PrecisionSampler(Integer dataSize, int iterations)
+		{
+			adaptive = PRECISION_TARGET > 0 && (dataSize == null || dataSize <= LARGE_ARRAY_THRESHOLD);
+			block = adaptive ? PRECISION_BLOCK : iterations;
+			maxIterations = adaptive ? PRECISION_MAX_ITERATIONS : iterations;
+		}
+
+		int nextBlock(long[] samples)
+		{
+			int n = samples.length;
+			if (n == 0)
+			{
+				deadline = System.nanoTime() + PRECISION_MAX_SECONDS * 1_000_000_000L;
 			}
-			catch (Throwable e)
+			else
 			{
-				throw new RuntimeException("Benchmark '" + scenario + "' warmup iteration " + i + ": " + e.getMessage(), e);
+				blocks++;
+				halfWidth = medianCiHalfWidth(samples);
+				if (!adaptive) stop = "iterations";
+				else if (halfWidth <= PRECISION_TARGET) stop = "target";
+				else if (n >= maxIterations) stop = "max_iterations";
+				else if (System.nanoTime() - deadline >= 0) stop = "time_budget";
+				if (stop != null)
+				{
+					iterations = n;
+					return 0;
+				}
 			}
+			return Math.min(block, maxIterations - n);
 		}
 
+		String toJson()
+		{
+			String target = adaptive ? String.valueOf(PRECISION_TARGET) : "null";
+			String met = adaptive ? String.valueOf(halfWidth <= PRECISION_TARGET) : "null";
+			return "{\"mode\": \"" + (adaptive ? "target" : "fixed") + "\", \"target\": " + target +
+				", \"iterations\": " + iterations + ", \"blocks\": " + blocks + ", \"half_width_rel\": " + halfWidth +
+				", \"met\": " + met + ", \"stop\": \"" + stop + "\"}";
+		}
+	}
+
+	private static String runBenchmark(String scenario, Integer dataSize, int warmup, int iterations, BenchFn fn) throws Throwable
+	{
+		String label = scenario + (dataSize != null ? "[" + dataSize + "]" : "");
+		System.err.println("  Benchmark: " + label + " (" + warmup + " warmup + " + iterations + " iterations)...");
+		System.err.flush();
+
+		// Warmup phase
+		String warmupJson = warmUp(scenario, dataSize, warmup, fn);
+
 		// Measurement phase
-		long[] rawNs = new long[iterations];
-		for (int i = 0; i < iterations; i++)
+		PrecisionSampler sampler = new PrecisionSampler(dataSize, iterations);
+		long[] rawNs = new long[0];
+		int block;
+		while ((block = sampler.nextBlock(rawNs)) > 0)
 		{
-			long start = System.nanoTime();
-			fn.run();
-			rawNs[i] = System.nanoTime() - start;
+			int first = rawNs.length;
+			rawNs = Arrays.copyOf(rawNs, first + block);
+			for (int i = first; i < rawNs.length; i++)
+			{
+				long start = System.nanoTime();
+				fn.run();
+				rawNs[i] = System.nanoTime() - start;
+			}
 		}
 
 		// Sort for statistics
@@ -273,14 +591,25 @@ public class TestBenchmark
 		sb.append("      \"data_size\": ").append(dataSize == null ? "null" : dataSize).append(",\n");
 		sb.append("      \"status\": \"PASS\",\n");
 
-		// Raw iterations
-		sb.append("      \"raw_iterations_ns\": [");
-		for (int i = 0; i < rawNs.length; i++)
+		// Raw iterations (inline, or an .npy sidecar when METAFFI_TEST_RAW_FORMAT=npy)
+		if (RAW_SAMPLE_FORMAT.equals("npy"))
+		{
+			sb.append("      \"raw_iterations_ns\": null,\n");
+			sb.append("      \"raw_iterations_ns_file\": ").append(writeRawSidecar(scenario, dataSize, rawNs)).append(",\n");
+		}
+		else
 		{
-			if (i > 0) sb.append(", ");
-			sb.append(rawNs[i]);
+			sb.append("      \"raw_iterations_ns\": [");
+			for (int i = 0; i < rawNs.length; i++)
+			{
+				if (i > 0) sb.append(", ");
+				sb.append(rawNs[i]);
+			}
+			sb.append("],\n");
 		}
-		sb.append("],\n");
+
+		sb.append("      \"warmup\": ").append(warmupJson).append(",\n");
+		sb.append("      \"precision\": ").append(sampler.toJson()).append(",\n");
 
 		// Phases
 		sb.append("      \"phases\": {\n");
@@ -403,7 +732,7 @@ public class TestBenchmark
 	{
 		// Check if any array_echo size is requested
 		boolean anyRequested = false;
-		for (int s : new int[]{10, 100, 1000, 10000})
+		for (int s : ARRAY_SIZES)
 		{
 			if (shouldRunScenario(filter, "array_echo", s)) anyRequested = true;
 		}
@@ -414,7 +743,7 @@ public class TestBenchmark
 			new MetaFFITypeInfo[]{arr(MetaFFITypes.MetaFFIUInt8PackedArray, 1)});
 		assertNotNull("Failed to load EchoBytes", echoFn);
 
-		for (int size : new int[]{10, 100, 1000, 10000})
+		for (int size : ARRAY_SIZES)
 		{
 			if (!shouldRunScenario(filter, "array_echo", size)) continue;
 
@@ -423,7 +752,7 @@ public class TestBenchmark
 			final byte[] finalData = data;
 			final int finalSize = size;
 
-			jsons.add(runBenchmark("array_echo", size, WARMUP, ITERATIONS,
+			jsons.add(runBenchmark("array_echo", size, arrayWarmup(size), arrayIterations(size),
 				() -> {
 					Object[] result = echoFn.call((Object) finalData);
 					if (((byte[]) result[0]).length != finalSize)
@@ -604,7 +933,7 @@ public class TestBenchmark
 		writeResults(benchmarkJsons, timerOverhead);
 	}
 
-	private void writeResults(List<String> benchmarkJsons, long timerOverhead)
+	private static String resolveResultPath()
 	{
 		String resultPath = System.getenv().getOrDefault("METAFFI_TEST_RESULTS_FILE", "");
 		if (resultPath.isEmpty())
@@ -612,6 +941,12 @@ public class TestBenchmark
 			String sourceRoot = System.getenv("METAFFI_SOURCE_ROOT");
 			resultPath = sourceRoot + "/tests/results/java_to_go_metaffi.json";
 		}
+		return resultPath;
+	}
+
+	private void writeResults(List<String> benchmarkJsons, long timerOverhead)
+	{
+		String resultPath = resolveResultPath();
 
 		// Build full JSON
 		StringBuilder sb = new StringBuilder();
@@ -628,7 +963,18 @@ public class TestBenchmark
 		sb.append("    },\n");
 		sb.append("    \"config\": {\n");
 		sb.append("      \"warmup_iterations\": ").append(WARMUP).append(",\n");
+		sb.append("      \"warmup_mode\": \"").append(WARMUP_MODE).append("\",\n");
+		sb.append("      \"warmup_window_calls\": ").append(WARMUP_WINDOW).append(",\n");
+		sb.append("      \"warmup_stable_windows\": ").append(WARMUP_STABLE_WINDOWS).append(",\n");
+		sb.append("      \"warmup_tolerance\": ").append(WARMUP_TOLERANCE).append(",\n");
+		sb.append("      \"warmup_max_calls\": ").append(WARMUP_MAX_CALLS).append(",\n");
+		sb.append("      \"precision_target\": ").append(PRECISION_TARGET).append(",\n");
+		sb.append("      \"precision_block_iterations\": ").append(PRECISION_BLOCK).append(",\n");
+		sb.append("      \"precision_max_iterations\": ").append(PRECISION_MAX_ITERATIONS).append(",\n");
+		sb.append("      \"precision_max_seconds\": ").append(PRECISION_MAX_SECONDS).append(",\n");
 		sb.append("      \"measured_iterations\": ").append(ITERATIONS).append(",\n");
+		sb.append("      \"raw_sample_format\": \"").append(RAW_SAMPLE_FORMAT).append("\",\n");
+		sb.append("      \"array_sizes\": ").append(Arrays.toString(ARRAY_SIZES)).append(",\n");
 		sb.append("      \"timer_overhead_ns\": ").append(timerOverhead).append("\n");
 		sb.append("    }\n");
 		sb.append("  },\n");
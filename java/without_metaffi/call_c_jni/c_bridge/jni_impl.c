@@ -0,0 +1,108 @@
+/**
+ * JNI native method implementations for CBridge.java.
+ *
+ * The C guest module is loaded at runtime (LoadLibrary / dlopen) from the
+ * path passed to loadGuest(), and its exported functions are called through
+ * cached function pointers: the same binary the MetaFFI benchmark loads.
+ *
+ * Build: CMakeLists.txt in this directory (find_package(JNI)), e.g.
+ *   cmake -S . -B build && cmake --build build --config Release
+ */
+
+#include <jni.h>
+#include <stdint.h>
+#include <stdio.h>
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <dlfcn.h>
+#endif
+
+/* ---------------------------------------------------------------------------
+ * Guest function pointers (resolved by loadGuest)
+ * ---------------------------------------------------------------------------*/
+
+typedef void (*NoOpFunc)(void);
+typedef double (*DivIntegersFunc)(int64_t, int64_t);
+typedef void (*SetCounterFunc)(int64_t);
+typedef int64_t (*IncCounterFunc)(int64_t);
+
+static NoOpFunc g_no_op = NULL;
+static DivIntegersFunc g_div_integers = NULL;
+static SetCounterFunc g_set_counter = NULL;
+static IncCounterFunc g_inc_counter = NULL;
+
+#ifdef _WIN32
+static void* load_symbol(void* lib, const char* name)
+{
+    return (void*)GetProcAddress((HMODULE)lib, name);
+}
+#else
+static void* load_symbol(void* lib, const char* name)
+{
+    return dlsym(lib, name);
+}
+#endif
+
+JNIEXPORT jstring JNICALL Java_CBridge_loadGuest(JNIEnv* env, jclass cls, jstring path)
+{
+    char err[512];
+    const char* cpath = (*env)->GetStringUTFChars(env, path, NULL);
+
+#ifdef _WIN32
+    void* lib = (void*)LoadLibraryA(cpath);
+#else
+    void* lib = dlopen(cpath, RTLD_NOW);
+#endif
+    if (!lib)
+    {
+        snprintf(err, sizeof(err), "failed to load %s", cpath);
+        (*env)->ReleaseStringUTFChars(env, path, cpath);
+        return (*env)->NewStringUTF(env, err);
+    }
+    (*env)->ReleaseStringUTFChars(env, path, cpath);
+
+    g_no_op = (NoOpFunc)load_symbol(lib, "xcall_c_no_op");
+    g_div_integers = (DivIntegersFunc)load_symbol(lib, "xcall_c_div_integers");
+    g_set_counter = (SetCounterFunc)load_symbol(lib, "xcall_c_set_counter");
+    g_inc_counter = (IncCounterFunc)load_symbol(lib, "xcall_c_inc_counter");
+
+    if (!g_no_op || !g_div_integers || !g_set_counter || !g_inc_counter)
+    {
+        return (*env)->NewStringUTF(env, "missing xcall_c_* export in C guest module");
+    }
+    return NULL;
+}
+
+/* ---------------------------------------------------------------------------
+ * Scenario 1: void call
+ * ---------------------------------------------------------------------------*/
+
+JNIEXPORT void JNICALL Java_CBridge_noOp(JNIEnv* env, jclass cls)
+{
+    g_no_op();
+}
+
+/* ---------------------------------------------------------------------------
+ * Scenario 2: primitive echo
+ * ---------------------------------------------------------------------------*/
+
+JNIEXPORT jdouble JNICALL Java_CBridge_divIntegers(JNIEnv* env, jclass cls, jlong x, jlong y)
+{
+    return (jdouble)g_div_integers((int64_t)x, (int64_t)y);
+}
+
+/* ---------------------------------------------------------------------------
+ * Scenario 3: counter increment
+ * ---------------------------------------------------------------------------*/
+
+JNIEXPORT void JNICALL Java_CBridge_setCounter(JNIEnv* env, jclass cls, jlong value)
+{
+    g_set_counter((int64_t)value);
+}
+
+JNIEXPORT jlong JNICALL Java_CBridge_incCounter(JNIEnv* env, jclass cls, jlong delta)
+{
+    return (jlong)g_inc_counter((int64_t)delta);
+}
@@ -0,0 +1,26 @@
+/**
+ * JNI bridge to the C guest module.
+ *
+ * The native methods are implemented in c_bridge/jni_impl.c, which loads
+ * c_guest_module at runtime and calls its exported functions directly.
+ */
+public class CBridge
+{
+	static
+	{
+		System.loadLibrary("c_jni_bridge");
+	}
+
+	// Load the guest module (returns error message, null on success)
+	public static native String loadGuest(String path);
+
+	// Scenario 1: void call
+	public static native void noOp();
+
+	// Scenario 2: primitive echo
+	public static native double divIntegers(long x, long y);
+
+	// Scenario 3: counter increment
+	public static native void setCounter(long value);
+	public static native long incCounter(long delta);
+}
@@ -0,0 +1,78 @@
+"""
+Deferred import of the metaffi Python SDK for the Python3 -> C/C++/Go/Java MetaFFI tests.
+
+The conftests import the SDK through this module instead of doing a top-level
+`import metaffi`, so collecting a test module, or a session whose selected
+tests never reach a MetaFFI fixture, does not pay the SDK import:
+
+    metaffi    proxy for the metaffi package; the first attribute access imports it
+    T          proxy for metaffi.MetaFFITypes
+    ti(...)    metaffi.metaffi_type_info(...), resolved per call
+
+Test modules import these from their conftest; type infos are built inside the
+test bodies, after the runtime fixture has run. The runtime fixtures call
+load_metaffi() explicitly and record its cost (sdk_import_ns) next to the
+runtime and module load times.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable
+
+_metaffi: ModuleType | None = None
+_sdk_import_ns = 0
+
+
+def metaffi_source_root() -> str:
+    """METAFFI_SOURCE_ROOT; raises when the variable is unset."""
+    root = os.environ.get("METAFFI_SOURCE_ROOT")
+    if not root:
+        raise RuntimeError(
+            "METAFFI_SOURCE_ROOT environment variable not set. "
+            "Set it to the MetaFFI repository root (e.g., c:\\src\\github.com\\MetaFFI)"
+        )
+    return root
+
+
+def load_metaffi() -> ModuleType:
+    """Import the metaffi SDK on first use and return it."""
+    global _metaffi, _sdk_import_ns
+    if _metaffi is None:
+        path = os.path.join(metaffi_source_root(), "sdk", "api", "python3")
+        if path not in sys.path:
+            sys.path.insert(0, path)
+        start = time.perf_counter_ns()
+        _metaffi = importlib.import_module("metaffi")
+        _sdk_import_ns = time.perf_counter_ns() - start
+    return _metaffi
+
+
+def sdk_import_ns() -> int:
+    """Time the SDK import took in this process (0 if it has not been imported)."""
+    return _sdk_import_ns
+
+
+class _LazyAttributes:
+    """Forwards attribute access to the object returned by resolve()."""
+
+    def __init__(self, resolve: Callable[[], Any]):
+        object.__setattr__(self, "_resolve", resolve)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+
+metaffi = _LazyAttributes(load_metaffi)
+T = _LazyAttributes(lambda: load_metaffi().MetaFFITypes)
+
+
+def ti(*args: Any, **kwargs: Any) -> Any:
+    return load_metaffi().metaffi_type_info(*args, **kwargs)
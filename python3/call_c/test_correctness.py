@@ -5,10 +5,7 @@ Fail-fast: every assertion is exact (or epsilon-justified for floats).
 """
 
 import pytest
-import metaffi
-
-T = metaffi.MetaFFITypes
-ti = metaffi.metaffi_type_info
+from conftest import T, metaffi, ti
 
 
 # ============================================================================
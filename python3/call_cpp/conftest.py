@@ -8,20 +8,15 @@ import os
 import sys
 import time
 
-# --- Ensure metaffi SDK is on the Python path ---
-METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
-if not METAFFI_SOURCE_ROOT:
-    raise RuntimeError(
-        "METAFFI_SOURCE_ROOT environment variable not set. "
-        "Set it to the MetaFFI repository root (e.g., c:\\src\\github.com\\MetaFFI)"
-    )
-
-_sdk_python_path = os.path.join(METAFFI_SOURCE_ROOT, "sdk", "api", "python3")
-if _sdk_python_path not in sys.path:
-    sys.path.insert(0, _sdk_python_path)
+# Shared helpers (lazy_metaffi.py) live at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
 
 import pytest
-import metaffi
+
+# The SDK is imported by the cpp_runtime fixture, not at collection time
+from lazy_metaffi import T, load_metaffi, metaffi, metaffi_source_root, sdk_import_ns, ti
 
 
 def _guest_module_filename() -> str:
@@ -32,18 +27,19 @@ def _guest_module_filename() -> str:
     return "cpp_guest_module.so"
 
 
-# C++ guest module path
-CPP_GUEST_MODULE_PATH = os.path.join(
-    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "cpp",
-    "test_bin", _guest_module_filename()
-)
-
-if not os.path.isfile(CPP_GUEST_MODULE_PATH):
-    raise RuntimeError(
-        f"C++ guest module library not found: {CPP_GUEST_MODULE_PATH}\n"
-        "Build it first: cmake --build ... --target cpp_guest_module"
+def cpp_guest_module_path() -> str:
+    """C++ guest module library; raises if missing."""
+    path = os.path.join(
+        metaffi_source_root(), "sdk", "test_modules", "guest_modules", "cpp",
+        "test_bin", _guest_module_filename()
     )
-print(f"+++ call_cpp fixture: resolved CPP_GUEST_MODULE_PATH={CPP_GUEST_MODULE_PATH}", file=sys.stderr, flush=True)
+    if not os.path.isfile(path):
+        raise RuntimeError(
+            f"C++ guest module library not found: {path}\n"
+            "Build it first: cmake --build ... --target cpp_guest_module"
+        )
+    print(f"+++ call_cpp fixture: resolved CPP_GUEST_MODULE_PATH={path}", file=sys.stderr, flush=True)
+    return path
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +47,7 @@ print(f"+++ call_cpp fixture: resolved CPP_GUEST_MODULE_PATH={CPP_GUEST_MODULE_P
 # ---------------------------------------------------------------------------
 
 init_timing = {
+    "sdk_import_ns": 0,
     "load_runtime_plugin_ns": 0,
     "load_module_ns": 0,
 }
@@ -63,6 +60,8 @@ init_timing = {
 @pytest.fixture(scope="session")
 def cpp_runtime():
     """Initialize the MetaFFI C++ runtime plugin. Released at session end."""
+    load_metaffi()
+    init_timing["sdk_import_ns"] = sdk_import_ns()
     print("+++ call_cpp fixture: cpp_runtime create start", file=sys.stderr, flush=True)
     rt = metaffi.MetaFFIRuntime("cpp")
 
@@ -77,8 +76,9 @@ def cpp_runtime():
 @pytest.fixture(scope="session")
 def cpp_module(cpp_runtime):
     """Load the C++ guest module via MetaFFI."""
+    path = cpp_guest_module_path()
     start = time.perf_counter_ns()
-    mod = cpp_runtime.load_module(CPP_GUEST_MODULE_PATH)
+    mod = cpp_runtime.load_module(path)
     init_timing["load_module_ns"] = time.perf_counter_ns() - start
 
     yield mod
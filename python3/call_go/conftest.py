@@ -9,20 +9,15 @@ import os
 import sys
 import time
 
-# --- Ensure metaffi SDK is on the Python path ---
-METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
-if not METAFFI_SOURCE_ROOT:
-    raise RuntimeError(
-        "METAFFI_SOURCE_ROOT environment variable not set. "
-        "Set it to the MetaFFI repository root (e.g., c:\\src\\github.com\\MetaFFI)"
-    )
-
-_sdk_python_path = os.path.join(METAFFI_SOURCE_ROOT, "sdk", "api", "python3")
-if _sdk_python_path not in sys.path:
-    sys.path.insert(0, _sdk_python_path)
+# Shared helpers (lazy_metaffi.py) live at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
 
 import pytest
-import metaffi
+
+# The SDK is imported by the go_runtime fixture, not at collection time
+from lazy_metaffi import T, load_metaffi, metaffi, metaffi_source_root, sdk_import_ns, ti
 
 
 def _atexit_probe():
@@ -39,18 +34,19 @@ def _guest_module_filename() -> str:
     return "guest_MetaFFIGuest.so"
 
 
-# Go runtime plugin requires the compiled guest shared library path
-GO_GUEST_MODULE_PATH = os.path.join(
-    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "go",
-    "test_bin", _guest_module_filename()
-)
-
-if not os.path.isfile(GO_GUEST_MODULE_PATH):
-    raise RuntimeError(
-        f"Go guest module library not found: {GO_GUEST_MODULE_PATH}\n"
-        "Build it first: cmake --build ... (see sdk/test_modules/guest_modules/go/CMakeLists.txt)"
+def go_guest_module_path() -> str:
+    """Compiled Go guest shared library (required by the Go runtime plugin); raises if missing."""
+    path = os.path.join(
+        metaffi_source_root(), "sdk", "test_modules", "guest_modules", "go",
+        "test_bin", _guest_module_filename()
     )
-print(f"+++ call_go fixture: resolved GO_GUEST_MODULE_PATH={GO_GUEST_MODULE_PATH}", file=sys.stderr, flush=True)
+    if not os.path.isfile(path):
+        raise RuntimeError(
+            f"Go guest module library not found: {path}\n"
+            "Build it first: cmake --build ... (see sdk/test_modules/guest_modules/go/CMakeLists.txt)"
+        )
+    print(f"+++ call_go fixture: resolved GO_GUEST_MODULE_PATH={path}", file=sys.stderr, flush=True)
+    return path
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +54,7 @@ print(f"+++ call_go fixture: resolved GO_GUEST_MODULE_PATH={GO_GUEST_MODULE_PATH
 # ---------------------------------------------------------------------------
 
 init_timing = {
+    "sdk_import_ns": 0,
     "load_runtime_plugin_ns": 0,
     "load_module_ns": 0,
 }
@@ -70,6 +67,8 @@ init_timing = {
 @pytest.fixture(scope="session")
 def go_runtime():
     """Initialize the MetaFFI Go runtime plugin. Released at session end."""
+    load_metaffi()
+    init_timing["sdk_import_ns"] = sdk_import_ns()
     print("+++ call_go fixture: go_runtime create start", file=sys.stderr, flush=True)
     rt = metaffi.MetaFFIRuntime("go")
 
@@ -88,9 +87,10 @@ def go_runtime():
 @pytest.fixture(scope="session")
 def go_module(go_runtime):
     """Load the Go guest module via MetaFFI."""
+    path = go_guest_module_path()
     start = time.perf_counter_ns()
-    print(f"+++ call_go fixture: load_module begin path={GO_GUEST_MODULE_PATH}", file=sys.stderr, flush=True)
-    mod = go_runtime.load_module(GO_GUEST_MODULE_PATH)
+    print(f"+++ call_go fixture: load_module begin path={path}", file=sys.stderr, flush=True)
+    mod = go_runtime.load_module(path)
     print("+++ call_go fixture: load_module done", file=sys.stderr, flush=True)
     init_timing["load_module_ns"] = time.perf_counter_ns() - start
 
@@ -0,0 +1,84 @@
+"""Scaling-mode setup for the Python3 -> Go MetaFFI benchmarks.
+
+scaling_factories() builds the per-worker callables for thread scaling in the
+benchmark process. process_setup() is the entry point of every process-scaling
+worker (benchmark_scaling.run_process_scaling_suite): it is imported in a fresh
+interpreter, so it must not depend on pytest fixtures.
+"""
+
+import time
+
+from conftest import T, go_guest_module_path, metaffi, ti
+
+
+def scaling_factories(go_module) -> dict:
+    """Per-thread callables for the scaling scenarios.
+
+    The loaded entities and the MetaFFI callback are shared by all threads:
+    concurrent use of one load_entity() callable is what is being measured.
+    """
+    noop_fn = go_module.load_entity("callable=NoOp", None, None)
+    div_fn = go_module.load_entity("callable=DivIntegers",
+        [ti(T.metaffi_int64_type), ti(T.metaffi_int64_type)],
+        [ti(T.metaffi_float64_type)])
+    echo_fn = go_module.load_entity("callable=EchoBytes",
+        [ti(T.metaffi_uint8_packed_array_type, dims=1)],
+        [ti(T.metaffi_uint8_packed_array_type, dims=1)])
+    call_cb = go_module.load_entity("callable=CallCallbackAdd",
+        [ti(T.metaffi_callable_type)],
+        [ti(T.metaffi_int64_type)])
+    metaffi_adder = metaffi.make_metaffi_callable(lambda a, b: a + b)
+    echo_data = bytes(i % 256 for i in range(1000))
+
+    def make_void():
+        return noop_fn
+
+    def make_primitive():
+        def call():
+            result = div_fn(10, 2)
+            if abs(result - 5.0) > 1e-10:
+                raise RuntimeError(f"DivIntegers(10,2) = {result}, want 5.0")
+        return call
+
+    def make_array():
+        def call():
+            result = echo_fn(echo_data)
+            if len(result) != 1000:
+                raise RuntimeError(f"EchoBytes(1000): got len {len(result)}, want 1000")
+        return call
+
+    def make_callback():
+        def call():
+            result = call_cb(metaffi_adder)
+            if result != 3:
+                raise RuntimeError(f"CallCallbackAdd: got {result}, want 3")
+        return call
+
+    return {
+        ("void_call", None): make_void,
+        ("primitive_echo", None): make_primitive,
+        ("array_echo", 1000): make_array,
+        ("callback", None): make_callback,
+    }
+
+
+def process_setup():
+    """Load the Go runtime plugin and guest module in this worker process.
+
+    Returns (init timings, scaling factories). The runtime is never released:
+    the worker process exits through os._exit once its samples are collected.
+    """
+    rt = metaffi.MetaFFIRuntime("go")
+    start = time.perf_counter_ns()
+    rt.load_runtime_plugin()
+    load_runtime_plugin_ns = time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    go_module = rt.load_module(go_guest_module_path())
+    load_module_ns = time.perf_counter_ns() - start
+
+    init = {
+        "load_runtime_plugin_ns": load_runtime_plugin_ns,
+        "load_module_ns": load_module_ns,
+    }
+    return init, scaling_factories(go_module)
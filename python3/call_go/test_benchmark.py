@@ -5,25 +5,55 @@ Outputs results to tests/results/python3_to_go_metaffi.json.
 """
 
 import json
-import math
 import os
 import platform
 import sys
 import time
 
 import pytest
-import metaffi
-from conftest import init_timing
-
-T = metaffi.MetaFFITypes
-ti = metaffi.metaffi_type_info
+from conftest import T, init_timing, metaffi, ti
+from scaling_setup import process_setup, scaling_factories
+
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_inputs import (
+    array_iterations, array_payload, array_sizes_from_env, container_scenario,
+    containers_from_env, element_size, make_array_input, supports_size,
+)
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_phases import phase_probe_calls_from_env, phase_stats, probe_phases
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_scaling import (
+    duration_ns_from_env, process_counts_from_env, run_process_scaling_suite,
+    run_thread_scaling_suite, thread_counts_from_env,
+)
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
 
 # ---------------------------------------------------------------------------
 # Configuration (from env or defaults)
 # ---------------------------------------------------------------------------
 
 WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
 ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+PHASE_PROBE_CALLS = phase_probe_calls_from_env()
+ARRAY_CONTAINERS = containers_from_env()
+ARRAY_SIZES = array_sizes_from_env()
+SCALING_THREADS = thread_counts_from_env()
+SCALING_PROCESSES = process_counts_from_env()
+SCALING_DURATION_NS = duration_ns_from_env()
 
 
 def _parse_scenario_filter() -> set[str] | None:
@@ -45,63 +75,9 @@ def _should_run(filter_set: set[str] | None, name: str, data_size: int | None) -
 
 
 # ---------------------------------------------------------------------------
-# Statistical helpers (matching Go implementation)
+# Timer calibration
 # ---------------------------------------------------------------------------
 
-def compute_stats(sorted_ns: list[int]) -> dict:
-    """Compute summary statistics from a sorted list of nanosecond timings."""
-    n = len(sorted_ns)
-    if n == 0:
-        return {"mean_ns": 0, "median_ns": 0, "p95_ns": 0, "p99_ns": 0,
-                "stddev_ns": 0, "ci95_ns": [0, 0]}
-
-    # Mean
-    total = sum(sorted_ns)
-    mean = total / n
-
-    # Median
-    if n % 2 == 1:
-        median = float(sorted_ns[n // 2])
-    else:
-        median = (sorted_ns[n // 2 - 1] + sorted_ns[n // 2]) / 2.0
-
-    # Percentiles
-    p95 = float(sorted_ns[int(n * 0.95)])
-    p99 = float(sorted_ns[min(int(n * 0.99), n - 1)])
-
-    # Standard deviation
-    sq_diff_sum = sum((v - mean) ** 2 for v in sorted_ns)
-    stddev = math.sqrt(sq_diff_sum / n)
-
-    # 95% confidence interval
-    se = stddev / math.sqrt(n)
-    ci95 = [mean - 1.96 * se, mean + 1.96 * se]
-
-    return {
-        "mean_ns": mean,
-        "median_ns": median,
-        "p95_ns": p95,
-        "p99_ns": p99,
-        "stddev_ns": stddev,
-        "ci95_ns": ci95,
-    }
-
-
-def remove_outliers_iqr(sorted_ns: list[int]) -> list[int]:
-    """Remove IQR-based outliers from a sorted list."""
-    n = len(sorted_ns)
-    if n < 4:
-        return sorted_ns
-
-    q1 = float(sorted_ns[n // 4])
-    q3 = float(sorted_ns[3 * n // 4])
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-
-    return [v for v in sorted_ns if lower <= v <= upper]
-
-
 def measure_timer_overhead() -> int:
     """Estimate timer overhead: 10K samples, return median."""
     samples = []
@@ -119,52 +95,80 @@ def measure_timer_overhead() -> int:
 
 def run_benchmark(scenario: str, data_size: int | None,
                   warmup: int, iterations: int,
-                  bench_fn: callable) -> dict:
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
     """Execute a benchmark scenario with warmup + measured iterations.
 
     bench_fn() must raise on incorrect results (fail-fast).
     """
 
+    mem_before = memory_before()
+
     # Warmup phase (still validate correctness)
-    for i in range(warmup):
-        try:
-            bench_fn()
-        except Exception as e:
-            raise RuntimeError(
-                f"Benchmark '{scenario}' warmup iteration {i}: {e}"
-            ) from e
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
 
     # Measurement phase
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
     raw_ns = []
-    for i in range(iterations):
-        start = time.perf_counter_ns()
-        bench_fn()
-        elapsed = time.perf_counter_ns() - start
-        raw_ns.append(elapsed)
-
-    # Sort for statistics
-    sorted_ns = sorted(raw_ns)
-
-    # Remove outliers
-    cleaned = remove_outliers_iqr(sorted_ns)
-
-    # Compute stats
-    total_stats = compute_stats(cleaned)
-
-    return {
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # Optional marshal/call/unmarshal breakdown, also an untimed pass (sys.monitoring)
+    phase_probe = None
+    if PHASE_PROBE_CALLS > 0:
+        phase_probe = probe_phases(bench_fn, min(PHASE_PROBE_CALLS, iterations),
+                                   os.path.dirname(metaffi.__file__))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
+
+    entry = {
         "scenario": scenario,
         "data_size": data_size,
         "status": "PASS",
         "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
         "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
     }
+    if phase_probe is not None:
+        entry["phases"].update(phase_stats(phase_probe["raw_phase_ns"]))
+        entry.update(phase_probe)
+    return entry
 
 
 # ---------------------------------------------------------------------------
 # Result writer
 # ---------------------------------------------------------------------------
 
-def write_results(benchmarks: list[dict], timer_overhead: int):
+def write_results(benchmarks: list[dict], timer_overhead: int, scaling: dict | None = None):
     """Write benchmark results to JSON file."""
 
     result_path = os.environ.get("METAFFI_TEST_RESULTS_FILE", "")
@@ -187,7 +191,17 @@ def write_results(benchmarks: list[dict], timer_overhead: int):
             },
             "config": {
                 "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
                 "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "phase_probe_calls": PHASE_PROBE_CALLS,
+                "array_input_containers": ARRAY_CONTAINERS,
+                "array_sizes": ARRAY_SIZES,
                 "timer_overhead_ns": timer_overhead,
             },
         },
@@ -195,10 +209,15 @@ def write_results(benchmarks: list[dict], timer_overhead: int):
         "correctness": None,  # Correctness tested separately
         "benchmarks": benchmarks,
     }
+    if scaling:
+        result["scaling"] = scaling
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
 
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2)
 
@@ -274,15 +293,23 @@ class TestBenchmarks:
             del join_fn
 
         # --- Scenario 4: Array echo (varying sizes, packed uint8[]) ---
-        if any(_should_run(scenario_filter, "array_echo", size) for size in [10, 100, 1000, 10000]):
+        # The plain scenario passes bytes; METAFFI_TEST_ARRAY_CONTAINERS adds
+        # array_echo_<container> for every other input container.
+        echo_runs = [
+            (container, size)
+            for size in ARRAY_SIZES
+            for container in ["bytes", *(c for c in ARRAY_CONTAINERS if c != "bytes")]
+            if supports_size(container, size)
+            and _should_run(scenario_filter, container_scenario("array_echo", container, "bytes"), size)
+        ]
+        if echo_runs:
             echo_fn = go_module.load_entity("callable=EchoBytes",
                 [ti(T.metaffi_uint8_packed_array_type, dims=1)],
                 [ti(T.metaffi_uint8_packed_array_type, dims=1)])
 
-            for size in [10, 100, 1000, 10000]:
-                if not _should_run(scenario_filter, "array_echo", size):
-                    continue
-                data = bytes(i % 256 for i in range(size))
+            for container, size in echo_runs:
+                data = make_array_input(container, array_payload("B", size))
+                warmup, iterations = array_iterations(size, WARMUP, ITERATIONS)
 
                 # Capture loop vars with default args
                 def bench_array(d=data, sz=size):
@@ -292,9 +319,14 @@ class TestBenchmarks:
                             f"EchoBytes({sz}): got len {len(result)}, want {sz}"
                         )
 
-                benchmarks.append(run_benchmark(
-                    "array_echo", size, WARMUP, ITERATIONS, bench_array
-                ))
+                entry = run_benchmark(
+                    container_scenario("array_echo", container, "bytes"), size,
+                    warmup, iterations, bench_array
+                )
+                entry["input_container"] = container
+                entry["payload_bytes"] = size * element_size("B")
+                benchmarks.append(entry)
+                del data, bench_array
 
             del echo_fn
 
@@ -386,11 +418,28 @@ class TestBenchmarks:
             ))
             del err_fn
 
-        if not benchmarks:
+        # --- Thread scaling: same calls from 1..N threads ---
+        scaling = {}
+        if SCALING_THREADS:
+            scaling["threads"] = run_thread_scaling_suite(
+                scaling_factories(go_module),
+                lambda name, size: _should_run(scenario_filter, name, size),
+                SCALING_THREADS, WARMUP, SCALING_DURATION_NS,
+            )
+
+        # --- Process scaling: one runtime plugin + module per worker process ---
+        if SCALING_PROCESSES:
+            scaling["processes"] = run_process_scaling_suite(
+                process_setup,
+                lambda name, size: _should_run(scenario_filter, name, size),
+                SCALING_PROCESSES, WARMUP, SCALING_DURATION_NS,
+            )
+
+        if not benchmarks and not any(s["scenarios"] for s in scaling.values()):
             raise RuntimeError(
                 "METAFFI_TEST_SCENARIOS selected no benchmark scenarios: "
                 + os.environ.get("METAFFI_TEST_SCENARIOS", "")
             )
 
         # --- Write results ---
-        write_results(benchmarks, timer_overhead)
+        write_results(benchmarks, timer_overhead, scaling)
@@ -6,10 +6,7 @@ Any failure aborts immediately with a detailed error.
 """
 
 import pytest
-import metaffi
-
-T = metaffi.MetaFFITypes
-ti = metaffi.metaffi_type_info
+from conftest import T, metaffi, ti
 
 
 # ============================================================================
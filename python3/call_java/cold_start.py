@@ -0,0 +1,47 @@
+"""Cold start: fresh interpreter -> first Python3 -> Java call via MetaFFI.
+
+Launched once per sample by benchmark_cold_start.run_cold_start; prints one
+METAFFI_COLD_START mark per stage and exits after the first call.
+"""
+
+import time
+
+_T0 = time.monotonic_ns()
+
+import os
+import sys
+
+
+def _mark(stage, ns=None):
+    print(f"METAFFI_COLD_START {stage} {time.monotonic_ns() if ns is None else ns}", flush=True)
+
+
+METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
+if not METAFFI_SOURCE_ROOT:
+    raise RuntimeError("METAFFI_SOURCE_ROOT environment variable not set.")
+
+JAVA_GUEST_JAR_PATH = os.path.join(
+    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "java",
+    "test_bin", "guest_java.jar"
+)
+if not os.path.isfile(JAVA_GUEST_JAR_PATH):
+    raise RuntimeError(f"Java guest JAR not found: {JAVA_GUEST_JAR_PATH}")
+
+sys.path.insert(0, os.path.join(METAFFI_SOURCE_ROOT, "sdk", "api", "python3"))
+_mark("interpreter_start", _T0)
+
+import metaffi
+_mark("sdk_import")
+
+runtime = metaffi.MetaFFIRuntime("jvm")
+runtime.load_runtime_plugin()
+_mark("runtime_load")
+
+module = runtime.load_module(JAVA_GUEST_JAR_PATH)
+_mark("module_load")
+
+noop_fn = module.load_entity("class=guest.CoreFunctions,callable=noOp", None, None)
+_mark("first_load_entity")
+
+noop_fn()
+_mark("first_call")
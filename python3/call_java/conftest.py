@@ -8,32 +8,29 @@ import os
 import sys
 import time
 
-# --- Ensure metaffi SDK is on the Python path ---
-METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
-if not METAFFI_SOURCE_ROOT:
-    raise RuntimeError(
-        "METAFFI_SOURCE_ROOT environment variable not set. "
-        "Set it to the MetaFFI repository root (e.g., c:\\src\\github.com\\MetaFFI)"
-    )
-
-_sdk_python_path = os.path.join(METAFFI_SOURCE_ROOT, "sdk", "api", "python3")
-if _sdk_python_path not in sys.path:
-    sys.path.insert(0, _sdk_python_path)
+# Shared helpers (lazy_metaffi.py) live at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
 
 import pytest
-import metaffi
-
-# Java guest module JAR path
-JAVA_GUEST_JAR_PATH = os.path.join(
-    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "java",
-    "test_bin", "guest_java.jar"
-)
-
-if not os.path.isfile(JAVA_GUEST_JAR_PATH):
-    raise RuntimeError(
-        f"Java guest JAR not found: {JAVA_GUEST_JAR_PATH}\n"
-        "Build it first: cmake --build ... (see sdk/test_modules/guest_modules/java/CMakeLists.txt)"
+
+# The SDK is imported by the java_runtime fixture, not at collection time
+from lazy_metaffi import T, load_metaffi, metaffi, metaffi_source_root, sdk_import_ns, ti
+
+
+def java_guest_jar_path() -> str:
+    """Java guest module JAR; raises if missing."""
+    path = os.path.join(
+        metaffi_source_root(), "sdk", "test_modules", "guest_modules", "java",
+        "test_bin", "guest_java.jar"
     )
+    if not os.path.isfile(path):
+        raise RuntimeError(
+            f"Java guest JAR not found: {path}\n"
+            "Build it first: cmake --build ... (see sdk/test_modules/guest_modules/java/CMakeLists.txt)"
+        )
+    return path
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +38,7 @@ if not os.path.isfile(JAVA_GUEST_JAR_PATH):
 # ---------------------------------------------------------------------------
 
 init_timing = {
+    "sdk_import_ns": 0,
     "load_runtime_plugin_ns": 0,
     "load_module_ns": 0,
 }
@@ -53,6 +51,8 @@ init_timing = {
 @pytest.fixture(scope="session")
 def java_runtime():
     """Initialize the MetaFFI OpenJDK runtime plugin. Released at session end."""
+    load_metaffi()
+    init_timing["sdk_import_ns"] = sdk_import_ns()
     rt = metaffi.MetaFFIRuntime("jvm")
 
     start = time.perf_counter_ns()
@@ -66,8 +66,9 @@ def java_runtime():
 @pytest.fixture(scope="session")
 def java_module(java_runtime):
     """Load the Java guest module via MetaFFI."""
+    path = java_guest_jar_path()
     start = time.perf_counter_ns()
-    mod = java_runtime.load_module(JAVA_GUEST_JAR_PATH)
+    mod = java_runtime.load_module(path)
     init_timing["load_module_ns"] = time.perf_counter_ns() - start
 
     yield mod
@@ -5,26 +5,49 @@ Outputs results to tests/results/python3_to_java_metaffi.json.
 """
 
 import json
-import math
 import os
 import platform
 import sys
 import time
 
 import pytest
-import metaffi
 import ctypes
-from conftest import init_timing
-
-T = metaffi.MetaFFITypes
-ti = metaffi.metaffi_type_info
+from conftest import T, init_timing, metaffi, ti
+
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_inputs import (
+    array_iterations, array_payload, array_sizes_from_env, container_scenario,
+    containers_from_env, element_size, expected_ascending_sum, make_array_input, supports,
+    supports_size,
+)
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_phases import phase_probe_calls_from_env, phase_stats, probe_phases
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
 
 # ---------------------------------------------------------------------------
 # Configuration (from env or defaults)
 # ---------------------------------------------------------------------------
 
 WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
 ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+PHASE_PROBE_CALLS = phase_probe_calls_from_env()
+ARRAY_CONTAINERS = containers_from_env()
+ARRAY_SIZES = array_sizes_from_env()
 
 
 def _parse_scenario_filter() -> set[str] | None:
@@ -46,53 +69,9 @@ def _should_run(filter_set: set[str] | None, name: str, data_size: int | None) -
 
 
 # ---------------------------------------------------------------------------
-# Statistical helpers (matching Go implementation)
+# Timer calibration
 # ---------------------------------------------------------------------------
 
-def compute_stats(sorted_ns: list[int]) -> dict:
-    n = len(sorted_ns)
-    if n == 0:
-        return {"mean_ns": 0, "median_ns": 0, "p95_ns": 0, "p99_ns": 0,
-                "stddev_ns": 0, "ci95_ns": [0, 0]}
-
-    total = sum(sorted_ns)
-    mean = total / n
-
-    if n % 2 == 1:
-        median = float(sorted_ns[n // 2])
-    else:
-        median = (sorted_ns[n // 2 - 1] + sorted_ns[n // 2]) / 2.0
-
-    p95 = float(sorted_ns[int(n * 0.95)])
-    p99 = float(sorted_ns[min(int(n * 0.99), n - 1)])
-
-    sq_diff_sum = sum((v - mean) ** 2 for v in sorted_ns)
-    stddev = math.sqrt(sq_diff_sum / n)
-
-    se = stddev / math.sqrt(n)
-    ci95 = [mean - 1.96 * se, mean + 1.96 * se]
-
-    return {
-        "mean_ns": mean, "median_ns": median,
-        "p95_ns": p95, "p99_ns": p99,
-        "stddev_ns": stddev, "ci95_ns": ci95,
-    }
-
-
-def remove_outliers_iqr(sorted_ns: list[int]) -> list[int]:
-    n = len(sorted_ns)
-    if n < 4:
-        return sorted_ns
-
-    q1 = float(sorted_ns[n // 4])
-    q3 = float(sorted_ns[3 * n // 4])
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-
-    return [v for v in sorted_ns if lower <= v <= upper]
-
-
 def measure_timer_overhead() -> int:
     samples = []
     for _ in range(10000):
@@ -109,34 +88,67 @@ def measure_timer_overhead() -> int:
 
 def run_benchmark(scenario: str, data_size: int | None,
                   warmup: int, iterations: int,
-                  bench_fn: callable) -> dict:
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
 
-    for i in range(warmup):
-        try:
-            bench_fn()
-        except Exception as e:
-            raise RuntimeError(
-                f"Benchmark '{scenario}' warmup iteration {i}: {e}"
-            ) from e
+    mem_before = memory_before()
 
-    raw_ns = []
-    for i in range(iterations):
-        start = time.perf_counter_ns()
-        bench_fn()
-        elapsed = time.perf_counter_ns() - start
-        raw_ns.append(elapsed)
-
-    sorted_ns = sorted(raw_ns)
-    cleaned = remove_outliers_iqr(sorted_ns)
-    total_stats = compute_stats(cleaned)
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
 
-    return {
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
+    raw_ns = []
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # Optional marshal/call/unmarshal breakdown, also an untimed pass (sys.monitoring)
+    phase_probe = None
+    if PHASE_PROBE_CALLS > 0:
+        phase_probe = probe_phases(bench_fn, min(PHASE_PROBE_CALLS, iterations),
+                                   os.path.dirname(metaffi.__file__))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
+
+    entry = {
         "scenario": scenario,
         "data_size": data_size,
         "status": "PASS",
         "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
         "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
     }
+    if phase_probe is not None:
+        entry["phases"].update(phase_stats(phase_probe["raw_phase_ns"]))
+        entry.update(phase_probe)
+    return entry
 
 
 # ---------------------------------------------------------------------------
@@ -163,7 +175,17 @@ def write_results(benchmarks: list[dict], timer_overhead: int):
             },
             "config": {
                 "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
                 "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "phase_probe_calls": PHASE_PROBE_CALLS,
+                "array_input_containers": ARRAY_CONTAINERS,
+                "array_sizes": ARRAY_SIZES,
                 "timer_overhead_ns": timer_overhead,
             },
         },
@@ -173,6 +195,9 @@ def write_results(benchmarks: list[dict], timer_overhead: int):
     }
 
     os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2)
 
@@ -247,7 +272,16 @@ class TestBenchmarks:
         ))
 
     def _bench_array_sum(self, java_module, filt, benchmarks):
-        if not any(_should_run(filt, "array_sum", size) for size in [10, 100, 1000, 10000]):
+        # The plain scenario passes a list; METAFFI_TEST_ARRAY_CONTAINERS adds
+        # array_sum_<container> for every other int32-capable input container.
+        runs = [
+            (container, size)
+            for size in ARRAY_SIZES
+            for container in ["list", *(c for c in ARRAY_CONTAINERS if c != "list" and supports(c, "i"))]
+            if supports_size(container, size)
+            and _should_run(filt, container_scenario("array_sum", container, "list"), size)
+        ]
+        if not runs:
             return
 
         sum_fn = java_module.load_entity(
@@ -255,11 +289,11 @@ class TestBenchmarks:
             [ti(T.metaffi_int32_packed_array_type, dims=1)],
             [ti(T.metaffi_int32_type)])
 
-        for size in [10, 100, 1000, 10000]:
-            if not _should_run(filt, "array_sum", size):
-                continue
-            row = list(range(1, size + 1))
-            expected = size * (size + 1) // 2
+        for container, size in runs:
+            row = make_array_input(container, array_payload("i", size))
+            # sumInt1dArray accumulates in a Java int
+            expected = expected_ascending_sum(size, 32)
+            warmup, iterations = array_iterations(size, WARMUP, ITERATIONS)
 
             def bench_array(a=row, e=expected):
                 result = sum_fn(a)
@@ -268,9 +302,14 @@ class TestBenchmarks:
                         f"sumInt1dArray({len(a)}): got {result}, want {e}"
                     )
 
-            benchmarks.append(run_benchmark(
-                "array_sum", size, WARMUP, ITERATIONS, bench_array
-            ))
+            entry = run_benchmark(
+                container_scenario("array_sum", container, "list"), size,
+                warmup, iterations, bench_array
+            )
+            entry["input_container"] = container
+            entry["payload_bytes"] = size * element_size("i")
+            benchmarks.append(entry)
+            del row, bench_array
 
     def _bench_any_echo(self, java_module, filt, benchmarks):
         any_echo_size = 100
@@ -5,12 +5,9 @@ Fail-fast: every assertion is exact (or epsilon-justified for floats).
 """
 
 import pytest
-import metaffi
+from conftest import T, metaffi, ti
 import ctypes
 
-T = metaffi.MetaFFITypes
-ti = metaffi.metaffi_type_info
-
 # ---------------------------------------------------------------------------
 # Common xfail reasons for known MetaFFI SDK bugs
 # ---------------------------------------------------------------------------
@@ -0,0 +1,315 @@
+"""Performance benchmarks: Python3 -> C via ctypes (native baseline)
+
+The scenarios of the MetaFFI C benchmark (void call, primitive echo, counter
+increment), calling the exported functions of the same c_guest_module
+.dll/.so directly through ctypes. No bridge is built: the guest functions are
+plain C (void xcall_c_no_op(void), double xcall_c_div_integers(int64_t,
+int64_t), int64_t xcall_c_inc_counter(int64_t), void xcall_c_set_counter(int64_t)).
+Outputs results to tests/results/python3_to_c_ctypes.json.
+"""
+
+import ctypes
+import json
+import os
+import platform
+import sys
+import time
+
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
+
+# ---------------------------------------------------------------------------
+# Configuration (from env or defaults)
+# ---------------------------------------------------------------------------
+
+WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
+ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+
+
+def _parse_scenario_filter() -> set[str] | None:
+    raw = os.environ.get("METAFFI_TEST_SCENARIOS", "").strip()
+    if not raw:
+        return None
+    items = {part.strip() for part in raw.split(",") if part.strip()}
+    return items or None
+
+
+def _scenario_key(name: str, data_size: int | None) -> str:
+    return f"{name}_{data_size}" if data_size is not None else name
+
+
+def _should_run(filter_set: set[str] | None, name: str, data_size: int | None) -> bool:
+    if not filter_set:
+        return True
+    return _scenario_key(name, data_size) in filter_set
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ---------------------------------------------------------------------------
+# Load the C guest module and define function signatures
+# ---------------------------------------------------------------------------
+
+def _guest_module_filename() -> str:
+    if sys.platform.startswith("win"):
+        return "c_guest_module.dll"
+    if sys.platform == "darwin":
+        return "c_guest_module.dylib"
+    return "c_guest_module.so"
+
+
+def c_guest_module_path() -> str:
+    """C guest module library (the one the MetaFFI benchmark loads); raises if missing."""
+    source_root = os.environ.get("METAFFI_SOURCE_ROOT")
+    if not source_root:
+        raise RuntimeError("METAFFI_SOURCE_ROOT environment variable not set")
+    path = os.path.join(source_root, "sdk", "test_modules", "guest_modules", "c",
+                        "test_bin", _guest_module_filename())
+    if not os.path.isfile(path):
+        raise RuntimeError(
+            f"C guest module library not found: {path}\n"
+            "Build it first: cmake --build ... --target c_guest_module"
+        )
+    return path
+
+
+def load_guest():
+    """Load the C guest module and set up function signatures."""
+    lib = ctypes.CDLL(c_guest_module_path())
+
+    # Scenario 1: void call
+    lib.xcall_c_no_op.argtypes = []
+    lib.xcall_c_no_op.restype = None
+
+    # Scenario 2: primitive echo
+    lib.xcall_c_div_integers.argtypes = [ctypes.c_int64, ctypes.c_int64]
+    lib.xcall_c_div_integers.restype = ctypes.c_double
+
+    # Scenario 3: counter increment
+    lib.xcall_c_set_counter.argtypes = [ctypes.c_int64]
+    lib.xcall_c_set_counter.restype = None
+
+    lib.xcall_c_inc_counter.argtypes = [ctypes.c_int64]
+    lib.xcall_c_inc_counter.restype = ctypes.c_int64
+
+    return lib
+
+
+# ---------------------------------------------------------------------------
+# Timer calibration
+# ---------------------------------------------------------------------------
+
+def measure_timer_overhead() -> int:
+    """Estimate timer overhead: 10K samples, return median."""
+    samples = []
+    for _ in range(10000):
+        start = time.perf_counter_ns()
+        elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed)
+    samples.sort()
+    return samples[5000]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark runner
+# ---------------------------------------------------------------------------
+
+def run_benchmark(scenario: str, data_size: int | None,
+                  warmup: int, iterations: int,
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
+    """Execute a benchmark scenario with warmup + measured iterations."""
+
+    mem_before = memory_before()
+
+    # Warmup phase
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
+
+    # Measurement phase
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
+    raw_ns = []
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
+
+    return {
+        "scenario": scenario,
+        "data_size": data_size,
+        "status": "PASS",
+        "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
+        "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Result writer
+# ---------------------------------------------------------------------------
+
+def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
+    """Write benchmark results to JSON file."""
+
+    result_path = os.environ.get("METAFFI_TEST_RESULTS_FILE", "")
+    if not result_path:
+        result_path = os.path.join(THIS_DIR, "..", "..", "..", "results",
+                                   "python3_to_c_ctypes.json")
+
+    result = {
+        "metadata": {
+            "host": "python3",
+            "guest": "c",
+            "mechanism": "ctypes",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "environment": {
+                "os": platform.system().lower(),
+                "arch": platform.machine(),
+                "python_version": platform.python_version(),
+            },
+            "config": {
+                "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
+                "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "timer_overhead_ns": timer_overhead,
+            },
+        },
+        "initialization": {
+            "load_dll_ns": init_ns,
+        },
+        "correctness": None,
+        "benchmarks": benchmarks,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
+    with open(result_path, "w") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"Results written to {result_path}", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# Main benchmark
+# ---------------------------------------------------------------------------
+
+def main():
+    mode = os.environ.get("METAFFI_TEST_MODE", "")
+    if mode == "correctness":
+        print("Skipping benchmarks: METAFFI_TEST_MODE=correctness", file=sys.stderr)
+        return
+
+    # Load the guest module and measure init time
+    init_start = time.perf_counter_ns()
+    lib = load_guest()
+    init_ns = time.perf_counter_ns() - init_start
+    print(f"C guest module loaded in {init_ns / 1e6:.1f} ms", file=sys.stderr)
+
+    timer_overhead = measure_timer_overhead()
+    print(f"Timer overhead: {timer_overhead} ns", file=sys.stderr)
+
+    benchmarks = []
+    scenario_filter = _parse_scenario_filter()
+    if scenario_filter:
+        print(
+            "Scenario filter enabled: " + os.environ.get("METAFFI_TEST_SCENARIOS", ""),
+            file=sys.stderr,
+        )
+
+    # --- Scenario 1: Void call ---
+    if _should_run(scenario_filter, "void_call", None):
+        benchmarks.append(run_benchmark(
+            "void_call", None, WARMUP, ITERATIONS, lib.xcall_c_no_op
+        ))
+
+    # --- Scenario 2: Primitive echo (int64 -> float64) ---
+    def bench_primitive():
+        result = lib.xcall_c_div_integers(10, 2)
+        if abs(result - 5.0) > 1e-10:
+            raise RuntimeError(f"xcall_c_div_integers(10,2) = {result}, want 5.0")
+
+    if _should_run(scenario_filter, "primitive_echo", None):
+        benchmarks.append(run_benchmark(
+            "primitive_echo", None, WARMUP, ITERATIONS, bench_primitive
+        ))
+
+    # --- Scenario 3: Counter increment (guest-side state, int64 -> int64) ---
+    expected = [0]
+
+    def bench_counter():
+        result = lib.xcall_c_inc_counter(1)
+        expected[0] += 1
+        if result != expected[0]:
+            raise RuntimeError(f"xcall_c_inc_counter(1) = {result}, want {expected[0]}")
+
+    if _should_run(scenario_filter, "counter_increment", None):
+        lib.xcall_c_set_counter(0)
+        benchmarks.append(run_benchmark(
+            "counter_increment", None, WARMUP, ITERATIONS, bench_counter
+        ))
+        lib.xcall_c_set_counter(0)
+
+    if not benchmarks:
+        raise RuntimeError(
+            "METAFFI_TEST_SCENARIOS selected no benchmark scenarios: "
+            + os.environ.get("METAFFI_TEST_SCENARIOS", "")
+        )
+
+    # --- Write results ---
+    write_results(benchmarks, timer_overhead, init_ns)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,19 +7,43 @@ Outputs results to tests/results/python3_to_go_ctypes.json.
 
 import ctypes
 import json
-import math
 import os
 import platform
-import subprocess
 import sys
 import time
+from pathlib import Path
+
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_inputs import array_iterations, array_payload, array_sizes_from_env
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_scaling import duration_ns_from_env, run_thread_scaling_suite, thread_counts_from_env
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
+from build_cache import BuildCache, BuildCacheError, go_build_spec
 
 # ---------------------------------------------------------------------------
 # Configuration (from env or defaults)
 # ---------------------------------------------------------------------------
 
 WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
 ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+ARRAY_SIZES = array_sizes_from_env()
+SCALING_THREADS = thread_counts_from_env()
+SCALING_DURATION_NS = duration_ns_from_env()
 
 
 def _parse_scenario_filter() -> set[str] | None:
@@ -40,8 +64,8 @@ def _should_run(filter_set: set[str] | None, name: str, data_size: int | None) -
     return _scenario_key(name, data_size) in filter_set
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
-GO_BRIDGE_DIR = os.path.join(THIS_DIR, "go_bridge")
-DLL_PATH = os.path.join(GO_BRIDGE_DIR, "bridge.dll")
+GO_BRIDGE_DIR = Path(THIS_DIR) / "go_bridge"
+DLL_PATH = str(GO_BRIDGE_DIR / "bridge.dll")
 
 
 # ---------------------------------------------------------------------------
@@ -49,34 +73,20 @@ DLL_PATH = os.path.join(GO_BRIDGE_DIR, "bridge.dll")
 # ---------------------------------------------------------------------------
 
 def ensure_bridge_dll():
-    """Build the Go bridge DLL if missing or stale."""
-    must_build = not os.path.isfile(DLL_PATH)
-    if not must_build:
-        dll_mtime = os.path.getmtime(DLL_PATH)
-        for root, _dirs, files in os.walk(GO_BRIDGE_DIR):
-            for name in files:
-                if not name.endswith((".go", ".c", ".h")):
-                    continue
-                src_path = os.path.join(root, name)
-                if os.path.getmtime(src_path) > dll_mtime:
-                    must_build = True
-                    break
-            if must_build:
-                break
-
-    if not must_build:
+    """Build the Go bridge DLL unless the build cache holds it for the current sources."""
+    spec = go_build_spec(
+        "python3_go_ctypes_bridge", GO_BRIDGE_DIR, "bridge.dll", build_flags=("-buildmode=c-shared",)
+    )
+    cache = BuildCache.from_env()
+    if cache.is_fresh(spec):
         return
 
     print(f"Building Go bridge DLL at {DLL_PATH}...", file=sys.stderr)
-    result = subprocess.run(
-        ["go", "build", "-buildmode=c-shared", "-o", "bridge.dll", "."],
-        cwd=GO_BRIDGE_DIR, capture_output=True, text=True
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Failed to build Go bridge DLL:\n{result.stderr}"
-        )
-    print("Go bridge DLL built successfully.", file=sys.stderr)
+    try:
+        outcome = cache.ensure(spec)
+    except BuildCacheError as e:
+        raise RuntimeError(f"Failed to build Go bridge DLL:\n{e}") from e
+    print(f"Go bridge DLL {outcome}.", file=sys.stderr)
 
 
 # ---------------------------------------------------------------------------
@@ -156,55 +166,9 @@ def load_bridge():
 
 
 # ---------------------------------------------------------------------------
-# Statistical helpers (matching MetaFFI implementation)
+# Timer calibration
 # ---------------------------------------------------------------------------
 
-def compute_stats(sorted_ns: list[int]) -> dict:
-    """Compute summary statistics from a sorted list of nanosecond timings."""
-    n = len(sorted_ns)
-    if n == 0:
-        return {"mean_ns": 0, "median_ns": 0, "p95_ns": 0, "p99_ns": 0,
-                "stddev_ns": 0, "ci95_ns": [0, 0]}
-
-    total = sum(sorted_ns)
-    mean = total / n
-
-    if n % 2 == 1:
-        median = float(sorted_ns[n // 2])
-    else:
-        median = (sorted_ns[n // 2 - 1] + sorted_ns[n // 2]) / 2.0
-
-    p95 = float(sorted_ns[int(n * 0.95)])
-    p99 = float(sorted_ns[min(int(n * 0.99), n - 1)])
-
-    sq_diff_sum = sum((v - mean) ** 2 for v in sorted_ns)
-    stddev = math.sqrt(sq_diff_sum / n)
-
-    se = stddev / math.sqrt(n)
-    ci95 = [mean - 1.96 * se, mean + 1.96 * se]
-
-    return {
-        "mean_ns": mean, "median_ns": median,
-        "p95_ns": p95, "p99_ns": p99,
-        "stddev_ns": stddev, "ci95_ns": ci95,
-    }
-
-
-def remove_outliers_iqr(sorted_ns: list[int]) -> list[int]:
-    """Remove IQR-based outliers from a sorted list."""
-    n = len(sorted_ns)
-    if n < 4:
-        return sorted_ns
-
-    q1 = float(sorted_ns[n // 4])
-    q3 = float(sorted_ns[3 * n // 4])
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-
-    return [v for v in sorted_ns if lower <= v <= upper]
-
-
 def measure_timer_overhead() -> int:
     """Estimate timer overhead: 10K samples, return median."""
     samples = []
@@ -222,36 +186,120 @@ def measure_timer_overhead() -> int:
 
 def run_benchmark(scenario: str, data_size: int | None,
                   warmup: int, iterations: int,
-                  bench_fn: callable) -> dict:
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
     """Execute a benchmark scenario with warmup + measured iterations."""
 
+    mem_before = memory_before()
+
     # Warmup phase
-    for i in range(warmup):
-        try:
-            bench_fn()
-        except Exception as e:
-            raise RuntimeError(
-                f"Benchmark '{scenario}' warmup iteration {i}: {e}"
-            ) from e
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
 
     # Measurement phase
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
     raw_ns = []
-    for i in range(iterations):
-        start = time.perf_counter_ns()
-        bench_fn()
-        elapsed = time.perf_counter_ns() - start
-        raw_ns.append(elapsed)
-
-    sorted_ns = sorted(raw_ns)
-    cleaned = remove_outliers_iqr(sorted_ns)
-    total_stats = compute_stats(cleaned)
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
 
     return {
         "scenario": scenario,
         "data_size": data_size,
         "status": "PASS",
         "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
         "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Thread scaling (METAFFI_TEST_SCALING_THREADS)
+# ---------------------------------------------------------------------------
+
+def scaling_factories(lib, AddCallbackType) -> dict:
+    """Per-thread callables for the scaling scenarios.
+
+    ctypes out-parameters are per thread; the DLL and the C callback are shared.
+    """
+    @AddCallbackType
+    def c_adder(a, b):
+        return a + b
+
+    echo_data = bytes(i % 256 for i in range(1000))
+
+    def make_void():
+        def call():
+            if lib.GoNoOp() != 0:
+                raise RuntimeError("GoNoOp failed")
+        return call
+
+    def make_primitive():
+        out_double = ctypes.c_double()
+
+        def call():
+            if lib.GoDivIntegers(ctypes.c_int64(10), ctypes.c_int64(2), ctypes.byref(out_double)) != 0:
+                raise RuntimeError("GoDivIntegers failed")
+            if abs(out_double.value - 5.0) > 1e-10:
+                raise RuntimeError(f"DivIntegers(10,2) = {out_double.value}, want 5.0")
+        return call
+
+    def make_array():
+        out_ptr = ctypes.c_void_p()
+        out_len = ctypes.c_int()
+
+        def call():
+            if lib.GoEchoBytes(echo_data, ctypes.c_int(1000), ctypes.byref(out_ptr), ctypes.byref(out_len)) != 0:
+                raise RuntimeError("GoEchoBytes failed")
+            if out_len.value != 1000:
+                raise RuntimeError(f"EchoBytes(1000): got len {out_len.value}, want 1000")
+            lib.GoFreeBytes(out_ptr)
+        return call
+
+    def make_callback():
+        cb_result = ctypes.c_int64()
+
+        def call():
+            if lib.GoCallCallbackAdd(c_adder, ctypes.byref(cb_result)) != 0:
+                raise RuntimeError("GoCallCallbackAdd failed")
+            if cb_result.value != 3:
+                raise RuntimeError(f"CallCallbackAdd: got {cb_result.value}, want 3")
+        return call
+
+    return {
+        ("void_call", None): make_void,
+        ("primitive_echo", None): make_primitive,
+        ("array_echo", 1000): make_array,
+        ("callback", None): make_callback,
     }
 
 
@@ -259,7 +307,8 @@ def run_benchmark(scenario: str, data_size: int | None,
 # Result writer
 # ---------------------------------------------------------------------------
 
-def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
+def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int,
+                  scaling: dict | None = None):
     """Write benchmark results to JSON file."""
 
     result_path = os.environ.get("METAFFI_TEST_RESULTS_FILE", "")
@@ -280,7 +329,15 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
             },
             "config": {
                 "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
                 "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "array_sizes": ARRAY_SIZES,
                 "timer_overhead_ns": timer_overhead,
             },
         },
@@ -290,8 +347,13 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
         "correctness": None,
         "benchmarks": benchmarks,
     }
+    if scaling:
+        result["scaling"] = scaling
 
     os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2)
 
@@ -378,11 +440,13 @@ def main():
         ))
 
     # --- Scenario 4: Array echo (varying sizes) ---
-    for size in [10, 100, 1000, 10000]:
+    for size in ARRAY_SIZES:
         if not _should_run(scenario_filter, "array_echo", size):
             continue
         selected_count += 1
-        data = bytes(i % 256 for i in range(size))
+        # Zero-copy view of the (memory-mapped) payload as unsigned char[size]
+        data = (ctypes.c_ubyte * size).from_buffer(array_payload("B", size))
+        warmup, iterations = array_iterations(size, WARMUP, ITERATIONS)
         out_ptr = ctypes.c_void_p()
         out_len = ctypes.c_int()
 
@@ -397,9 +461,10 @@ def main():
                 )
             lib.GoFreeBytes(out_ptr)
 
-        benchmarks.append(run_benchmark(
-            "array_echo", size, WARMUP, ITERATIONS, bench_array
-        ))
+        entry = run_benchmark("array_echo", size, warmup, iterations, bench_array)
+        entry["payload_bytes"] = size
+        benchmarks.append(entry)
+        del data, bench_array
 
     # --- Scenario 5: Object create + method call ---
     handle = ctypes.c_uint64()
@@ -485,6 +550,16 @@ def main():
             "any_echo", any_echo_size, WARMUP, ITERATIONS, bench_any_echo
         ))
 
+    # --- Thread scaling: same calls from 1..N threads ---
+    scaling = {}
+    if SCALING_THREADS:
+        scaling["threads"] = run_thread_scaling_suite(
+            scaling_factories(lib, AddCallbackType),
+            lambda name, size: _should_run(scenario_filter, name, size),
+            SCALING_THREADS, WARMUP, SCALING_DURATION_NS,
+        )
+        selected_count += len(scaling["threads"]["scenarios"])
+
     if scenario_filter and selected_count == 0:
         raise RuntimeError(
             "METAFFI_TEST_SCENARIOS selected no benchmark scenarios: "
@@ -492,7 +567,7 @@ def main():
         )
 
     # --- Write results ---
-    write_results(benchmarks, timer_overhead, init_ns)
+    write_results(benchmarks, timer_overhead, init_ns, scaling)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+"""Cold start: fresh interpreter -> first Python3 -> Go call via ctypes.
+
+Launched once per sample by benchmark_cold_start.run_cold_start; prints one
+METAFFI_COLD_START mark per stage and exits after the first call. The bridge
+DLL must already be built (the runner builds it before launching). ctypes has
+no runtime plugin, so runtime_load is reported as zero.
+"""
+
+import time
+
+_T0 = time.monotonic_ns()
+
+import os
+
+
+def _mark(stage, ns=None):
+    print(f"METAFFI_COLD_START {stage} {time.monotonic_ns() if ns is None else ns}", flush=True)
+
+
+DLL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "go_bridge", "bridge.dll")
+if not os.path.isfile(DLL_PATH):
+    raise RuntimeError(f"Go bridge DLL not found: {DLL_PATH}")
+_mark("interpreter_start", _T0)
+
+import ctypes
+_mark("sdk_import")
+_mark("runtime_load")
+
+lib = ctypes.CDLL(DLL_PATH)
+_mark("module_load")
+
+go_noop = lib.GoNoOp
+go_noop.argtypes = []
+go_noop.restype = ctypes.c_int
+_mark("first_load_entity")
+
+if go_noop() != 0:
+    raise RuntimeError("GoNoOp failed")
+_mark("first_call")
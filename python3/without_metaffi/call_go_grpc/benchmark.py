@@ -6,14 +6,15 @@ Outputs results to tests/results/python3_to_go_grpc.json.
 """
 
 import json
-import math
 import os
 import platform
+import queue
 import subprocess
 import sys
 import time
 
 import grpc
+import grpc.aio
 from google.protobuf import struct_pb2
 
 # Add this directory to sys.path so generated stubs are importable
@@ -24,14 +25,47 @@ if THIS_DIR not in sys.path:
 import benchmark_pb2
 import benchmark_pb2_grpc
 
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_inputs import array_iterations, array_payload, array_sizes_from_env
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_scaling import (
+    duration_ns_from_env, inflight_depths_from_env, run_inflight_suite,
+    run_thread_scaling_suite, thread_counts_from_env,
+)
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
 ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+ARRAY_SIZES = array_sizes_from_env()
+SCALING_THREADS = thread_counts_from_env()
+SCALING_INFLIGHT = inflight_depths_from_env()
+SCALING_DURATION_NS = duration_ns_from_env()
 SERVER_DIR = os.path.join(THIS_DIR, "server")
 SERVER_EXE = os.path.join(SERVER_DIR, "server.exe")
+# Large array sizes exceed gRPC's default 4 MB message limit; the server lifts it too.
+CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
 
 
 def _parse_scenario_filter() -> set[str] | None:
@@ -101,53 +135,9 @@ class GrpcServerProcess:
 
 
 # ---------------------------------------------------------------------------
-# Statistical helpers (matching MetaFFI implementation)
+# Timer calibration
 # ---------------------------------------------------------------------------
 
-def compute_stats(sorted_ns: list[int]) -> dict:
-    n = len(sorted_ns)
-    if n == 0:
-        return {"mean_ns": 0, "median_ns": 0, "p95_ns": 0, "p99_ns": 0,
-                "stddev_ns": 0, "ci95_ns": [0, 0]}
-
-    total = sum(sorted_ns)
-    mean = total / n
-
-    if n % 2 == 1:
-        median = float(sorted_ns[n // 2])
-    else:
-        median = (sorted_ns[n // 2 - 1] + sorted_ns[n // 2]) / 2.0
-
-    p95 = float(sorted_ns[int(n * 0.95)])
-    p99 = float(sorted_ns[min(int(n * 0.99), n - 1)])
-
-    sq_diff_sum = sum((v - mean) ** 2 for v in sorted_ns)
-    stddev = math.sqrt(sq_diff_sum / n)
-
-    se = stddev / math.sqrt(n)
-    ci95 = [mean - 1.96 * se, mean + 1.96 * se]
-
-    return {
-        "mean_ns": mean, "median_ns": median,
-        "p95_ns": p95, "p99_ns": p99,
-        "stddev_ns": stddev, "ci95_ns": ci95,
-    }
-
-
-def remove_outliers_iqr(sorted_ns: list[int]) -> list[int]:
-    n = len(sorted_ns)
-    if n < 4:
-        return sorted_ns
-
-    q1 = float(sorted_ns[n // 4])
-    q3 = float(sorted_ns[3 * n // 4])
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-
-    return [v for v in sorted_ns if lower <= v <= upper]
-
-
 def measure_timer_overhead() -> int:
     samples = []
     for _ in range(10000):
@@ -164,33 +154,149 @@ def measure_timer_overhead() -> int:
 
 def run_benchmark(scenario: str, data_size: int | None,
                   warmup: int, iterations: int,
-                  bench_fn: callable) -> dict:
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
 
-    for i in range(warmup):
-        try:
-            bench_fn()
-        except Exception as e:
-            raise RuntimeError(
-                f"Benchmark '{scenario}' warmup iteration {i}: {e}"
-            ) from e
+    mem_before = memory_before()
 
-    raw_ns = []
-    for i in range(iterations):
-        start = time.perf_counter_ns()
-        bench_fn()
-        elapsed = time.perf_counter_ns() - start
-        raw_ns.append(elapsed)
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
 
-    sorted_ns = sorted(raw_ns)
-    cleaned = remove_outliers_iqr(sorted_ns)
-    total_stats = compute_stats(cleaned)
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
+    raw_ns = []
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
 
     return {
         "scenario": scenario,
         "data_size": data_size,
         "status": "PASS",
         "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
         "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Callback stream
+# ---------------------------------------------------------------------------
+
+class CallbackStream:
+    """One long-lived CallbackAdd bidi stream.
+
+    Requests are fed to gRPC through a queue-backed iterator, which gRPC drains
+    on its own request-consumer thread; responses are delivered by the channel's
+    polling thread and picked up by the calling thread. Each round trip therefore
+    includes these client-side thread hand-offs, as it does for any callback
+    over a sync gRPC stream. Not thread-safe: use one stream per thread.
+    """
+
+    def __init__(self, stub):
+        self._send_q = queue.Queue()
+        self._responses = stub.CallbackAdd(self._request_iter())
+
+    def _request_iter(self):
+        while True:
+            msg = self._send_q.get()
+            if msg is None:
+                return
+            yield msg
+
+    def round_trip(self) -> int:
+        """invoke -> compute(a, b) -> add_result -> final_result."""
+        self._send_q.put(benchmark_pb2.CallbackClientMsg(invoke=True))
+        compute = next(self._responses).compute
+        self._send_q.put(benchmark_pb2.CallbackClientMsg(add_result=compute.a + compute.b))
+        return next(self._responses).final_result
+
+    def close(self):
+        """Half-close the stream and wait for the server to end it."""
+        self._send_q.put(None)
+        for resp in self._responses:
+            raise RuntimeError(f"CallbackAdd: unexpected message after close: {resp}")
+
+
+# ---------------------------------------------------------------------------
+# Request builders and grpc.aio calls (in-flight scaling)
+# ---------------------------------------------------------------------------
+
+def make_any_echo_request(size: int):
+    """AnyEcho request with a mixed [1, "two", 3.0, ...] payload."""
+    values = struct_pb2.ListValue()
+    for i in range(size):
+        mod = i % 3
+        if mod == 0:
+            values.values.add(number_value=1)
+        elif mod == 1:
+            values.values.add(string_value="two")
+        else:
+            values.values.add(number_value=3.0)
+    return benchmark_pb2.AnyEchoRequest(values=values)
+
+
+async def aio_inflight_calls(address: str):
+    """One grpc.aio channel and the async calls measured at each in-flight depth."""
+    channel = grpc.aio.insecure_channel(address, options=CHANNEL_OPTIONS)
+    await channel.channel_ready()
+    stub = benchmark_pb2_grpc.BenchmarkServiceStub(channel)
+    void_req = benchmark_pb2.VoidCallRequest()
+    div_req = benchmark_pb2.DivIntegersRequest(x=10, y=2)
+    echo_req = benchmark_pb2.EchoBytesRequest(data=bytes(i % 256 for i in range(1000)))
+    any_req = make_any_echo_request(100)
+
+    async def void_call():
+        await stub.VoidCall(void_req)
+
+    async def primitive_echo():
+        resp = await stub.DivIntegers(div_req)
+        if abs(resp.result - 5.0) > 1e-10:
+            raise RuntimeError(f"DivIntegers: {resp.result}, want 5.0")
+
+    async def array_echo():
+        resp = await stub.EchoBytes(echo_req)
+        if len(resp.data) != 1000:
+            raise RuntimeError(f"EchoBytes(1000): got len {len(resp.data)}")
+
+    async def any_echo():
+        resp = await stub.AnyEcho(any_req)
+        if len(resp.values.values) != 100:
+            raise RuntimeError(f"AnyEcho: got len {len(resp.values.values)}, want 100")
+
+    return channel, {
+        ("void_call", None): void_call,
+        ("primitive_echo", None): primitive_echo,
+        ("array_echo", 1000): array_echo,
+        ("any_echo", 100): any_echo,
     }
 
 
@@ -198,7 +304,8 @@ def run_benchmark(scenario: str, data_size: int | None,
 # Result writer
 # ---------------------------------------------------------------------------
 
-def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
+def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int,
+                  scaling: dict | None = None):
     result_path = os.environ.get("METAFFI_TEST_RESULTS_FILE", "")
     if not result_path:
         result_path = os.path.join(THIS_DIR, "..", "..", "..", "results",
@@ -217,7 +324,15 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
             },
             "config": {
                 "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
                 "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "array_sizes": ARRAY_SIZES,
                 "timer_overhead_ns": timer_overhead,
             },
         },
@@ -227,8 +342,13 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
         "correctness": None,
         "benchmarks": benchmarks,
     }
+    if scaling:
+        result["scaling"] = scaling
 
     os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2)
 
@@ -255,7 +375,7 @@ def main():
 
     try:
         # Connect to server
-        channel = grpc.insecure_channel(server.address())
+        channel = grpc.insecure_channel(server.address(), options=CHANNEL_OPTIONS)
         stub = benchmark_pb2_grpc.BenchmarkServiceStub(channel)
 
         timer_overhead = measure_timer_overhead()
@@ -311,12 +431,12 @@ def main():
             ))
 
         # --- Scenario 4: Array echo (varying sizes) ---
-        for size in [10, 100, 1000, 10000]:
+        for size in ARRAY_SIZES:
             if not _should_run(scenario_filter, "array_echo", size):
                 continue
             selected_count += 1
-            data = bytes(i % 256 for i in range(size))
-            echo_req = benchmark_pb2.EchoBytesRequest(data=data)
+            echo_req = benchmark_pb2.EchoBytesRequest(data=bytes(array_payload("B", size)))
+            warmup, iterations = array_iterations(size, WARMUP, ITERATIONS)
 
             def bench_array(req=echo_req, sz=size):
                 resp = stub.EchoBytes(req)
@@ -325,24 +445,16 @@ def main():
                         f"EchoBytes({sz}): got len {len(resp.data)}"
                     )
 
-            benchmarks.append(run_benchmark(
-                "array_echo", size, WARMUP, ITERATIONS, bench_array
-            ))
+            entry = run_benchmark("array_echo", size, warmup, iterations, bench_array)
+            entry["payload_bytes"] = size
+            benchmarks.append(entry)
+            del echo_req, bench_array
 
         # --- Scenario: dynamic any echo (mixed array payload) ---
         any_echo_size = 100
         if _should_run(scenario_filter, "any_echo", any_echo_size):
             selected_count += 1
-            values = struct_pb2.ListValue()
-            for i in range(any_echo_size):
-                mod = i % 3
-                if mod == 0:
-                    values.values.add(number_value=1)
-                elif mod == 1:
-                    values.values.add(string_value="two")
-                else:
-                    values.values.add(number_value=3.0)
-            any_req = benchmark_pb2.AnyEchoRequest(values=values)
+            any_req = make_any_echo_request(any_echo_size)
 
             def bench_any_echo(r=any_req, expected_len=any_echo_size):
                 resp = stub.AnyEcho(r)
@@ -369,107 +481,32 @@ def main():
                 "object_method", None, WARMUP, ITERATIONS, bench_object
             ))
 
-        # --- Scenario 6: Callback via bidirectional streaming ---
-        def bench_callback():
-            # Each iteration opens a new stream
-            def request_iterator():
-                # Step 1: send invoke
-                yield benchmark_pb2.CallbackClientMsg(invoke=True)
-
-                # Step 3: receive compute request, compute, send result
-                # This is handled in the response loop below
-                # We need to yield the result after receiving compute
-                yield bench_callback._pending_result
-
-            # We need a two-phase approach: send invoke, recv compute, send result, recv final
-            responses = stub.CallbackAdd(iter([
-                benchmark_pb2.CallbackClientMsg(invoke=True),
-            ]))
-
-            # Receive compute request
-            resp = next(responses)
-            compute = resp.compute
-            add_result = compute.a + compute.b
-
-            # Send result via a new stream call (simplified: use single stream)
-            # Actually, bidirectional streaming requires sending and receiving on the same stream.
-            # Let me restructure to use a generator properly.
-            pass
-
-        # Bidirectional streaming is more complex - use a proper generator
-        def bench_callback_proper():
-            result_holder = [None]
-
-            def request_gen():
-                # Send invoke
-                yield benchmark_pb2.CallbackClientMsg(invoke=True)
-
-                # Wait for the compute response to be processed
-                # The main thread will set result_holder[0]
-                while result_holder[0] is None:
-                    time.sleep(0)  # yield to other code
-                yield result_holder[0]
-
-            # This approach won't work with gRPC's synchronous API.
-            # Use a simpler sequential approach with threading.
-            pass
-
-        # Simplified callback benchmark using threading
-        import threading
-        import queue
-
-        def bench_callback_threaded():
-            send_q = queue.Queue()
-            recv_q = queue.Queue()
-
-            def request_gen():
-                while True:
-                    msg = send_q.get()
-                    if msg is None:
-                        return
-                    yield msg
-
-            def run_stream():
-                try:
-                    responses = stub.CallbackAdd(request_gen())
-                    for resp in responses:
-                        recv_q.put(resp)
-                except Exception as e:
-                    recv_q.put(e)
-
-            t = threading.Thread(target=run_stream, daemon=True)
-            t.start()
-
-            # Step 1: Send invoke
-            send_q.put(benchmark_pb2.CallbackClientMsg(invoke=True))
-
-            # Step 2: Receive compute(a, b)
-            resp = recv_q.get(timeout=5)
-            if isinstance(resp, Exception):
-                raise resp
-            compute = resp.compute
-            result = compute.a + compute.b
-
-            # Step 3: Send result
-            send_q.put(benchmark_pb2.CallbackClientMsg(add_result=result))
-
-            # Step 4: Receive final result
-            resp = recv_q.get(timeout=5)
-            if isinstance(resp, Exception):
-                raise resp
-            final = resp.final_result
-
-            if final != 3:
-                raise RuntimeError(f"Callback: got {final}, want 3")
-
-            # Close stream
-            send_q.put(None)
-            t.join(timeout=5)
-
+        # --- Scenario 6: Callback over one persistent bidirectional stream ---
+        # Stream setup is measured separately (callback_stream_setup), so the
+        # callback number is the per-callback crossing cost only.
         if _should_run(scenario_filter, "callback", None):
             selected_count += 1
+            callback_stream = CallbackStream(stub)
+
+            def bench_callback():
+                final = callback_stream.round_trip()
+                if final != 3:
+                    raise RuntimeError(f"Callback: got {final}, want 3")
+
+            benchmarks.append(run_benchmark(
+                "callback", None, WARMUP, ITERATIONS, bench_callback
+            ))
+            callback_stream.close()
+
+        # --- Scenario 6b: Callback stream setup (open + half-close + server end) ---
+        if _should_run(scenario_filter, "callback_stream_setup", None):
+            selected_count += 1
+
+            def bench_stream_setup():
+                CallbackStream(stub).close()
+
             benchmarks.append(run_benchmark(
-                "callback", None, WARMUP, ITERATIONS, bench_callback_threaded
+                "callback_stream_setup", None, WARMUP, ITERATIONS, bench_stream_setup
             ))
 
         # --- Scenario 7: Error propagation ---
@@ -489,6 +526,54 @@ def main():
                 "error_propagation", None, WARMUP, ITERATIONS, bench_error
             ))
 
+        # --- Thread scaling: same calls from 1..N threads over the shared channel ---
+        scaling = {}
+        if SCALING_THREADS:
+            echo_req_1000 = benchmark_pb2.EchoBytesRequest(data=bytes(i % 256 for i in range(1000)))
+
+            def make_array():
+                def call():
+                    resp = stub.EchoBytes(echo_req_1000)
+                    if len(resp.data) != 1000:
+                        raise RuntimeError(f"EchoBytes(1000): got len {len(resp.data)}")
+                return call
+
+            scaling_streams = []
+
+            def make_callback():
+                # One stream per worker thread: a bidi stream is not thread-safe.
+                stream = CallbackStream(stub)
+                scaling_streams.append(stream)
+
+                def call():
+                    final = stream.round_trip()
+                    if final != 3:
+                        raise RuntimeError(f"Callback: got {final}, want 3")
+                return call
+
+            scaling["threads"] = run_thread_scaling_suite(
+                {
+                    ("void_call", None): lambda: bench_void,
+                    ("primitive_echo", None): lambda: bench_primitive,
+                    ("array_echo", 1000): make_array,
+                    ("callback", None): make_callback,
+                },
+                lambda name, size: _should_run(scenario_filter, name, size),
+                SCALING_THREADS, WARMUP, SCALING_DURATION_NS,
+            )
+            for stream in scaling_streams:
+                stream.close()
+            selected_count += len(scaling["threads"]["scenarios"])
+
+        # --- In-flight scaling: N outstanding grpc.aio requests on one channel ---
+        if SCALING_INFLIGHT:
+            scaling["inflight"] = run_inflight_suite(
+                lambda: aio_inflight_calls(server.address()),
+                lambda name, size: _should_run(scenario_filter, name, size),
+                SCALING_INFLIGHT, WARMUP, SCALING_DURATION_NS,
+            )
+            selected_count += len(scaling["inflight"]["scenarios"])
+
         if scenario_filter and selected_count == 0:
             raise RuntimeError(
                 "METAFFI_TEST_SCENARIOS selected no benchmark scenarios: "
@@ -496,7 +581,7 @@ def main():
             )
 
         # --- Write results ---
-        write_results(benchmarks, timer_overhead, init_ns)
+        write_results(benchmarks, timer_overhead, init_ns, scaling)
 
         # Cleanup
         channel.close()
@@ -0,0 +1,55 @@
+"""Cold start: fresh interpreter -> first Python3 -> Go call via gRPC.
+
+Launched once per sample by benchmark_cold_start.run_cold_start; prints one
+METAFFI_COLD_START mark per stage and exits after the first call.
+runtime_load starts the Go server (until READY:<port>); module_load opens the
+channel and waits until it is connected. The server is stopped afterwards
+(not measured).
+"""
+
+import time
+
+_T0 = time.monotonic_ns()
+
+import os
+import subprocess
+
+
+def _mark(stage, ns=None):
+    print(f"METAFFI_COLD_START {stage} {time.monotonic_ns() if ns is None else ns}", flush=True)
+
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server")
+SERVER_EXE = os.path.join(SERVER_DIR, "server.exe")
+if not os.path.isfile(SERVER_EXE):
+    raise RuntimeError(f"Server executable not found: {SERVER_EXE}")
+_mark("interpreter_start", _T0)
+
+import grpc
+import benchmark_pb2
+import benchmark_pb2_grpc
+_mark("sdk_import")
+
+server = subprocess.Popen([SERVER_EXE], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=SERVER_DIR)
+try:
+    line = server.stdout.readline().decode().strip()
+    if not line.startswith("READY:"):
+        raise RuntimeError(f"Server did not print READY:<port>, got: {line!r}")
+    _mark("runtime_load")
+
+    channel = grpc.insecure_channel(f"127.0.0.1:{int(line.split(':')[1])}")
+    grpc.channel_ready_future(channel).result(timeout=60)
+    _mark("module_load")
+
+    stub = benchmark_pb2_grpc.BenchmarkServiceStub(channel)
+    _mark("first_load_entity")
+
+    stub.VoidCall(benchmark_pb2.VoidCallRequest())
+    _mark("first_call")
+    channel.close()
+finally:
+    server.terminate()
+    try:
+        server.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        server.kill()
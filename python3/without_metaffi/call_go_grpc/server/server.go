@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"io"
+	"math"
 	"net"
 	"os"
 
@@ -149,7 +150,11 @@ func main() {
 		os.Exit(1)
 	}
 
-	grpcServer := grpc.NewServer()
+	// Large array sizes exceed gRPC's default 4 MB message limit
+	grpcServer := grpc.NewServer(
+		grpc.MaxRecvMsgSize(math.MaxInt32),
+		grpc.MaxSendMsgSize(math.MaxInt32),
+	)
 	pb.RegisterBenchmarkServiceServer(grpcServer, &benchmarkServer{})
 
 	// Print READY:<port> so the client knows we're up
@@ -0,0 +1,73 @@
+"""Cold start: fresh interpreter -> first Python3 -> Java call via gRPC.
+
+Launched once per sample by benchmark_cold_start.run_cold_start; prints one
+METAFFI_COLD_START mark per stage and exits after the first call.
+runtime_load starts the Java server JVM (until READY:<port>); module_load
+opens the channel and waits until it is connected. The server is stopped
+afterwards (not measured).
+"""
+
+import time
+
+_T0 = time.monotonic_ns()
+
+import os
+import subprocess
+
+
+def _mark(stage, ns=None):
+    print(f"METAFFI_COLD_START {stage} {time.monotonic_ns() if ns is None else ns}", flush=True)
+
+
+METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
+if not METAFFI_SOURCE_ROOT:
+    raise RuntimeError("METAFFI_SOURCE_ROOT environment variable not set.")
+
+SERVER_DIR = os.path.join(
+    METAFFI_SOURCE_ROOT, "tests", "go", "without_metaffi",
+    "call_java_grpc", "server"
+)
+FAT_JAR = os.path.join(SERVER_DIR, "target", "benchmark-server-1.0-SNAPSHOT.jar")
+GUEST_JAR = os.path.join(
+    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "java",
+    "test_bin", "guest_java.jar"
+)
+for _path in (FAT_JAR, GUEST_JAR):
+    if not os.path.isfile(_path):
+        raise RuntimeError(f"JAR not found: {_path}")
+_mark("interpreter_start", _T0)
+
+import grpc
+import benchmark_pb2
+import benchmark_pb2_grpc
+_mark("sdk_import")
+
+server = subprocess.Popen(
+    [os.environ.get("JAVA_EXE", "java"), "-cp", FAT_JAR + os.pathsep + GUEST_JAR,
+     "benchmark.BenchmarkServer", "--port", "0"],
+    stdout=subprocess.PIPE,
+    stderr=subprocess.DEVNULL,
+    cwd=SERVER_DIR,
+)
+try:
+    line = server.stdout.readline().decode().strip()
+    if not line.startswith("READY:"):
+        raise RuntimeError(f"Server did not print READY:<port>, got: {line!r}")
+    _mark("runtime_load")
+
+    channel = grpc.insecure_channel(f"127.0.0.1:{int(line.split(':')[1])}")
+    grpc.channel_ready_future(channel).result(timeout=60)
+    _mark("module_load")
+
+    stub = benchmark_pb2_grpc.BenchmarkServiceStub(channel)
+    _mark("first_load_entity")
+
+    stub.VoidCall(benchmark_pb2.VoidCallRequest())
+    _mark("first_call")
+    channel.close()
+finally:
+    server.terminate()
+    try:
+        server.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        server.kill()
@@ -6,7 +6,6 @@ Outputs results to tests/results/python3_to_java_jpype.json.
 """
 
 import json
-import math
 import os
 import platform
 import sys
@@ -15,12 +14,35 @@ import time
 import jpype
 import jpype.imports
 
+# Shared statistics engine (benchmark_stats.py) lives at the tests root
+TESTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if TESTS_ROOT not in sys.path:
+    sys.path.insert(0, TESTS_ROOT)
+
+from benchmark_gc import GcMonitor, GcSettings
+from benchmark_inputs import (
+    array_iterations, array_payload, array_sizes_from_env, element_size, expected_ascending_sum,
+)
+from benchmark_memory import memory_before, probe_calls_from_env, scenario_memory
+from benchmark_precision import PrecisionSampler, PrecisionSettings
+from benchmark_samples import externalize_raw_samples, raw_format_from_env
+from benchmark_stats import summarize
+from benchmark_warmup import WarmupSettings, warm_up
+
 # ---------------------------------------------------------------------------
 # Configuration (from env or defaults)
 # ---------------------------------------------------------------------------
 
 WARMUP = int(os.environ.get("METAFFI_TEST_WARMUP", "100"))
+WARMUP_SETTINGS = WarmupSettings.from_env()
+PRECISION_SETTINGS = PrecisionSettings.from_env()
+GC_SETTINGS = GcSettings.from_env()
 ITERATIONS = int(os.environ.get("METAFFI_TEST_ITERATIONS", "10000"))
+BATCH_MIN_ELAPSED_NS = int(os.environ.get("METAFFI_TEST_BATCH_MIN_ELAPSED_NS", "10000"))
+BATCH_MAX_CALLS = int(os.environ.get("METAFFI_TEST_BATCH_MAX_CALLS", "100000"))
+RAW_SAMPLE_FORMAT = raw_format_from_env()
+MEMORY_PROBE_CALLS = probe_calls_from_env()
+ARRAY_SIZES = array_sizes_from_env()
 
 
 def _parse_scenario_filter() -> set[str] | None:
@@ -71,53 +93,9 @@ def start_jvm() -> int:
 
 
 # ---------------------------------------------------------------------------
-# Statistical helpers (matching MetaFFI implementation)
+# Timer calibration
 # ---------------------------------------------------------------------------
 
-def compute_stats(sorted_ns: list[int]) -> dict:
-    n = len(sorted_ns)
-    if n == 0:
-        return {"mean_ns": 0, "median_ns": 0, "p95_ns": 0, "p99_ns": 0,
-                "stddev_ns": 0, "ci95_ns": [0, 0]}
-
-    total = sum(sorted_ns)
-    mean = total / n
-
-    if n % 2 == 1:
-        median = float(sorted_ns[n // 2])
-    else:
-        median = (sorted_ns[n // 2 - 1] + sorted_ns[n // 2]) / 2.0
-
-    p95 = float(sorted_ns[int(n * 0.95)])
-    p99 = float(sorted_ns[min(int(n * 0.99), n - 1)])
-
-    sq_diff_sum = sum((v - mean) ** 2 for v in sorted_ns)
-    stddev = math.sqrt(sq_diff_sum / n)
-
-    se = stddev / math.sqrt(n)
-    ci95 = [mean - 1.96 * se, mean + 1.96 * se]
-
-    return {
-        "mean_ns": mean, "median_ns": median,
-        "p95_ns": p95, "p99_ns": p99,
-        "stddev_ns": stddev, "ci95_ns": ci95,
-    }
-
-
-def remove_outliers_iqr(sorted_ns: list[int]) -> list[int]:
-    n = len(sorted_ns)
-    if n < 4:
-        return sorted_ns
-
-    q1 = float(sorted_ns[n // 4])
-    q3 = float(sorted_ns[3 * n // 4])
-    iqr = q3 - q1
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
-
-    return [v for v in sorted_ns if lower <= v <= upper]
-
-
 def measure_timer_overhead() -> int:
     samples = []
     for _ in range(10000):
@@ -134,33 +112,56 @@ def measure_timer_overhead() -> int:
 
 def run_benchmark(scenario: str, data_size: int | None,
                   warmup: int, iterations: int,
-                  bench_fn: callable) -> dict:
+                  bench_fn: callable,
+                  batch_min_elapsed_ns: int = BATCH_MIN_ELAPSED_NS,
+                  batch_max_calls: int = BATCH_MAX_CALLS) -> dict:
 
-    for i in range(warmup):
-        try:
-            bench_fn()
-        except Exception as e:
-            raise RuntimeError(
-                f"Benchmark '{scenario}' warmup iteration {i}: {e}"
-            ) from e
+    mem_before = memory_before()
 
-    raw_ns = []
-    for i in range(iterations):
-        start = time.perf_counter_ns()
-        bench_fn()
-        elapsed = time.perf_counter_ns() - start
-        raw_ns.append(elapsed)
+    warmup_info = warm_up(scenario, data_size, bench_fn, warmup, WARMUP_SETTINGS)
 
-    sorted_ns = sorted(raw_ns)
-    cleaned = remove_outliers_iqr(sorted_ns)
-    total_stats = compute_stats(cleaned)
+    sampler = PrecisionSampler(PRECISION_SETTINGS, data_size, iterations)
+    gc_monitor = GcMonitor(GC_SETTINGS)
+    raw_ns = []
+    batch_calls = []
+    with gc_monitor:
+        while (block := sampler.next_block(raw_ns)):
+            gc_monitor.before_block()
+            for i in range(block):
+                # Keep calling within one sample until the batch budget is used up,
+                # so sub-microsecond calls are not dominated by the timer floor.
+                collections = gc_monitor.collections
+                calls = 0
+                start = time.perf_counter_ns()
+                while True:
+                    bench_fn()
+                    calls += 1
+                    elapsed = time.perf_counter_ns() - start
+                    if elapsed >= batch_min_elapsed_ns or calls >= batch_max_calls:
+                        break
+                per_call = elapsed / calls
+                raw_ns.append(1 if 0.0 < per_call < 1.0 else round(per_call))
+                batch_calls.append(calls)
+                if gc_monitor.collections != collections:
+                    gc_monitor.tag(len(raw_ns) - 1)
+
+    # Memory accounting; the tracemalloc probe is a separate, untimed pass
+    memory = scenario_memory(mem_before, bench_fn, min(MEMORY_PROBE_CALLS, iterations))
+
+    # IQR outlier removal + summary stats (shared with the runner)
+    total_stats = summarize(raw_ns)
 
     return {
         "scenario": scenario,
         "data_size": data_size,
         "status": "PASS",
         "raw_iterations_ns": raw_ns,
+        "raw_batch_calls": batch_calls,
         "phases": {"total": total_stats},
+        "memory": memory,
+        "warmup": warmup_info,
+        "precision": sampler.info(),
+        "gc": gc_monitor.info(raw_ns),
     }
 
 
@@ -188,7 +189,15 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
             },
             "config": {
                 "warmup_iterations": WARMUP,
+                **WARMUP_SETTINGS.as_config(),
+                **PRECISION_SETTINGS.as_config(),
+                **GC_SETTINGS.as_config(),
                 "measured_iterations": ITERATIONS,
+                "batch_min_elapsed_ns": BATCH_MIN_ELAPSED_NS,
+                "batch_max_calls": BATCH_MAX_CALLS,
+                "raw_sample_format": RAW_SAMPLE_FORMAT,
+                "memory_probe_calls": MEMORY_PROBE_CALLS,
+                "array_sizes": ARRAY_SIZES,
                 "timer_overhead_ns": timer_overhead,
             },
         },
@@ -200,6 +209,9 @@ def write_results(benchmarks: list[dict], timer_overhead: int, init_ns: int):
     }
 
     os.makedirs(os.path.dirname(os.path.abspath(result_path)), exist_ok=True)
+    # Large sample lists go to .npy sidecars when METAFFI_TEST_RAW_FORMAT=npy
+    externalize_raw_samples(result, result_path, RAW_SAMPLE_FORMAT)
+
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2)
 
@@ -277,14 +289,16 @@ def main():
 
     # --- Scenario 4: Array sum (varying sizes) ---
     JInt = jpype.JInt
-    for size in [10, 100, 1000, 10000]:
+    for size in ARRAY_SIZES:
         if not _should_run(scenario_filter, "array_sum", size):
             continue
         selected_count += 1
-        # Build a Java int[][] with a single row [1..size]
-        row = jpype.JArray(JInt)(list(range(1, size + 1)))
+        # Build a Java int[][] with a single row [1..size] (bulk buffer copy)
+        row = jpype.JArray(JInt)(array_payload("i", size))
         arr = jpype.JArray(jpype.JArray(JInt))([row])
-        expected = size * (size + 1) // 2
+        # sumRaggedArray accumulates in a Java int
+        expected = expected_ascending_sum(size, 32)
+        warmup, iterations = array_iterations(size, WARMUP, ITERATIONS)
 
         def bench_array(a=arr, e=expected):
             result = int(ArrayFunctions.sumRaggedArray(a))
@@ -293,9 +307,10 @@ def main():
                     f"sumRaggedArray: got {result}, want {e}"
                 )
 
-        benchmarks.append(run_benchmark(
-            "array_sum", size, WARMUP, ITERATIONS, bench_array
-        ))
+        entry = run_benchmark("array_sum", size, warmup, iterations, bench_array)
+        entry["payload_bytes"] = size * element_size("i")
+        benchmarks.append(entry)
+        del row, arr, bench_array
 
     # --- Scenario: dynamic any echo (mixed array payload) ---
     any_echo_size = 100
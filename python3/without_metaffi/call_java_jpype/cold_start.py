@@ -0,0 +1,45 @@
+"""Cold start: fresh interpreter -> first Python3 -> Java call via JPype.
+
+Launched once per sample by benchmark_cold_start.run_cold_start; prints one
+METAFFI_COLD_START mark per stage and exits after the first call.
+runtime_load is JVM startup; module_load imports the guest class.
+"""
+
+import time
+
+_T0 = time.monotonic_ns()
+
+import os
+
+
+def _mark(stage, ns=None):
+    print(f"METAFFI_COLD_START {stage} {time.monotonic_ns() if ns is None else ns}", flush=True)
+
+
+METAFFI_SOURCE_ROOT = os.environ.get("METAFFI_SOURCE_ROOT")
+if not METAFFI_SOURCE_ROOT:
+    raise RuntimeError("METAFFI_SOURCE_ROOT environment variable not set.")
+
+JAVA_GUEST_JAR = os.path.join(
+    METAFFI_SOURCE_ROOT, "sdk", "test_modules", "guest_modules", "java",
+    "test_bin", "guest_java.jar"
+)
+if not os.path.isfile(JAVA_GUEST_JAR):
+    raise RuntimeError(f"Java guest JAR not found: {JAVA_GUEST_JAR}")
+_mark("interpreter_start", _T0)
+
+import jpype
+import jpype.imports
+_mark("sdk_import")
+
+jpype.startJVM(classpath=[JAVA_GUEST_JAR])
+_mark("runtime_load")
+
+from guest import CoreFunctions
+_mark("module_load")
+
+noop = CoreFunctions.noOp
+_mark("first_load_entity")
+
+noop()
+_mark("first_call")
@@ -0,0 +1,582 @@
+"""
+In-memory report model shared by generate_tables.py and generate_report.py.
+
+build_model() turns consolidated.json and complexity.json into the ordered
+content of tables.md: markdown lines (headings, summaries, notes) and Table
+objects. Every table cell keeps the formatted text shown in tables.md and the
+exact number behind it (nanoseconds, bytes, SLOC, ...), so figures plot the
+full-precision value instead of parsing the rounded text back.
+
+consolidate_results.py builds the model once from its in-memory result and
+renders tables.md and report.md in the same process; the two scripts can also
+be run on their own, each loading the JSON inputs directly.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+CONSOLIDATED_FILE = RESULTS_DIR / "consolidated.json"
+COMPLEXITY_FILE = RESULTS_DIR / "complexity.json"
+
+# Table kinds (what a table's rows and columns mean)
+PAIR_PERFORMANCE = "pair_performance"          # Scenario x mechanism means of one host -> guest pair
+PHASE_BREAKDOWN = "phase_breakdown"
+PRECISION_MISSES = "precision_misses"
+GC_ATTRIBUTION = "gc_attribution"
+COLD_START = "cold_start"
+ARRAY_THROUGHPUT = "array_throughput"
+CONTAINER_COMPARISON = "container_comparison"
+SCALING = "scaling"
+CONCURRENCY_THROUGHPUT = "concurrency_throughput"
+PROCESS_INIT = "process_init"
+COMPLEXITY_SUMMARY = "complexity_summary"      # Summary by Mechanism
+COMPLEXITY_PAIR_SLOC = "complexity_pair_sloc"  # Per-Pair Comparison (Benchmark-Only SLOC)
+COMPLEXITY_LANGUAGES = "complexity_languages"  # Languages Required per Pair
+
+COMPLEXITY_KINDS = (COMPLEXITY_SUMMARY, COMPLEXITY_PAIR_SLOC, COMPLEXITY_LANGUAGES)
+
+
+class ReportModelError(Exception):
+    """Raised when the report inputs are missing or malformed (fail-fast)."""
+
+
+@dataclass
+class Cell:
+    """One table cell: the text shown in tables.md and the exact value behind it."""
+
+    text: str
+    value: float | None = None
+
+
+@dataclass
+class Table:
+    kind: str
+    title: str  # text of the heading the table sits under
+    header: list[str]
+    rows: list[list[Cell]]
+    host: str | None = None
+    guest: str | None = None
+
+    def markdown(self) -> str:
+        lines = ["| " + " | ".join(self.header) + " |",
+                 "|" + "|".join("---" for _ in self.header) + "|"]
+        lines.extend("| " + " | ".join(c.text for c in row) + " |" for row in self.rows)
+        return "\n".join(lines)
+
+    def column(self, index: int) -> list[float | None]:
+        """Exact values of one column, top to bottom."""
+        return [row[index].value for row in self.rows]
+
+
+@dataclass
+class ReportModel:
+    consolidated: dict[str, Any]
+    complexity: dict[str, Any]
+    # tables.md in order: markdown lines and tables
+    blocks: list[str | Table] = field(default_factory=list)
+
+    @property
+    def tables(self) -> list[Table]:
+        return [b for b in self.blocks if isinstance(b, Table)]
+
+    def markdown(self) -> str:
+        return "\n".join(b.markdown() if isinstance(b, Table) else b for b in self.blocks)
+
+
+def load_json(path: Path) -> dict:
+    if not path.is_file():
+        raise ReportModelError(f"Missing required input file: {path}")
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ReportModelError(f"Malformed JSON in {path}: {e}") from e
+
+
+def load_model(consolidated_file: Path = CONSOLIDATED_FILE, complexity_file: Path = COMPLEXITY_FILE) -> ReportModel:
+    return build_model(load_json(consolidated_file), load_json(complexity_file))
+
+
+def build_model(consolidated: dict, complexity: dict) -> ReportModel:
+    """Model of tables.md: performance tables, then code complexity tables."""
+    try:
+        blocks = _performance_blocks(consolidated) + _complexity_blocks(complexity)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ReportModelError(f"Malformed report input: {type(e).__name__}: {e}") from e
+    return ReportModel(consolidated=consolidated, complexity=complexity, blocks=blocks)
+
+
+# ---------------------------------------------------------------------------
+# Cell formatting
+# ---------------------------------------------------------------------------
+
+def fmt_ns(ns) -> str:
+    """Format nanoseconds to human-readable string."""
+    if ns is None:
+        return "—"
+    ns = float(ns)
+    if ns < 1:
+        return f"{ns:.3f} ns"
+    elif ns < 1000:
+        return f"{ns:.1f} ns"
+    elif ns < 1_000_000:
+        return f"{ns/1000:.1f} µs"
+    elif ns < 1_000_000_000:
+        return f"{ns/1_000_000:.2f} ms"
+    else:
+        return f"{ns/1_000_000_000:.2f} s"
+
+
+def fmt_bytes(n) -> str:
+    """Format a (possibly negative) byte count with binary units."""
+    if n is None:
+        return "—"
+    n = float(n)
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n < 1024 or unit == "GiB":
+            return f"{sign}{n:.0f} {unit}" if unit == "B" else f"{sign}{n:.1f} {unit}"
+        n /= 1024
+
+
+def fmt_rate(bytes_per_sec) -> str:
+    """Format a throughput in decimal units (MB/s, GB/s)."""
+    if bytes_per_sec is None:
+        return "—"
+    rate = float(bytes_per_sec)
+    if rate < 1e6:
+        return f"{rate / 1e3:.1f} kB/s"
+    elif rate < 1e9:
+        return f"{rate / 1e6:.1f} MB/s"
+    return f"{rate / 1e9:.2f} GB/s"
+
+
+def _number(value) -> float | None:
+    return None if value is None else float(value)
+
+
+def ns_cell(ns) -> Cell:
+    return Cell(fmt_ns(ns), _number(ns))
+
+
+def bytes_cell(n) -> Cell:
+    return Cell(fmt_bytes(n), _number(n))
+
+
+def rate_cell(bytes_per_sec) -> Cell:
+    return Cell(fmt_rate(bytes_per_sec), _number(bytes_per_sec))
+
+
+def text_cell(text) -> Cell:
+    return Cell(str(text))
+
+
+# ---------------------------------------------------------------------------
+# Performance tables
+# ---------------------------------------------------------------------------
+
+def _performance_blocks(consolidated: dict) -> list[str | Table]:
+    """Summary, then per-scenario performance comparison tables."""
+
+    lines: list[str | Table] = []
+    lines.append("# MetaFFI Cross-Language Performance Comparison\n")
+    lines.append("## Benchmark Results Summary\n")
+    summary = consolidated['summary']
+    lines.append(f"- **Result files**: {summary['total_result_files']} of {summary.get('expected_triples', '?')} expected")
+    lines.append(f"- **Missing result files**: {summary.get('missing_result_files', 0)}")
+    lines.append(f"- **Benchmarks passed**: {summary['benchmarks']['passed']}")
+    lines.append(f"- **Benchmarks failed**: {summary['benchmarks']['failed']}")
+    lines.append("")
+
+    # Report missing triples if any
+    missing = consolidated.get("missing_triples", [])
+    if missing:
+        lines.append("### Missing Result Files\n")
+        for m in missing:
+            lines.append(f"- **{m['host']}->{m['guest']} [{m['mechanism']}]**: `{m['expected_file']}`")
+        lines.append("")
+
+    # Report failed benchmarks if any
+    failed = consolidated.get("failed_benchmarks", [])
+    if failed:
+        lines.append("### Failed Benchmarks\n")
+        for f_item in failed:
+            label = f"- **{f_item['host']}->{f_item['guest']} [{f_item['mechanism']}]** {f_item['scenario']}"
+            if f_item.get("error"):
+                label += f": {f_item['error'][:100]}"
+            lines.append(label)
+        lines.append("")
+
+    # Group comparisons by (host, guest)
+    pairs: dict[tuple[str, str], list[dict]] = {}
+    for comp in consolidated["comparisons"]:
+        key = (comp["host"], comp["guest"])
+        if key not in pairs:
+            pairs[key] = []
+        pairs[key].append(comp)
+
+    # For each pair, build a table: scenario vs mechanism
+    for (host, guest), scenarios in sorted(pairs.items()):
+        title = f"{host.title()} -> {guest.title()}"
+        lines.append(f"\n## {title}\n")
+
+        # Determine which mechanisms exist for this pair
+        all_mechs = set()
+        for s in scenarios:
+            for k in s:
+                if k not in ("host", "guest", "scenario") and s[k] is not None:
+                    all_mechs.add(k)
+
+        # Order: metaffi first, then native, then grpc
+        native_mechs = [m for m in all_mechs if m not in ("metaffi", "grpc")]
+        mech_order = []
+        if "metaffi" in all_mechs:
+            mech_order.append("metaffi")
+        mech_order.extend(sorted(native_mechs))
+        if "grpc" in all_mechs:
+            mech_order.append("grpc")
+
+        # Memory columns only where a harness recorded them (Python hosts)
+        mem_mechs = [m for m in mech_order
+                     if any(isinstance(s.get(m), dict) and "py_alloc_bytes_per_call" in s[m] for s in scenarios)]
+
+        header = ["Scenario"] + [f"{m} (mean)" for m in mech_order]
+        header += [col for m in mem_mechs for col in (f"{m} alloc/call", f"{m} RSS growth")]
+
+        rows = []
+        for s in sorted(scenarios, key=lambda x: x["scenario"]):
+            row = [text_cell(s["scenario"])]
+            for mech in mech_order:
+                data = s.get(mech)
+                if data and "mean_ns" in data:
+                    row.append(ns_cell(data["mean_ns"]))
+                elif data and "status" in data:
+                    row.append(text_cell(data["status"]))
+                else:
+                    row.append(text_cell("—"))
+            for mech in mem_mechs:
+                data = s.get(mech) or {}
+                row += [bytes_cell(data.get("py_alloc_bytes_per_call")), bytes_cell(data.get("rss_growth_bytes"))]
+            rows.append(row)
+        lines.append(Table(PAIR_PERFORMANCE, title, header, rows, host=host, guest=guest))
+
+    lines.extend(_phase_blocks(consolidated))
+    lines.extend(_precision_blocks(consolidated))
+    lines.extend(_gc_blocks(consolidated))
+    lines.extend(_cold_start_blocks(consolidated))
+    lines.extend(_array_throughput_blocks(consolidated))
+    lines.extend(_container_blocks(consolidated))
+    lines.extend(_scaling_blocks(consolidated))
+    return lines
+
+
+def _phase_blocks(consolidated: dict) -> list[str | Table]:
+    """Marshal / call / unmarshal split of the probed MetaFFI scenarios."""
+    rows = consolidated.get("phase_breakdown") or []
+    if not rows:
+        return []
+
+    groups: dict[tuple[str, str, str], list[dict]] = {}
+    for row in rows:
+        groups.setdefault((row["host"], row["guest"], row["mechanism"]), []).append(row)
+
+    lines: list[str | Table] = ["\n## Call Phase Breakdown\n"]
+    for (host, guest, mech), scenarios in sorted(groups.items()):
+        title = f"{host.title()} -> {guest.title()} ({mech})"
+        lines.append(f"\n### {title}\n")
+        header = ["Scenario", "Marshal", "Call (xcall)", "Unmarshal", "Call Share", "Total (timed)"]
+        table_rows = []
+        for r in scenarios:
+            share = r["call_share"]
+            share_cell = Cell(f"{share * 100:.0f}%", share) if share is not None else text_cell("—")
+            table_rows.append([
+                text_cell(r["scenario"]), ns_cell(r["marshal_ns"]), ns_cell(r["call_ns"]),
+                ns_cell(r["unmarshal_ns"]), share_cell, ns_cell(r["total_ns"]),
+            ])
+        lines.append(Table(PHASE_BREAKDOWN, title, header, table_rows, host=host, guest=guest))
+    return lines
+
+
+def _precision_blocks(consolidated: dict) -> list[str | Table]:
+    """Scenarios measured with run.precision_target that stopped at a cap first."""
+    counts = (consolidated.get("summary") or {}).get("precision") or {}
+    if not counts.get("targeted"):
+        return []
+
+    lines: list[str | Table] = ["\n## Sampling Precision\n"]
+    lines.append(
+        f"{counts['met']} of {counts['targeted']} targeted scenarios reached their median CI target."
+    )
+    misses = consolidated.get("precision_misses") or []
+    if misses:
+        lines.append("")
+        header = ["Host -> Guest", "Mechanism", "Scenario", "Target", "Achieved", "Iterations", "Stopped At"]
+        rows = []
+        for m in misses:
+            iterations = ", ".join(str(n) for n in m.get("iterations_per_repeat") or [])
+            stops = ", ".join(sorted({s for s in m.get("stop_per_repeat") or [] if s}))
+            rows.append([
+                text_cell(f"{m['host'].title()} -> {m['guest'].title()}"), text_cell(m["mechanism"]),
+                text_cell(m["scenario"]), Cell(f"±{m['target'] * 100:.1f}%", m["target"]),
+                Cell(f"±{m['half_width_rel'] * 100:.1f}%", m["half_width_rel"]),
+                text_cell(iterations), text_cell(stops),
+            ])
+        lines.append(Table(PRECISION_MISSES, "Sampling Precision", header, rows))
+    return lines
+
+
+def _gc_blocks(consolidated: dict) -> list[str | Table]:
+    """Host GC activity during measurement (run.gc_mode: trace) and its effect on p99."""
+    rows = consolidated.get("gc_attribution") or []
+    if not rows:
+        return []
+
+    lines: list[str | Table] = [
+        "\n## GC Attribution\n",
+        "Python3 hosts; raw samples (no IQR cleaning). \"GC samples\" had a collection inside them.\n",
+    ]
+    header = ["Host -> Guest", "Mechanism", "Scenario", "Collections (gen 0/1/2)", "GC Pause Total",
+              "GC Samples", "p99", "p99 w/o GC"]
+    table_rows = []
+    for r in rows:
+        gens = "/".join(str(n) for n in r["collections_by_generation"] or [])
+        table_rows.append([
+            text_cell(f"{r['host'].title()} -> {r['guest'].title()}"), text_cell(r["mechanism"]),
+            text_cell(r["scenario"]), Cell(f"{r['collections']} ({gens})", _number(r["collections"])),
+            ns_cell(r["pause_ns_total"]), Cell(str(r["gc_samples"]), _number(r["gc_samples"])),
+            ns_cell(r["p99_ns"]), ns_cell(r["p99_ns_without_gc"]),
+        ])
+    lines.append(Table(GC_ATTRIBUTION, "GC Attribution", header, table_rows))
+    return lines
+
+
+def _cold_start_blocks(consolidated: dict) -> list[str | Table]:
+    """Median per-stage cost from process launch to the first cross-language call."""
+    cold_start = consolidated.get("cold_start") or {}
+    entries = cold_start.get("mechanisms") or []
+    if not entries:
+        return []
+
+    stages = ["interpreter_start", "sdk_import", "runtime_load", "module_load",
+              "first_load_entity", "first_call", "exec_to_first_call"]
+    lines: list[str | Table] = [
+        "\n## Cold Start\n",
+        f"Median over {cold_start['metadata'].get('runs')} fresh-process launches per mechanism.\n",
+    ]
+    header = ["Host -> Guest", "Mechanism", "Interpreter", "SDK Import", "Runtime Load", "Module Load",
+              "First load_entity", "First Call", "Launch -> First Call"]
+    rows = []
+    for e in entries:
+        rows.append([text_cell(f"{e['host'].title()} -> {e['guest'].title()}"), text_cell(e["mechanism"])]
+                    + [ns_cell(e["stages"][stage]["median_ns"]) for stage in stages])
+    lines.append(Table(COLD_START, "Cold Start", header, rows))
+    return lines
+
+
+def _array_throughput_blocks(consolidated: dict) -> list[str | Table]:
+    """Bytes/sec per mechanism across the array size sweep, with peak RSS where recorded."""
+    rows = consolidated.get("array_throughput") or []
+    if not rows:
+        return []
+
+    groups: dict[tuple[str, str, str], list[dict]] = {}
+    for row in rows:
+        groups.setdefault((row["host"], row["guest"], row["scenario"]), []).append(row)
+
+    lines: list[str | Table] = ["\n## Array Payload Throughput\n"]
+    for (host, guest, scenario), sizes in sorted(groups.items()):
+        mechs = sorted({k for r in sizes for k in r} - {"host", "guest", "scenario", "data_size"},
+                       key=lambda m: (m != "metaffi", m == "grpc", m))
+        has_rss = any(r[m].get("peak_rss_bytes") is not None for r in sizes for m in mechs if m in r)
+        title = f"{host.title()} -> {guest.title()}: {scenario}"
+        lines.append(f"\n### {title}\n")
+        cols = [f"{m} throughput" for m in mechs] + ([f"{m} peak RSS" for m in mechs] if has_rss else [])
+        table_rows = []
+        for r in sorted(sizes, key=lambda x: x["data_size"]):
+            payload = next(r[m]["payload_bytes"] for m in mechs if m in r)
+            cells = [rate_cell(r[m]["bytes_per_sec"]) if m in r else text_cell("—") for m in mechs]
+            if has_rss:
+                cells += [bytes_cell(r[m].get("peak_rss_bytes")) if m in r else text_cell("—") for m in mechs]
+            table_rows.append([Cell(f"{r['data_size']:,}", r["data_size"]), bytes_cell(payload)] + cells)
+        lines.append(Table(ARRAY_THROUGHPUT, title, ["Elements", "Payload"] + cols, table_rows,
+                           host=host, guest=guest))
+    return lines
+
+
+def _container_blocks(consolidated: dict) -> list[str | Table]:
+    """MetaFFI array scenarios per Python input container, vs. the native baseline."""
+    rows = consolidated.get("container_comparisons") or []
+    if not rows:
+        return []
+
+    lines: list[str | Table] = ["\n## MetaFFI Array Inputs by Python Container\n"]
+    for row in rows:
+        natives = sorted(row["native"])
+        title = f"{row['host'].title()} -> {row['guest'].title()}: {row['scenario']}_{row['data_size']}"
+        lines.append(f"\n### {title}\n")
+        native_s = ", ".join(f"{n} {fmt_ns(row['native'][n])}" for n in natives) or "no native result"
+        lines.append(f"Native baseline: {native_s}\n")
+        header = ["Container", "MetaFFI Mean"] + [f"x {n}" for n in natives]
+        table_rows = []
+        for container, data in sorted(row["containers"].items(), key=lambda kv: kv[1]["mean_ns"]):
+            label = f"{container} (default)" if data["default"] else container
+            ratios = [Cell(f"{data['vs_native'][n]:.2f}x", data["vs_native"][n]) if n in data["vs_native"]
+                      else text_cell("—") for n in natives]
+            table_rows.append([text_cell(label), ns_cell(data["mean_ns"])] + ratios)
+        lines.append(Table(CONTAINER_COMPARISON, title, header, table_rows, host=row["host"], guest=row["guest"]))
+    return lines
+
+
+def _scaling_blocks(consolidated: dict) -> list[str | Table]:
+    """Throughput vs. worker count per mechanism: ops/s (scaling efficiency), p99."""
+    rows = consolidated.get("scaling_comparisons") or []
+    if not rows:
+        return []
+
+    groups: dict[tuple[str, str, str, str], list[dict]] = {}
+    for row in rows:
+        groups.setdefault((row["host"], row["guest"], row["mode"], row["scenario"]), []).append(row)
+
+    lines: list[str | Table] = ["\n## Concurrency Scaling\n"]
+    for (host, guest, mode, scenario), levels in sorted(groups.items()):
+        mechs = sorted({k for lv in levels for k in lv} - {"host", "guest", "mode", "scenario", "workers"},
+                       key=lambda m: (m != "metaffi", m == "grpc", m))
+        title = f"{host.title()} -> {guest.title()}: {scenario} ({mode})"
+        lines.append(f"\n### {title}\n")
+        level_label = "In Flight" if mode == "inflight" else "Workers"
+        header = [level_label] + [col for m in mechs for col in (f"{m} ops/s (eff.)", f"{m} p99")]
+        table_rows = []
+        for lv in sorted(levels, key=lambda x: x["workers"]):
+            row = [Cell(str(lv["workers"]), lv["workers"])]
+            for mech in mechs:
+                data = lv.get(mech)
+                if not data:
+                    row += [text_cell("—"), text_cell("—")]
+                    continue
+                eff = data.get("efficiency")
+                eff_s = f" ({eff:.2f})" if eff is not None else ""
+                row.append(Cell(f"{data['ops_per_sec']:,.0f}{eff_s}", data["ops_per_sec"]))
+                row.append(ns_cell(data["p99_ns"]) if data.get("p99_ns") is not None else text_cell("—"))
+            table_rows.append(row)
+        lines.append(Table(SCALING, title, header, table_rows, host=host, guest=guest))
+
+    lines.extend(_concurrency_throughput_blocks(consolidated))
+
+    init_rows = consolidated.get("scaling_process_init") or []
+    if init_rows:
+        title = "Process Scaling: Per-Process Initialization"
+        lines.append(f"\n### {title}\n")
+        header = ["Host -> Guest", "Mechanism", "Workers", "Spawn", "Runtime + Module Init", "RSS After Init"]
+        table_rows = []
+        for row in init_rows:
+            rss = row["median_rss_after_init_bytes"]
+            rss_cell = Cell(f"{rss / (1 << 20):.1f} MiB", rss) if rss is not None else text_cell("—")
+            table_rows.append([
+                text_cell(f"{row['host'].title()} -> {row['guest'].title()}"), text_cell(row["mechanism"]),
+                Cell(str(row["workers"]), row["workers"]), ns_cell(row["median_spawn_ns"]),
+                ns_cell(row["median_init_ns"]), rss_cell,
+            ])
+        lines.append(Table(PROCESS_INIT, title, header, table_rows))
+    return lines
+
+
+def _concurrency_throughput_blocks(consolidated: dict) -> list[str | Table]:
+    """ops/s at equal concurrency across threads, processes and grpc.aio in-flight depth."""
+    rows = consolidated.get("concurrency_throughput") or []
+    if not rows:
+        return []
+
+    groups: dict[tuple[str, str, str], list[dict]] = {}
+    for row in rows:
+        groups.setdefault((row["host"], row["guest"], row["scenario"]), []).append(row)
+
+    lines: list[str | Table] = [
+        "\n### Throughput Under Concurrency\n",
+        "N = threads / processes for MetaFFI and native, requests in flight for grpc.aio.\n",
+    ]
+    for (host, guest, scenario), levels in sorted(groups.items()):
+        cols = sorted({k for lv in levels for k in lv if "/" in k},
+                      key=lambda c: (c.split("/")[0] != "metaffi", c.split("/")[0] == "grpc", c))
+        title = f"{host.title()} -> {guest.title()}: {scenario}"
+        lines.append(f"\n#### {title}\n")
+        table_rows = []
+        for lv in sorted(levels, key=lambda x: x["concurrency"]):
+            cells = [Cell(f"{lv[c]['ops_per_sec']:,.0f}", lv[c]["ops_per_sec"]) if c in lv else text_cell("—")
+                     for c in cols]
+            table_rows.append([Cell(str(lv["concurrency"]), lv["concurrency"])] + cells)
+        lines.append(Table(CONCURRENCY_THROUGHPUT, title, ["N"] + [f"{c} ops/s" for c in cols], table_rows,
+                           host=host, guest=guest))
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Code complexity tables
+# ---------------------------------------------------------------------------
+
+def native_mechanism(mechs: dict[str, Any]) -> str | None:
+    """The dedicated-package mechanism of a complexity pair entry (first non-MetaFFI, non-gRPC)."""
+    return next((m for m in mechs if m not in ("metaffi", "grpc")), None)
+
+
+def _complexity_blocks(complexity: dict) -> list[str | Table]:
+    """Code complexity comparison tables."""
+
+    lines: list[str | Table] = []
+    lines.append("\n\n# Code Complexity Comparison\n")
+
+    # Aggregate summary
+    agg = complexity["aggregate_by_mechanism"]
+    title = "Summary by Mechanism"
+    lines.append(f"## {title}\n")
+    header = ["Mechanism", "Count", "Avg SLOC", "Avg Benchmark SLOC", "Avg Languages", "Avg Files", "Avg Max CC"]
+    rows = []
+    for mech, stats in sorted(agg.items()):
+        rows.append([
+            text_cell(mech),
+            Cell(str(stats["count"]), stats["count"]),
+            Cell(f"{stats['avg_source_sloc']:.0f}", stats["avg_source_sloc"]),
+            Cell(f"{stats['avg_benchmark_sloc']:.0f}", stats["avg_benchmark_sloc"]),
+            Cell(f"{stats['avg_language_count']:.1f}", stats["avg_language_count"]),
+            Cell(f"{stats['avg_file_count']:.1f}", stats["avg_file_count"]),
+            Cell(f"{stats['avg_max_cc']:.1f}", stats["avg_max_cc"]),
+        ])
+    lines.append(Table(COMPLEXITY_SUMMARY, title, header, rows))
+
+    # Per-pair comparison
+    title = "Per-Pair Comparison (Benchmark-Only SLOC)"
+    lines.append(f"\n## {title}\n")
+    lines.append("Excludes MetaFFI correctness tests for fair cross-mechanism comparison.\n")
+    rows = []
+    for comp in complexity["pair_comparisons"]:
+        mechs = comp["mechanisms"]
+        cells = []
+        for mech in ("metaffi", native_mechanism(mechs), "grpc"):
+            sloc = mechs.get(mech, {}).get("benchmark_only_sloc") if mech else None
+            cells.append(Cell("—", None) if sloc is None else Cell(str(sloc), sloc))
+        native_name = native_mechanism(mechs)
+        if native_name:
+            cells[1] = Cell(f"{cells[1].text} ({native_name})", cells[1].value)
+        rows.append([text_cell(f"{comp['host']}->{comp['guest']}"), cells[0], cells[1], cells[2]])
+    lines.append(Table(COMPLEXITY_PAIR_SLOC, title, ["Pair", "MetaFFI", "Native", "gRPC"], rows))
+
+    # Languages required
+    title = "Languages Required per Pair"
+    lines.append(f"\n## {title}\n")
+    rows = []
+    for comp in complexity["pair_comparisons"]:
+        mechs = comp["mechanisms"]
+        native_name = native_mechanism(mechs)
+        cells = [text_cell(f"{comp['host']}->{comp['guest']}")]
+        for mech in ("metaffi", native_name, "grpc"):
+            langs = mechs.get(mech, {}).get("languages", []) if mech else []
+            cells.append(Cell(f"{len(langs)} ({', '.join(langs)})", len(langs)))
+        rows.append(cells)
+    lines.append(Table(COMPLEXITY_LANGUAGES, title, ["Pair", "MetaFFI", "Native", "gRPC"], rows))
+
+    return lines
@@ -14,21 +14,37 @@ import argparse
 import copy
 import hashlib
 import json
-import math
 import os
 import re
+import selectors
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
+import benchmark_cold_start
+import benchmark_gc
+import benchmark_importtime
+import benchmark_inputs
+import benchmark_memory
+import benchmark_phases
+import benchmark_precision
+import benchmark_samples
+import benchmark_scaling
+import benchmark_stats
+import benchmark_warmup
+import build_cache
+
 
 TESTS_ROOT = Path(__file__).resolve().parent
 REPO_ROOT = TESTS_ROOT.parent
@@ -54,12 +70,26 @@ for h in HOSTS:
             ALL_TRIPLES.append((h, g, nm))
             ALL_TRIPLES.append((h, g, "grpc"))
 
-# C-as-guest triples (C is not a host, only a guest via the cpp runtime)
+# C-as-guest triples (C is not a host, only a guest via the cpp runtime).
+# The native baselines call the C guest module's exports directly; no gRPC.
 C_GUEST_HOSTS = ["go", "python3", "java"]
+C_NATIVE_MECHANISMS = {
+    "go": "cgo",
+    "python3": "ctypes",
+    "java": "jni",
+}
 for h in C_GUEST_HOSTS:
     ALL_TRIPLES.append((h, "c", "metaffi"))
+    ALL_TRIPLES.append((h, "c", C_NATIVE_MECHANISMS[h]))
 
 ALL_MECHANISMS = sorted({m for _, _, m in ALL_TRIPLES})
+ALL_GUESTS = sorted({g for _, g, _ in ALL_TRIPLES})
+
+# in_memory: pool repeats into one array. streaming: one repeat at a time, bounded memory.
+AGGREGATION_MODES = ("in_memory", "streaming")
+
+# Per-benchmark descriptors copied unchanged from the repeats into the aggregate.
+BENCH_DESCRIPTOR_FIELDS = ("input_container", "payload_bytes")
 
 
 class ConfigError(Exception):
@@ -76,9 +106,30 @@ class Config:
     include_correctness: bool
     repeats: int
     warmup_iterations: int
+    warmup_mode: str
+    warmup_window_calls: int
+    warmup_stable_windows: int
+    warmup_tolerance: float
+    warmup_max_calls: int
     measured_iterations: int
+    precision_target: float
+    precision_block_iterations: int
+    precision_max_iterations: int
+    precision_max_seconds: int
+    gc_mode: str
     batch_min_elapsed_ns: int
     batch_max_calls: int
+    scaling_threads: list[int]
+    scaling_processes: list[int]
+    scaling_inflight: list[int]
+    scaling_duration_ms: int
+    array_input_containers: list[str]
+    array_sizes: list[int]
+    large_array_iterations: int
+    list_array_max_size: int
+    memory_probe_calls: int
+    phase_probe_calls: int
+    cold_start_runs: int
     heartbeat_seconds: int
 
     hosts: list[str]
@@ -89,14 +140,22 @@ class Config:
     fail_fast: bool
     default_timeout_seconds: int
     java_metaffi_timeout_seconds: int
+    concurrency: int
+    pin_cpus: bool
+    benchmark_exclusive: bool
 
     canonical_results_dir: Path
     repeat_root_dir: Path
     write_repeat_files: bool
+    raw_sample_format: str
+    aggregation_mode: str
+    keep_stage_logs: bool
     run_complexity: bool
     run_consolidation: bool
     run_tables: bool
     run_report: bool
+    # Set from --importtime, not from the YAML config
+    import_profile: bool = False
 
 
 @dataclass
@@ -133,8 +192,8 @@ def parse_pair(pair: str) -> tuple[str, str]:
     if len(parts) != 2:
         raise ConfigError(f"Invalid pair '{pair}', expected host:guest")
     host, guest = parts[0].strip().lower(), parts[1].strip().lower()
-    if host not in HOSTS or guest not in HOSTS or host == guest:
-        raise ConfigError(f"Invalid pair '{pair}', allowed hosts={HOSTS} and host!=guest")
+    if host not in HOSTS or guest not in ALL_GUESTS or host == guest:
+        raise ConfigError(f"Invalid pair '{pair}', allowed hosts={HOSTS}, guests={ALL_GUESTS} and host!=guest")
     return host, guest
 
 
@@ -173,9 +232,30 @@ def load_config(path: Path) -> Config:
             "include_correctness",
             "repeats",
             "warmup_iterations",
+            "warmup_mode",
+            "warmup_window_calls",
+            "warmup_stable_windows",
+            "warmup_tolerance",
+            "warmup_max_calls",
             "measured_iterations",
+            "precision_target",
+            "precision_block_iterations",
+            "precision_max_iterations",
+            "precision_max_seconds",
+            "gc_mode",
             "batch_min_elapsed_ns",
             "batch_max_calls",
+            "scaling_threads",
+            "scaling_processes",
+            "scaling_inflight",
+            "scaling_duration_ms",
+            "array_input_containers",
+            "array_sizes",
+            "large_array_iterations",
+            "list_array_max_size",
+            "memory_probe_calls",
+            "phase_probe_calls",
+            "cold_start_runs",
             "heartbeat_seconds",
         },
         "run",
@@ -188,6 +268,9 @@ def load_config(path: Path) -> Config:
             "fail_fast",
             "default_timeout_seconds",
             "java_metaffi_timeout_seconds",
+            "concurrency",
+            "pin_cpus",
+            "benchmark_exclusive",
         },
         "execution",
     )
@@ -197,6 +280,9 @@ def load_config(path: Path) -> Config:
             "canonical_results_dir",
             "repeat_root_dir",
             "write_repeat_files",
+            "raw_sample_format",
+            "aggregation_mode",
+            "keep_stage_logs",
             "run_complexity",
             "run_consolidation",
             "run_tables",
@@ -224,10 +310,69 @@ def load_config(path: Path) -> Config:
 
     repeats = as_pos_int(run["repeats"], "run.repeats")
     warmup_iterations = as_pos_int(run["warmup_iterations"], "run.warmup_iterations", min_value=0)
+    warmup_mode = run["warmup_mode"]
+    if warmup_mode not in benchmark_warmup.WARMUP_MODES:
+        raise ConfigError(f"run.warmup_mode must be one of {list(benchmark_warmup.WARMUP_MODES)}")
+    warmup_window_calls = as_pos_int(run["warmup_window_calls"], "run.warmup_window_calls")
+    warmup_stable_windows = as_pos_int(run["warmup_stable_windows"], "run.warmup_stable_windows", min_value=2)
+    warmup_tolerance = run["warmup_tolerance"]
+    if isinstance(warmup_tolerance, bool) or not isinstance(warmup_tolerance, (int, float)) or not 0 < warmup_tolerance < 1:
+        raise ConfigError("run.warmup_tolerance must be a number in (0, 1)")
+    warmup_max_calls = as_pos_int(run["warmup_max_calls"], "run.warmup_max_calls")
+    if warmup_max_calls < warmup_iterations:
+        raise ConfigError("run.warmup_max_calls must be >= run.warmup_iterations")
     measured_iterations = as_pos_int(run["measured_iterations"], "run.measured_iterations")
+    precision_target = run["precision_target"]
+    if isinstance(precision_target, bool) or not isinstance(precision_target, (int, float)) or not 0 <= precision_target < 1:
+        raise ConfigError("run.precision_target must be a number in [0, 1) (0 = fixed measured_iterations)")
+    precision_block_iterations = as_pos_int(run["precision_block_iterations"], "run.precision_block_iterations")
+    precision_max_iterations = as_pos_int(run["precision_max_iterations"], "run.precision_max_iterations")
+    if precision_max_iterations < precision_block_iterations:
+        raise ConfigError("run.precision_max_iterations must be >= run.precision_block_iterations")
+    precision_max_seconds = as_pos_int(run["precision_max_seconds"], "run.precision_max_seconds")
+    gc_mode = run["gc_mode"]
+    if gc_mode not in benchmark_gc.GC_MODES:
+        raise ConfigError(f"run.gc_mode must be one of {list(benchmark_gc.GC_MODES)}")
     batch_min_elapsed_ns = as_pos_int(run["batch_min_elapsed_ns"], "run.batch_min_elapsed_ns")
     batch_max_calls = as_pos_int(run["batch_max_calls"], "run.batch_max_calls")
     heartbeat_seconds = as_pos_int(run["heartbeat_seconds"], "run.heartbeat_seconds")
+    scaling_threads = run["scaling_threads"]
+    if not isinstance(scaling_threads, list):
+        raise ConfigError("run.scaling_threads must be a list (empty disables thread scaling)")
+    scaling_threads = [as_pos_int(n, "run.scaling_threads[]") for n in scaling_threads]
+    scaling_processes = run["scaling_processes"]
+    if not isinstance(scaling_processes, list):
+        raise ConfigError("run.scaling_processes must be a list (empty disables process scaling)")
+    scaling_processes = [as_pos_int(n, "run.scaling_processes[]") for n in scaling_processes]
+    scaling_inflight = run["scaling_inflight"]
+    if not isinstance(scaling_inflight, list):
+        raise ConfigError("run.scaling_inflight must be a list (empty disables in-flight scaling)")
+    scaling_inflight = [as_pos_int(n, "run.scaling_inflight[]") for n in scaling_inflight]
+    scaling_duration_ms = as_pos_int(run["scaling_duration_ms"], "run.scaling_duration_ms")
+    array_input_containers = run["array_input_containers"]
+    if not isinstance(array_input_containers, list) or not all(
+        isinstance(c, str) and c in benchmark_inputs.ARRAY_CONTAINERS for c in array_input_containers
+    ):
+        raise ConfigError(
+            f"run.array_input_containers must be a list of {list(benchmark_inputs.ARRAY_CONTAINERS)}"
+        )
+    array_sizes = run["array_sizes"]
+    if not isinstance(array_sizes, list) or not array_sizes:
+        raise ConfigError("run.array_sizes must be a non-empty list of element counts")
+    try:
+        array_sizes = [benchmark_inputs.parse_size(n, "run.array_sizes[]") for n in array_sizes]
+    except benchmark_inputs.InputError as e:
+        raise ConfigError(str(e)) from e
+    if len(set(array_sizes)) != len(array_sizes):
+        raise ConfigError("run.array_sizes must not contain duplicates")
+    large_array_iterations = as_pos_int(run["large_array_iterations"], "run.large_array_iterations")
+    try:
+        list_array_max_size = benchmark_inputs.parse_size(run["list_array_max_size"], "run.list_array_max_size")
+    except benchmark_inputs.InputError as e:
+        raise ConfigError(str(e)) from e
+    memory_probe_calls = as_pos_int(run["memory_probe_calls"], "run.memory_probe_calls", min_value=0)
+    phase_probe_calls = as_pos_int(run["phase_probe_calls"], "run.phase_probe_calls", min_value=0)
+    cold_start_runs = as_pos_int(run["cold_start_runs"], "run.cold_start_runs", min_value=0)
 
     hosts = selection["hosts"]
     if not isinstance(hosts, list) or not hosts:
@@ -264,10 +409,30 @@ def load_config(path: Path) -> Config:
     java_metaffi_timeout_seconds = as_pos_int(
         execution["java_metaffi_timeout_seconds"], "execution.java_metaffi_timeout_seconds"
     )
+    concurrency = as_pos_int(execution["concurrency"], "execution.concurrency")
+    pin_cpus = as_bool(execution["pin_cpus"], "execution.pin_cpus")
+    benchmark_exclusive = as_bool(execution["benchmark_exclusive"], "execution.benchmark_exclusive")
+    if pin_cpus and not hasattr(os, "sched_setaffinity"):
+        raise ConfigError("execution.pin_cpus=true requires os.sched_setaffinity (Linux)")
 
     canonical_results_dir = (REPO_ROOT / str(outputs["canonical_results_dir"]))
     repeat_root_dir = (REPO_ROOT / str(outputs["repeat_root_dir"]))
     write_repeat_files = as_bool(outputs["write_repeat_files"], "outputs.write_repeat_files")
+    raw_sample_format = outputs["raw_sample_format"]
+    if raw_sample_format not in benchmark_samples.RAW_FORMATS:
+        raise ConfigError(
+            f"outputs.raw_sample_format must be one of {list(benchmark_samples.RAW_FORMATS)}"
+        )
+    aggregation_mode = outputs["aggregation_mode"]
+    if aggregation_mode not in AGGREGATION_MODES:
+        raise ConfigError(f"outputs.aggregation_mode must be one of {list(AGGREGATION_MODES)}")
+    if aggregation_mode == "streaming":
+        # Streaming writes pooled samples straight into sidecars and spills sorted runs with NumPy.
+        if raw_sample_format != "npy":
+            raise ConfigError("outputs.aggregation_mode=streaming requires outputs.raw_sample_format=npy")
+        if not benchmark_stats.HAVE_NUMPY:
+            raise ConfigError("outputs.aggregation_mode=streaming requires NumPy")
+    keep_stage_logs = as_bool(outputs["keep_stage_logs"], "outputs.keep_stage_logs")
     run_complexity = as_bool(outputs["run_complexity"], "outputs.run_complexity")
     run_consolidation = as_bool(outputs["run_consolidation"], "outputs.run_consolidation")
     run_tables = as_bool(outputs["run_tables"], "outputs.run_tables")
@@ -278,9 +443,30 @@ def load_config(path: Path) -> Config:
         include_correctness=include_correctness,
         repeats=repeats,
         warmup_iterations=warmup_iterations,
+        warmup_mode=warmup_mode,
+        warmup_window_calls=warmup_window_calls,
+        warmup_stable_windows=warmup_stable_windows,
+        warmup_tolerance=float(warmup_tolerance),
+        warmup_max_calls=warmup_max_calls,
         measured_iterations=measured_iterations,
+        precision_target=float(precision_target),
+        precision_block_iterations=precision_block_iterations,
+        precision_max_iterations=precision_max_iterations,
+        precision_max_seconds=precision_max_seconds,
+        gc_mode=gc_mode,
         batch_min_elapsed_ns=batch_min_elapsed_ns,
         batch_max_calls=batch_max_calls,
+        scaling_threads=scaling_threads,
+        scaling_processes=scaling_processes,
+        scaling_inflight=scaling_inflight,
+        scaling_duration_ms=scaling_duration_ms,
+        array_input_containers=array_input_containers,
+        array_sizes=array_sizes,
+        large_array_iterations=large_array_iterations,
+        list_array_max_size=list_array_max_size,
+        memory_probe_calls=memory_probe_calls,
+        phase_probe_calls=phase_probe_calls,
+        cold_start_runs=cold_start_runs,
         heartbeat_seconds=heartbeat_seconds,
         hosts=hosts_norm,
         pairs=pairs_norm,
@@ -289,9 +475,15 @@ def load_config(path: Path) -> Config:
         fail_fast=fail_fast,
         default_timeout_seconds=default_timeout_seconds,
         java_metaffi_timeout_seconds=java_metaffi_timeout_seconds,
+        concurrency=concurrency,
+        pin_cpus=pin_cpus,
+        benchmark_exclusive=benchmark_exclusive,
         canonical_results_dir=canonical_results_dir,
         repeat_root_dir=repeat_root_dir,
         write_repeat_files=write_repeat_files,
+        raw_sample_format=raw_sample_format,
+        aggregation_mode=aggregation_mode,
+        keep_stage_logs=keep_stage_logs,
         run_complexity=run_complexity,
         run_consolidation=run_consolidation,
         run_tables=run_tables,
@@ -426,19 +618,58 @@ def _find_jep_home() -> str | None:
         pass
     return None
 
-def _build_cpp_host_tests() -> None:
-    """Configure and build all 3 C++ host test executables via cmake.
+BUILD_CACHE_DIRNAME = "_build_cache"
+JAVA_GRPC_SERVER_DIR = TESTS_ROOT / "go" / "without_metaffi" / "call_java_grpc" / "server"
+GO_GRPC_SERVER_DIR = TESTS_ROOT / "python3" / "without_metaffi" / "call_go_grpc" / "server"
+
+
+def build_cache_dir(cfg: Config) -> Path:
+    return cfg.canonical_results_dir / BUILD_CACHE_DIRNAME
+
+
+INPUTS_DIRNAME = "_inputs"
+
+
+def array_input_dir(cfg: Config) -> Path:
+    return cfg.canonical_results_dir / INPUTS_DIRNAME
+
+
+# Payload the Python3 harnesses map per guest: array_echo (uint8) for Go, array_sum (int32) for Java.
+# The C and C++ guests have no array scenarios.
+ARRAY_INPUT_TYPECODES = {"go": "B", "java": "i"}
+
+
+def prepare_array_inputs(cfg: Config, triples: list[tuple[str, str, str]]) -> None:
+    """Generate the shared array payload files once, before any Python3 harness maps them."""
+    typecodes = sorted({
+        ARRAY_INPUT_TYPECODES[guest] for host, guest, _ in triples
+        if host == "python3" and guest in ARRAY_INPUT_TYPECODES
+    })
+    if not typecodes:
+        return
+    start = time.monotonic()
+    total = 0
+    for size in cfg.array_sizes:
+        for typecode in typecodes:
+            total += benchmark_inputs.input_file(array_input_dir(cfg), typecode, size).stat().st_size
+    print(
+        f"Array inputs: {len(cfg.array_sizes)} sizes, {total / 1e6:.1f} MB in {array_input_dir(cfg)} "
+        f"({time.monotonic() - start:.1f}s)"
+    )
+
+
+def _cpp_build_commands() -> tuple[list[str], list[str], Path]:
+    """Return the cmake configure and build commands for the C++ host tests.
 
     Uses TESTS_ROOT/cpp as the cmake source (dual-use CMakeLists.txt).
     Build dir is persistent at TESTS_ROOT/cpp/.cmake_build for incremental rebuilds.
     """
     cmake_exe = shutil.which("cmake")
     if not cmake_exe:
-        raise RunnerError("cmake not found on PATH; cannot build C++ host tests")
+        raise build_cache.BuildCacheError("cmake not found on PATH; cannot build C++ host tests")
 
     build_dir = TESTS_ROOT / "cpp" / ".cmake_build"
     src_dir   = TESTS_ROOT / "cpp"
-    build_dir.mkdir(parents=True, exist_ok=True)
 
     # Platform-specific generator and build args
     if sys.platform.startswith("win"):
@@ -469,9 +700,202 @@ def _build_cpp_host_tests() -> None:
 
     configure_cmd = [cmake_exe, "-G", generator, "-B", str(build_dir), "-S", str(src_dir)] + extra_args
     build_cmd     = [cmake_exe, "--build", str(build_dir)] + build_args
+    return configure_cmd, build_cmd, build_dir
+
+
+def _cpp_host_tests_spec() -> build_cache.BuildSpec:
+    """All C++ host test and benchmark executables, copied by CMake into METAFFI_HOME."""
+    mffi_home = os.environ.get("METAFFI_HOME", "")
+    if not mffi_home:
+        raise build_cache.BuildCacheError("METAFFI_HOME not set; cannot locate cpp host test binaries")
+    configure_cmd, build_cmd, _ = _cpp_build_commands()
+    exe_suffix = ".exe" if sys.platform.startswith("win") else ""
+    sources = build_cache.collect_sources(TESTS_ROOT / "cpp")
+    logger_src = Path(os.environ.get("METAFFI_SOURCE_ROOT", str(REPO_ROOT))) / "sdk" / "utils" / "logger_c.cpp"
+    if logger_src.is_file():
+        sources += (logger_src,)
+    return build_cache.BuildSpec(
+        name="cpp_host_tests",
+        command=tuple(build_cmd),
+        cwd=TESTS_ROOT / "cpp",
+        sources=sources,
+        outputs=tuple(
+            Path(mffi_home) / f"cpp_call_{g}_{kind}{exe_suffix}"
+            for g in ("go", "java", "python3")
+            for kind in ("test", "benchmark")
+        ),
+        toolchain=(("cmake", "--version"),),
+        flags=tuple(configure_cmd),
+        env=build_cache.compiler_env(),
+        # The executables live in METAFFI_HOME next to the SDK; the persistent
+        # cmake build dir already makes rebuilds incremental.
+        store_artifacts=False,
+    )
+
+
+def _build_cpp_host_tests() -> None:
+    """Configure and build the C++ host test and benchmark executables via cmake."""
+    configure_cmd, build_cmd, build_dir = _cpp_build_commands()
+    build_dir.mkdir(parents=True, exist_ok=True)
+    for cmd in (configure_cmd, build_cmd):
+        proc = subprocess.run(cmd, check=False)
+        if proc.returncode != 0:
+            raise build_cache.BuildCacheError(f"C++ host test build failed (exit code {proc.returncode}): {' '.join(cmd)}")
+
+
+def _java_c_jni_bridge_commands(bridge_dir: Path) -> tuple[list[str], list[str], Path]:
+    """Return the cmake configure and build commands for the Java -> C JNI bridge."""
+    cmake_exe = shutil.which("cmake")
+    if not cmake_exe:
+        raise build_cache.BuildCacheError("cmake not found on PATH; cannot build the C JNI bridge")
+    build_dir = bridge_dir / ".cmake_build"
+    configure_cmd = [cmake_exe, "-B", str(build_dir), "-S", str(bridge_dir), "-DCMAKE_BUILD_TYPE=Release"]
+    build_cmd     = [cmake_exe, "--build", str(build_dir), "--config", "Release"]
+    return configure_cmd, build_cmd, build_dir
+
+
+def _java_c_jni_bridge_spec(bridge_dir: Path) -> build_cache.BuildSpec:
+    """JNI library of the Java -> C baseline, placed next to its sources (java.library.path)."""
+    configure_cmd, build_cmd, _ = _java_c_jni_bridge_commands(bridge_dir)
+    if sys.platform.startswith("win"):
+        output = "c_jni_bridge.dll"
+    elif sys.platform == "darwin":
+        output = "libc_jni_bridge.dylib"
+    else:
+        output = "libc_jni_bridge.so"
+    return build_cache.BuildSpec(
+        name="java_c_jni_bridge",
+        command=tuple(build_cmd),
+        cwd=bridge_dir,
+        sources=build_cache.collect_sources(bridge_dir, suffixes=(".c", ".txt")),
+        outputs=(bridge_dir / output,),
+        toolchain=(("cmake", "--version"),),
+        flags=(*configure_cmd, f"JAVA_HOME={os.environ.get('JAVA_HOME', '')}"),
+        env=build_cache.compiler_env(),
+    )
+
+
+def _build_java_c_jni_bridge(bridge_dir: Path) -> None:
+    """Configure and build the Java -> C JNI bridge via cmake."""
+    configure_cmd, build_cmd, build_dir = _java_c_jni_bridge_commands(bridge_dir)
+    build_dir.mkdir(parents=True, exist_ok=True)
+    for cmd in (configure_cmd, build_cmd):
+        proc = subprocess.run(cmd, check=False)
+        if proc.returncode != 0:
+            raise build_cache.BuildCacheError(f"C JNI bridge build failed (exit code {proc.returncode}): {' '.join(cmd)}")
+
+
+def _java_grpc_server_spec(mvn: str) -> build_cache.BuildSpec:
+    """Shaded Java gRPC server JAR shared by the Go and Python3 gRPC clients."""
+    source_root = os.environ.get("METAFFI_SOURCE_ROOT", str(REPO_ROOT))
+    sources = build_cache.collect_sources(JAVA_GRPC_SERVER_DIR / "src") + (JAVA_GRPC_SERVER_DIR / "pom.xml",)
+    guest_jar = Path(source_root) / "sdk" / "test_modules" / "guest_modules" / "java" / "test_bin" / "guest_java.jar"
+    if guest_jar.is_file():
+        sources += (guest_jar,)
+    return build_cache.BuildSpec(
+        name="java_grpc_server",
+        command=(mvn, "package", "-q"),
+        cwd=JAVA_GRPC_SERVER_DIR,
+        sources=sources,
+        outputs=(JAVA_GRPC_SERVER_DIR / "target" / "benchmark-server-1.0-SNAPSHOT.jar",),
+        toolchain=((mvn, "--version"),),
+        env=(("METAFFI_SOURCE_ROOT", source_root),),
+    )
+
+
+def _java_test_classes_spec(triple: tuple[str, str, str], mvn: str) -> build_cache.BuildSpec:
+    """Compiled main + test classes (including generated protobuf stubs) of a Java test module."""
+    cwd = test_directory(triple)
+    return build_cache.BuildSpec(
+        name=f"{result_filename(triple).removesuffix('.json')}_classes",
+        # A miss means sources or toolchain changed: start from a clean target/
+        # so no .class file generated by a previous protobuf version survives.
+        command=(mvn, "clean", "test-compile", "-pl", "."),
+        cwd=cwd,
+        sources=build_cache.collect_sources(cwd / "src") + (cwd / "pom.xml",),
+        outputs=(cwd / "target" / "classes", cwd / "target" / "test-classes"),
+        toolchain=((mvn, "--version"),),
+        store_artifacts=False,
+    )
+
+
+def stage_build_specs(
+    triple: tuple[str, str, str],
+    stage: str,
+) -> list[tuple[build_cache.BuildSpec, Callable[[], None] | None]]:
+    """Cached builds a stage depends on, with their build step (None = run spec.command)."""
+    host, guest, mechanism = triple
+    if host == "cpp" and mechanism == "metaffi":
+        return [(_cpp_host_tests_spec(), _build_cpp_host_tests)]
+    if stage == "correctness":
+        return []
 
-    subprocess.run(configure_cmd, check=True)
-    subprocess.run(build_cmd,     check=True)
+    specs: list[tuple[build_cache.BuildSpec, Callable[[], None] | None]] = []
+    if (host, guest, mechanism) == ("python3", "go", "ctypes"):
+        specs.append((build_cache.go_build_spec(
+            "python3_go_ctypes_bridge",
+            test_directory(triple) / "go_bridge",
+            "bridge.dll",
+            build_flags=("-buildmode=c-shared",),
+        ), None))
+    if guest == "go" and mechanism == "grpc":
+        specs.append((build_cache.go_build_spec("go_grpc_server", GO_GRPC_SERVER_DIR, "server.exe"), None))
+    if guest == "java" and mechanism == "grpc":
+        specs.append((_java_grpc_server_spec(_find_maven()), None))
+    if (host, guest, mechanism) == ("java", "go", "jni"):
+        go_bridge_dir = test_directory(triple) / "go_bridge"
+        if not go_bridge_dir.is_dir():
+            raise RunnerError(f"Missing Go JNI bridge directory: {go_bridge_dir}")
+        build_script = go_bridge_dir / "build.ps1"
+        if not build_script.is_file():
+            raise RunnerError(f"Missing Go JNI bridge build script: {build_script}")
+        specs.append((build_cache.go_build_spec(
+            "java_go_jni_bridge",
+            go_bridge_dir,
+            "go_jni_bridge.dll",
+            command=("powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", str(build_script)),
+            extra_sources=(build_script,),
+            flags=(f"JAVA_HOME={os.environ.get('JAVA_HOME', '')}",),
+        ), None))
+    if (host, guest, mechanism) == ("java", "c", "jni"):
+        c_bridge_dir = test_directory(triple) / "c_bridge"
+        if not (c_bridge_dir / "CMakeLists.txt").is_file():
+            raise RunnerError(f"Missing C JNI bridge CMakeLists.txt: {c_bridge_dir}")
+        specs.append((_java_c_jni_bridge_spec(c_bridge_dir), lambda: _build_java_c_jni_bridge(c_bridge_dir)))
+    if host == "java" and mechanism == "grpc":
+        specs.append((_java_test_classes_spec(triple, _find_maven()), None))
+    return specs
+
+
+def ensure_stage_builds(triple: tuple[str, str, str], stage: str, cfg: Config) -> None:
+    """Bring every build the stage depends on up to date through the build cache."""
+    cache = build_cache.BuildCache(build_cache_dir(cfg))
+    for spec, build in stage_build_specs(triple, stage):
+        outcome = cache.ensure(spec, build)
+        if outcome != "hit":
+            print(f"        build cache: {spec.name} {outcome}")
+
+
+def _cpp_host_exe(guest: str, kind: str, env: dict[str, str]) -> str:
+    """Path of cpp_call_<guest>_<kind>; prepends the guest plugin dir to the library path in env."""
+    # C++ tests and benchmarks are built by CMake (dual-use CMakeLists.txt) and placed
+    # in METAFFI_HOME by the cached build step (ensure_stage_builds)
+    mffi_home = os.environ.get("METAFFI_HOME", "")
+    if not mffi_home:
+        raise RunnerError("METAFFI_HOME not set; cannot locate cpp host test binaries")
+    bin_dir    = Path(mffi_home)
+    exe_suffix = ".exe" if sys.platform.startswith("win") else ""
+    exe        = str(bin_dir / f"cpp_call_{guest}_{kind}{exe_suffix}")
+
+    # At runtime the exe needs: METAFFI_HOME/<guest> for the guest plugin DLLs/SOs.
+    # spdlog is linked header-only so no vcpkg DLLs are needed at runtime.
+    path_sep = ";" if sys.platform.startswith("win") else ":"
+    extra_dirs = [str(bin_dir / guest)]  # METAFFI_HOME/<guest>
+    path_key = "PATH" if sys.platform.startswith("win") else "LD_LIBRARY_PATH"
+
+    existing = env.get(path_key, os.environ.get(path_key, ""))
+    env[path_key] = path_sep.join(extra_dirs + ([existing] if existing else []))
+    return exe
 
 
 def build_stage_commands(
@@ -488,9 +912,32 @@ def build_stage_commands(
 
     env: dict[str, str] = {
         "METAFFI_TEST_WARMUP": str(cfg.warmup_iterations),
+        benchmark_warmup.WARMUP_MODE_ENV: cfg.warmup_mode,
+        benchmark_warmup.WARMUP_WINDOW_ENV: str(cfg.warmup_window_calls),
+        benchmark_warmup.WARMUP_STABLE_WINDOWS_ENV: str(cfg.warmup_stable_windows),
+        benchmark_warmup.WARMUP_TOLERANCE_ENV: str(cfg.warmup_tolerance),
+        benchmark_warmup.WARMUP_MAX_CALLS_ENV: str(cfg.warmup_max_calls),
         "METAFFI_TEST_ITERATIONS": str(cfg.measured_iterations),
+        benchmark_precision.PRECISION_TARGET_ENV: str(cfg.precision_target),
+        benchmark_precision.PRECISION_BLOCK_ENV: str(cfg.precision_block_iterations),
+        benchmark_precision.PRECISION_MAX_ITERATIONS_ENV: str(cfg.precision_max_iterations),
+        benchmark_precision.PRECISION_MAX_SECONDS_ENV: str(cfg.precision_max_seconds),
+        benchmark_gc.GC_MODE_ENV: cfg.gc_mode,
         "METAFFI_TEST_BATCH_MIN_ELAPSED_NS": str(cfg.batch_min_elapsed_ns),
         "METAFFI_TEST_BATCH_MAX_CALLS": str(cfg.batch_max_calls),
+        benchmark_scaling.SCALING_THREADS_ENV: ",".join(str(n) for n in cfg.scaling_threads),
+        benchmark_scaling.SCALING_PROCESSES_ENV: ",".join(str(n) for n in cfg.scaling_processes),
+        benchmark_scaling.SCALING_INFLIGHT_ENV: ",".join(str(n) for n in cfg.scaling_inflight),
+        benchmark_scaling.SCALING_DURATION_ENV: str(cfg.scaling_duration_ms),
+        benchmark_inputs.ARRAY_CONTAINERS_ENV: ",".join(cfg.array_input_containers),
+        benchmark_inputs.ARRAY_SIZES_ENV: ",".join(str(n) for n in cfg.array_sizes),
+        benchmark_inputs.LARGE_ARRAY_ITERATIONS_ENV: str(cfg.large_array_iterations),
+        benchmark_inputs.LIST_ARRAY_MAX_SIZE_ENV: str(cfg.list_array_max_size),
+        benchmark_inputs.INPUT_DIR_ENV: str(array_input_dir(cfg)),
+        benchmark_memory.MEMORY_PROBE_CALLS_ENV: str(cfg.memory_probe_calls),
+        benchmark_phases.PHASE_PROBE_CALLS_ENV: str(cfg.phase_probe_calls),
+        benchmark_samples.RAW_FORMAT_ENV: cfg.raw_sample_format,
+        build_cache.BUILD_CACHE_ENV: str(build_cache_dir(cfg)),
         "METAFFI_TEST_MODE": "benchmarks" if stage == "benchmark" else "correctness",
     }
     if stage == "benchmark" and scenario_selectors:
@@ -517,28 +964,7 @@ def build_stage_commands(
             mvn = _find_maven()
             return [[mvn, "test", "-Dtest=TestCorrectness", "-pl", "."]], cwd, env
         if host == "cpp":
-            # C++ tests are built by CMake (dual-use CMakeLists.txt) and placed in METAFFI_HOME
-            mffi_home = os.environ.get("METAFFI_HOME", "")
-            if not mffi_home:
-                raise RunnerError("METAFFI_HOME not set; cannot locate cpp host test binaries")
-            bin_dir    = Path(mffi_home)
-            exe_suffix = ".exe" if sys.platform.startswith("win") else ""
-            exe        = str(bin_dir / f"cpp_call_{guest}_test{exe_suffix}")
-
-            # Build all 3 executables when any one is missing
-            if not Path(exe).exists():
-                _build_cpp_host_tests()
-
-            # At runtime the exe needs: METAFFI_HOME/<guest> for the guest plugin DLLs/SOs.
-            # spdlog is linked header-only so no vcpkg DLLs are needed at runtime.
-            path_sep = ";" if sys.platform.startswith("win") else ":"
-            extra_dirs = [str(bin_dir / guest)]  # METAFFI_HOME/<guest>
-            path_key = "PATH" if sys.platform.startswith("win") else "LD_LIBRARY_PATH"
-
-            existing = env.get(path_key, os.environ.get(path_key, ""))
-            env[path_key] = path_sep.join(extra_dirs + ([existing] if existing else []))
-
-            return [[exe]], cwd, env
+            return [[_cpp_host_exe(guest, "test", env)]], cwd, env
         raise RunnerError(f"Unsupported host: {host}")
 
     if host == "go":
@@ -559,32 +985,22 @@ def build_stage_commands(
         # Avoid method-level selector flakiness on default-package tests in Surefire.
         test_class = "TestBenchmark" if mechanism == "metaffi" else "BenchmarkTest"
 
-        if mechanism == "jni" and guest == "go":
-            go_bridge_dir = cwd / "go_bridge"
-            if not go_bridge_dir.is_dir():
-                raise RunnerError(f"Missing Go JNI bridge directory: {go_bridge_dir}")
-            build_script = go_bridge_dir / "build.ps1"
-            if not build_script.is_file():
-                raise RunnerError(f"Missing Go JNI bridge build script: {build_script}")
-            return [
-                ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", str(build_script)],
-                [mvn, "test", f"-Dtest={test_class}", "-pl", "."],
-            ], cwd, env
-
         if mechanism == "jep":
             jep_home = _find_jep_home()
             if jep_home:
                 env["JEP_HOME"] = jep_home
 
-        # gRPC Java modules generate protobuf stubs under target/.  Stale
-        # .class files from a previous protobuf version cause NoSuchMethodError
-        # at runtime.  We nuke the entire target/ dir via the OS shell before
-        # running Maven (shutil.rmtree silently fails on Windows file locks).
+        # gRPC Java modules generate protobuf stubs under target/.  The classes
+        # are compiled by the cached build step (ensure_stage_builds), so only
+        # the Surefire goal runs here; no per-repeat protoc/javac.
         if mechanism == "grpc":
-            return [[mvn, "compile", "test", f"-Dtest={test_class}", "-pl", "."]], cwd, env
+            return [[mvn, "surefire:test", f"-Dtest={test_class}", "-pl", "."]], cwd, env
 
         return [[mvn, "test", f"-Dtest={test_class}", "-pl", "."]], cwd, env
 
+    if host == "cpp" and mechanism == "metaffi":
+        return [[_cpp_host_exe(guest, "benchmark", env)]], cwd, env
+
     raise RunnerError(f"Unsupported host: {host}")
 
 
@@ -642,8 +1058,30 @@ def format_command_display(commands: list[list[str]], cwd: Path, env: dict[str,
         "METAFFI_TEST_RESULTS_FILE",
         "METAFFI_TEST_ITERATIONS",
         "METAFFI_TEST_WARMUP",
+        benchmark_warmup.WARMUP_MODE_ENV,
+        benchmark_warmup.WARMUP_WINDOW_ENV,
+        benchmark_warmup.WARMUP_STABLE_WINDOWS_ENV,
+        benchmark_warmup.WARMUP_TOLERANCE_ENV,
+        benchmark_warmup.WARMUP_MAX_CALLS_ENV,
+        benchmark_precision.PRECISION_TARGET_ENV,
+        benchmark_precision.PRECISION_BLOCK_ENV,
+        benchmark_precision.PRECISION_MAX_ITERATIONS_ENV,
+        benchmark_precision.PRECISION_MAX_SECONDS_ENV,
+        benchmark_gc.GC_MODE_ENV,
         "METAFFI_TEST_BATCH_MIN_ELAPSED_NS",
         "METAFFI_TEST_BATCH_MAX_CALLS",
+        benchmark_scaling.SCALING_THREADS_ENV,
+        benchmark_scaling.SCALING_PROCESSES_ENV,
+        benchmark_scaling.SCALING_INFLIGHT_ENV,
+        benchmark_scaling.SCALING_DURATION_ENV,
+        benchmark_inputs.ARRAY_CONTAINERS_ENV,
+        benchmark_inputs.ARRAY_SIZES_ENV,
+        benchmark_inputs.LARGE_ARRAY_ITERATIONS_ENV,
+        benchmark_inputs.INPUT_DIR_ENV,
+        benchmark_memory.MEMORY_PROBE_CALLS_ENV,
+        benchmark_phases.PHASE_PROBE_CALLS_ENV,
+        benchmark_samples.RAW_FORMAT_ENV,
+        build_cache.BUILD_CACHE_ENV,
         "METAFFI_TEST_SCENARIOS",
         "METAFFI_TEST_MODE",
         "JEP_HOME",
@@ -653,6 +1091,158 @@ def format_command_display(commands: list[list[str]], cwd: Path, env: dict[str,
     return " ; ".join(parts)
 
 
+OUTPUT_TAIL_LINES = 150
+_READ_CHUNK = 64 * 1024
+# A "line" longer than this without a newline is cut so the tail stays bounded.
+_MAX_PARTIAL_LINE = 64 * 1024
+
+
+class OutputTail:
+    """Last OUTPUT_TAIL_LINES non-blank lines of a child's output, optionally teed to a log file."""
+
+    def __init__(
+        self,
+        log_path: Path | None = None,
+        max_lines: int = OUTPUT_TAIL_LINES,
+        import_lines: list[str] | None = None,
+    ):
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        # -X importtime lines go here instead of the tail, where they would crowd out errors
+        self.import_lines = import_lines
+        self._partial = b""
+        self._lock = threading.Lock()
+        self._log = None
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(log_path, "wb")
+
+    def _push(self, raw: bytes) -> None:
+        line = raw.rstrip(b"\r").decode("utf-8", errors="replace")
+        if self.import_lines is not None and line.startswith(benchmark_importtime.IMPORT_TIME_PREFIX):
+            self.import_lines.append(line)
+        elif line.strip():
+            self.lines.append(line)
+
+    def feed(self, data: bytes) -> None:
+        with self._lock:
+            if self._log is not None:
+                self._log.write(data)
+            *complete, self._partial = (self._partial + data).split(b"\n")
+            for raw in complete:
+                self._push(raw)
+            if len(self._partial) > _MAX_PARTIAL_LINE:
+                self._push(self._partial)
+                self._partial = b""
+
+    def close(self) -> str:
+        with self._lock:
+            if self._partial:
+                self._push(self._partial)
+                self._partial = b""
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            return "\n".join(self.lines)
+
+
+def _pidfd_open(pid: int) -> int | None:
+    """Linux pidfd for the child: readable once it exits. None where unsupported."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _capture_with_selector(
+    proc: subprocess.Popen,
+    tail: OutputTail,
+    deadline: float,
+    heartbeat: Callable[[], float],
+) -> bool:
+    """Drain proc.stdout until the child exits or deadline passes (POSIX). Returns timed_out.
+
+    The child's exit is signalled by a pidfd (Linux) so a grandchild that keeps
+    the pipe open (e.g. a leaked gRPC server) cannot delay completion; without a
+    pidfd, EOF on the pipe ends the capture and waitpid is checked at every wakeup.
+    """
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
+    pidfd = _pidfd_open(proc.pid)
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ, "out")
+    if pidfd is not None:
+        sel.register(pidfd, selectors.EVENT_READ, "exit")
+
+    def drain() -> bool:
+        """Read everything available; True on EOF."""
+        while True:
+            try:
+                data = os.read(fd, _READ_CHUNK)
+            except BlockingIOError:
+                return False
+            if not data:
+                return True
+            tail.feed(data)
+
+    try:
+        pipe_open = True
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return True
+            next_beat = heartbeat()
+            timeout = min(deadline, next_beat) - now
+            if pidfd is None:
+                # Nothing signals the exit itself: re-check waitpid briefly after EOF,
+                # and at least every 0.5 s while a grandchild may hold the pipe open.
+                timeout = min(timeout, 0.5 if pipe_open else 0.05)
+            for key, _ in sel.select(max(timeout, 0.0)):
+                if key.data == "out" and drain():
+                    sel.unregister(fd)
+                    pipe_open = False
+            if proc.poll() is not None:
+                if pipe_open:
+                    drain()
+                return False
+    finally:
+        sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _capture_with_thread(
+    proc: subprocess.Popen,
+    tail: OutputTail,
+    deadline: float,
+    heartbeat: Callable[[], float],
+) -> bool:
+    """Windows fallback (no select() on pipes): a reader thread feeds the tail,
+    the calling thread blocks in proc.wait() until exit, heartbeat or deadline."""
+    def reader() -> None:
+        for data in iter(lambda: proc.stdout.read1(_READ_CHUNK), b""):
+            tail.feed(data)
+
+    t = threading.Thread(target=reader, name=f"stage-output-{proc.pid}", daemon=True)
+    t.start()
+    timed_out = False
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            timed_out = True
+            break
+        try:
+            proc.wait(timeout=min(deadline, heartbeat()) - now)
+            break
+        except subprocess.TimeoutExpired:
+            continue
+    if not timed_out:
+        # The pipe may be held open by a grandchild; do not wait for it indefinitely.
+        t.join(timeout=2.0)
+    return timed_out
+
+
 def run_command_with_heartbeat(
     cmd: list[str],
     cwd: Path,
@@ -660,51 +1250,85 @@ def run_command_with_heartbeat(
     timeout_seconds: int,
     heartbeat_seconds: int,
     heartbeat_label: str,
+    cpus: list[int] | None = None,
+    log_path: Path | None = None,
+    import_lines: list[str] | None = None,
 ) -> tuple[int, float, str, bool]:
+    """Run cmd, keep the last OUTPUT_TAIL_LINES lines of stdout+stderr and return
+    (returncode, elapsed_seconds, tail, timed_out). The full output is written to
+    log_path when given. Completion is detected as soon as the child exits.
+    -X importtime lines are collected into import_lines when given.
+    """
     start = time.monotonic()
+    taskset = shutil.which("taskset") if cpus else None
+    if taskset:
+        cmd = [taskset, "-c", ",".join(str(c) for c in cpus)] + cmd
+    deadline = start + timeout_seconds
     next_heartbeat = start + heartbeat_seconds
 
-    with tempfile.NamedTemporaryFile(mode="w+b", delete=False) as tf:
-        log_path = Path(tf.name)
+    def heartbeat() -> float:
+        """Print a heartbeat when due; return the time of the next one."""
+        nonlocal next_heartbeat
+        now = time.monotonic()
+        if now >= next_heartbeat:
+            print(f"        [alive] {heartbeat_label} | elapsed={now - start:.1f}s")
+            next_heartbeat = now + heartbeat_seconds
+        return next_heartbeat
 
+    tail = OutputTail(log_path, import_lines=import_lines)
     try:
-        with open(log_path, "wb") as logf:
-            proc = subprocess.Popen(
-                cmd,
-                cwd=str(cwd),
-                env=env,
-                stdout=logf,
-                stderr=subprocess.STDOUT,
-            )
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        try:
+            if cpus and not taskset:
+                # No taskset: pin right after spawn; threads the child creates later inherit it.
+                os.sched_setaffinity(proc.pid, cpus)
 
-            timed_out = False
-            while True:
-                rc = proc.poll()
-                now = time.monotonic()
-                if rc is not None:
-                    break
-                elapsed = now - start
-                if elapsed > timeout_seconds:
-                    proc.kill()
-                    proc.wait()
-                    timed_out = True
-                    rc = -99999
-                    break
-                if now >= next_heartbeat:
-                    print(f"        [alive] {heartbeat_label} | elapsed={elapsed:.1f}s")
-                    next_heartbeat = now + heartbeat_seconds
-                time.sleep(0.5)
-
-        elapsed = time.monotonic() - start
-        full_log = log_path.read_text(encoding="utf-8", errors="replace")
-        lines = [ln for ln in full_log.splitlines() if ln.strip()]
-        tail = "\n".join(lines[-150:]) if lines else ""
-        return rc, elapsed, tail, timed_out
+            capture = _capture_with_thread if sys.platform.startswith("win") else _capture_with_selector
+            timed_out = capture(proc, tail, deadline, heartbeat)
+            if timed_out:
+                proc.kill()
+                proc.wait()
+                rc = -99999
+            else:
+                rc = proc.wait()
+        finally:
+            proc.stdout.close()
     finally:
-        try:
-            log_path.unlink(missing_ok=True)
-        except OSError:
-            pass
+        text = tail.close()
+
+    elapsed = time.monotonic() - start
+    return rc, elapsed, text, timed_out
+
+
+def store_import_profile(
+    triple: tuple[str, str, str],
+    stage: str,
+    cfg: Config,
+    repeat_index: int | None,
+    result_path: Path | None,
+    import_lines: list[str],
+) -> None:
+    """Write the stage's -X importtime profile and embed its summary in the benchmark result."""
+    try:
+        summary = benchmark_importtime.summarize_importtime(benchmark_importtime.parse_importtime(import_lines))
+    except benchmark_importtime.ImportTimeError as e:
+        raise RunnerError(f"{triple_label(triple)} stage={stage}: {e}") from e
+    name = f"{result_filename(triple).removesuffix('.json')}__{stage}"
+    if repeat_index is not None:
+        name += f"__r{repeat_index:02d}"
+    profile_path = cfg.canonical_results_dir / benchmark_importtime.IMPORT_PROFILE_DIRNAME / f"{name}.json"
+    benchmark_importtime.write_import_profile(profile_path, summary, import_lines)
+
+    if result_path is not None and result_path.is_file():
+        data = json.loads(result_path.read_text(encoding="utf-8"))
+        data["import_profile"] = summary
+        result_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
 def run_stage(
@@ -714,7 +1338,24 @@ def run_stage(
     repeat_index: int | None,
     result_path: Path | None,
     scenario_selectors: list[str] | None,
+    cpus: list[int] | None = None,
+    log_dir: Path | None = None,
 ) -> StageOutcome:
+    try:
+        ensure_stage_builds(triple, stage, cfg)
+    except build_cache.BuildCacheError as e:
+        return StageOutcome(
+            host=triple[0],
+            guest=triple[1],
+            mechanism=triple[2],
+            stage=stage,
+            repeat_index=repeat_index,
+            status="FAIL",
+            elapsed_seconds=0.0,
+            command_display="(build)",
+            error_message=str(e),
+        )
+
     commands, cwd, stage_env = build_stage_commands(triple, stage, cfg, result_path, scenario_selectors)
     if not commands:
         return StageOutcome(
@@ -735,6 +1376,11 @@ def run_stage(
     if "METAFFI_TEST_SCENARIOS" not in stage_env:
         env.pop("METAFFI_TEST_SCENARIOS", None)
 
+    import_lines: list[str] | None = None
+    if cfg.import_profile and triple[0] == "python3":
+        import_lines = []
+        commands = [[c[0], "-X", "importtime", *c[1:]] if c[0] == sys.executable else c for c in commands]
+
     command_display = format_command_display(commands, cwd, stage_env)
     timeout = timeout_for(triple, cfg)
 
@@ -748,6 +1394,14 @@ def run_stage(
             label += f" phase={phase_i}/{len(commands)}"
         attempt = 1
         while True:
+            log_path = None
+            if log_dir is not None:
+                log_name = f"{result_filename(triple).removesuffix('.json')}__{stage}"
+                if multi_phase:
+                    log_name += f"__phase{phase_i}"
+                if attempt > 1:
+                    log_name += f"__retry{attempt}"
+                log_path = log_dir / f"{log_name}.log"
             rc, elapsed, tail, timed_out = run_command_with_heartbeat(
                 cmd=cmd,
                 cwd=cwd,
@@ -755,6 +1409,9 @@ def run_stage(
                 timeout_seconds=timeout,
                 heartbeat_seconds=cfg.heartbeat_seconds,
                 heartbeat_label=label if attempt == 1 else f"{label} retry={attempt}",
+                cpus=cpus,
+                log_path=log_path,
+                import_lines=import_lines,
             )
             total_elapsed += elapsed
 
@@ -823,6 +1480,9 @@ def run_stage(
             error_message=f"No result file produced: {result_path}",
         )
 
+    if import_lines:
+        store_import_profile(triple, stage, cfg, repeat_index, result_path, import_lines)
+
     return StageOutcome(
         host=triple[0],
         guest=triple[1],
@@ -834,59 +1494,132 @@ def run_stage(
         command_display=command_display,
     )
 
-def percentile_from_sorted(values: list[float], q: float) -> float:
-    if not values:
-        return 0.0
-    idx = min(int(len(values) * q), len(values) - 1)
-    return float(values[idx])
-
-
-def remove_outliers_iqr(values: list[float]) -> list[float]:
-    if len(values) < 4:
-        return values
-    s = sorted(values)
-    n = len(s)
-    q1 = s[n // 4]
-    q3 = s[(3 * n) // 4]
-    iqr = q3 - q1
-    low = q1 - 1.5 * iqr
-    high = q3 + 1.5 * iqr
-    cleaned = [x for x in s if low <= x <= high]
-    return cleaned if cleaned else s
-
-
-def compute_stats(values: list[float]) -> dict[str, float | list[float]]:
-    if not values:
-        return {
-            "mean_ns": 0.0,
-            "median_ns": 0.0,
-            "p95_ns": 0.0,
-            "p99_ns": 0.0,
-            "stddev_ns": 0.0,
-            "ci95_ns": [0.0, 0.0],
-        }
 
-    s = sorted(values)
-    n = len(s)
-    mean = sum(s) / n
-    if n % 2 == 1:
-        median = s[n // 2]
-    else:
-        median = (s[n // 2 - 1] + s[n // 2]) / 2.0
-    p95 = percentile_from_sorted(s, 0.95)
-    p99 = percentile_from_sorted(s, 0.99)
+@dataclass
+class StageJob:
+    triple: tuple[str, str, str]
+    stage: str
+    repeat_index: int | None
+    result_path: Path | None
+    scenario_selectors: list[str] | None
+    progress: str
+    log_dir: Path | None = None
+
+
+def partition_cpus(groups: int) -> list[list[int]]:
+    """Split the CPUs this process may use into `groups` disjoint, contiguous sets."""
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < groups:
+        raise ConfigError(f"execution.concurrency={groups} exceeds the {len(cpus)} CPUs available for pinning")
+    size, extra = divmod(len(cpus), groups)
+    out: list[list[int]] = []
+    start = 0
+    for g in range(groups):
+        end = start + size + (1 if g < extra else 0)
+        out.append(cpus[start:end])
+        start = end
+    return out
+
+
+class StageScheduler:
+    """Run stage jobs on `execution.concurrency` worker slots.
+
+    - Each slot owns a disjoint CPU group when execution.pin_cpus is set.
+    - Jobs sharing a test directory never overlap (Maven target/, go_bridge builds).
+    - With execution.benchmark_exclusive, a benchmark stage waits until every slot is
+      idle and holds all of them (pinned to the union of their CPU groups), so nothing
+      else runs next to it.
+      Jobs after it in the list are not started early.
+    - Callbacks run on the calling thread, so outcome/state handling needs no locks.
+    """
 
-    var = sum((x - mean) ** 2 for x in s) / n
-    stddev = math.sqrt(var)
-    se = stddev / math.sqrt(n)
-    return {
-        "mean_ns": mean,
-        "median_ns": median,
-        "p95_ns": p95,
-        "p99_ns": p99,
-        "stddev_ns": stddev,
-        "ci95_ns": [mean - 1.96 * se, mean + 1.96 * se],
-    }
+    def __init__(self, cfg: Config):
+        self.concurrency = cfg.concurrency
+        self.benchmark_exclusive = cfg.benchmark_exclusive
+        self.cpu_groups: list[list[int] | None] = (
+            list(partition_cpus(cfg.concurrency)) if cfg.pin_cpus else [None] * cfg.concurrency
+        )
+        self.cfg = cfg
+
+    def describe(self) -> str:
+        parts = [f"concurrency={self.concurrency}"]
+        if self.cpu_groups[0] is not None:
+            parts.append("cpu_groups=" + " | ".join(",".join(str(c) for c in g) for g in self.cpu_groups))
+        parts.append(f"benchmark_exclusive={self.benchmark_exclusive}")
+        return ", ".join(parts)
+
+    def _is_exclusive(self, job: StageJob) -> bool:
+        return self.benchmark_exclusive and job.stage == "benchmark" and self.concurrency > 1
+
+    def _cpus_for(self, slots: list[int]) -> list[int] | None:
+        """CPUs a job holding `slots` is pinned to (None when pinning is off)."""
+        if self.cpu_groups[0] is None:
+            return None
+        return sorted(c for slot in slots for c in self.cpu_groups[slot])
+
+    def run(
+        self,
+        jobs: list[StageJob],
+        on_start: Callable[[StageJob], None],
+        on_done: Callable[[StageJob, StageOutcome], None],
+    ) -> None:
+        """Run all jobs; on_done may raise (e.g. fail-fast) to stop launching new jobs."""
+        pending = list(jobs)
+        free_slots = list(range(self.concurrency))
+        busy_dirs: set[Path] = set()
+        running: dict[Future, tuple[StageJob, list[int], Path]] = {}
+        stop_error: BaseException | None = None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while running or (pending and stop_error is None):
+                if stop_error is None:
+                    for job in list(pending):
+                        cwd = test_directory(job.triple)
+                        exclusive = self._is_exclusive(job)
+                        if exclusive and len(free_slots) < self.concurrency:
+                            break
+                        if cwd in busy_dirs or not free_slots:
+                            continue
+                        slots = list(free_slots) if exclusive else [free_slots[0]]
+                        for slot in slots:
+                            free_slots.remove(slot)
+                        busy_dirs.add(cwd)
+                        pending.remove(job)
+                        on_start(job)
+                        fut = pool.submit(
+                            run_stage,
+                            job.triple,
+                            job.stage,
+                            self.cfg,
+                            repeat_index=job.repeat_index,
+                            result_path=job.result_path,
+                            scenario_selectors=job.scenario_selectors,
+                            cpus=self._cpus_for(slots),
+                            log_dir=job.log_dir,
+                        )
+                        running[fut] = (job, slots, cwd)
+                        if exclusive:
+                            break
+
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    job, slots, cwd = running.pop(fut)
+                    free_slots.extend(slots)
+                    free_slots.sort()
+                    busy_dirs.discard(cwd)
+                    if stop_error is not None:
+                        continue
+                    try:
+                        on_done(job, fut.result())
+                    except BaseException as e:  # fail-fast: drain running jobs, then re-raise
+                        stop_error = e
+                        if running:
+                            print(f"  Waiting for {len(running)} running stage(s) to finish...")
+
+        if stop_error is not None:
+            raise stop_error
 
 
 def scenario_key(bench: dict[str, Any]) -> tuple[str, int | None]:
@@ -951,6 +1684,8 @@ def merge_selected_benchmarks(
     rerun_data: dict[str, Any],
     selected_keys: set[tuple[str, int | None]],
     run_id: str,
+    raw_sample_format: str,
+    staged_sidecars: list[benchmark_samples.NpySampleWriter],
 ) -> None:
     if not canonical_file.is_file():
         raise RunnerError(
@@ -1017,8 +1752,172 @@ def merge_selected_benchmarks(
     current["metadata"]["config"]["last_partial_scenarios"] = sorted(
         scenario_key_to_selector(k) for k in applicable_keys
     )
-    with open(canonical_file, "w", encoding="utf-8") as f:
-        json.dump(current, f, indent=2)
+    write_canonical_result(current, canonical_file, raw_sample_format, staged_sidecars)
+
+
+def load_run_samples(
+    bench: dict[str, Any],
+    field: str,
+    run_dir: Path,
+    triple: tuple[str, str, str],
+    key: tuple[str, int | None],
+    run_index: int,
+) -> Any:
+    try:
+        return benchmark_samples.load_samples(bench, field, run_dir)
+    except benchmark_samples.SampleFileError as e:
+        raise RunnerError(f"{triple_label(triple)} scenario {key} run_{run_index}: {e}") from e
+
+
+def write_sample_sidecars(
+    result: dict[str, Any],
+    result_file: Path,
+    raw_sample_format: str,
+    staged_sidecars: list[benchmark_samples.NpySampleWriter],
+) -> None:
+    try:
+        benchmark_samples.externalize_raw_samples(result, result_file, raw_sample_format, staged_sidecars)
+    except (benchmark_samples.SampleFileError, OSError) as e:
+        raise RunnerError(f"Failed to write raw sample sidecars for {result_file}: {e}") from e
+
+
+def abort_staged_sidecars(staged_sidecars: list[benchmark_samples.NpySampleWriter]) -> None:
+    for w in staged_sidecars:
+        w.abort()
+
+
+def write_canonical_result(
+    result: dict[str, Any],
+    result_file: Path,
+    raw_sample_format: str,
+    staged_sidecars: list[benchmark_samples.NpySampleWriter],
+) -> None:
+    """Write a canonical result, publishing its sidecars only once its JSON is on disk.
+
+    Inline samples are staged next to the streamed sidecars; the JSON goes to a
+    temporary file first, then the staged sidecars and the JSON are moved into
+    place, so an interrupted aggregation never leaves the previous result file
+    next to sidecars it does not describe.
+    """
+    tmp = result_file.with_name(result_file.name + ".tmp")
+    try:
+        write_sample_sidecars(result, result_file, raw_sample_format, staged_sidecars)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        for w in staged_sidecars:
+            w.commit()
+        os.replace(tmp, result_file)
+    except BaseException:
+        abort_staged_sidecars(staged_sidecars)
+        if tmp.exists():
+            os.remove(tmp)
+        raise
+
+
+def pool_samples_in_memory(
+    triple: tuple[str, str, str],
+    key: tuple[str, int | None],
+    passed_runs: list[tuple[int, dict[str, Any]]],
+    repeat_files: list[Path],
+) -> tuple[dict[str, Any], int, dict[str, Any]]:
+    """Concatenate the samples of all repeats and summarize them as one array."""
+    pooled_chunks: list[Any] = []
+    pooled_batch_calls: list[int] = []
+    batch_calls_complete = True
+    for i, b in passed_runs:
+        # Samples are either inline JSON lists or memory-mapped .npy sidecars.
+        run_dir = repeat_files[i - 1].parent
+        raw = load_run_samples(b, "raw_iterations_ns", run_dir, triple, key, i)
+        if raw is None:
+            raise RunnerError(f"raw_iterations_ns missing in {triple_label(triple)} scenario {key} run_{i}")
+
+        pooled_chunks.append(benchmark_stats.as_samples(raw))
+
+        # Per-sample batch sizes are only emitted by harnesses that record them;
+        # keep them aligned with the pooled samples when every repeat has them.
+        batch_calls = load_run_samples(b, "raw_batch_calls", run_dir, triple, key, i)
+        if batch_calls is None:
+            batch_calls_complete = False
+        elif len(batch_calls) != len(raw):
+            raise RunnerError(
+                f"raw_batch_calls must match raw_iterations_ns in "
+                f"{triple_label(triple)} scenario {key} run_{i}"
+            )
+        else:
+            pooled_batch_calls.extend(int(c) for c in batch_calls)
+
+    pooled_per_call = benchmark_stats.concat_samples(pooled_chunks)
+    stats = benchmark_stats.summarize(pooled_per_call)
+    fields: dict[str, Any] = {"raw_iterations_ns": benchmark_stats.to_list(pooled_per_call)}
+    if batch_calls_complete:
+        fields["raw_batch_calls"] = pooled_batch_calls
+    return stats, len(pooled_per_call), fields
+
+
+def pool_samples_streaming(
+    triple: tuple[str, str, str],
+    key: tuple[str, int | None],
+    passed_runs: list[tuple[int, dict[str, Any]]],
+    repeat_files: list[Path],
+    output_file: Path,
+    scratch_root: Path,
+    staged_sidecars: list[benchmark_samples.NpySampleWriter],
+) -> tuple[dict[str, Any], int, dict[str, Any]]:
+    """Pool repeats one at a time: exact stats from sorted runs, pooled samples streamed to sidecars.
+
+    Only one repeat's samples are held in memory; the pooled samples are written
+    straight into the output file's sidecars instead of an inline list. The
+    finished sidecars are appended to staged_sidecars unpublished; see
+    write_canonical_result.
+    """
+    bench_id = {"scenario": key[0], "data_size": key[1]}
+    total = 0
+    batch_calls_complete = True
+    for i, b in passed_runs:
+        if not benchmark_samples.has_samples(b, "raw_iterations_ns"):
+            raise RunnerError(f"raw_iterations_ns missing in {triple_label(triple)} scenario {key} run_{i}")
+        total += benchmark_samples.sample_count(b, "raw_iterations_ns")
+        batch_calls_complete = batch_calls_complete and benchmark_samples.has_samples(b, "raw_batch_calls")
+
+    fields = ["raw_iterations_ns"] + (["raw_batch_calls"] if batch_calls_complete else [])
+    writers = {
+        f: benchmark_samples.NpySampleWriter(benchmark_samples.sidecar_path(output_file, bench_id, f), total)
+        for f in fields
+    }
+    scratch_root.mkdir(parents=True, exist_ok=True)
+    try:
+        with tempfile.TemporaryDirectory(prefix="aggregate_", dir=scratch_root) as scratch:
+            with benchmark_stats.SortedRunsSummary(scratch) as acc:
+                for i, b in passed_runs:
+                    run_dir = repeat_files[i - 1].parent
+                    raw = load_run_samples(b, "raw_iterations_ns", run_dir, triple, key, i)
+                    acc.add(raw)
+                    writers["raw_iterations_ns"].append(raw)
+                    if batch_calls_complete:
+                        batch_calls = load_run_samples(b, "raw_batch_calls", run_dir, triple, key, i)
+                        if len(batch_calls) != len(raw):
+                            raise RunnerError(
+                                f"raw_batch_calls must match raw_iterations_ns in "
+                                f"{triple_label(triple)} scenario {key} run_{i}"
+                            )
+                        writers["raw_batch_calls"].append(batch_calls)
+                    del raw
+                stats = acc.summarize()
+        refs: dict[str, Any] = {}
+        for f, w in writers.items():
+            ref = {"path": w.path.relative_to(output_file.parent).as_posix()}
+            ref.update(w.finish())
+            refs[benchmark_samples.file_ref_key(f)] = ref
+        staged_sidecars.extend(writers.values())
+    except benchmark_samples.SampleFileError as e:
+        for w in writers.values():
+            w.abort()
+        raise RunnerError(f"{triple_label(triple)} scenario {key}: {e}") from e
+    except BaseException:
+        for w in writers.values():
+            w.abort()
+        raise
+    return stats, total, refs
 
 
 def build_aggregated_result(
@@ -1027,7 +1926,13 @@ def build_aggregated_result(
     cfg: Config,
     run_id: str,
     config_stem: str,
+    output_file: Path,
+    staged_sidecars: list[benchmark_samples.NpySampleWriter],
 ) -> dict[str, Any]:
+    """Pool all repeats of one triple into a canonical result destined for output_file.
+
+    Streamed sidecars are left in staged_sidecars for write_canonical_result to publish.
+    """
     if not repeat_files:
         raise RunnerError(f"No repeat files found for {triple_label(triple)}")
 
@@ -1040,9 +1945,13 @@ def build_aggregated_result(
         except json.JSONDecodeError as e:
             raise RunnerError(f"Malformed JSON in repeat file {p}: {e}") from e
 
-    base = copy.deepcopy(loaded[0])
-    if "benchmarks" not in base or not isinstance(base["benchmarks"], list):
+    if not isinstance(loaded[0].get("benchmarks"), list):
         raise RunnerError(f"Repeat file missing benchmarks array: {repeat_files[0]}")
+    # The benchmarks section is rebuilt below; copying it would duplicate every raw sample.
+    base = {k: copy.deepcopy(v) for k, v in loaded[0].items() if k != "benchmarks"}
+    import_profile = benchmark_importtime.merge_import_profiles([d.get("import_profile") for d in loaded])
+    if import_profile is not None:
+        base["import_profile"] = import_profile
 
     by_run: list[dict[tuple[str, int | None], dict[str, Any]]] = []
     for i, data in enumerate(loaded, start=1):
@@ -1076,7 +1985,7 @@ def build_aggregated_result(
     for key in sorted(keys_all, key=lambda x: (x[0], x[1] if x[1] is not None else -1)):
         scenario_name, data_size = key
         repeat_means: list[float] = []
-        pooled_per_call: list[float] = []
+        passed_runs: list[tuple[int, dict[str, Any]]] = []
         errors: list[str] = []
 
         if key not in keys_common:
@@ -1114,13 +2023,7 @@ def build_aggregated_result(
             if "mean_ns" not in total_phase:
                 raise RunnerError(f"Missing phases.total.mean_ns in {triple_label(triple)} scenario {key} run_{i}")
             repeat_means.append(float(total_phase["mean_ns"]))
-
-            raw = b.get("raw_iterations_ns")
-            if not isinstance(raw, list):
-                raise RunnerError(f"raw_iterations_ns must be a list in {triple_label(triple)} scenario {key} run_{i}")
-
-            for v in raw:
-                pooled_per_call.append(float(v))
+            passed_runs.append((i, b))
 
         if errors:
             aggregated_benchmarks.append(
@@ -1141,27 +2044,53 @@ def build_aggregated_result(
             )
             continue
 
-        cleaned = remove_outliers_iqr(pooled_per_call)
-        stats = compute_stats(cleaned)
-        aggregated_benchmarks.append(
-            {
-                "scenario": scenario_name,
-                "data_size": data_size,
-                "status": "PASS",
-                "raw_iterations_ns": pooled_per_call,
-                "phases": {"total": stats},
-                "repeat_analysis": {
-                    "repeat_count": len(repeat_files),
-                    "repeat_means_ns": repeat_means,
-                    "global_mean_ns": stats["mean_ns"],
-                    "pooled_sample_count": len(pooled_per_call),
-                    "aggregation_method": "pooled_iterations",
-                },
-            }
-        )
+        if cfg.aggregation_mode == "streaming":
+            stats, sample_count, sample_fields = pool_samples_streaming(
+                triple, key, passed_runs, repeat_files, output_file, cfg.repeat_root_dir, staged_sidecars
+            )
+        else:
+            stats, sample_count, sample_fields = pool_samples_in_memory(triple, key, passed_runs, repeat_files)
 
-    base["benchmarks"] = aggregated_benchmarks
+        entry: dict[str, Any] = {
+            "scenario": scenario_name,
+            "data_size": data_size,
+            "status": "PASS",
+        }
+        for field in BENCH_DESCRIPTOR_FIELDS:
+            if field in passed_runs[0][1]:
+                entry[field] = passed_runs[0][1][field]
+        memory = benchmark_memory.merge_memory([b.get("memory") for _, b in passed_runs])
+        if memory is not None:
+            entry["memory"] = memory
+        warmup = benchmark_warmup.merge_warmup([b.get("warmup") for _, b in passed_runs])
+        if warmup is not None:
+            entry["warmup"] = warmup
+        precision = benchmark_precision.merge_precision([b.get("precision") for _, b in passed_runs])
+        if precision is not None:
+            entry["precision"] = precision
+        gc_info = benchmark_gc.merge_gc([b.get("gc") for _, b in passed_runs])
+        if gc_info is not None:
+            entry["gc"] = gc_info
+        entry.update(sample_fields)
+        entry["phases"] = {"total": stats}
+        phase_data = benchmark_phases.merge_phases([b for _, b in passed_runs])
+        if phase_data is not None:
+            entry["phases"].update(phase_data["phases"])
+            entry["raw_phase_ns"] = phase_data["raw_phase_ns"]
+            entry["phase_probe"] = phase_data["phase_probe"]
+        entry["repeat_analysis"] = {
+            "repeat_count": len(repeat_files),
+            "repeat_means_ns": repeat_means,
+            "global_mean_ns": stats["mean_ns"],
+            "pooled_sample_count": sample_count,
+            "aggregation_method": "pooled_iterations",
+        }
+        aggregated_benchmarks.append(entry)
 
+    base["benchmarks"] = aggregated_benchmarks
+    scaling = benchmark_scaling.merge_scaling_runs([data.get("scaling") for data in loaded])
+    if scaling is not None:
+        base["scaling"] = scaling
     if not isinstance(base.get("metadata"), dict):
         base["metadata"] = {}
     if not isinstance(base["metadata"].get("config"), dict):
@@ -1169,11 +2098,33 @@ def build_aggregated_result(
 
     base["metadata"]["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     base["metadata"]["config"]["warmup_iterations"] = cfg.warmup_iterations
+    base["metadata"]["config"]["warmup_mode"] = cfg.warmup_mode
+    base["metadata"]["config"]["warmup_window_calls"] = cfg.warmup_window_calls
+    base["metadata"]["config"]["warmup_stable_windows"] = cfg.warmup_stable_windows
+    base["metadata"]["config"]["warmup_tolerance"] = cfg.warmup_tolerance
+    base["metadata"]["config"]["warmup_max_calls"] = cfg.warmup_max_calls
     base["metadata"]["config"]["measured_iterations"] = cfg.measured_iterations
+    base["metadata"]["config"]["precision_target"] = cfg.precision_target
+    base["metadata"]["config"]["precision_block_iterations"] = cfg.precision_block_iterations
+    base["metadata"]["config"]["precision_max_iterations"] = cfg.precision_max_iterations
+    base["metadata"]["config"]["precision_max_seconds"] = cfg.precision_max_seconds
+    base["metadata"]["config"]["gc_mode"] = cfg.gc_mode
     base["metadata"]["config"]["repeat_count"] = len(repeat_files)
     base["metadata"]["config"]["batch_min_elapsed_ns"] = cfg.batch_min_elapsed_ns
     base["metadata"]["config"]["batch_max_calls"] = cfg.batch_max_calls
+    base["metadata"]["config"]["scaling_threads"] = cfg.scaling_threads
+    base["metadata"]["config"]["scaling_processes"] = cfg.scaling_processes
+    base["metadata"]["config"]["scaling_inflight"] = cfg.scaling_inflight
+    base["metadata"]["config"]["array_input_containers"] = cfg.array_input_containers
+    base["metadata"]["config"]["array_sizes"] = cfg.array_sizes
+    base["metadata"]["config"]["large_array_iterations"] = cfg.large_array_iterations
+    base["metadata"]["config"]["list_array_max_size"] = cfg.list_array_max_size
+    base["metadata"]["config"]["memory_probe_calls"] = cfg.memory_probe_calls
+    base["metadata"]["config"]["phase_probe_calls"] = cfg.phase_probe_calls
+    base["metadata"]["config"]["import_profile"] = cfg.import_profile
+    base["metadata"]["config"]["raw_sample_format"] = cfg.raw_sample_format
     base["metadata"]["config"]["aggregation_method"] = "pooled_iterations"
+    base["metadata"]["config"]["aggregation_mode"] = cfg.aggregation_mode
     base["metadata"]["config"]["run_id"] = run_id
     base["metadata"]["config"]["run_config_name"] = config_stem
     return base
@@ -1187,10 +2138,75 @@ def aggregate_repeat_files(
     run_id: str,
     config_stem: str,
 ) -> None:
-    base = build_aggregated_result(triple, repeat_files, cfg, run_id, config_stem)
+    staged: list[benchmark_samples.NpySampleWriter] = []
+    try:
+        base = build_aggregated_result(triple, repeat_files, cfg, run_id, config_stem, canonical_file, staged)
+    except BaseException:
+        abort_staged_sidecars(staged)
+        raise
     canonical_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(canonical_file, "w", encoding="utf-8") as f:
-        json.dump(base, f, indent=2)
+    write_canonical_result(base, canonical_file, cfg.raw_sample_format, staged)
+
+
+def run_cold_start_stage(triples: list[tuple[str, str, str]], cfg: Config) -> list[StageOutcome]:
+    """Measure process launch -> first call for every selected triple with a cold-start script."""
+    cold_start_file = cfg.canonical_results_dir / benchmark_cold_start.COLD_START_FILENAME
+    existing: set[tuple[str, str, str]] = set()
+    if not cfg.rerun_existing and cold_start_file.is_file():
+        with open(cold_start_file, encoding="utf-8") as f:
+            existing = {(e["host"], e["guest"], e["mechanism"]) for e in json.load(f).get("mechanisms", [])}
+
+    env = os.environ.copy()
+    env.pop("METAFFI_TEST_SCENARIOS", None)
+    outcomes: list[StageOutcome] = []
+    entries: list[dict[str, Any]] = []
+    for triple in triples:
+        if triple not in benchmark_cold_start.COLD_START_SCRIPTS:
+            continue
+        if triple in existing:
+            out = StageOutcome(
+                host=triple[0],
+                guest=triple[1],
+                mechanism=triple[2],
+                stage="cold_start",
+                repeat_index=None,
+                status="SKIP",
+                elapsed_seconds=0.0,
+                command_display="(existing cold-start result)",
+            )
+            outcomes.append(out)
+            print_outcome("SKIP", out)
+            continue
+
+        script = TESTS_ROOT / benchmark_cold_start.COLD_START_SCRIPTS[triple]
+        print(f"  RUN   {triple_label(triple)} stage=cold_start launches={cfg.cold_start_runs}")
+        start = time.monotonic()
+        error = None
+        try:
+            ensure_stage_builds(triple, "benchmark", cfg)
+            entries.append(benchmark_cold_start.run_cold_start(triple, TESTS_ROOT, cfg.cold_start_runs, env))
+        except (build_cache.BuildCacheError, benchmark_cold_start.ColdStartError) as e:
+            error = str(e)
+        out = StageOutcome(
+            host=triple[0],
+            guest=triple[1],
+            mechanism=triple[2],
+            stage="cold_start",
+            repeat_index=None,
+            status="FAIL" if error else "PASS",
+            elapsed_seconds=time.monotonic() - start,
+            command_display=f"{sys.executable} {script} (x{cfg.cold_start_runs})",
+            error_message=error,
+        )
+        outcomes.append(out)
+        print_outcome(out.status, out)
+        if error and cfg.fail_fast:
+            raise RunnerError("Fail-fast: cold-start stage failed")
+
+    if entries:
+        benchmark_cold_start.write_cold_start(cold_start_file, entries, cfg.cold_start_runs)
+        print(f"  Cold-start results -> {cold_start_file}")
+    return outcomes
 
 
 def print_outcome(prefix: str, outcome: StageOutcome) -> None:
@@ -1243,6 +2259,9 @@ def clear_config_artifacts(config_path: Path) -> None:
         if f.is_file():
             f.unlink()
             removed_canonical += 1
+        raw_dir = benchmark_samples.sidecar_dir(f)
+        if raw_dir.is_dir():
+            shutil.rmtree(raw_dir)
 
     print("Cleared config artifacts:")
     print(f"  Config: {config_path.resolve()}")
@@ -1269,6 +2288,14 @@ def main() -> int:
             "Can be repeated or comma-separated."
         ),
     )
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help=(
+            "Run Python3-host stages under `python -X importtime` and store the import profile "
+            "(results/import_profiles/, and import_profile in benchmark results)."
+        ),
+    )
     args = parser.parse_args()
 
     if args.clear_config:
@@ -1282,6 +2309,7 @@ def main() -> int:
 
     config_path = Path(args.config).resolve()
     cfg = load_config(config_path)
+    cfg.import_profile = args.importtime
     triples = filter_triples(cfg)
     selected_scenario_keys = parse_scenario_selectors(args.scenarios)
     selected_scenario_selectors = [scenario_key_to_selector(k) for k in selected_scenario_keys]
@@ -1307,8 +2335,40 @@ def main() -> int:
     print(f"Triples selected: {len(triples)}")
     print(f"Benchmarks: {cfg.include_benchmarks} | Correctness: {cfg.include_correctness}")
     print(f"Repeats: {cfg.repeats} | Warmup: {cfg.warmup_iterations} | Iterations: {cfg.measured_iterations}")
+    if cfg.warmup_mode == "adaptive":
+        print(
+            f"Adaptive warmup: windows of {cfg.warmup_window_calls} calls until {cfg.warmup_stable_windows} agree "
+            f"within {cfg.warmup_tolerance:.0%} (at least {cfg.warmup_iterations}, at most {cfg.warmup_max_calls} calls)"
+        )
+    if cfg.precision_target:
+        print(
+            f"Precision target: median 95% CI within +/-{cfg.precision_target:.1%} (blocks of "
+            f"{cfg.precision_block_iterations}, at most {cfg.precision_max_iterations} iterations or "
+            f"{cfg.precision_max_seconds} s per scenario)"
+        )
+    if cfg.gc_mode != "enabled":
+        print(f"GC mode (Python3 hosts): {cfg.gc_mode}")
     print(f"Batching: min_elapsed_ns={cfg.batch_min_elapsed_ns}, max_calls={cfg.batch_max_calls}")
+    print(
+        f"Array sizes: {cfg.array_sizes} (iterations above {benchmark_inputs.LARGE_ARRAY_THRESHOLD}: "
+        f"{cfg.large_array_iterations}; list inputs up to {cfg.list_array_max_size})"
+    )
+    print(f"Memory probe: {cfg.memory_probe_calls} untimed tracemalloc calls per Python scenario")
+    if cfg.phase_probe_calls:
+        print(f"Phase probe: {cfg.phase_probe_calls} instrumented calls per Python3 MetaFFI scenario")
+    if cfg.cold_start_runs:
+        print(f"Cold start: {cfg.cold_start_runs} fresh-process launches per Python3-host mechanism")
+    if cfg.scaling_threads:
+        print(f"Thread scaling: workers={cfg.scaling_threads}, window={cfg.scaling_duration_ms} ms")
+    if cfg.scaling_processes:
+        print(f"Process scaling: workers={cfg.scaling_processes}, window={cfg.scaling_duration_ms} ms")
+    if cfg.scaling_inflight:
+        print(f"gRPC in-flight scaling: depths={cfg.scaling_inflight}, window={cfg.scaling_duration_ms} ms")
+    if cfg.import_profile:
+        print("Import profile: Python3-host stages run under -X importtime")
     print(f"Fail-fast: {cfg.fail_fast}")
+    scheduler = StageScheduler(cfg)
+    print(f"Scheduling: {scheduler.describe()}")
     if scenario_mode:
         print(f"Scenario rerun mode: {', '.join(selected_scenario_selectors)}")
     print(f"Run ID: {run_id}")
@@ -1344,6 +2404,7 @@ def main() -> int:
 
     if cfg.include_correctness:
         print("-- Correctness Stage --")
+        correctness_jobs: list[StageJob] = []
         for idx, triple in enumerate(triples, start=1):
             ckey = triple_key(triple)
             if resume_state["correctness"].get(ckey) is True:
@@ -1361,25 +2422,33 @@ def main() -> int:
                 print_outcome("SKIP", out)
                 continue
 
-            print(f"  RUN   [{idx}/{len(triples)}] {triple_label(triple)} stage=correctness")
-            out = run_stage(
-                triple,
-                "correctness",
-                cfg,
-                repeat_index=None,
-                result_path=None,
-                scenario_selectors=None,
+            correctness_jobs.append(
+                StageJob(
+                    triple=triple,
+                    stage="correctness",
+                    repeat_index=None,
+                    result_path=None,
+                    scenario_selectors=None,
+                    progress=f"[{idx}/{len(triples)}]",
+                    log_dir=repeat_session_dir / "logs" if cfg.keep_stage_logs else None,
+                )
             )
+
+        def on_correctness_start(job: StageJob) -> None:
+            print(f"  RUN   {job.progress} {triple_label(job.triple)} stage=correctness")
+
+        def on_correctness_done(job: StageJob, out: StageOutcome) -> None:
             outcomes.append(out)
             print_outcome(out.status, out)
             if out.status == "PASS":
-                resume_state["correctness"][ckey] = True
+                resume_state["correctness"][triple_key(job.triple)] = True
                 save_resume_state(state_file, resume_state)
             if out.status == "FAIL" and cfg.fail_fast:
                 raise RunnerError("Fail-fast: correctness stage failed")
+
+        scheduler.run(correctness_jobs, on_correctness_start, on_correctness_done)
         print()
 
-    repeat_files_by_triple: dict[tuple[str, str, str], list[Path]] = {t: [] for t in benchmark_targets}
     resume_benchmarks = cfg.write_repeat_files and not scenario_mode
     if cfg.include_benchmarks and not resume_benchmarks and benchmark_targets:
         reason = (
@@ -1394,11 +2463,13 @@ def main() -> int:
             repeat_session_dir.mkdir(parents=True, exist_ok=True)
 
         print("-- Benchmark Stage --")
+        prepare_array_inputs(cfg, benchmark_targets)
         total_runs = len(benchmark_targets) * cfg.repeats
         run_counter = 0
+        benchmark_jobs: list[StageJob] = []
+        repeat_file_by_rep: dict[tuple[str, str, str], dict[int, Path]] = {t: {} for t in benchmark_targets}
 
         for rep in range(1, cfg.repeats + 1):
-            print(f"  Repeat {rep}/{cfg.repeats}")
             run_dir = repeat_session_dir / f"run_{rep:02d}"
             if cfg.write_repeat_files:
                 run_dir.mkdir(parents=True, exist_ok=True)
@@ -1429,46 +2500,63 @@ def main() -> int:
                                 command_display="(resume: already passed for this config)",
                             )
                             outcomes.append(out)
-                            repeat_files_by_triple[triple].append(prev_path)
+                            repeat_file_by_rep[triple][rep] = prev_path
                             print_outcome("SKIP", out)
                             continue
                         # stale path in state: force re-run this repeat
                         bstate.pop(rep_key, None)
                         save_resume_state(state_file, resume_state)
 
-                print(f"    RUN   [{run_counter}/{total_runs}] {triple_label(triple)} stage=benchmark repeat={rep}")
-
-                out = run_stage(
-                    triple,
-                    "benchmark",
-                    cfg,
-                    repeat_index=rep,
-                    result_path=repeat_file,
-                    scenario_selectors=selected_scenario_selectors if scenario_mode else None,
+                benchmark_jobs.append(
+                    StageJob(
+                        triple=triple,
+                        stage="benchmark",
+                        repeat_index=rep,
+                        result_path=repeat_file,
+                        scenario_selectors=selected_scenario_selectors if scenario_mode else None,
+                        progress=f"[{run_counter}/{total_runs}]",
+                        log_dir=run_dir / "logs" if cfg.keep_stage_logs else None,
+                    )
                 )
-                outcomes.append(out)
-                print_outcome(out.status, out)
-
-                if out.status == "PASS":
-                    repeat_files_by_triple[triple].append(repeat_file)
-                    if resume_benchmarks:
-                        bstate = resume_state["benchmarks"].setdefault(bkey, {})
-                        if not isinstance(bstate, dict):
-                            raise RunnerError(f"Malformed resume benchmark entry for {triple_label(triple)}")
-                        bstate[rep_key] = str(repeat_file.resolve())
-                        save_resume_state(state_file, resume_state)
-                elif repeat_file.is_file() and repeat_file.stat().st_size > 0:
-                    # Process failed but incremental saving produced partial results.
-                    # Include the file so aggregation can use whatever scenarios completed.
-                    # Do NOT trigger fail-fast here: the tail crash (e.g. any_echo
-                    # handle-table overflow) happened after all critical scenarios
-                    # were already saved.  Aggregation will flag any missing data.
-                    repeat_files_by_triple[triple].append(repeat_file)
-                    print(f"        (partial results salvaged from {repeat_file.name})")
-                elif cfg.fail_fast:
-                    raise RunnerError("Fail-fast: benchmark stage failed")
-
-            print()
+
+        def on_benchmark_start(job: StageJob) -> None:
+            print(
+                f"    RUN   {job.progress} {triple_label(job.triple)} "
+                f"stage=benchmark repeat={job.repeat_index}"
+            )
+
+        def on_benchmark_done(job: StageJob, out: StageOutcome) -> None:
+            triple = job.triple
+            repeat_file = job.result_path
+            outcomes.append(out)
+            print_outcome(out.status, out)
+
+            if out.status == "PASS":
+                repeat_file_by_rep[triple][job.repeat_index] = repeat_file
+                if resume_benchmarks:
+                    bstate = resume_state["benchmarks"].setdefault(triple_key(triple), {})
+                    if not isinstance(bstate, dict):
+                        raise RunnerError(f"Malformed resume benchmark entry for {triple_label(triple)}")
+                    bstate[str(job.repeat_index)] = str(repeat_file.resolve())
+                    save_resume_state(state_file, resume_state)
+            elif repeat_file.is_file() and repeat_file.stat().st_size > 0:
+                # Process failed but incremental saving produced partial results.
+                # Include the file so aggregation can use whatever scenarios completed.
+                # Do NOT trigger fail-fast here: the tail crash (e.g. any_echo
+                # handle-table overflow) happened after all critical scenarios
+                # were already saved.  Aggregation will flag any missing data.
+                repeat_file_by_rep[triple][job.repeat_index] = repeat_file
+                print(f"        (partial results salvaged from {repeat_file.name})")
+            elif cfg.fail_fast:
+                raise RunnerError("Fail-fast: benchmark stage failed")
+
+        scheduler.run(benchmark_jobs, on_benchmark_start, on_benchmark_done)
+        print()
+
+        # Completion order depends on scheduling; aggregate repeats in repeat order.
+        repeat_files_by_triple: dict[tuple[str, str, str], list[Path]] = {
+            t: [by_rep[r] for r in sorted(by_rep)] for t, by_rep in repeat_file_by_rep.items()
+        }
 
         print("-- Aggregation Stage (pooled iterations across repeats) --")
         for i, triple in enumerate(benchmark_targets, start=1):
@@ -1492,12 +2580,25 @@ def main() -> int:
                     f"[{i}/{len(benchmark_targets)}] {triple_label(triple)} "
                     f"(update scenarios: {', '.join(selected_scenario_selectors)}) -> {canonical_file.name}"
                 )
-                rerun_data = build_aggregated_result(triple, files, cfg, run_id, config_stem)
-                merge_selected_benchmarks(canonical_file, rerun_data, selected_scenario_key_set, run_id)
+                staged: list[benchmark_samples.NpySampleWriter] = []
+                try:
+                    rerun_data = build_aggregated_result(
+                        triple, files, cfg, run_id, config_stem, canonical_file, staged
+                    )
+                    merge_selected_benchmarks(
+                        canonical_file, rerun_data, selected_scenario_key_set, run_id, cfg.raw_sample_format, staged
+                    )
+                except BaseException:
+                    abort_staged_sidecars(staged)
+                    raise
             else:
                 print(f"  AGGR  [{i}/{len(benchmark_targets)}] {triple_label(triple)} -> {canonical_file.name}")
                 aggregate_repeat_files(triple, files, canonical_file, cfg, run_id, config_stem)
 
+    if cfg.include_benchmarks and cfg.cold_start_runs and not scenario_mode:
+        print("\n-- Cold Start Stage (process launch to first call) --")
+        outcomes.extend(run_cold_start_stage(triples, cfg))
+
     if cfg.run_complexity:
         print("\n-- Complexity Analysis --")
         run_script(TESTS_ROOT / "analyze_complexity.py", TESTS_ROOT)